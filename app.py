@@ -40,7 +40,8 @@ from screens.mirail_autocall import (
     show_mirail_guarantor_with10k,
     show_mirail_guarantor_without10k_today_included,
     show_mirail_emergency_without10k,
-    show_mirail_emergency_with10k
+    show_mirail_emergency_with10k,
+    show_mirail_autocall_batch
 )
 from screens.faith_autocall import (
     show_faith_contract,
@@ -75,6 +76,9 @@ from screens.sms.plaza import (
 from screens.sms.gb import (
     show_gb_sms_contract
 )
+from screens.sms.batch import (
+    show_sms_batch
+)
 from screens.registration.ark import (
     show_ark_registration_tokyo,
     show_ark_registration_osaka,
@@ -149,6 +153,12 @@ from screens.autocall_history import (
 from screens.fine_history import (
     render_fine_history
 )
+from screens.metrics import (
+    render_metrics
+)
+from screens.profiler import (
+    render_profiler
+)
 
 # プロセッサーをインポート
 
@@ -176,6 +186,7 @@ def main():
         "mirail_guarantor_with10k": show_mirail_guarantor_with10k,
         "mirail_emergency_without10k": show_mirail_emergency_without10k,
         "mirail_emergency_with10k": show_mirail_emergency_with10k,
+        "mirail_autocall_batch": show_mirail_autocall_batch,
         "faith_contract": show_faith_contract,
         "faith_guarantor": show_faith_guarantor,
         "faith_emergency": show_faith_emergency,
@@ -193,6 +204,7 @@ def main():
         "mirail_sms_guarantor_blank": show_mirail_sms_guarantor_blank,
         "mirail_sms_emergencycontact_id5": show_mirail_sms_emergencycontact_id5,
         "mirail_sms_emergencycontact_blank": show_mirail_sms_emergencycontact_blank,
+        "sms_batch": show_sms_batch,
         "plaza_sms_contract": show_plaza_sms_contract,
         "plaza_sms_guarantor": show_plaza_sms_guarantor,
         "plaza_sms_contact": show_plaza_sms_contact,
@@ -234,7 +246,9 @@ def main():
         "visit_list": render_visit_list,
         "visit_list_backrent": render_visit_list_backrent,
         "autocall_history": render_autocall_history,
-        "fine_history": render_fine_history
+        "fine_history": render_fine_history,
+        "metrics": render_metrics,
+        "profiler": render_profiler
     }
     
     # カスタムCSSを適用
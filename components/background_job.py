@@ -0,0 +1,93 @@
+"""
+バックグラウンドジョブの画面表示
+Business Data Processor
+
+processors/common/job_runner.py のジョブを画面から投入・表示する。
+- セッションID: ブラウザのタブごとの st.session_state に保持する推測できないトークン
+  URLには含めないため、URLを共有・複製したタブから他のユーザーの処理結果は見えない
+  （再実行・通信の再接続では同じジョブを表示し、ブラウザの再読み込み後は新しいセッションになる）
+- 実行中: 進捗を表示し、POLL_INTERVAL_SECONDS ごとに再実行して完了を待つ
+- メトリクス: ジョブごとに処理時間・件数・メモリを記録（processors/common/metrics.py、処理名はジョブキー）
+- プロファイル: 管理画面で予約したセッションの次のジョブは cProfile + tracemalloc の下で実行し
+  （processors/common/profiler.py、メトリクスには記録せず、同時に実行したジョブは重なりを付けて記録）、結果を処理結果の下に表示
+"""
+
+import secrets
+import time
+from typing import Any, Callable, Optional
+
+import streamlit as st
+
+from components.profile_view import render_profile
+from components.result_display import display_error_result
+from processors.common.job_runner import FAILED, QUEUED, Job, get_job_runner
+from processors.common.metrics import instrument_run
+from processors.common.profiler import get_profile_registry, instrument_profile
+
+
+# 以前セッションIDを保持していたクエリパラメータ名（URLに残っている場合は削除する）
+LEGACY_SESSION_PARAM = "sid"
+
+# 実行中ジョブの確認間隔（秒）
+POLL_INTERVAL_SECONDS = 0.5
+
+
+def get_job_session_id() -> str:
+    """ジョブ登録簿のセッションIDを取得（なければ作成してこのタブのセッションに保持）"""
+    session_id = st.session_state.get("job_session_id")
+    if session_id:
+        return session_id
+
+    query_params = getattr(st, "query_params", None)
+    if query_params is not None and LEGACY_SESSION_PARAM in query_params:
+        del query_params[LEGACY_SESSION_PARAM]
+    session_id = secrets.token_urlsafe(32)
+    st.session_state.job_session_id = session_id
+    return session_id
+
+
+def submit_job(key: str, func: Callable, *args, **kwargs) -> Job:
+    """処理をジョブとして投入（同じ画面の前回のジョブは置き換え）"""
+    session_id = get_job_session_id()
+    registry = get_profile_registry()
+    if registry.take(session_id):
+        func = instrument_profile(key, func, lambda profile: registry.save(session_id, profile))
+    else:
+        func = instrument_run(key, func)
+    return get_job_runner().submit(session_id, key, func, *args, **kwargs)
+
+
+def get_job(key: str) -> Optional[Job]:
+    """この画面のジョブ（なければ None）"""
+    return get_job_runner().get(get_job_session_id(), key)
+
+
+def render_job(job: Job, on_result: Callable[[Any], None]) -> None:
+    """
+    ジョブの状態を表示
+
+    実行中は進捗を表示して再実行し、完了後は on_result に処理結果を渡す。
+    処理で例外が発生した場合はエラーを表示する。
+    プロファイルを取得したジョブは、完了後に取得結果も表示する。
+    """
+    if not job.done:
+        if job.status == QUEUED:
+            st.info("⏳ 待機中: 他の処理の完了を待っています...")
+        else:
+            st.progress(job.progress, text=job.message or "処理中...")
+            st.caption(f"経過時間: {job.elapsed:.0f}秒（他の画面に移動しても処理は続きます。ブラウザを再読み込みすると結果は表示されません）")
+        time.sleep(POLL_INTERVAL_SECONDS)
+        st.rerun()
+    elif job.status == FAILED:
+        display_error_result(f"エラーが発生しました: {str(job.error())}")
+        _render_job_profile(job)
+    else:
+        on_result(job.result())
+        _render_job_profile(job)
+
+
+def _render_job_profile(job: Job) -> None:
+    """このジョブで取得したプロファイルがあれば表示"""
+    profile = get_profile_registry().get(get_job_session_id(), job.key)
+    if profile is not None and job.started_at is not None and profile.started_at.timestamp() >= job.started_at:
+        render_profile(profile, expanded=True, key_prefix="job_profile")
@@ -7,9 +7,13 @@ Business Data Processor
 
 import streamlit as st
 import pandas as pd
-import io
-from openpyxl import Workbook
 from openpyxl.styles import Font
+from processors.common.csv_writer import format_replaced_chars, to_csv_cp932
+from processors.common.excel_writer import ExcelSheet, to_excel_bytes
+
+
+# Excelダウンロードのフォント（游ゴシック Regular 12pt、罫線なし）
+EXCEL_FONT = Font(name='游ゴシック', size=12, bold=False)
 
 
 def safe_dataframe_display(df: pd.DataFrame):
@@ -34,31 +38,11 @@ def safe_dataframe_display(df: pd.DataFrame):
 
 
 def safe_csv_download(df: pd.DataFrame, filename: str, label: str = "📥 CSVファイルをダウンロード"):
-    """安全なCSVダウンロード関数（cp932エンコーディングエラー対応）"""
-    # DataFrameのコピーを作成して空列問題を回避
-    df_copy = df.copy()
-    
-    # 空文字列のカラム名に一時的な名前を付ける
-    columns = list(df_copy.columns)
-    empty_col_counter = 1
-    for i, col in enumerate(columns):
-        if col == "":
-            columns[i] = f"_empty_col_{empty_col_counter}_"
-            empty_col_counter += 1
-    
-    # 一時的なカラム名を設定
-    df_copy.columns = columns
-    
-    try:
-        # CSVとして出力する際に元のカラム名に戻す
-        csv_data = df_copy.to_csv(index=False, encoding='cp932', errors='replace', header=list(df.columns))
-        csv_bytes = csv_data.encode('cp932', errors='replace')
-    except UnicodeEncodeError:
-        # cp932でエラーが出る場合はUTF-8で出力
-        csv_data = df_copy.to_csv(index=False, encoding='utf-8-sig', header=list(df.columns))
-        csv_bytes = csv_data.encode('utf-8-sig')
-        st.warning("⚠️ 一部の文字がcp932に対応していないため、UTF-8で出力します")
-    
+    """安全なCSVダウンロード関数（CP932で表せない文字は「?」に置き換えて通知）"""
+    csv_bytes, replaced = to_csv_cp932(df)
+    if replaced:
+        display_replaced_chars_warning(replaced)
+
     return st.download_button(
         label=label,
         data=csv_bytes,
@@ -68,6 +52,12 @@ def safe_csv_download(df: pd.DataFrame, filename: str, label: str = "📥 CSVフ
     )
 
 
+def display_replaced_chars_warning(replaced: dict, filename: str = None):
+    """CP932で表せずに「?」に置き換えた文字の警告表示"""
+    target = f"{filename}: " if filename else ""
+    st.warning(f"⚠️ {target}CP932で表せない文字を「?」に置き換えました: {format_replaced_chars(replaced)}")
+
+
 def display_processing_logs(logs: list, title: str = "📊 処理ログ", expanded: bool = False):
     """処理ログの統一表示関数"""
     with st.expander(title, expanded=expanded):
@@ -88,41 +78,11 @@ def display_processing_logs(logs: list, title: str = "📊 処理ログ", expand
 
 def safe_excel_download(df: pd.DataFrame, filename: str, label: str = "📥 Excelファイルをダウンロード"):
     """安全なExcelダウンロード関数（游ゴシック 12ptフォント適用）"""
-    output = io.BytesIO()
-
-    # openpyxlで直接ワークブックを作成
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Sheet1'
-
-    # フォント設定（游ゴシック Regular 12pt、罫線なし）
-    custom_font = Font(
-        name='游ゴシック',
-        size=12,
-        bold=False
-    )
-
-    # ヘッダーを書き込み（フォント適用）
-    for col_num, column_title in enumerate(df.columns, 1):
-        cell = ws.cell(row=1, column=col_num, value=column_title)
-        cell.font = custom_font
-
-    # データを書き込み（フォント適用）
-    for row_num, row_data in enumerate(df.values, 2):
-        for col_num, cell_value in enumerate(row_data, 1):
-            # NaNやNoneの処理
-            if pd.isna(cell_value):
-                cell_value = ''
-            cell = ws.cell(row=row_num, column=col_num, value=cell_value)
-            cell.font = custom_font
-
-    # 保存
-    wb.save(output)
-    output.seek(0)
+    excel_bytes = to_excel_bytes([ExcelSheet('Sheet1', df, EXCEL_FONT)])
 
     return st.download_button(
         label=label,
-        data=output.getvalue(),
+        data=excel_bytes,
         file_name=filename,
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         type="primary"
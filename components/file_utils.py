@@ -6,7 +6,8 @@ Business Data Processor
 """
 
 import pandas as pd
-import io
+
+from processors.common.parsed_frame_cache import read_csv_cached
 
 
 def read_csv_with_encoding(file_data: bytes, **kwargs) -> pd.DataFrame:
@@ -23,12 +24,7 @@ def read_csv_with_encoding(file_data: bytes, **kwargs) -> pd.DataFrame:
     Raises:
         ValueError: サポートされていないエンコーディングの場合
     """
-    encodings = ['cp932', 'shift_jis', 'utf-8-sig']
-
-    for encoding in encodings:
-        try:
-            return pd.read_csv(io.BytesIO(file_data), encoding=encoding, **kwargs)
-        except UnicodeDecodeError:
-            continue
-
-    raise ValueError("サポートされていないエンコーディングです。対応形式: CP932, Shift_JIS, UTF-8")
+    try:
+        return read_csv_cached(file_data, **kwargs)
+    except UnicodeDecodeError:
+        raise ValueError("サポートされていないエンコーディングです。対応形式: CP932, Shift_JIS, UTF-8")
@@ -0,0 +1,69 @@
+"""
+プロファイル取得結果の表示
+Business Data Processor
+
+processors/common/profiler.py の取得結果（関数ごとの時間・メモリ確保）を表示し、
+pstats ファイルのダウンロードを提供する。
+"""
+
+import streamlit as st
+
+from processors.common.profiler import ProfileResult
+
+
+# 表に表示する件数
+DISPLAY_ROWS = 30
+
+FUNCTION_COLUMNS = {
+    "function": "関数", "calls": "呼び出し回数", "primitive_calls": "呼び出し回数（再帰除く）",
+    "tottime": "自己時間（秒）", "cumtime": "累積時間（秒）",
+}
+ALLOCATION_COLUMNS = {"location": "場所", "size_mb": "サイズ（MB）", "count": "確保数"}
+
+
+def render_profile(profile: ProfileResult, expanded: bool = False, key_prefix: str = "profile") -> None:
+    """取得結果1件を表示（key_prefix: 同じ取得結果を1ページに複数表示する場合のウィジェットキー）"""
+    title = f"🔬 プロファイル: {profile.processor}（{profile.started_at:%Y/%m/%d %H:%M:%S}）"
+    with st.expander(title, expanded=expanded):
+        col1, col2 = st.columns(2)
+        col1.metric("処理時間（プロファイル取得中）", f"{profile.seconds:.2f}秒")
+        if profile.peak_memory_mb is not None:
+            col2.metric("メモリ確保のピーク（プロセス全体）", f"{profile.peak_memory_mb:,.1f}MB")
+        if profile.error:
+            st.error(f"処理はエラーで終了しました: {profile.error}")
+        if profile.concurrent_runs:
+            st.warning(
+                "取得中に他の処理が同時に実行されていました（"
+                + "、".join(profile.concurrent_runs)
+                + "）。メモリ確保の表とピークにはそれらの処理の確保も含まれます"
+            )
+
+        st.download_button(
+            label="📥 pstatsファイルをダウンロード",
+            data=profile.pstats_bytes,
+            file_name=profile.filename,
+            mime="application/octet-stream",
+            key=f"{key_prefix}_download_{profile.filename}",
+        )
+        st.caption(f"`python -m pstats {profile.filename}` や snakeviz で開けます（入力データは含みません）")
+
+        by_self, by_cumulative, allocations = st.tabs(["自己時間順", "累積時間順", "メモリ確保"])
+        with by_self:
+            st.dataframe(
+                profile.hot_functions("tottime", DISPLAY_ROWS).rename(columns=FUNCTION_COLUMNS),
+                hide_index=True,
+                use_container_width=True,
+            )
+        with by_cumulative:
+            st.dataframe(
+                profile.hot_functions("cumtime", DISPLAY_ROWS).rename(columns=FUNCTION_COLUMNS),
+                hide_index=True,
+                use_container_width=True,
+            )
+        with allocations:
+            st.caption("処理の終了時点で確保されたままのメモリ（ファイル:行ごと、プロセス全体が対象）")
+            st.dataframe(
+                profile.allocations.head(DISPLAY_ROWS).rename(columns=ALLOCATION_COLUMNS),
+                hide_index=True,
+                use_container_width=True,
+            )
@@ -3,6 +3,8 @@
 Business Data Processor
 
 全画面で使用される共通のUI構造を提供
+処理はバックグラウンドジョブ（components/background_job.py）として実行し、
+実行中も他のユーザーの画面を止めず、画面を移動して戻っても結果を表示する
 """
 
 import streamlit as st
@@ -10,6 +12,7 @@ from typing import Dict, List, Callable, Optional, Any, Union, Tuple
 from datetime import date
 from components.common_ui import display_filter_conditions, safe_csv_download, display_processing_logs
 from components.result_display import display_processing_result, display_error_result
+from components.background_job import get_job, render_job, submit_job
 
 
 class ScreenConfig:
@@ -28,7 +31,8 @@ class ScreenConfig:
         no_data_message: str = "条件に合致するデータがありませんでした。",
         title_icon: str = "",
         processing_time_message: Optional[str] = None,
-        file_types: Optional[List[str]] = None
+        file_types: Optional[List[str]] = None,
+        on_result: Optional[Callable[[Any], Any]] = None
     ):
         self.title = title
         self.subtitle = subtitle
@@ -43,6 +47,10 @@ class ScreenConfig:
         self.title_icon = title_icon
         self.processing_time_message = processing_time_message
         self.file_types = file_types or ["csv"]
+        # 画面固有の結果表示（処理結果を受け取って表示し、共通の結果表示に渡す結果を返す）
+        # process_function はワーカースレッドで実行され、その中の st.* は表示されないため、
+        # 画面固有の表示は処理結果として返してここで行う
+        self.on_result = on_result
 
 
 def render_screen(config: ScreenConfig, key_prefix: str):
@@ -114,33 +122,42 @@ def render_screen(config: ScreenConfig, key_prefix: str):
             for file in uploaded_files:
                 st.success(f"✅ {file.name}: 読み込み完了")
             
-            # 7. 処理実行ボタン
+            # 7. 処理実行ボタン（処理はジョブとして投入し、結果は下の 8. で表示）
             if st.button("処理を実行", type="primary", key=f"{key_prefix}_process"):
-                with st.spinner("処理中..."):
-                    # ファイルデータの準備
-                    if config.file_count == 1:
-                        file_data = uploaded_files[0].read()
-                    else:
-                        file_data = [f.read() for f in uploaded_files]
-                    
-                    # 処理実行
-                    if payment_deadline_values:
-                        result = config.process_function(file_data, **payment_deadline_values)
-                    else:
-                        result = config.process_function(file_data)
-                    
-                    # 8. 結果表示
-                    _display_result(result, config, key_prefix)
-                    
+                # ファイルデータの準備（getvalue は読み込み位置に関係なく全体を返す。
+                # 同じ内容のCSVは読み込み結果キャッシュにより再解析されない）
+                if config.file_count == 1:
+                    file_data = uploaded_files[0].getvalue()
+                else:
+                    file_data = [f.getvalue() for f in uploaded_files]
+                
+                submit_job(key_prefix, config.process_function, file_data, **payment_deadline_values)
+            
         except Exception as e:
             display_error_result(f"エラーが発生しました: {str(e)}")
 
     elif 0 < len(uploaded_files) < config.file_count:
         st.warning(f"{config.file_count}つのファイルをアップロードしてください。")
+    
+    # 8. ジョブの進捗・結果表示（ファイルを選び直す前・他の画面から戻った後も表示）
+    job = get_job(key_prefix)
+    if job is not None:
+        try:
+            render_job(job, lambda result: _display_result(result, config, key_prefix))
+        except Exception as e:
+            display_error_result(f"エラーが発生しました: {str(e)}")
 
 
 def _display_result(result: Any, config: ScreenConfig, key_prefix: str):
     """結果表示の共通処理"""
+    if config.on_result is not None and result is not None:
+        result = config.on_result(result)
+
+    # 処理関数が None を返した場合（入力エラー）
+    if result is None:
+        display_error_result("処理に失敗しました。入力ファイルの形式を確認してください。")
+        return
+    
     # 結果の形式に応じて処理を分岐
     if isinstance(result, tuple):
         if len(result) == 2:  # (df, filename) パターン
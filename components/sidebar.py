@@ -76,6 +76,8 @@ def _show_mirail_menu():
         st.session_state.selected_processor = "mirail_emergency_without10k"
     if st.button("緊急連絡人（10,000円を除外しないパターン）", key="mirail_emergency_with10k", use_container_width=True):
         st.session_state.selected_processor = "mirail_emergency_with10k"
+    if st.button("一括処理（全パターンZIP）", key="mirail_autocall_batch", use_container_width=True):
+        st.session_state.selected_processor = "mirail_autocall_batch"
 
     # SMS
     st.markdown('<div class="sidebar-category">📱 ミライル用SMS送信用</div>', unsafe_allow_html=True)
@@ -95,6 +97,8 @@ def _show_mirail_menu():
         st.session_state.selected_processor = "mirail_sms_contract_today"
     if st.button("当日SMS用　契約者　委託先法人→空白", key="mirail_sms_contract_today_blank", use_container_width=True):
         st.session_state.selected_processor = "mirail_sms_contract_today_blank"
+    if st.button("一括処理（ミライル・フェイス・GB　ZIP）", key="sms_batch", use_container_width=True):
+        st.session_state.selected_processor = "sms_batch"
 
     # 催告書
     st.markdown('<div class="sidebar-category">📝 ミライル用催告書 差し込みリスト</div>', unsafe_allow_html=True)
@@ -245,3 +249,10 @@ def _show_others_menu():
     st.markdown('<div class="sidebar-category">📋 ファイン履歴</div>', unsafe_allow_html=True)
     if st.button("ファイン履歴作成", key="fine_history", use_container_width=True):
         st.session_state.selected_processor = "fine_history"
+
+    # 管理
+    st.markdown('<div class="sidebar-category">📈 管理</div>', unsafe_allow_html=True)
+    if st.button("処理メトリクス", key="metrics", use_container_width=True):
+        st.session_state.selected_processor = "metrics"
+    if st.button("プロファイル取得", key="profiler", use_container_width=True):
+        st.session_state.selected_processor = "profiler"
@@ -15,15 +15,33 @@
 """
 
 import pandas as pd
-import io
+import numpy as np
 import re
-import chardet
 import unicodedata
 from datetime import datetime
 from typing import Tuple, List, Dict, Union
 import logging
 from processors.common.detailed_logger import DetailedLogger
-from .common.address_splitter import AddressSplitter
+from .common.address_splitter import get_address_splitter
+from .common.parsed_frame_cache import read_csv_cached
+from .common.progress import report_progress
+from .common.text_decoder import detect_encoding
+from .common.column_spec import (
+    ColumnSpec,
+    ConversionContext,
+    apply_unique,
+    build_template_frame,
+    computed,
+    copy_of,
+    fixed,
+    join_nonempty,
+    move_home_to_mobile,
+    normalize_phone,
+    remove_spaces,
+    source,
+    split_address_columns,
+    to_zenkaku,
+)
 
 
 class ArkConfig:
@@ -368,74 +386,22 @@ class DataLoader:
         self.logger = logging.getLogger(__name__)
 
     def detect_encoding(self, file_content: bytes) -> str:
-        """エンコーディング自動検出（文字化け解消）"""
-        # chardetで検出
-        result = chardet.detect(file_content[:10000])
-        detected_encoding = result["encoding"]
-        confidence = result.get("confidence", 0)
-
-        # エンコーディング候補リスト（優先順位）
-        encoding_candidates = [
-            "cp932",
-            "shift_jis",
-            "utf-8-sig",
-            "utf-8",
-            "iso-2022-jp",
-            "euc-jp",
-        ]
-
-        # 信頼度が低い場合は代替エンコーディングを試す
-        if confidence < 0.7:
-            for encoding in encoding_candidates:
-                try:
-                    file_content.decode(encoding)
-                    return encoding
-                except UnicodeDecodeError:
-                    continue
-
-        # よくあるエンコーディングの修正
-        if detected_encoding in ["CP932", "SHIFT_JIS", "SHIFT-JIS"]:
-            return "cp932"
-        elif detected_encoding in ["UTF-8-SIG"]:
-            return "utf-8-sig"
-        elif detected_encoding:
-            return detected_encoding
-        else:
-            return "utf-8-sig"  # UTF-8-sig優先フォールバック
+        """エンコーディング自動検出（先頭の一部のみで判定）"""
+        return detect_encoding(file_content)
 
     def load_csv_from_bytes(self, file_content: bytes) -> pd.DataFrame:
         """バイト形式CSVファイル読み込み（エンコーディング自動対応）"""
-        encoding = self.detect_encoding(file_content)
-
-        # 複数のエンコーディングで試行
-        encodings_to_try = [
-            encoding,
-            "cp932",
-            "shift_jis",
-            "utf-8-sig",
-            "utf-8",
-            "iso-2022-jp",
-            "euc-jp",
-        ]
-
-        for try_encoding in encodings_to_try:
-            try:
-                df = pd.read_csv(
-                    io.BytesIO(file_content), encoding=try_encoding, dtype=str
-                )
-                # デバッグ情報をログに出力（ファイル書き込みを削除）
-                self.logger.debug(
-                    f"CSV読み込み成功 - エンコーディング: {try_encoding}, 列数: {len(df.columns)}, 行数: {len(df)}"
-                )
-                return df
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                if try_encoding == encodings_to_try[-1]:
-                    raise ValueError(f"CSVファイルの読み込みに失敗: {str(e)}")
-                continue
-
-        raise ValueError("対応するエンコーディングが見つかりませんでした")
+        try:
+            df = read_csv_cached(file_content, dtype=str)
+        except UnicodeDecodeError:
+            raise ValueError("対応するエンコーディングが見つかりませんでした")
+        except Exception as e:
+            raise ValueError(f"CSVファイルの読み込みに失敗: {str(e)}")
+        # デバッグ情報をログに出力（ファイル書き込みを削除）
+        self.logger.debug(
+            f"CSV読み込み成功 - 列数: {len(df.columns)}, 行数: {len(df)}"
+        )
+        return df
 
     def load_ark_report_data(self, file_content: bytes) -> pd.DataFrame:
         """案件取込用レポート読み込み"""
@@ -569,10 +535,62 @@ class DuplicateChecker:
 class DataConverter:
     """データ変換クラス"""
 
+    # 名前2・名前3の列名候補（新形式, 旧形式）
+    CONTACT_COLUMNS = {
+        2: {
+            "relationship": ("種別／続柄2", "種別／続柄２"),
+            "name": ("氏名2", "名前2"),
+            "kana": ("氏名2(カナ)", "名前2（カナ）"),
+        },
+        3: {
+            "relationship": ("種別/続柄3", "種別／続柄３"),
+            "name": ("氏名3", "名前3"),
+            "kana": ("氏名3(カナ)", "名前3（カナ）"),
+        },
+    }
+
+    # 保証人・緊急連絡人の出力列（枠, 列名接頭辞, [(列名接尾辞, 項目)]）
+    CONTACT_OUTPUT_FIELDS = [
+        (
+            slot,
+            prefix,
+            [
+                ("氏名", "氏名"),
+                ("カナ", "カナ"),
+                ("契約者との関係", "続柄"),
+                ("生年月日", "生年月日"),
+                ("郵便番号", "郵便番号"),
+                ("住所1", "住所1"),
+                ("住所2", "住所2"),
+                ("住所3", "住所3"),
+                ("TEL自宅", "自宅TEL"),
+                ("TEL携帯", "携帯TEL"),
+            ],
+        )
+        for slot, prefix in [("guarantor1", "保証人１"), ("guarantor2", "保証人２")]
+    ] + [
+        (
+            slot,
+            prefix,
+            [
+                ("氏名", "氏名"),
+                ("カナ", "カナ"),
+                ("契約者との関係", "続柄"),
+                ("郵便番号", "郵便番号"),
+                ("現住所1", "住所1"),
+                ("現住所2", "住所2"),
+                ("現住所3", "住所3"),
+                ("TEL自宅", "自宅TEL"),
+                ("TEL携帯", "携帯TEL"),
+            ],
+        )
+        for slot, prefix in [("emergency1", "緊急連絡人１"), ("emergency2", "緊急連絡人２")]
+    ]
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.prefectures = ArkConfig.PREFECTURES
-        self.address_splitter = AddressSplitter()
+        self.address_splitter = get_address_splitter()
 
     def safe_str_convert(self, value) -> str:
         """安全な文字列変換"""
@@ -959,249 +977,294 @@ class DataConverter:
 
         return result
 
-    def convert_new_contracts(
-        self, new_contracts_df: pd.DataFrame, region_code: int = 1
-    ) -> pd.DataFrame:
-        """新規契約データを111列テンプレートに変換
+    def validate_birth_dates(self, dates: pd.Series, names: pd.Series) -> pd.Series:
+        """生年月日の妥当性チェック（列単位、法人契約は空にする）
 
         Args:
-            new_contracts_df: 新規契約データ
-            region_code: 地域コード（1:東京, 2:大阪, 3:北海道, 4:北関東）
-        """
-        output_data = []
+            dates: 生年月日の文字列Series
+            names: 氏名の文字列Series（法人判定用）
 
-        for _, row in new_contracts_df.iterrows():
-            converted_row = {}
+        Returns:
+            妥当な生年月日のSeries（不正・法人の行は空文字）
+        """
+        valid = apply_unique(dates, self.validate_birth_date)
+        corporate = apply_unique(names, self.is_corporate).astype(bool)
+        return valid.where(~corporate, "")
 
-            # 1. 基本情報
-            converted_row["引継番号"] = self.safe_str_convert(row.get("契約番号", ""))
-            converted_row["契約者氏名"] = self.remove_all_spaces(
-                self.safe_str_convert(row.get("契約元帳: 主契約者", ""))
-            )
-            converted_row["契約者カナ"] = self.remove_all_spaces(
-                self.hankaku_to_zenkaku(
-                    self.safe_str_convert(row.get("主契約者（カナ）", ""))
-                )
-            )
+    def calculate_exit_procedure_fees(
+        self, fees: List[pd.Series], region_code: int = 1
+    ) -> pd.Series:
+        """退去手続き費用計算（列単位、calculate_exit_procedure_fee と同じ計算）
 
-            # 生年月日の妥当性チェック（法人判定付き）
-            birth_date = self.safe_str_convert(row.get("生年月日1", ""))
-            converted_row["契約者生年月日"] = self.validate_birth_date(
-                birth_date, converted_row["契約者氏名"]
-            )
+        Args:
+            fees: [月額賃料, 管理費, 駐車場代, その他料金] の文字列Series
+            region_code: 地域コード（1:東京, 2:大阪, 3:北海道, 4:北関東）
+        """
+        min_fee = 40000 if region_code == 3 else 70000
 
-            # 2. 電話番号処理
-            phone_result = self.process_phone_numbers(
-                row.get("自宅TEL1", ""), row.get("携帯TEL1", "")
-            )
-            converted_row["契約者TEL自宅"] = phone_result["home"]
-            converted_row["契約者TEL携帯"] = phone_result["mobile"]
+        def parse_fee(value: str):
+            if not value.isdigit():
+                return 0
+            try:
+                return int(value)
+            except ValueError:
+                return None
+
+        total = np.zeros(len(fees[0]), dtype=np.int64)
+        failed = np.zeros(len(fees[0]), dtype=bool)
+        for fee in fees:
+            clean = fee.str.replace(",", "", regex=False).str.replace(
+                "￥", "", regex=False
+            ).str.strip()
+            amounts = apply_unique(clean, parse_fee).to_numpy(dtype=object)
+            unparsed = pd.isna(amounts)
+            failed |= unparsed
+            amounts[unparsed] = 0
+            total += amounts.astype(np.int64)
+
+        # 最低額〜上限100,000円（数値変換に失敗した行は最低額）
+        result = np.minimum(np.maximum(total, min_fee), 100000)
+        result[failed] = min_fee
+        return pd.Series(result, index=fees[0].index).astype(str).astype(object)
+
+    def _phone_pair(
+        self, ctx: ConversionContext, home_col: str, mobile_col: str
+    ) -> Tuple[pd.Series, pd.Series]:
+        """電話番号処理（列単位、自宅TELのみの場合は携帯TELに移動）"""
+        return ctx.cached(
+            ("phones", home_col, mobile_col),
+            lambda: move_home_to_mobile(
+                normalize_phone(ctx.text(home_col)),
+                normalize_phone(ctx.text(mobile_col)),
+            ),
+        )
 
-            # 3. 住所分割処理（契約者現住所は物件住所から取得）
-            address_parts = self.split_address(
-                self.safe_str_convert(row.get("物件住所", ""))
-            )
+    def _address_parts(self, ctx: ConversionContext, column: str) -> pd.DataFrame:
+        """住所列の分割結果（列ごとに1回だけ分割）"""
+        return ctx.cached(
+            ("address", column),
+            lambda: split_address_columns(self.address_splitter, ctx.text(column)),
+        )
 
-            # 契約者現住所
-            converted_row["契約者現住所郵便番号"] = address_parts.get("postal_code", "")
-            converted_row["契約者現住所1"] = address_parts["prefecture"]
-            converted_row["契約者現住所2"] = address_parts["city"]
+    def _contact_person(self, ctx: ConversionContext, number: int) -> Dict:
+        """名前2・名前3の人物情報（列単位）
 
-            # 契約者現住所3: 町村以下　全角スペース　物件名　全角スペース　部屋番号
-            property_name = self.safe_str_convert(row.get("物件名", ""))
-            room_number = self.safe_str_convert(row.get("部屋番号", ""))
-            address3_parts = []
-            if address_parts["remaining"]:
-                address3_parts.append(address_parts["remaining"])
-            if property_name:
-                address3_parts.append(property_name)
-            if room_number:
-                address3_parts.append(room_number)
-            converted_row["契約者現住所3"] = "　".join(
-                address3_parts
-            )  # 全角スペース結合
+        Returns:
+            {"guarantor": 保証人の行, "emergency": 緊急連絡先の行, "fields": 項目別Series}
+        """
+        columns = self.CONTACT_COLUMNS[number]
+        relationship = ctx.text(columns["relationship"])
+        name = remove_spaces(ctx.text(columns["name"]))
+        kana = remove_spaces(to_zenkaku(ctx.text(columns["kana"])))
+        home, mobile = self._phone_pair(ctx, f"自宅TEL{number}", f"携帯TEL{number}")
+        address = self._address_parts(ctx, f"自宅住所{number}")
+
+        present = (relationship != "") & (name != "")
+        guarantor = present & relationship.str.contains("保証人", regex=False)
+        emergency = (
+            present & ~guarantor & relationship.str.contains("緊急連絡先", regex=False)
+        )
 
-            # 4. 物件情報
-            clean_prop_name, room_num = self.extract_room_from_property_name(
-                property_name
-            )
-            converted_row["物件名"] = clean_prop_name
-
-            # 部屋番号（物件名から抽出、または既存の部屋番号列）
-            if room_num:
-                converted_row["部屋番号"] = self.normalize_room_number(room_num)
-            else:
-                converted_row["部屋番号"] = self.normalize_room_number(room_number)
-
-            # 物件住所（物件住所から取得）
-            property_address = self.safe_str_convert(row.get("物件住所", ""))
-            prop_addr_parts = self.split_address(property_address)
-            converted_row["物件住所郵便番号"] = prop_addr_parts.get("postal_code", "")
-            converted_row["物件住所1"] = prop_addr_parts["prefecture"]
-            converted_row["物件住所2"] = prop_addr_parts["city"]
-            converted_row["物件住所3"] = prop_addr_parts["remaining"]
-
-            # 5. 引継情報生成
-            move_in_date = self.safe_str_convert(row.get("入居日", ""))
-            converted_row["引継情報"] = self.generate_takeover_info(move_in_date)
+        fields = {
+            "氏名": name,
+            "カナ": kana,
+            "生年月日": self.validate_birth_dates(
+                ctx.text(f"生年月日{number}"), name
+            ),
+            "続柄": ctx.blank("他"),
+            "自宅TEL": home,
+            "携帯TEL": mobile,
+            "郵便番号": address["postal_code"],
+            "住所1": address["prefecture"],
+            "住所2": address["city"],
+            "住所3": address["remaining"],
+        }
+        return {"guarantor": guarantor, "emergency": emergency, "fields": fields}
+
+    def _contact_slots(self, ctx: ConversionContext) -> Dict[str, Dict[str, pd.Series]]:
+        """保証人1・2、緊急連絡人1・2への振り分け（process_guarantor_emergency と同じ規則）"""
+
+        def assign():
+            person2 = self._contact_person(ctx, 2)
+            person3 = self._contact_person(ctx, 3)
+
+            # 名前2が埋まっていれば名前3は2番目の枠へ、空いていれば1番目の枠へ
+            candidates = {
+                "guarantor1": [
+                    (person2["guarantor"], person2),
+                    (person3["guarantor"], person3),
+                ],
+                "guarantor2": [(person2["guarantor"] & person3["guarantor"], person3)],
+                "emergency1": [
+                    (person2["emergency"], person2),
+                    (person3["emergency"], person3),
+                ],
+                "emergency2": [(person2["emergency"] & person3["emergency"], person3)],
+            }
+
+            slots = {}
+            for slot, choices in candidates.items():
+                slots[slot] = {}
+                for field in person2["fields"]:
+                    value = ctx.blank("")
+                    for mask, person in reversed(choices):
+                        value = person["fields"][field].where(mask, value)
+                    slots[slot][field] = value
+            return slots
+
+        return ctx.cached("contact_slots", assign)
+
+    def build_column_specs(self, region_code: int = 1) -> Dict[str, ColumnSpec]:
+        """111列テンプレートの列定義
 
-            # 6. 金額情報
-            rent = self.safe_str_convert(row.get("賃料", "0")).replace(",", "")
-            management_fee = self.safe_str_convert(row.get("管理共益費", "0")).replace(
-                ",", ""
-            )
-            parking_fee = self.safe_str_convert(row.get("駐車場料金", "0")).replace(
-                ",", ""
+        Args:
+            region_code: 地域コード（1:東京, 2:大阪, 3:北海道, 4:北関東）
+        """
+        today = datetime.now().strftime("%Y/%m/%d")
+
+        def rent_column(column):
+            return source(column, lambda s: s.str.replace(",", "", regex=False), default="0")
+
+        def property_name_parts(ctx):
+            return ctx.cached(
+                "property_name_parts",
+                lambda: (
+                    apply_unique(
+                        ctx.text("物件名"),
+                        lambda name: self.extract_room_from_property_name(name)[0],
+                    ),
+                    apply_unique(
+                        ctx.text("物件名"),
+                        lambda name: self.extract_room_from_property_name(name)[1],
+                    ),
+                ),
             )
 
-            converted_row["月額賃料"] = rent
-            converted_row["共益費"] = management_fee  # 管理共益費を共益費欄に設定
-            converted_row["駐車場代"] = parking_fee
-            converted_row["その他費用1"] = self.safe_str_convert(
-                row.get("その他料金", "0")
-            )
-            converted_row["その他費用2"] = self.safe_str_convert(
-                row.get("決済サービス料", "0")
+        def room_number(ctx):
+            # 物件名から抽出した部屋番号を優先し、なければ部屋番号列を使用
+            room_from_name = property_name_parts(ctx)[1]
+            return apply_unique(room_from_name, self.normalize_room_number).where(
+                room_from_name != "",
+                apply_unique(ctx.text("部屋番号"), self.normalize_room_number),
             )
-            converted_row["敷金"] = self.safe_str_convert(row.get("敷金", "0"))
-            converted_row["礼金"] = self.safe_str_convert(row.get("礼金", "0"))
 
+        specs = {
+            # 1. 基本情報
+            "引継番号": source("契約番号"),
+            "契約者氏名": source("契約元帳: 主契約者", remove_spaces),
+            "契約者カナ": source("主契約者（カナ）", to_zenkaku, remove_spaces),
+            "契約者生年月日": computed(
+                lambda ctx: self.validate_birth_dates(
+                    ctx.text("生年月日1"), ctx.columns["契約者氏名"]
+                )
+            ),
+            # 2. 電話番号処理
+            "契約者TEL自宅": computed(
+                lambda ctx: self._phone_pair(ctx, "自宅TEL1", "携帯TEL1")[0]
+            ),
+            "契約者TEL携帯": computed(
+                lambda ctx: self._phone_pair(ctx, "自宅TEL1", "携帯TEL1")[1]
+            ),
+            # 3. 契約者現住所（物件住所から取得）
+            "契約者現住所郵便番号": computed(
+                lambda ctx: self._address_parts(ctx, "物件住所")["postal_code"]
+            ),
+            "契約者現住所1": computed(
+                lambda ctx: self._address_parts(ctx, "物件住所")["prefecture"]
+            ),
+            "契約者現住所2": computed(
+                lambda ctx: self._address_parts(ctx, "物件住所")["city"]
+            ),
+            # 契約者現住所3: 町村以下　全角スペース　物件名　全角スペース　部屋番号
+            "契約者現住所3": computed(
+                lambda ctx: join_nonempty(
+                    [
+                        self._address_parts(ctx, "物件住所")["remaining"],
+                        ctx.text("物件名"),
+                        ctx.text("部屋番号"),
+                    ],
+                    "　",
+                )
+            ),
+            # 4. 物件情報
+            "物件名": computed(lambda ctx: property_name_parts(ctx)[0]),
+            "部屋番号": computed(room_number),
+            "物件住所郵便番号": copy_of("契約者現住所郵便番号"),
+            "物件住所1": copy_of("契約者現住所1"),
+            "物件住所2": copy_of("契約者現住所2"),
+            "物件住所3": computed(
+                lambda ctx: self._address_parts(ctx, "物件住所")["remaining"]
+            ),
+            # 5. 引継情報
+            "引継情報": source(
+                "入居日",
+                lambda s: "●20日～25日頃に督促手数料2,750円or2,970円が加算されることあり。案内注意！！　●入居日："
+                + s,
+            ),
+            # 6. 金額情報
+            "月額賃料": rent_column("賃料"),
+            "共益費": rent_column("管理共益費"),  # 管理共益費を共益費欄に設定
+            "駐車場代": rent_column("駐車場料金"),
+            "その他費用1": source("その他料金", default="0"),
+            "その他費用2": source("決済サービス料", default="0"),
+            "敷金": source("敷金", default="0"),
+            "礼金": source("礼金", default="0"),
             # 7. 退去手続き費用計算（その他料金を含む）
-            other_fee = self.safe_str_convert(row.get("その他料金", "0"))
-            exit_fee = self.calculate_exit_procedure_fee(
-                rent, management_fee, parking_fee, other_fee, region_code
-            )
-            converted_row["退去手続き（実費）"] = str(exit_fee)
-
+            "退去手続き（実費）": computed(
+                lambda ctx: self.calculate_exit_procedure_fees(
+                    [
+                        ctx.columns["月額賃料"],
+                        ctx.columns["共益費"],
+                        ctx.columns["駐車場代"],
+                        ctx.columns["その他費用1"],
+                    ],
+                    region_code,
+                )
+            ),
             # 8. その他情報
-            converted_row["管理前滞納額"] = self.safe_str_convert(
-                row.get("未収金額合計", "0")
-            )
-            converted_row["契約者勤務先名"] = self.safe_str_convert(
-                row.get("勤務先1", "")
-            )
-            converted_row["契約者勤務先TEL"] = self.safe_str_convert(
-                row.get("勤務先TEL1", "")
-            )
-
+            "管理前滞納額": source("未収金額合計", default="0"),
+            "契約者勤務先名": source("勤務先1"),
+            "契約者勤務先TEL": source("勤務先TEL1"),
             # 9. 回収口座情報（バーチャル口座情報を含む）
-            converted_row["回収口座支店名"] = self.safe_str_convert(
-                row.get("バーチャル口座(支店)", "")
-            )
-            converted_row["回収口座番号"] = self.safe_str_convert(
-                row.get("バーチャル口座(口座番号)", "")
-            )
-            converted_row["回収口座支店CD"] = ""  # 空
-
+            "回収口座支店名": source("バーチャル口座(支店)"),
+            "回収口座番号": source("バーチャル口座(口座番号)"),
+            "回収口座支店CD": fixed(""),
             # 10. 日付情報
-            today = datetime.now().strftime("%Y/%m/%d")
-            converted_row["管理受託日"] = today
-
-            # 11. 保証人・緊急連絡人判定
-            contact_info = self.process_guarantor_emergency(row)
-
-            # 保証人１の設定
-            if contact_info["guarantor1"]:
-                g1 = contact_info["guarantor1"]
-                converted_row["保証人１氏名"] = g1.get("氏名", "")
-                converted_row["保証人１カナ"] = g1.get("カナ", "")
-                converted_row["保証人１契約者との関係"] = g1.get("続柄", "")
-                converted_row["保証人１生年月日"] = self.validate_birth_date(
-                    g1.get("生年月日", ""), g1.get("氏名", "")
-                )
-                converted_row["保証人１TEL自宅"] = g1.get("自宅TEL", "")
-                converted_row["保証人１TEL携帯"] = g1.get("携帯TEL", "")
-                converted_row["保証人１郵便番号"] = g1.get("郵便番号", "")
-                converted_row["保証人１住所1"] = g1.get("住所1", "")
-                converted_row["保証人１住所2"] = g1.get("住所2", "")
-                converted_row["保証人１住所3"] = g1.get("住所3", "")
-
-            # 緊急連絡人１の設定
-            if contact_info["emergency1"]:
-                e1 = contact_info["emergency1"]
-                converted_row["緊急連絡人１氏名"] = e1.get("氏名", "")
-                converted_row["緊急連絡人１カナ"] = e1.get("カナ", "")
-                converted_row["緊急連絡人１契約者との関係"] = e1.get("続柄", "")
-                converted_row["緊急連絡人１郵便番号"] = e1.get("郵便番号", "")
-                converted_row["緊急連絡人１現住所1"] = e1.get("住所1", "")
-                converted_row["緊急連絡人１現住所2"] = e1.get("住所2", "")
-                converted_row["緊急連絡人１現住所3"] = e1.get("住所3", "")
-                converted_row["緊急連絡人１TEL自宅"] = e1.get("自宅TEL", "")
-                converted_row["緊急連絡人１TEL携帯"] = e1.get("携帯TEL", "")
-
-            # 保証人２の設定
-            if contact_info["guarantor2"]:
-                g2 = contact_info["guarantor2"]
-                converted_row["保証人２氏名"] = g2.get("氏名", "")
-                converted_row["保証人２カナ"] = g2.get("カナ", "")
-                converted_row["保証人２契約者との関係"] = g2.get("続柄", "")
-                converted_row["保証人２生年月日"] = self.validate_birth_date(
-                    g2.get("生年月日", ""), g2.get("氏名", "")
+            "管理受託日": fixed(today),
+        }
+
+        # 11. 保証人・緊急連絡人（名前2・名前3から振り分け）
+        for slot, prefix, fields in self.CONTACT_OUTPUT_FIELDS:
+            for output_suffix, field in fields:
+                specs[f"{prefix}{output_suffix}"] = computed(
+                    lambda ctx, slot=slot, field=field: self._contact_slots(ctx)[slot][field]
                 )
-                converted_row["保証人２TEL自宅"] = g2.get("自宅TEL", "")
-                converted_row["保証人２TEL携帯"] = g2.get("携帯TEL", "")
-                converted_row["保証人２郵便番号"] = g2.get("郵便番号", "")
-                converted_row["保証人２住所1"] = g2.get("住所1", "")
-                converted_row["保証人２住所2"] = g2.get("住所2", "")
-                converted_row["保証人２住所3"] = g2.get("住所3", "")
-
-            # 緊急連絡人２の設定
-            if contact_info["emergency2"]:
-                e2 = contact_info["emergency2"]
-                converted_row["緊急連絡人２氏名"] = e2.get("氏名", "")
-                converted_row["緊急連絡人２カナ"] = e2.get("カナ", "")
-                converted_row["緊急連絡人２契約者との関係"] = e2.get("続柄", "")
-                converted_row["緊急連絡人２郵便番号"] = e2.get("郵便番号", "")
-                converted_row["緊急連絡人２現住所1"] = e2.get("住所1", "")
-                converted_row["緊急連絡人２現住所2"] = e2.get("住所2", "")
-                converted_row["緊急連絡人２現住所3"] = e2.get("住所3", "")
-                converted_row["緊急連絡人２TEL自宅"] = e2.get("自宅TEL", "")
-                converted_row["緊急連絡人２TEL携帯"] = e2.get("携帯TEL", "")
-
-            # 12. 地域別・個別設定（FIXED_VALUES処理前に実行して重複回避）
-            # 更新契約手数料を地域別に設定
-            converted_row["更新契約手数料"] = str(region_code)
-
-            # 管理会社設定（アーク元データのH列「8. 取引先」をマッピング）
-            # H列は8番目（0ベースで7番目）の列「取引先」
-            management_company = self.safe_str_convert(row.get("取引先", ""))
-            converted_row["管理会社"] = management_company
-
-            # 委託先法人ID設定（固定値"5"）- ARK・CAPCO共通仕様
-            converted_row["委託先法人ID"] = "5"
-
-            # 13. 固定値設定（重複回避で安全処理）
-            for key, value in ArkConfig.FIXED_VALUES.items():
-                # 既に設定済みのデータは上書きしない（地域別設定・個別設定を優先）
-                if key not in converted_row or converted_row[key] == "":
-                    converted_row[key] = value
-
-            output_data.append(converted_row)
-
-        # 111列の正確な順序でDataFrame構築（空列対応）
-        # 空列用の一意な仮名前を使用してから最後にリネーム
-        temp_columns = []
-        temp_data = {}
-        empty_col_counter = 1
-
-        for i, col in enumerate(ArkConfig.OUTPUT_COLUMNS):
-            if col == "":  # 空列の場合
-                temp_col_name = f"__EMPTY_COL_{empty_col_counter}__"
-                temp_columns.append(temp_col_name)
-                temp_data[temp_col_name] = [""] * len(output_data)
-                empty_col_counter += 1
-            else:
-                temp_columns.append(col)
-                temp_data[col] = [row.get(col, "") for row in output_data]
-
-        # DataFrameを一度に構築（空列対応で重複チェックを無効化）
-        final_df = pd.DataFrame(temp_data)
-
-        # 列順を正しく設定し、空列の仮名前を元の空文字列に戻す
-        final_df = final_df.reindex(columns=temp_columns)
-        final_df.columns = ArkConfig.OUTPUT_COLUMNS
-
-        return final_df
+
+        # 12. 地域別・個別設定（FIXED_VALUES より優先）
+        specs["更新契約手数料"] = fixed(str(region_code))
+        # 管理会社（アーク元データのH列「8. 取引先」をマッピング）
+        specs["管理会社"] = source("取引先")
+        # 委託先法人ID（固定値"5"）- ARK・CAPCO共通仕様
+        specs["委託先法人ID"] = fixed("5")
+
+        return specs
+
+    def convert_new_contracts(
+        self, new_contracts_df: pd.DataFrame, region_code: int = 1
+    ) -> pd.DataFrame:
+        """新規契約データを111列テンプレートに変換（列単位）
+
+        Args:
+            new_contracts_df: 新規契約データ
+            region_code: 地域コード（1:東京, 2:大阪, 3:北海道, 4:北関東）
+        """
+        # 固定値は設定済みのデータを上書きしない（地域別設定・個別設定を優先）
+        return build_template_frame(
+            new_contracts_df,
+            self.build_column_specs(region_code),
+            ArkConfig.OUTPUT_COLUMNS,
+            fixed_values=ArkConfig.FIXED_VALUES,
+        )
 
 
 def process_ark_data(
@@ -1233,6 +1296,7 @@ def process_ark_data(
         logger.info("アーク新規登録処理開始")
 
         # 1. データ読み込み
+        report_progress("ファイル読み込み", 0, 3)
         data_loader = DataLoader()
         report_df = data_loader.load_ark_report_data(report_content)
         contract_df = data_loader.load_contract_list(contract_content)
@@ -1251,6 +1315,7 @@ def process_ark_data(
                 logs.append(f"  - {warning}")
 
         # 2. 重複チェック（新規案件抽出）
+        report_progress("重複チェック", 1, 3)
         duplicate_checker = DuplicateChecker()
         new_contracts, existing_contracts, match_stats, detail_logs = (
             duplicate_checker.find_new_contracts(report_df, contract_df)
@@ -1266,6 +1331,7 @@ def process_ark_data(
             return pd.DataFrame(), logs, "no_new_contracts.csv"
 
         # 3. データ変換（111列テンプレート準拠）
+        report_progress("データ変換", 2, 3)
         data_converter = DataConverter()
         output_df = data_converter.convert_new_contracts(new_contracts, region_code)
 
@@ -17,10 +17,14 @@ DetailedLoggerと統合し、フィルタリングロジックを一箇所に集
     }
     
     df_filtered, logs = apply_filters(df_input, filter_config)
+
+    # 単一パスモード（全フィルタをマスクとして評価し、最後に1回だけ抽出）
+    df_filtered, logs = apply_filters(df_input, filter_config, single_pass=True)
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterable, List, Tuple, Any, Optional
 from datetime import datetime
 import sys
 import os
@@ -32,23 +36,33 @@ if processors_dir not in sys.path:
 
 from common.detailed_logger import DetailedLogger
 from common.contract_list_columns import ContractListColumns as COL
+from processors.common.metrics import instrument_phase
 
 
 class FilterEngine:
     """共通フィルタリングエンジン"""
     
     @staticmethod
-    def apply_filters(df: pd.DataFrame, filter_config: Dict[str, Dict[str, Any]]) -> Tuple[pd.DataFrame, List[str]]:
+    @instrument_phase("filter")
+    def apply_filters(
+        df: pd.DataFrame,
+        filter_config: Dict[str, Dict[str, Any]],
+        single_pass: bool = False
+    ) -> Tuple[pd.DataFrame, List[str]]:
         """
         設定に基づいてフィルタリングを実行
         
         Args:
             df: 入力DataFrame
             filter_config: フィルタ設定の辞書
+            single_pass: Trueの場合、全フィルタをマスクとして評価し1回だけ抽出する
             
         Returns:
             tuple: (フィルタリング済みDataFrame, ログリスト)
         """
+        if single_pass:
+            return FilterEngine.apply_filters_single_pass(df, filter_config)
+
         df = df.copy()
         logs = []
         
@@ -84,6 +98,363 @@ class FilterEngine:
         
         return df, logs
     
+    # フィルタ名 → マスク評価関数名
+    MASK_BUILDERS = {
+        "trustee_id": "_mask_trustee_id",
+        "payment_date": "_mask_payment_date",
+        "collection_rank": "_mask_collection_rank",
+        "arrears": "_mask_arrears",
+        "special_debt": "_mask_special_debt",
+        "mobile_phone": "_mask_mobile_phone",
+        "payment_amount": "_mask_payment_amount",
+    }
+
+    @staticmethod
+    def build_masks(
+        df: pd.DataFrame,
+        filter_config: Dict[str, Dict[str, Any]],
+        converted: Optional[Dict[int, pd.Series]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        各フィルタを元のDataFrame全体に対するマスクとして評価
+
+        フィルタ同士は互いに独立して評価されるため、同じ入力に対する
+        複数の設定間でマスクを共有できる。
+
+        Args:
+            df: 入力DataFrame（変更しない）
+            filter_config: フィルタ設定の辞書
+            converted: 変換済み列（列番号 → Series）。評価中の変換結果も追記される
+
+        Returns:
+            list: フィルタごとの評価結果
+                {"name", "config", "mask"（np.ndarray）, "converted_columns"}
+        """
+        if converted is None:
+            converted = {}
+
+        results = []
+        for filter_name, config in filter_config.items():
+            builder_name = FilterEngine.MASK_BUILDERS.get(filter_name)
+            if builder_name is None:
+                continue
+            builder = getattr(FilterEngine, builder_name)
+            mask, new_columns = builder(df, config, converted)
+            converted.update(new_columns)
+            results.append({
+                "name": filter_name,
+                "config": config,
+                "mask": mask,
+                "converted_columns": new_columns,
+            })
+        return results
+
+    @staticmethod
+    def apply_filters_single_pass(
+        df: pd.DataFrame,
+        filter_config: Dict[str, Dict[str, Any]],
+        mask_results: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        単一パスでフィルタリングを実行
+
+        全フィルタを元のDataFrameに対するマスクとして評価してANDで合成し、
+        最後に1回だけ対象行を抽出する。各段階の件数と除外詳細ログは
+        「前段までのマスク AND 当該フィルタの否定」から算出するため、
+        apply_filters（逐次モード）と同じログになる。
+
+        Args:
+            df: 入力DataFrame（変更しない）
+            filter_config: フィルタ設定の辞書
+            mask_results: build_masks の評価結果（事前計算済みのマスクを再利用する場合）
+
+        Returns:
+            tuple: (フィルタリング済みDataFrame, ログリスト)
+        """
+        if mask_results is None:
+            mask_results = FilterEngine.build_masks(df, filter_config)
+
+        logs = []
+        logs.append(DetailedLogger.log_initial_load(len(df)))
+
+        alive = np.ones(len(df), dtype=bool)
+        converted = {}
+        for result in mask_results:
+            mask = result["mask"]
+            converted.update(result["converted_columns"])
+            before_count = int(alive.sum())
+            excluded = alive & ~mask
+            logs.extend(FilterEngine._stage_logs(df, result, converted, excluded, before_count))
+            alive &= mask
+            logs.append(FilterEngine._stage_result_log(result, before_count, int(alive.sum())))
+
+        # 対象行を1回だけ抽出し、変換済みの列を書き戻す
+        positions = np.flatnonzero(alive)
+        df_filtered = df.iloc[positions].copy()
+        for column_idx, series in converted.items():
+            df_filtered.iloc[:, column_idx] = series.iloc[positions].array
+
+        logs.append(DetailedLogger.log_final_result(len(df_filtered)))
+
+        return df_filtered, logs
+
+    @staticmethod
+    def apply_filters_chunked(
+        chunks: Iterable[pd.DataFrame],
+        filter_config: Dict[str, Dict[str, Any]]
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        チャンク単位でフィルタリングを実行（ストリーミング読み込み用）
+
+        チャンクごとにマスクを評価して対象行だけを残すため、メモリに保持するのは
+        対象行と除外詳細ログ用の列の値だけになる。各段階の件数と除外値は
+        チャンク間で合算してからログを作成するため、全行を連結して
+        apply_filters_single_pass を実行した場合と同じ結果・ログになる。
+
+        Args:
+            chunks: 入力DataFrameのチャンク（インデックスは通し番号であること）
+            filter_config: フィルタ設定の辞書
+
+        Returns:
+            tuple: (フィルタリング済みDataFrame, ログリスト)
+        """
+        total_count = 0
+        stages = None
+        kept = []
+        empty_result = None
+
+        for chunk in chunks:
+            total_count += len(chunk)
+            mask_results = FilterEngine.build_masks(chunk, filter_config)
+            if stages is None:
+                stages = [
+                    {
+                        "result": {"name": result["name"], "config": result["config"]},
+                        "before": 0, "after": 0, "excluded": {},
+                    }
+                    for result in mask_results
+                ]
+
+            alive = np.ones(len(chunk), dtype=bool)
+            converted = {}
+            for stage, result in zip(stages, mask_results):
+                converted.update(result["converted_columns"])
+                stage["before"] += int(alive.sum())
+                excluded = alive & ~result["mask"]
+                if excluded.any():
+                    for column_idx in FilterEngine._log_columns(result):
+                        column = FilterEngine._current_column(chunk, column_idx, converted)
+                        stage["excluded"].setdefault(column_idx, []).append(column[excluded])
+                alive &= result["mask"]
+                stage["after"] += int(alive.sum())
+
+            positions = np.flatnonzero(alive)
+            if len(positions) == 0 and (kept or empty_result is not None):
+                continue
+            chunk_filtered = chunk.iloc[positions].copy()
+            for column_idx, series in converted.items():
+                chunk_filtered.iloc[:, column_idx] = series.iloc[positions].array
+            if len(positions) == 0:
+                empty_result = chunk_filtered
+            else:
+                kept.append(chunk_filtered)
+
+        logs = [DetailedLogger.log_initial_load(total_count)]
+        for stage in stages or []:
+            excluded_columns = {
+                column_idx: pd.concat(values) for column_idx, values in stage["excluded"].items()
+            }
+            if excluded_columns:
+                excluded_count = len(next(iter(excluded_columns.values())))
+                logs.extend(FilterEngine._stage_logs(
+                    None, stage["result"], excluded_columns,
+                    np.ones(excluded_count, dtype=bool), stage["before"]
+                ))
+            logs.append(FilterEngine._stage_result_log(stage["result"], stage["before"], stage["after"]))
+
+        if kept:
+            df_filtered = pd.concat(kept) if len(kept) > 1 else kept[0]
+        else:
+            df_filtered = empty_result if empty_result is not None else pd.DataFrame()
+
+        logs.append(DetailedLogger.log_final_result(len(df_filtered)))
+
+        return df_filtered, logs
+
+    @staticmethod
+    def _log_columns(result: Dict[str, Any]) -> List[int]:
+        """除外詳細ログに使う列番号"""
+        config = result["config"]
+        if result["name"] == "special_debt":
+            return [config["client_cd_column"], config["debt_column"]]
+        return [config["column"]]
+
+    @staticmethod
+    def _current_column(df: pd.DataFrame, column_idx: int, converted: Dict[int, pd.Series]) -> pd.Series:
+        """変換済みの列があればそれを、なければ元の列を返す"""
+        if column_idx in converted:
+            return converted[column_idx]
+        return df.iloc[:, column_idx]
+
+    @staticmethod
+    def _stage_logs(
+        df: pd.DataFrame,
+        result: Dict[str, Any],
+        converted: Dict[int, pd.Series],
+        excluded: np.ndarray,
+        before_count: int
+    ) -> List[str]:
+        """単一パスモードの除外詳細ログ（逐次モードと同一フォーマット）"""
+        if not excluded.any():
+            return []
+
+        name = result["name"]
+        config = result["config"]
+
+        if name == "special_debt":
+            client_cd = FilterEngine._current_column(df, config["client_cd_column"], converted)
+            debt = FilterEngine._current_column(df, config["debt_column"], converted)
+            special_debt_data = pd.DataFrame({
+                'クライアントCD': client_cd.to_numpy()[excluded],
+                '滞納残債': debt.to_numpy()[excluded],
+            })
+            special_debt_counts = special_debt_data.groupby(['クライアントCD', '滞納残債']).size().to_dict()
+            special_debt_str = {f"CD={int(k[0])}, {int(k[1])}円": v for k, v in special_debt_counts.items()}
+            return [f"{config.get('label', 'ミライル特殊残債')}除外詳細: {special_debt_str}"]
+
+        column_idx = config["column"]
+        column = FilterEngine._current_column(df, column_idx, converted)
+        excluded_data = column[excluded].to_frame()
+
+        if name == "trustee_id":
+            detail_log = DetailedLogger.log_exclusion_details(
+                excluded_data, 0, config.get("label", "委託先法人ID"),
+                config.get("log_type", "id")
+            )
+        elif name == "payment_date":
+            detail_log = DetailedLogger.log_exclusion_details(
+                excluded_data, 0, config.get("label", "入金予定日"),
+                "date", top_n=config.get("top_n", 3)
+            )
+        elif name == "collection_rank":
+            detail_log = DetailedLogger.log_exclusion_details(
+                excluded_data, 0, config.get("label", "回収ランク"), "category"
+            )
+        elif name == "mobile_phone":
+            detail_log = DetailedLogger.log_exclusion_details(
+                excluded_data, 0, config.get("label", "携帯電話"), "phone"
+            )
+        elif name == "payment_amount":
+            detail_log = DetailedLogger.log_exclusion_details(
+                excluded_data, 0, config.get("label", "除外金額"), "amount"
+            )
+        else:  # arrears
+            detail_log = DetailedLogger.log_exclusion_details(
+                excluded_data, 0, config.get("label", "滞納残債"), "amount"
+            )
+
+        return [detail_log] if detail_log else []
+
+    @staticmethod
+    def _stage_result_log(result: Dict[str, Any], before_count: int, after_count: int) -> str:
+        """単一パスモードのフィルタ結果ログ（逐次モードと同一フォーマット）"""
+        name = result["name"]
+        config = result["config"]
+
+        if name == "trustee_id":
+            allowed_values = config.get("values", ["", "5"])
+            label = config.get("label", "委託先法人ID") + f"（{','.join(allowed_values)}）"
+        elif name == "payment_date":
+            label = config.get("label", "入金予定日")
+        elif name == "collection_rank":
+            label = config.get("label", "回収ランク")
+        elif name == "special_debt":
+            label = config.get("label", "特殊残債")
+        elif name == "mobile_phone":
+            label = config.get("label", "携帯電話")
+        elif name == "payment_amount":
+            label = config.get("label", "入金予定金額")
+        else:  # arrears
+            label = config.get("label", "滞納残債") + f"（{config.get('min_amount', 1)}円以上）"
+
+        return DetailedLogger.log_filter_result(before_count, after_count, label)
+
+    @staticmethod
+    def _mask_trustee_id(df: pd.DataFrame, config: Dict[str, Any], converted: Dict[int, pd.Series]):
+        """委託先法人IDマスク"""
+        column = FilterEngine._current_column(df, config["column"], converted)
+        allowed_values = config.get("values", ["", "5"])
+        mask = column.isna() | column.astype(str).str.strip().isin(allowed_values)
+        return mask.to_numpy(dtype=bool), {}
+
+    @staticmethod
+    def _mask_payment_date(df: pd.DataFrame, config: Dict[str, Any], converted: Dict[int, pd.Series]):
+        """入金予定日マスク"""
+        column_idx = config["column"]
+        dates = pd.to_datetime(FilterEngine._current_column(df, column_idx, converted), errors='coerce')
+
+        if config.get("type") == "before_today":
+            reference_date = pd.Timestamp.now().normalize()
+            mask = dates.isna() | (dates < reference_date)
+        elif config.get("type") == "today_included":
+            reference_date = pd.Timestamp.now().normalize()
+            mask = dates.isna() | (dates <= reference_date)
+        else:
+            reference_date = pd.Timestamp(config.get("reference_date", datetime.now())).normalize()
+            mask = dates.isna() | (dates < reference_date)
+        return mask.to_numpy(dtype=bool), {column_idx: dates}
+
+    @staticmethod
+    def _mask_collection_rank(df: pd.DataFrame, config: Dict[str, Any], converted: Dict[int, pd.Series]):
+        """回収ランクマスク"""
+        column = FilterEngine._current_column(df, config["column"], converted)
+        mask = ~column.isin(config.get("exclude", ["弁護士介入"]))
+        return mask.to_numpy(dtype=bool), {}
+
+    @staticmethod
+    def _mask_special_debt(df: pd.DataFrame, config: Dict[str, Any], converted: Dict[int, pd.Series]):
+        """特殊残債マスク（ミライル用）"""
+        client_cd_idx = config["client_cd_column"]
+        debt_idx = config["debt_column"]
+        conditions = config.get("conditions", {})
+
+        client_cd = pd.to_numeric(FilterEngine._current_column(df, client_cd_idx, converted), errors="coerce")
+        debt = pd.to_numeric(
+            FilterEngine._current_column(df, debt_idx, converted).astype(str).str.replace(',', ''),
+            errors='coerce'
+        )
+        exclude_condition = (
+            client_cd.isin(conditions.get("client_cds", [1, 4])) &
+            debt.isin(conditions.get("debt_amounts", [10000, 11000]))
+        )
+        return (~exclude_condition).to_numpy(dtype=bool), {client_cd_idx: client_cd, debt_idx: debt}
+
+    @staticmethod
+    def _mask_mobile_phone(df: pd.DataFrame, config: Dict[str, Any], converted: Dict[int, pd.Series]):
+        """携帯電話番号マスク"""
+        column = FilterEngine._current_column(df, config["column"], converted)
+        mask = column.notna() & (~column.astype(str).str.strip().isin(["", "nan", "NaN"]))
+        return mask.to_numpy(dtype=bool), {}
+
+    @staticmethod
+    def _mask_payment_amount(df: pd.DataFrame, config: Dict[str, Any], converted: Dict[int, pd.Series]):
+        """入金予定金額マスク"""
+        column_idx = config["column"]
+        amounts = pd.to_numeric(FilterEngine._current_column(df, column_idx, converted), errors='coerce')
+        mask = amounts.isna() | ~amounts.isin(config.get("exclude", [2, 3, 5, 12]))
+        return mask.to_numpy(dtype=bool), {column_idx: amounts}
+
+    @staticmethod
+    def _mask_arrears(df: pd.DataFrame, config: Dict[str, Any], converted: Dict[int, pd.Series]):
+        """滞納残債マスク（1円以上のみ対象）"""
+        column_idx = config["column"]
+        amounts = pd.to_numeric(
+            FilterEngine._current_column(df, column_idx, converted).astype(str).str.replace(',', ''),
+            errors='coerce'
+        )
+        mask = amounts >= config.get("min_amount", 1)
+        return mask.to_numpy(dtype=bool), {column_idx: amounts}
+
     @staticmethod
     def _filter_trustee_id(df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[pd.DataFrame, List[str]]:
         """委託先法人IDフィルタ"""
@@ -308,6 +679,10 @@ class FilterEngine:
 
 
 # エクスポート用の便利関数
-def apply_filters(df: pd.DataFrame, filter_config: Dict[str, Dict[str, Any]]) -> Tuple[pd.DataFrame, List[str]]:
+def apply_filters(
+    df: pd.DataFrame,
+    filter_config: Dict[str, Dict[str, Any]],
+    single_pass: bool = False
+) -> Tuple[pd.DataFrame, List[str]]:
     """フィルタリングを実行する便利関数"""
-    return FilterEngine.apply_filters(df, filter_config)
\ No newline at end of file
+    return FilterEngine.apply_filters(df, filter_config, single_pass=single_pass)
\ No newline at end of file
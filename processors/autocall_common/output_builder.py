@@ -0,0 +1,119 @@
+"""
+オートコール出力データ作成エンジン
+
+28列統一フォーマット（AUTOCALL_OUTPUT_COLUMNS）の出力DataFrameを
+列単位の一括処理で作成する。行ごとの iterrows / df.at 書き込みを行わないため、
+数万件規模のContractListでも高速に出力を作成できる。
+
+マッピングの入力列は列名（str）または列番号（int, 0ベース）で指定する。
+- 列名指定: 入力に列が存在しない場合は空文字
+- 列番号指定: ContractListColumns の定数をそのまま使用可能
+
+使用例:
+    from processors.autocall_common.output_builder import build_autocall_output
+
+    mapping_rules = {
+        "電話番号": "TEL携帯",
+        "架電番号": "TEL携帯",
+        "管理番号": "管理番号",
+    }
+    df_output = build_autocall_output(
+        df_filtered, mapping_rules, client_label_prefix="フェイス"
+    )
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Union
+
+from processors.autocall_common import AUTOCALL_OUTPUT_COLUMNS
+from processors.common.metrics import instrument_phase
+
+
+ColumnRef = Union[str, int]
+
+
+def _get_source_column(df: pd.DataFrame, source: ColumnRef) -> Optional[pd.Series]:
+    """マッピング元の列を取得（列名指定で列が存在しない場合はNone）"""
+    if isinstance(source, str):
+        if source not in df.columns:
+            return None
+        return df[source]
+    return df.iloc[:, source]
+
+
+def to_output_strings(series: pd.Series) -> np.ndarray:
+    """
+    列を出力用の文字列配列に変換
+
+    str(value) と同じ表記で変換し、NaN/None は空文字にする。
+
+    Args:
+        series: 変換元の列
+
+    Returns:
+        np.ndarray: object型の文字列配列
+    """
+    values = series.to_numpy(dtype=object)
+    result = np.full(len(values), "", dtype=object)
+    mask = pd.notna(values)
+    if mask.any():
+        result[mask] = [str(v) for v in values[mask]]
+    return result
+
+
+def build_client_labels(series: pd.Series, prefix: str) -> np.ndarray:
+    """
+    クライアント表示名を一括作成（例: 委託先法人ID=1 → "フェイス1"）
+
+    Args:
+        series: 委託先法人IDの列（数値または数値文字列）
+        prefix: 表示名の接頭辞
+
+    Returns:
+        np.ndarray: object型の文字列配列（IDが空の行は空文字）
+    """
+    ids = pd.to_numeric(series, errors="coerce")
+    result = np.full(len(ids), "", dtype=object)
+    mask = ids.notna().to_numpy()
+    if mask.any():
+        int_ids = ids.to_numpy()[mask].astype(np.int64)
+        result[mask] = [f"{prefix}{i}" for i in int_ids]
+    return result
+
+
+@instrument_phase("convert")
+def build_autocall_output(
+    df_filtered: pd.DataFrame,
+    mapping_rules: Dict[str, ColumnRef],
+    client_label_prefix: Optional[str] = None,
+    client_id_column: ColumnRef = "委託先法人ID"
+) -> pd.DataFrame:
+    """
+    28列統一フォーマットの出力DataFrameを列単位で作成
+
+    Args:
+        df_filtered: フィルタリング済みDataFrame
+        mapping_rules: 出力列名 → 入力列（列名または列番号）のマッピング
+        client_label_prefix: 指定時は「クライアント」列を接頭辞+委託先法人IDで作成
+        client_id_column: クライアント表示名に使う委託先法人IDの列
+
+    Returns:
+        pd.DataFrame: 28列統一フォーマットのDataFrame（未設定列は空文字）
+    """
+    row_count = len(df_filtered)
+    columns = {col: np.full(row_count, "", dtype=object) for col in AUTOCALL_OUTPUT_COLUMNS}
+
+    for output_col, source in mapping_rules.items():
+        if output_col not in columns:
+            continue
+        series = _get_source_column(df_filtered, source)
+        if series is not None:
+            columns[output_col] = to_output_strings(series)
+
+    if client_label_prefix is not None:
+        series = _get_source_column(df_filtered, client_id_column)
+        if series is not None:
+            columns["クライアント"] = build_client_labels(series, client_label_prefix)
+
+    return pd.DataFrame(columns, index=range(row_count), columns=AUTOCALL_OUTPUT_COLUMNS)
@@ -14,13 +14,14 @@
 """
 
 import pandas as pd
-import chardet
-from datetime import datetime
+from datetime import date, datetime
 import logging
 from typing import Tuple, Optional, Dict, List
-import io
 import unicodedata
+from processors.common.debt_snapshot import DebtSnapshotStore, record_snapshot
 from processors.common.detailed_logger import DetailedLogger
+from processors.common import text_decoder
+from processors.common.parsed_frame_cache import read_csv_cached
 
 # ロギング設定
 logging.basicConfig(level=logging.INFO)
@@ -53,6 +54,9 @@ CONTRACT_USECOLS = [
 # 出力ヘッダー（絶対に変更しない）
 OUTPUT_HEADERS = ["管理番号", "管理前滞納額"]
 
+# 残債スナップショットの識別名
+SNAPSHOT_SOURCE = "capco"
+
 
 def clean_amount(x) -> Optional[str]:
     """
@@ -90,23 +94,8 @@ def clean_amount(x) -> Optional[str]:
 
 
 def detect_encoding(file_content: bytes) -> str:
-    """ファイルのエンコーディングを自動検出する（先頭10KBのみサンプリング）"""
-    # 大きなファイルの場合、先頭10KBのみをサンプリングしてエンコーディングを検出
-    sample = file_content[:10000] if len(file_content) > 10000 else file_content
-    detection = chardet.detect(sample)
-    encoding = detection["encoding"]
-
-    # 信頼度が低い場合は一般的なエンコーディングを試す
-    if detection["confidence"] < 0.7:
-        encodings = ["cp932", "shift_jis", "utf-8-sig", "utf-8"]
-        for enc in encodings:
-            try:
-                sample.decode(enc)
-                return enc
-            except Exception:
-                continue
-
-    return encoding or "utf-8"
+    """ファイルのエンコーディングを自動検出する（先頭の一部のみで判定）"""
+    return text_decoder.detect_encoding(file_content)
 
 
 def read_csv_with_encoding(
@@ -114,18 +103,15 @@ def read_csv_with_encoding(
 ) -> pd.DataFrame:
     """エンコーディングを自動判定してCSVを読み込む"""
     try:
-        encoding = detect_encoding(file_content)
-        logger.info(f"ファイル {file_name} のエンコーディング: {encoding}")
-
-        # バイトデータをデコードしてテキストとして読み込む
-        text_data = file_content.decode(encoding)
+        # 同じファイル・同じ列指定の2回目以降は読み込み結果キャッシュを使用
+        logger.info(f"ファイル {file_name} の読み込み")
 
         # usecolsパラメータがある場合は必要な列のみ読み込み（dtype=strで先頭ゼロを保持）
         if usecols is not None:
-            df = pd.read_csv(io.StringIO(text_data), usecols=usecols, dtype=str)
+            df = read_csv_cached(file_content, usecols=usecols, dtype=str)
             logger.info(f"メモリ最適化: {len(usecols)} 列のみ読み込み（全列数は不明）")
         else:
-            df = pd.read_csv(io.StringIO(text_data), dtype=str)
+            df = read_csv_cached(file_content, dtype=str)
             logger.info(f"全列読み込み: {len(df.columns)} 列")
 
         return df
@@ -435,8 +421,31 @@ def create_output_dataframe(changed_df: pd.DataFrame) -> pd.DataFrame:
         raise
 
 
+def _record_arrear_snapshot(
+    snapshot_store: Optional[DebtSnapshotStore],
+    arrear_data: pd.DataFrame,
+    snapshot_date: Optional[date],
+    logs: List[str],
+) -> None:
+    """当日の滞納データを残債スナップショットとして保存（出力データの作成後に呼ぶ）"""
+    if snapshot_store is not None:
+        logs.extend(
+            record_snapshot(
+                snapshot_store,
+                SNAPSHOT_SOURCE,
+                arrear_data["契約No"],
+                arrear_data["滞納額合計"].map(clean_amount),
+                snapshot_date,
+            )
+        )
+
+
 def process_capco_debt_update(
-    arrear_file_content: bytes, contract_file_content: bytes, progress_callback=None
+    arrear_file_content: bytes,
+    contract_file_content: bytes,
+    progress_callback=None,
+    snapshot_store: Optional[DebtSnapshotStore] = None,
+    snapshot_date: Optional[date] = None,
 ) -> Tuple[pd.DataFrame, str, Dict[str, any], List[str]]:
     """
     カプコ残債更新処理のメイン関数
@@ -445,6 +454,9 @@ def process_capco_debt_update(
         arrear_file_content: csv_arrear_*.csv のファイル内容
         contract_file_content: ContractList_*.csv のファイル内容
         progress_callback: 進捗を更新するコールバック関数
+        snapshot_store: 残債スナップショットの保存先
+            （指定時は出力データの作成後に契約No→滞納額合計を保存し、前回分との差分をログに出力）
+        snapshot_date: スナップショットの日付（csv_arrear_*.csv の日付。省略時は今日）
 
     Returns:
         処理結果のDataFrame、出力ファイル名、処理統計情報、ログリストのタプル
@@ -453,6 +465,9 @@ def process_capco_debt_update(
         # 統計情報を保存する辞書
         stats = {}
         logs = []
+        if snapshot_store is not None:
+            # 日付の誤り（今日より後）は読み込み前に止める
+            snapshot_date = snapshot_store.resolve_date(snapshot_date)
 
         # Step 1: ファイルを読み込む（メモリ最適化：必要な列のみ）
         logger.info("=== Step 1: ファイル読み込み開始 ===")
@@ -535,6 +550,7 @@ def process_capco_debt_update(
             empty_df = pd.DataFrame(columns=OUTPUT_HEADERS)
             timestamp = datetime.now().strftime("%m%d")
             output_filename = f"{timestamp}カプコ残債の更新.csv"
+            _record_arrear_snapshot(snapshot_store, arrear_data, snapshot_date, logs)
             return empty_df, output_filename, stats, logs
 
         # Step 3: データマッチング
@@ -594,6 +610,7 @@ def process_capco_debt_update(
             empty_df = pd.DataFrame(columns=OUTPUT_HEADERS)
             timestamp = datetime.now().strftime("%m%d")
             output_filename = f"{timestamp}カプコ残債の更新.csv"
+            _record_arrear_snapshot(snapshot_store, arrear_data, snapshot_date, logs)
             return empty_df, output_filename, stats, logs
 
         # Step 5: 最終出力データ作成
@@ -603,13 +620,15 @@ def process_capco_debt_update(
         result_df = create_output_dataframe(changed_df)
         stats["output_count"] = len(result_df)
 
-        # 最終結果ログ
-        logs.append(DetailedLogger.log_final_result(stats["output_count"]))
-
         # 出力ファイル名の生成
         timestamp = datetime.now().strftime("%m%d")
         output_filename = f"{timestamp}カプコ残債の更新.csv"
 
+        _record_arrear_snapshot(snapshot_store, arrear_data, snapshot_date, logs)
+
+        # 最終結果ログ
+        logs.append(DetailedLogger.log_final_result(stats["output_count"]))
+
         logger.info("=== 処理完了 ===")
         logger.info(f"出力ファイル名: {output_filename}")
 
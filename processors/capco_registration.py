@@ -15,14 +15,30 @@
 """
 
 import pandas as pd
-import io
 import re
-import chardet
 from datetime import datetime
 from typing import Tuple, List, Dict
 import logging
 from processors.common.detailed_logger import DetailedLogger
-from processors.common.address_splitter import AddressSplitter
+from processors.common.address_splitter import get_address_splitter
+from processors.common.parsed_frame_cache import read_csv_cached
+from processors.common.progress import report_progress
+from processors.common.text_decoder import detect_encoding
+from processors.common.column_spec import (
+    ColumnSpec,
+    ConversionContext,
+    apply_unique,
+    build_template_frame,
+    computed,
+    copy_of,
+    fixed,
+    join_nonempty,
+    map_unique,
+    move_home_to_mobile,
+    remove_spaces,
+    source,
+    split_address_columns,
+)
 
 
 class CapcoConfig:
@@ -255,70 +271,18 @@ class DataLoader:
         self.logger = logging.getLogger(__name__)
 
     def detect_encoding(self, file_content: bytes) -> str:
-        """エンコーディング自動検出（文字化け解消）"""
-        # chardetで検出
-        result = chardet.detect(file_content[:10000])
-        detected_encoding = result["encoding"]
-        confidence = result.get("confidence", 0)
-
-        # エンコーディング候補リスト（優先順位）
-        encoding_candidates = [
-            "cp932",
-            "shift_jis",
-            "utf-8-sig",
-            "utf-8",
-            "iso-2022-jp",
-            "euc-jp",
-        ]
-
-        # 信頼度が低い場合は代替エンコーディングを試す
-        if confidence < 0.7:
-            for encoding in encoding_candidates:
-                try:
-                    file_content.decode(encoding)
-                    return encoding
-                except UnicodeDecodeError:
-                    continue
-
-        # よくあるエンコーディングの修正
-        if detected_encoding in ["CP932", "SHIFT_JIS", "SHIFT-JIS"]:
-            return "cp932"
-        elif detected_encoding in ["UTF-8-SIG"]:
-            return "utf-8-sig"
-        elif detected_encoding:
-            return detected_encoding
-        else:
-            return "cp932"  # フォールバック
+        """エンコーディング自動検出（先頭の一部のみで判定）"""
+        return detect_encoding(file_content)
 
     def load_csv_from_bytes(self, file_content: bytes) -> pd.DataFrame:
         """バイト形式CSVファイル読み込み（エンコーディング自動対応）"""
-        encoding = self.detect_encoding(file_content)
-
-        # 複数のエンコーディングで試行
-        encodings_to_try = [
-            encoding,
-            "cp932",
-            "shift_jis",
-            "utf-8-sig",
-            "utf-8",
-            "iso-2022-jp",
-            "euc-jp",
-        ]
-
-        for try_encoding in encodings_to_try:
-            try:
-                df = pd.read_csv(
-                    io.BytesIO(file_content), encoding=try_encoding, dtype=str
-                )
-                return df
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                if try_encoding == encodings_to_try[-1]:
-                    raise ValueError(f"CSVファイルの読み込みに失敗: {str(e)}")
-                continue
-
-        raise ValueError("対応するエンコーディングが見つかりませんでした")
+        try:
+            df = read_csv_cached(file_content, dtype=str)
+        except UnicodeDecodeError:
+            raise ValueError("対応するエンコーディングが見つかりませんでした")
+        except Exception as e:
+            raise ValueError(f"CSVファイルの読み込みに失敗: {str(e)}")
+        return df
 
     def load_capco_data(self, file_content: bytes) -> pd.DataFrame:
         """カプコ元データ読み込み"""
@@ -409,9 +373,15 @@ class DuplicateChecker:
 class DataConverter:
     """データ変換クラス"""
 
+    # ひらがな→カタカナ変換表
+    HIRAGANA_TO_KATAKANA = str.maketrans(
+        "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをんがぎぐげござじずぜぞだぢづでどばびぶべぼぱぴぷぺぽぁぃぅぇぉゃゅょっ",
+        "アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲンガギグゲゴザジズゼゾダヂヅデドバビブベボパピプペポァィゥェォャュョッ",
+    )
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.address_splitter = AddressSplitter()
+        self.address_splitter = get_address_splitter()
 
     def convert_name(self, name: str) -> str:
         """氏名変換：スペース削除"""
@@ -427,11 +397,7 @@ class DataConverter:
         kana_str = str(kana).strip()
 
         # ひらがな→カタカナ変換
-        hiragana = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをんがぎぐげござじずぜぞだぢづでどばびぶべぼぱぴぷぺぽぁぃぅぇぉゃゅょっ"
-        katakana = "アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲンガギグゲゴザジズゼゾダヂヅデドバビブベボパピプペポァィゥェォャュョッ"
-
-        kana_map = str.maketrans(hiragana, katakana)
-        katakana_result = kana_str.translate(kana_map)
+        katakana_result = kana_str.translate(self.HIRAGANA_TO_KATAKANA)
 
         # スペース削除
         return katakana_result.replace(" ", "").replace("　", "")
@@ -561,118 +527,107 @@ class DataConverter:
 
         return ""
 
-    def convert_new_contracts(self, new_contracts_df: pd.DataFrame) -> pd.DataFrame:
-        """新規契約データを111列テンプレートに変換"""
-        output_data = []
+    def _phone_pair(self, ctx: ConversionContext) -> Tuple[pd.Series, pd.Series]:
+        """電話番号処理（列単位）：携帯優先ロジック + 混入文字除去"""
 
-        for _, row in new_contracts_df.iterrows():
-            converted_row = {}
+        def build():
+            home = apply_unique(ctx.text("契約者：電話番号"), self.extract_clean_phone_number)
+            mobile = apply_unique(ctx.text("契約者：携帯番号"), self.extract_clean_phone_number)
+            return move_home_to_mobile(home, mobile)
 
-            # 1. 基本情報
-            converted_row["引継番号"] = str(row.get("契約No", "")).strip()
-            converted_row["契約者氏名"] = self.convert_name(row.get("契約者名", ""))
-            converted_row["契約者カナ"] = self.convert_kana(
-                row.get("契約者ふりがな", "")
-            )
+        return ctx.cached("phones", build)
 
-            # 2. 電話番号処理
-            home_tel, mobile_tel = self.process_phone_numbers(
-                row.get("契約者：電話番号", ""), row.get("契約者：携帯番号", "")
-            )
-            converted_row["契約者TEL自宅"] = home_tel
-            converted_row["契約者TEL携帯"] = mobile_tel
+    def _address_parts(self, ctx: ConversionContext) -> Dict[str, pd.Series]:
+        """住所分割処理（列単位、split_address と同じ組み立て）"""
 
-            # 3. 住所分割処理
-            address_parts = self.split_address(
-                row.get("建物：住所", ""), row.get("建物名", ""), row.get("部屋名", "")
-            )
+        def build():
+            full_address = ctx.text("建物：住所")
+            parts = split_address_columns(self.address_splitter, full_address)
+            remaining = parts["remaining"].str.strip()
 
-            # 契約者現住所
-            converted_row["契約者現住所郵便番号"] = str(
-                row.get("建物：郵便番号", "")
-            ).strip()
-            converted_row["契約者現住所1"] = address_parts["prefecture"]
-            converted_row["契約者現住所2"] = address_parts["city"]
-            converted_row["契約者現住所3"] = address_parts["address3"]
+            # 現住所3組み立て（remaining + 建物名 + 部屋名、住所が空なら空）
+            address3 = join_nonempty(
+                [remaining, ctx.text("建物名"), ctx.text("部屋名")], "　"
+            ).where(full_address != "", "")
 
-            # 4. 物件情報
-            converted_row["物件名"] = str(row.get("建物名", "")).strip()
-            converted_row["部屋番号"] = str(row.get("部屋名", "")).strip()
+            return {
+                "prefecture": parts["prefecture"],
+                "city": parts["city"],
+                "address3": address3,
+                "property_address3": remaining,
+            }
 
-            # 物件住所（契約者住所をコピー + 物件住所3は建物名・部屋名除外）
-            converted_row["物件住所郵便番号"] = converted_row["契約者現住所郵便番号"]
-            converted_row["物件住所1"] = converted_row["契約者現住所1"]
-            converted_row["物件住所2"] = converted_row["契約者現住所2"]
-            converted_row["物件住所3"] = address_parts["property_address3"]
+        return ctx.cached("address", build)
 
-            # 5. 引継情報生成
-            contract_start = str(row.get("契約開始", "")).strip()
-            converted_row["引継情報"] = f"カプコ一括登録　●保証開始日：{contract_start}"
+    def _management_company(self, ctx: ConversionContext) -> pd.Series:
+        """管理会社処理：nan回避 + クライアントCD条件処理"""
+        company = ctx.text("管理会社")
+        company = company.where(company.str.lower() != "nan", "")
+        # クライアントCDが"1"の場合は株式会社前田を設定
+        return company.where(ctx.columns["クライアントCD"] != "1", "株式会社前田")
 
-            # 6. 口座情報
-            converted_row["回収口座金融機関名"] = str(
-                row.get("V口座銀行名", "")
-            ).strip()
-            converted_row["回収口座支店CD"] = self.get_branch_code(
-                row.get("V口振支店名", "")
-            )
-            converted_row["回収口座支店名"] = str(row.get("V口振支店名", "")).strip()
-            converted_row["回収口座番号"] = str(row.get("V口振番号", "")).strip()
-            converted_row["回収口座名義"] = str(row.get("V口座振込先", "")).strip()
+    def build_column_specs(self) -> Dict[str, ColumnSpec]:
+        """111列テンプレートの列定義"""
+        today = datetime.now().strftime("%Y/%m/%d")
+
+        def raw(column, *transforms):
+            # 元データの値をそのまま文字列化（従来通り欠損値は"nan"）
+            return source(column, *transforms, keep_na_text=True)
 
+        return {
+            # 1. 基本情報
+            "引継番号": raw("契約No"),
+            "契約者氏名": source("契約者名", remove_spaces),
+            "契約者カナ": source(
+                "契約者ふりがな",
+                lambda s: s.str.translate(self.HIRAGANA_TO_KATAKANA),
+                remove_spaces,
+            ),
+            # 2. 電話番号処理
+            "契約者TEL自宅": computed(lambda ctx: self._phone_pair(ctx)[0]),
+            "契約者TEL携帯": computed(lambda ctx: self._phone_pair(ctx)[1]),
+            # 3. 契約者現住所
+            "契約者現住所郵便番号": raw("建物：郵便番号"),
+            "契約者現住所1": computed(lambda ctx: self._address_parts(ctx)["prefecture"]),
+            "契約者現住所2": computed(lambda ctx: self._address_parts(ctx)["city"]),
+            "契約者現住所3": computed(lambda ctx: self._address_parts(ctx)["address3"]),
+            # 4. 物件情報（契約者住所をコピー + 物件住所3は建物名・部屋名除外）
+            "物件名": raw("建物名"),
+            "部屋番号": raw("部屋名"),
+            "物件住所郵便番号": copy_of("契約者現住所郵便番号"),
+            "物件住所1": copy_of("契約者現住所1"),
+            "物件住所2": copy_of("契約者現住所2"),
+            "物件住所3": computed(
+                lambda ctx: self._address_parts(ctx)["property_address3"]
+            ),
+            # 5. 引継情報
+            "引継情報": raw("契約開始", lambda s: "カプコ一括登録　●保証開始日：" + s),
+            # 6. 口座情報
+            "回収口座金融機関名": raw("V口座銀行名"),
+            "回収口座支店CD": source(
+                "V口振支店名",
+                map_unique(lambda name: CapcoConfig.BRANCH_CODE_MAPPING.get(name, "")),
+            ),
+            "回収口座支店名": raw("V口振支店名"),
+            "回収口座番号": raw("V口振番号"),
+            "回収口座名義": raw("V口座振込先"),
             # 7. 特殊項目
-            client_cd = self.get_client_cd(row.get("約定日", ""))
-            converted_row["クライアントCD"] = client_cd
-            converted_row["管理前滞納額"] = str(row.get("滞納額合計", "")).strip()
-
-            # 管理会社処理：nan回避 + クライアントCD条件処理
-            management_company = row.get("管理会社", "")
-            if (
-                pd.isna(management_company)
-                or str(management_company).strip().lower() == "nan"
-            ):
-                management_company = ""
-            else:
-                management_company = str(management_company).strip()
-
-            # クライアントCDが"1"の場合は株式会社前田を設定
-            if client_cd == "1":
-                converted_row["管理会社"] = "株式会社前田"
-            else:
-                converted_row["管理会社"] = management_company
-
-            converted_row["管理受託日"] = datetime.now().strftime("%Y/%m/%d")
-
-            # 8. 固定値設定（すべて適用）
-            for key, value in CapcoConfig.FIXED_VALUES.items():
-                converted_row[key] = value
-
-            output_data.append(converted_row)
-
-        # 111列の正確な順序でDataFrame構築（空列対応）
-        # 空列用の一意な仮名前を使用してから最後にリネーム
-        temp_columns = []
-        temp_data = {}
-        empty_col_counter = 1
-
-        for i, col in enumerate(CapcoConfig.OUTPUT_COLUMNS):
-            if col == "":  # 空列の場合
-                temp_col_name = f"__EMPTY_COL_{empty_col_counter}__"
-                temp_columns.append(temp_col_name)
-                temp_data[temp_col_name] = [""] * len(output_data)
-                empty_col_counter += 1
-            else:
-                temp_columns.append(col)
-                temp_data[col] = [row.get(col, "") for row in output_data]
-
-        # DataFrameを一度に構築（空列対応で重複チェックを無効化）
-        final_df = pd.DataFrame(temp_data)
-
-        # 列順を正しく設定し、空列の仮名前を元の空文字列に戻す
-        final_df = final_df.reindex(columns=temp_columns)
-        final_df.columns = CapcoConfig.OUTPUT_COLUMNS
-
-        return final_df
+            "クライアントCD": source("約定日", map_unique(self.get_client_cd)),
+            "管理前滞納額": raw("滞納額合計"),
+            "管理会社": computed(self._management_company),
+            "管理受託日": fixed(today),
+        }
+
+    def convert_new_contracts(self, new_contracts_df: pd.DataFrame) -> pd.DataFrame:
+        """新規契約データを111列テンプレートに変換（列単位）"""
+        # 固定値はすべて適用（変換済みの値も上書き）
+        return build_template_frame(
+            new_contracts_df,
+            self.build_column_specs(),
+            CapcoConfig.OUTPUT_COLUMNS,
+            fixed_values=CapcoConfig.FIXED_VALUES,
+            overwrite_fixed=True,
+        )
 
 
 def process_capco_data(
@@ -703,6 +658,7 @@ def process_capco_data(
         logger.info("カプコ新規登録処理開始")
 
         # 1. データ読み込み
+        report_progress("ファイル読み込み", 0, 3)
         data_loader = DataLoader()
         capco_df = data_loader.load_capco_data(capco_content)
         contract_df = data_loader.load_contract_list(contract_content)
@@ -712,6 +668,7 @@ def process_capco_data(
         )
 
         # 2. 重複チェック（新規案件抽出）
+        report_progress("重複チェック", 1, 3)
         duplicate_checker = DuplicateChecker()
         new_contracts, existing_contracts, match_stats, detail_logs = (
             duplicate_checker.find_new_contracts(capco_df, contract_df)
@@ -727,6 +684,7 @@ def process_capco_data(
             return pd.DataFrame(), logs, "no_new_contracts.csv"
 
         # 3. データ変換（111列テンプレート準拠）
+        report_progress("データ変換", 2, 3)
         data_converter = DataConverter()
         output_df = data_converter.convert_new_contracts(new_contracts)
 
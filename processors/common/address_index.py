@@ -0,0 +1,182 @@
+"""
+住所分割用の検索インデックス
+
+municipalities.json から都道府県・市区町村の接頭辞トライを1回だけ構築し、
+AddressSplitter の extract_prefecture / extract_municipality を
+正規表現の再生成や辞書の再ソートなしで処理する。
+
+- 都道府県トライ: 元の表記で構築し、文字間の空白を読み飛ばしながら照合
+  （従来の正規表現 ^東\\s*京\\s*都 と同じ照合結果）
+- 市区町村トライ: 正規化（NFKC・空白除去・ヶ/ヵ統一）後の表記で構築し、
+  正規化済み住所の先頭から1回たどるだけで全候補を取得
+- 元住所での切り出し位置: 採用した市区町村の元の表記を、
+  文字間の空白を許容して元住所の先頭から照合して求める
+
+使用例:
+    from processors.common.address_index import AddressIndex
+
+    index = AddressIndex(municipalities, normalize)
+    prefecture, remaining = index.extract_prefecture("東京都新宿区西新宿1-1-1")
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# トライの終端ノードに格納する値のキー
+_TERMINAL = None
+
+# 郡パターン（辞書にマッチしない場合のフォールバック）
+COUNTY_PATTERN = re.compile(r'^(.+?郡)')
+
+
+def spaced_prefix_end(text: str, name: str) -> Optional[int]:
+    """
+    文字間の空白を許容して name が text の先頭に一致するか判定
+
+    正規表現 ^n1\\s*n2\\s*...\\s*nk による照合と同じ結果を返す。
+
+    Args:
+        text: 照合対象の文字列
+        name: 先頭に一致させる名称
+
+    Returns:
+        int: 一致した場合は text 上の終端位置、一致しない場合は None
+    """
+    if text.startswith(name):
+        # 空白を挟まない一致（\s* が0文字にマッチする場合と同じ）
+        return len(name)
+
+    if any(ch.isspace() for ch in name):
+        # 名称自体に空白を含む場合は正規表現で照合（辞書データには存在しない想定）
+        pattern = r'^' + r'\s*'.join(map(re.escape, list(name)))
+        m = re.match(pattern, text)
+        return m.end() if m else None
+
+    pos = 0
+    length = len(text)
+    for i, ch in enumerate(name):
+        if i > 0:
+            while pos < length and text[pos].isspace():
+                pos += 1
+        if pos >= length or text[pos] != ch:
+            return None
+        pos += 1
+    return pos
+
+
+class AddressIndex:
+    """都道府県・市区町村の接頭辞トライ"""
+
+    def __init__(self, municipalities: Dict[str, List[str]], normalize: Callable[[str], str]):
+        """
+        Args:
+            municipalities: 都道府県 → 市区町村リスト（municipalities.json の内容）
+            normalize: 表記ゆれの正規化関数（AddressSplitter.normalize）
+        """
+        self.normalize = normalize
+        self.prefectures: List[str] = list(municipalities.keys())
+        self._prefecture_trie = self._build_prefecture_trie(self.prefectures)
+        self._municipality_tries = {
+            prefecture: self._build_municipality_trie(names, normalize)
+            for prefecture, names in municipalities.items()
+        }
+
+    @staticmethod
+    def _build_prefecture_trie(prefectures: List[str]) -> dict:
+        """都道府県名のトライを構築（終端には辞書順の順位と名称を格納）"""
+        root: dict = {}
+        for order, prefecture in enumerate(prefectures):
+            node = root
+            for ch in prefecture:
+                node = node.setdefault(ch, {})
+            # 同名がある場合は先に出現したものを優先
+            node.setdefault(_TERMINAL, (order, prefecture))
+        return root
+
+    @staticmethod
+    def _build_municipality_trie(names: List[str], normalize: Callable[[str], str]) -> dict:
+        """
+        正規化済み市区町村名のトライを構築
+
+        終端には (優先順位, 元の名称) を格納する。優先順位は従来処理と同じ
+        「元の名称が長い順（同じ長さは辞書順）」で、小さいほど優先。
+        """
+        ranked = sorted(names, key=len, reverse=True)
+        root: dict = {}
+        for rank, name in enumerate(ranked):
+            node = root
+            for ch in normalize(name):
+                node = node.setdefault(ch, {})
+            if _TERMINAL not in node or node[_TERMINAL][0] > rank:
+                node[_TERMINAL] = (rank, name)
+        return root
+
+    def extract_prefecture(self, address: str) -> Tuple[str, str]:
+        """都道府県を抽出（文字間の空白も許容）"""
+        best = None
+        node = self._prefecture_trie
+        pos = 0
+        length = len(address)
+        first = True
+        while True:
+            if not first:
+                while pos < length and address[pos].isspace():
+                    pos += 1
+            if pos >= length or address[pos] not in node:
+                break
+            node = node[address[pos]]
+            pos += 1
+            first = False
+            terminal = node.get(_TERMINAL)
+            if terminal is not None and (best is None or terminal[0] < best[0]):
+                best = (terminal[0], terminal[1], pos)
+
+        if best is None:
+            return "", address
+        # 残り住所の先頭スペースも削除
+        return best[1], address[best[2]:].lstrip()
+
+    def find_municipality(self, prefecture: str, normalized_address: str) -> Optional[str]:
+        """
+        正規化済み住所の先頭に一致する市区町村名（元の表記）を返す
+
+        複数候補がある場合は従来処理と同じく最も長い名称を採用する。
+        """
+        node = self._municipality_tries.get(prefecture)
+        if node is None:
+            return None
+
+        best = node.get(_TERMINAL)
+        for ch in normalized_address:
+            node = node.get(ch)
+            if node is None:
+                break
+            terminal = node.get(_TERMINAL)
+            if terminal is not None and (best is None or terminal[0] < best[0]):
+                best = terminal
+        return best[1] if best is not None else None
+
+    def extract_municipality(self, prefecture: str, address: str) -> Tuple[str, str]:
+        """市区町村を抽出（辞書ベース + 郡対応）"""
+        if prefecture not in self._municipality_tries:
+            return "", address
+
+        # 1. まず辞書の市区町村でマッチング
+        municipality = self.find_municipality(prefecture, self.normalize(address))
+        if municipality is not None:
+            # 元の住所での終端位置を、文字間のスペースを許容して求める
+            end = spaced_prefix_end(address, municipality)
+            if end is None:
+                # フォールバック（表記が異なる場合は名称の長さで切り取る）
+                end = len(municipality)
+            return municipality, address[end:].lstrip()
+
+        # 2. 辞書にマッチしない場合のみ、郡パターンをチェック
+        county_match = COUNTY_PATTERN.match(address)
+        if county_match:
+            county_name = county_match.group(1)
+            remaining = address[len(county_name):].lstrip()
+            return county_name, remaining
+
+        return "", address
@@ -1,10 +1,16 @@
 import json
 import re
+import threading
 import unicodedata
 from pathlib import Path
 from typing import Dict, Tuple, Optional, List
 import logging
 
+import numpy as np
+import pandas as pd
+
+from processors.common.address_index import AddressIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +21,8 @@ class AddressSplitter:
         self.municipalities: Dict[str, List[str]] = {}
         self.prefectures: List[str] = []
         self._load_municipalities()
+        # 都道府県・市区町村の検索インデックス（読み込み時に1回だけ構築）
+        self.index = AddressIndex(self.municipalities, self.normalize)
         
     def _load_municipalities(self):
         """市区町村データを読み込む（環境非依存）"""
@@ -63,54 +71,11 @@ class AddressSplitter:
     
     def extract_prefecture(self, address: str) -> Tuple[str, str]:
         """都道府県を抽出（文字間の空白も許容）"""
-        for pref in self.prefectures:
-            # 例: "東\s*京\s*都" のように各文字の間の空白を許容
-            pattern = r'^' + r'\s*'.join(map(re.escape, list(pref)))
-            m = re.match(pattern, address)
-            if m:
-                # 残り住所の先頭スペースも削除
-                remaining = address[m.end():].lstrip()
-                return pref, remaining
-        return "", address
+        return self.index.extract_prefecture(address)
     
     def extract_municipality(self, prefecture: str, address: str) -> Tuple[str, str]:
         """市区町村を抽出（辞書ベース + 郡対応）"""
-        if prefecture not in self.municipalities:
-            return "", address
-
-        normalized_addr = self.normalize(address)
-
-        # 1. まず辞書の市区町村でマッチング（既存処理）
-        municipalities = sorted(
-            self.municipalities[prefecture],
-            key=len,
-            reverse=True
-        )
-
-        for municipality in municipalities:
-            normalized_muni = self.normalize(municipality)
-            if normalized_addr.startswith(normalized_muni):
-                # 元の住所から正規化前の長さ分を切り取る
-                # スペースを考慮して元の住所での終端位置を見つける
-                pattern = r'^' + r'\s*'.join(map(re.escape, list(municipality)))
-                m = re.match(pattern, address)
-                if m:
-                    # 残り住所の先頭スペースも削除
-                    remaining = address[m.end():].lstrip()
-                    return municipality, remaining
-                else:
-                    # フォールバック（スペースなしの場合）
-                    remaining = address[len(municipality):].lstrip()
-                    return municipality, remaining
-
-        # 2. 辞書にマッチしない場合のみ、郡パターンをチェック
-        county_match = re.match(r'^(.+?郡)', address)
-        if county_match:
-            county_name = county_match.group(1)
-            remaining = address[len(county_name):].lstrip()
-            return county_name, remaining
-
-        return "", address
+        return self.index.extract_municipality(prefecture, address)
     
     def split_address(self, address: str) -> Dict[str, str]:
         """住所を分割する（郵便番号、都道府県、市区町村、残り）"""
@@ -151,6 +116,31 @@ class AddressSplitter:
         
         return result
     
+    def split_many(self, addresses: pd.Series) -> pd.DataFrame:
+        """
+        住所列を一括で分割する
+        
+        同じ住所は1回だけ分割し、結果を共有する。
+        
+        Args:
+            addresses: 住所のSeries（NaN/Noneは空文字として扱う）
+            
+        Returns:
+            pd.DataFrame: postal_code, prefecture, city, remaining の4列（元のインデックスを維持）
+        """
+        columns = ["postal_code", "prefecture", "city", "remaining"]
+        values = addresses.astype(object).where(addresses.notna(), "").astype(str)
+        codes, uniques = pd.factorize(values)
+        
+        # ユニークな住所ごとに分割し、結果を元の並びに展開
+        split_results = [self.split_address(address) for address in uniques]
+        data = {
+            col: np.array([result[col] for result in split_results], dtype=object).take(codes)
+            for col in columns
+        }
+        
+        return pd.DataFrame(data, index=addresses.index, columns=columns)
+    
     def get_statistics(self) -> Dict[str, int]:
         """データ統計情報を返す（空データ対応）"""
         if not self.municipalities:
@@ -167,4 +157,49 @@ class AddressSplitter:
             "total_municipalities": sum(totals),
             "max_municipalities": max(totals),
             "min_municipalities": min(totals),
-        }
\ No newline at end of file
+        }
+
+
+# =============================================================================
+# プロセス共有インスタンス
+# =============================================================================
+
+# municipalities.json の読み込みとインデックス構築はプロセスごとに1回だけ行う
+_shared_splitter: Optional[AddressSplitter] = None
+_shared_lock = threading.Lock()
+
+
+def get_address_splitter() -> AddressSplitter:
+    """
+    プロセス共有のAddressSplitterを取得（初回呼び出し時に読み込み）
+    
+    スレッドセーフ。Streamlitの再実行ごとに各コンバーターが生成されても、
+    辞書の読み込みとインデックス構築は最初の1回だけになる。
+    
+    Returns:
+        AddressSplitter: 共有インスタンス
+    """
+    global _shared_splitter
+    splitter = _shared_splitter
+    if splitter is None:
+        with _shared_lock:
+            if _shared_splitter is None:
+                _shared_splitter = AddressSplitter()
+            splitter = _shared_splitter
+    return splitter
+
+
+def reload_address_splitter() -> AddressSplitter:
+    """
+    municipalities.json を再読み込みして共有インスタンスを差し替える
+    
+    既に取得済みのインスタンスは変更しない（次回の get_address_splitter から新しい辞書を使用）。
+    
+    Returns:
+        AddressSplitter: 新しい共有インスタンス
+    """
+    global _shared_splitter
+    splitter = AddressSplitter()
+    with _shared_lock:
+        _shared_splitter = splitter
+    return splitter
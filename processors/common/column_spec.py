@@ -0,0 +1,300 @@
+"""
+111列テンプレート変換エンジン（宣言的な列定義）
+
+新規登録系プロセッサ（アーク・カプコ・プラザ・IOG）の出力テンプレートを、
+行ごとの辞書作成ではなく列単位の一括処理で作成する。
+
+各出力列は以下のいずれかで定義する。
+- source(): 入力列 + 変換処理（スペース除去・電話番号正規化・全角変換など）
+- fixed(): 固定値
+- computed(): 入力列や作成済みの出力列から算出する関数
+
+入力列の参照方法:
+- 列名（str）: 列が存在しない場合は default の値
+- 列番号（int, 0ベース）: プラザのように列位置で指定する場合
+- 列名候補（tuple）: 新旧形式の列名を優先順に指定し、最初の非空の値を採用
+
+変換処理は文字列Seriesを受け取って文字列Seriesを返す関数で、
+行ごとにしか書けない処理は map_unique() でユニーク値ごとに1回だけ実行する。
+
+使用例:
+    from processors.common.column_spec import (
+        build_template_frame, source, fixed, remove_spaces, to_zenkaku
+    )
+
+    specs = {
+        "引継番号": source("契約番号"),
+        "契約者カナ": source("主契約者（カナ）", to_zenkaku, remove_spaces),
+        "委託先法人ID": fixed("5"),
+    }
+    output_df = build_template_frame(
+        new_contracts_df, specs, ArkConfig.OUTPUT_COLUMNS,
+        fixed_values=ArkConfig.FIXED_VALUES,
+    )
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+ColumnRef = Union[str, int, Tuple[str, ...]]
+Transform = Callable[[pd.Series], pd.Series]
+
+
+class ConversionContext:
+    """列定義の評価中に共有する入力データ・作成済み列・中間結果"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.columns: Dict[str, pd.Series] = {}
+        self._cache: Dict[Hashable, Any] = {}
+
+    def text(self, ref: ColumnRef, default: str = "", keep_na_text: bool = False) -> pd.Series:
+        """
+        入力列を前後空白除去済みの文字列Seriesで取得
+
+        Args:
+            ref: 列名・列番号・列名候補のタプル
+            default: 列が存在しない場合の値
+            keep_na_text: True の場合は欠損値も str() で文字列化する（"nan"）
+
+        Returns:
+            pd.Series: 入力DataFrameと同じインデックスの文字列Series
+        """
+        key = ("text", ref, default, keep_na_text)
+        if key not in self._cache:
+            if isinstance(ref, tuple):
+                self._cache[key] = self._first_non_empty(ref, default)
+            else:
+                self._cache[key] = self._column_text(ref, default, keep_na_text)
+        return self._cache[key]
+
+    def cached(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """住所分割結果など、複数の列で使う中間結果を1回だけ作成"""
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def blank(self, value: Any = "") -> pd.Series:
+        """全行が同じ値のSeries"""
+        return pd.Series([value] * len(self.df), index=self.df.index, dtype=object)
+
+    def _column_text(self, ref: Union[str, int], default: str, keep_na_text: bool) -> pd.Series:
+        if isinstance(ref, str) and ref not in self.df.columns:
+            text = str(default).strip()
+            return self.blank(text)
+
+        series = self.df[ref] if isinstance(ref, str) else self.df.iloc[:, ref]
+        values = series.to_numpy(dtype=object)
+        if keep_na_text:
+            result = np.array([str(v).strip() for v in values], dtype=object)
+        else:
+            result = np.full(len(values), "", dtype=object)
+            mask = pd.notna(values)
+            if mask.any():
+                result[mask] = [str(v).strip() for v in values[mask]]
+        return pd.Series(result, index=self.df.index, dtype=object)
+
+    def _first_non_empty(self, refs: Tuple[str, ...], default: str) -> pd.Series:
+        result = self.blank("")
+        for ref in refs:
+            candidate = self.text(ref, default)
+            result = result.where(result != "", candidate)
+        return result
+
+
+class ColumnSpec:
+    """出力1列分の定義"""
+
+    def __init__(
+        self,
+        ref: Optional[ColumnRef] = None,
+        transforms: Sequence[Transform] = (),
+        value: Any = None,
+        compute: Optional[Callable[[ConversionContext], Any]] = None,
+        default: str = "",
+        keep_na_text: bool = False,
+    ):
+        self.ref = ref
+        self.transforms = list(transforms)
+        self.value = value
+        self.compute = compute
+        self.default = default
+        self.keep_na_text = keep_na_text
+
+    def build(self, ctx: ConversionContext) -> pd.Series:
+        """列定義を評価して出力列を作成"""
+        if self.compute is not None:
+            series = _as_series(self.compute(ctx), ctx)
+        elif self.ref is not None:
+            series = ctx.text(self.ref, self.default, self.keep_na_text)
+        else:
+            return ctx.blank(self.value)
+
+        for transform in self.transforms:
+            series = transform(series)
+        return series
+
+
+def source(ref: ColumnRef, *transforms: Transform, default: str = "", keep_na_text: bool = False) -> ColumnSpec:
+    """入力列 + 変換処理の列定義"""
+    return ColumnSpec(ref=ref, transforms=transforms, default=default, keep_na_text=keep_na_text)
+
+
+def fixed(value: Any) -> ColumnSpec:
+    """固定値の列定義"""
+    return ColumnSpec(value=value)
+
+
+def computed(func: Callable[[ConversionContext], Any], *transforms: Transform) -> ColumnSpec:
+    """算出関数の列定義（func は ConversionContext を受け取りSeriesを返す）"""
+    return ColumnSpec(compute=func, transforms=transforms)
+
+
+def copy_of(column: str, *transforms: Transform) -> ColumnSpec:
+    """作成済みの出力列をそのまま使う列定義（物件住所1 ← 契約者現住所1 など）"""
+    return computed(lambda ctx: ctx.columns[column], *transforms)
+
+
+def _as_series(values: Any, ctx: ConversionContext) -> pd.Series:
+    if isinstance(values, pd.Series):
+        return values
+    return pd.Series(values, index=ctx.df.index, dtype=object)
+
+
+# ---------------------------------------------------------------------------
+# 変換処理（文字列Series → 文字列Series）
+# ---------------------------------------------------------------------------
+
+def remove_spaces(series: pd.Series) -> pd.Series:
+    """全てのスペース（半角・全角）を除去"""
+    return series.str.replace(" ", "", regex=False).str.replace("　", "", regex=False)
+
+
+def to_zenkaku(series: pd.Series) -> pd.Series:
+    """NFKC正規化（半角カナ→全角カナ、全角英数→半角英数）"""
+    return series.str.normalize("NFKC")
+
+
+def normalize_phone(series: pd.Series) -> pd.Series:
+    """電話番号の正規化（全角→半角、記号統一、数字・ハイフン・括弧以外を除去）"""
+    phone = series.str.normalize("NFKC")
+    phone = phone.str.replace("[－ー‐]", "-", regex=True)
+    phone = phone.str.replace("（", "(", regex=False).str.replace("）", ")", regex=False)
+    return phone.str.replace(r"[^\d\-\(\)]", "", regex=True)
+
+
+def map_unique(func: Callable[[Any], Any]) -> Transform:
+    """
+    行単位の関数をユニーク値ごとに1回だけ適用する変換処理を作成
+
+    Args:
+        func: 1値を受け取り1値を返す関数
+
+    Returns:
+        Transform: Series → Series の変換処理
+    """
+    def transform(series: pd.Series) -> pd.Series:
+        return apply_unique(series, func)
+    return transform
+
+
+def apply_unique(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Seriesのユニーク値ごとに func を1回だけ適用し、元の並びに展開"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    mapped = np.empty(len(uniques), dtype=object)
+    for position, value in enumerate(uniques):
+        mapped[position] = func(value)
+    return pd.Series(mapped.take(codes), index=series.index, dtype=object)
+
+
+def join_nonempty(parts: List[pd.Series], sep: str) -> pd.Series:
+    """空でない要素だけを区切り文字で結合（"　".join(空以外のリスト) と同じ）"""
+    result = parts[0]
+    for part in parts[1:]:
+        both = (result != "") & (part != "")
+        result = (result + sep).where(both, result) + part
+    return result
+
+
+def move_home_to_mobile(home: pd.Series, mobile: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """自宅TELのみの行は携帯TELに移動（携帯優先ロジック）"""
+    home_only = (home != "") & (mobile == "")
+    return home.where(~home_only, ""), mobile.where(~home_only, home)
+
+
+def split_address_columns(splitter, addresses: pd.Series) -> pd.DataFrame:
+    """
+    住所列を一括分割（郵便番号抽出・都道府県・市区町村・残り住所）
+
+    Args:
+        splitter: AddressSplitter
+        addresses: 前後空白除去済みの住所Series
+
+    Returns:
+        pd.DataFrame: postal_code, prefecture, city, remaining の4列
+    """
+    return splitter.split_many(addresses)
+
+
+# ---------------------------------------------------------------------------
+# テンプレート作成
+# ---------------------------------------------------------------------------
+
+def build_template_frame(
+    df: pd.DataFrame,
+    specs: Dict[str, ColumnSpec],
+    output_columns: List[str],
+    fixed_values: Optional[Dict[str, Any]] = None,
+    overwrite_fixed: bool = False,
+    finalize: Optional[Callable[[str, pd.Series], pd.Series]] = None,
+) -> pd.DataFrame:
+    """
+    列定義から出力テンプレートのDataFrameを列単位で作成
+
+    Args:
+        df: 入力データ
+        specs: 出力列名 → 列定義（定義順に評価し、後の列から前の列を参照可能）
+        output_columns: 出力列の並び（空文字列の列は空列として出力）
+        fixed_values: 固定値（FIXED_VALUES）
+        overwrite_fixed: True の場合は固定値で常に上書き、
+            False の場合は未定義または空文字の列にのみ設定
+        finalize: 固定値設定後に各列へ適用する関数（列名, 列 → 列）
+
+    Returns:
+        pd.DataFrame: output_columns の順に並んだDataFrame（インデックスは0からの連番）
+    """
+    ctx = ConversionContext(df)
+    for column, spec in specs.items():
+        ctx.columns[column] = spec.build(ctx)
+
+    fixed_columns = {}
+    for column, value in (fixed_values or {}).items():
+        if overwrite_fixed or column not in ctx.columns:
+            ctx.columns.pop(column, None)
+            fixed_columns[column] = value
+        elif value != "":
+            current = ctx.columns[column]
+            ctx.columns[column] = current.where(current != "", value)
+
+    if finalize is not None:
+        for column in list(ctx.columns):
+            ctx.columns[column] = finalize(column, ctx.columns[column])
+        for column, value in list(fixed_columns.items()):
+            fixed_columns[column] = finalize(column, pd.Series([value], dtype=object)).iloc[0]
+
+    row_count = len(df)
+    data = {}
+    for position, column in enumerate(output_columns):
+        key = f"__COL_{position}__"
+        if column in ctx.columns:
+            data[key] = ctx.columns[column].to_numpy(dtype=object)
+        elif column in fixed_columns:
+            # 固定値は従来通り値の型から列の型を推定（数値の固定値は数値列）
+            data[key] = [fixed_columns[column]] * row_count
+        else:
+            data[key] = np.full(row_count, "", dtype=object)
+
+    output_df = pd.DataFrame(data, index=pd.RangeIndex(row_count))
+    output_df.columns = list(output_columns)
+    return output_df
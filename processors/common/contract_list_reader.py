@@ -0,0 +1,171 @@
+"""
+ContractList列指定読み込み
+
+ContractListは121〜122列あるが、オートコールなどのプロセッサーが使うのは
+そのうち十数列のみ。プロセッサーが必要な列（ContractListColumns の列番号）を
+宣言し、その列だけを usecols で読み込む。
+
+- read: 必要な列だけを読み込む（読み込み結果キャッシュを使用）
+- apply_chunked: チャンク単位で読み込み、チャンクごとの処理結果を返す
+  （フィルタをチャンクごとに適用すれば、メモリ使用量はファイル全体ではなく
+  対象行の件数に比例する）
+
+読み込んだDataFrameの列は宣言した列番号の昇順に並ぶ。列番号で指定された
+設定（フィルタ設定・マッピングルール）は project_* で読み込み後の位置に変換する。
+列名は元のヘッダーのまま（重複列名の「.1」などの付番も全列読み込み時と同じ）。
+
+列名で参照するプロセッサー（フェイス・プラザなど）は列名でも宣言できる。
+列名はファイルのヘッダー行（全列読み込み時の列名、「TEL携帯.1」など）から列番号に変換する
+（resolve）。resolve ではヘッダーにない列名・列数を超える列番号は読み込み対象から除き、
+参照した時点でエラーにする（必須列の確認は各プロセッサーで行う）。
+
+使用例:
+    from processors.common.contract_list_reader import ContractListReader
+
+    reader = ContractListReader([COL.MANAGEMENT_NO, COL.TRUSTEE_ID, COL.DEBT_AMOUNT])
+    df = reader.read(file_content)
+    trustee_id = df.iloc[:, reader.position(COL.TRUSTEE_ID)]
+
+    reader = ContractListReader(["委託先法人ID", "TEL携帯", COL.DEBT_AMOUNT])
+    df = reader.read(file_content)  # 列名参照のみの場合
+    resolved = reader.resolve(file_content)  # 列番号でも参照する場合
+    df = resolved.read(file_content)
+    debt = df.iloc[:, resolved.position(COL.DEBT_AMOUNT)]
+"""
+
+import io
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, TypeVar, Union
+
+import pandas as pd
+
+from processors.common.parsed_frame_cache import read_csv_cached
+from processors.common.text_decoder import DEFAULT_ENCODINGS, decode_bytes, detect_encoding
+
+
+# チャンク読み込みの1チャンクあたりの行数
+DEFAULT_CHUNK_ROWS = 50_000
+
+# これ以上のサイズのファイルはチャンク単位で読み込む（読み込み結果キャッシュには載せない）
+STREAMING_MIN_BYTES = 64 * 1024 * 1024
+
+# 設定の中で列番号を表すキー（FilterEngine のフィルタ設定）
+COLUMN_KEYS = ("column", "client_cd_column", "debt_column")
+
+T = TypeVar("T")
+
+# 列番号（ContractListColumns の値）または列名
+ColumnRef = Union[int, str]
+
+
+class ContractListReader:
+    """必要な列だけを読み込むContractListリーダー"""
+
+    def __init__(
+        self,
+        columns: Iterable[ColumnRef],
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    ):
+        """
+        Args:
+            columns: 必要な列番号（ContractListColumns の値）または列名
+            chunk_rows: チャンク読み込みの1チャンクあたりの行数
+            encodings: 候補エンコーディング（優先順）
+        """
+        columns = list(columns)
+        self.columns: List[int] = sorted({column for column in columns if not isinstance(column, str)})
+        self.names: List[str] = list(dict.fromkeys(column for column in columns if isinstance(column, str)))
+        self.chunk_rows = chunk_rows
+        self.encodings = tuple(encodings)
+        self._positions = {column: position for position, column in enumerate(self.columns)}
+
+    def resolve(self, content: bytes) -> "ContractListReader":
+        """
+        列名をファイルのヘッダー行から列番号に変換したリーダーを返す
+
+        ヘッダー行だけを読み込む（ファイル全体はデコードしない）。
+        ヘッダーにない列名・列数を超える列番号は除く（position で KeyError になる）。
+        """
+        encoding = detect_encoding(content, self.encodings)
+        try:
+            header = pd.read_csv(io.BytesIO(content), encoding=encoding, nrows=0).columns
+        except UnicodeDecodeError:
+            text, _ = decode_bytes(content, self.encodings)
+            header = pd.read_csv(io.StringIO(text), nrows=0).columns
+        columns = [column for column in self.columns if column < len(header)]
+        columns += [header.get_loc(name) for name in self.names if name in header]
+        return ContractListReader(columns, self.chunk_rows, self.encodings)
+
+    def position(self, column: int) -> int:
+        """元の列番号 → 読み込み後のDataFrameでの列位置（列名を宣言した場合は resolve の結果で呼ぶ）"""
+        try:
+            return self._positions[column]
+        except KeyError:
+            raise KeyError(f"列番号 {column} は読み込み対象の列に含まれていません") from None
+
+    def project_filter_config(self, filter_config: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """フィルタ設定の列番号を読み込み後の列位置に変換（元の設定は変更しない）"""
+        projected = {}
+        for filter_name, config in filter_config.items():
+            config = dict(config)
+            for key in COLUMN_KEYS:
+                if key in config:
+                    config[key] = self.position(config[key])
+            projected[filter_name] = config
+        return projected
+
+    def project_mapping(self, mapping_rules: Dict[str, Any]) -> Dict[str, Any]:
+        """マッピングルールの列番号を読み込み後の列位置に変換（列名指定はそのまま）"""
+        return {
+            output_col: self.position(source) if isinstance(source, int) else source
+            for output_col, source in mapping_rules.items()
+        }
+
+    def read(self, content: bytes) -> pd.DataFrame:
+        """
+        必要な列だけを読み込む（同じファイル・同じ列の2回目以降はキャッシュから取得）
+
+        Raises:
+            UnicodeDecodeError: どの候補でもデコードできない場合
+            ValueError: 必要な列がファイルにない場合（列数不足）
+        """
+        if self.names:
+            return self.resolve(content).read(content)
+        return read_csv_cached(content, self.encodings, dtype=str, usecols=self.columns)
+
+    def iter_chunks(self, content: bytes, encoding: str) -> Iterator[pd.DataFrame]:
+        """
+        必要な列だけをチャンク単位で読み込む（ファイル全体のデコードは行わない）
+
+        チャンクのインデックスは全体での行番号（全行読み込み時と同じ）。
+        """
+        return self._read_chunks(io.BytesIO(content), encoding=encoding)
+
+    def apply_chunked(self, content: bytes, consume: Callable[[Iterator[pd.DataFrame]], T]) -> T:
+        """
+        チャンク単位で読み込み、consume(チャンクのイテレータ) の結果を返す
+
+        エンコーディングは先頭で判定し、途中でデコードに失敗した場合は
+        残りの候補で全体をデコードし直して consume を最初から実行し直す。
+
+        Args:
+            content: ContractListのバイトデータ
+            consume: チャンクを順に処理する関数（例: FilterEngine.apply_filters_chunked）
+
+        Returns:
+            consume の戻り値
+        """
+        if self.names:
+            return self.resolve(content).apply_chunked(content, consume)
+        encoding = detect_encoding(content, self.encodings)
+        try:
+            return consume(self.iter_chunks(content, encoding))
+        except UnicodeDecodeError:
+            text, _ = decode_bytes(content, self.encodings)
+            return consume(self._read_chunks(io.StringIO(text)))
+
+    def _read_chunks(self, buffer, **kwargs) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            buffer, dtype=str, usecols=self.columns, chunksize=self.chunk_rows, **kwargs
+        ) as chunks:
+            yield from chunks
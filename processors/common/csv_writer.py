@@ -0,0 +1,128 @@
+"""
+CP932 CSV書き出し
+
+DataFrameを CHUNK_ROWS 行ずつCSV文字列にしてCP932でエンコードし、
+バイト列のバッファやZIPのエントリに順に書き込む。
+出力全体のCSV文字列を作ってから encode する方式と違い、
+111列・59列テンプレートの大きな出力でも文字列は1チャンク分しか持たない。
+
+- 重複した列名・空文字の列名もそのまま出力する（一時的な列名の付け替えは不要）
+- CP932で表せない文字は '?' に置き換え、置き換えた文字と件数を返す
+  （errors='strict' の場合は置き換えずに UnicodeEncodeError）
+
+使用例:
+    from processors.common.csv_writer import to_csv_cp932, write_csv_to_zip
+
+    csv_bytes, replaced = to_csv_cp932(df)
+    if replaced:
+        logs.append(f"CP932で表せない文字を置き換え: {format_replaced_chars(replaced)}")
+
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        write_csv_to_zip(zip_file, filename, df)
+"""
+
+import io
+import zipfile
+from typing import BinaryIO, Dict, Tuple
+
+import pandas as pd
+
+from processors.common.metrics import instrument_phase
+
+
+# 1回にCSV文字列にする行数
+CHUNK_ROWS = 5_000
+
+ENCODING = 'cp932'
+
+
+def _encode_chunk(text: str, errors: str, replaced: Dict[str, int]) -> bytes:
+    """
+    チャンクをCP932にエンコード
+
+    大半のチャンクは置き換えが不要なため、まず厳密にエンコードし、
+    失敗した場合だけ表せない文字を数えてから置き換える。
+    """
+    try:
+        return text.encode(ENCODING)
+    except UnicodeEncodeError:
+        if errors == 'strict':
+            raise
+
+    for char in set(text):
+        try:
+            char.encode(ENCODING)
+        except UnicodeEncodeError:
+            replaced[char] = replaced.get(char, 0) + text.count(char)
+    return text.encode(ENCODING, errors=errors)
+
+
+def write_csv_cp932(
+    df: pd.DataFrame,
+    stream: BinaryIO,
+    errors: str = 'replace',
+    chunk_rows: int = CHUNK_ROWS,
+) -> Dict[str, int]:
+    """
+    DataFrameをCP932のCSVとしてバイナリストリームに書き込む
+
+    出力内容は df.to_csv(index=False).encode('cp932', errors=errors) と同じ。
+
+    Args:
+        df: 出力するDataFrame（列名の重複・空文字も可）
+        stream: 書き込み先（BytesIO、ZIPのエントリなど）
+        errors: CP932で表せない文字の扱い（'replace' / 'strict'）
+        chunk_rows: 1回にCSV文字列にする行数
+
+    Returns:
+        dict: 置き換えた文字 → 件数（置き換えがなければ空）
+
+    Raises:
+        UnicodeEncodeError: errors='strict' でCP932で表せない文字がある場合
+    """
+    replaced: Dict[str, int] = {}
+    rows = len(df)
+    start = 0
+    while True:
+        chunk = df.iloc[start:start + chunk_rows]
+        text = chunk.to_csv(index=False, header=(start == 0))
+        stream.write(_encode_chunk(text, errors, replaced))
+        start += chunk_rows
+        if start >= rows:
+            break
+    return replaced
+
+
+@instrument_phase("serialize")
+def to_csv_cp932(df: pd.DataFrame, errors: str = 'replace') -> Tuple[bytes, Dict[str, int]]:
+    """
+    DataFrameをCP932のCSVバイト列に変換
+
+    Returns:
+        tuple: (CSVバイト列, 置き換えた文字 → 件数)
+    """
+    buffer = io.BytesIO()
+    replaced = write_csv_cp932(df, buffer, errors)
+    return buffer.getvalue(), replaced
+
+
+@instrument_phase("serialize", arg=2)
+def write_csv_to_zip(
+    zip_file: zipfile.ZipFile,
+    filename: str,
+    df: pd.DataFrame,
+    errors: str = 'replace',
+) -> Dict[str, int]:
+    """
+    DataFrameをCP932のCSVとしてZIPのエントリに直接書き込む
+
+    Returns:
+        dict: 置き換えた文字 → 件数
+    """
+    with zip_file.open(filename, 'w') as entry:
+        return write_csv_cp932(df, entry, errors)
+
+
+def format_replaced_chars(replaced: Dict[str, int]) -> str:
+    """置き換えた文字の表示用文字列（例: 「𠮷」3件、「鷗」1件）"""
+    return "、".join(f"「{char}」{count}件" for char, count in sorted(replaced.items(), key=lambda item: -item[1]))
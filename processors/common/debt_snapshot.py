@@ -0,0 +1,285 @@
+"""
+残債スナップショットの保存（SQLite）
+
+プラザ・カプコ・アークの残債更新で、その日に取り込んだ残債表
+（会員番号・契約番号 → 残債額）を日付ごとに保存し、
+次回の処理で前回分との差分を取るためのストア。
+
+- 保存先: data/debt_snapshots.sqlite3（Docker では /app/data にマウント）
+  環境変数 DEBT_SNAPSHOT_DB で変更可能
+- テーブル: debt_snapshot（主キー: source, snapshot_date, key）
+  前回分の読み込み・差分の結合は主キーのインデックスで行う
+- 日付: 残債表の日付（ファイル名の YYYYMMDD、report_date_from_filename）。
+  ファイル名に日付がない場合は処理した日。今日より後の日付は受け付けない（resolve_date）
+- 保存のタイミング: 出力データの作成が完了した後（途中で失敗した処理は保存しない）
+- 同じ日の再処理: その日のスナップショットを置き換える
+- 保持期間: 保存のたびに同じ source の retention_days より古いスナップショットを削除
+  （基準日は今日と保存済みの最新日付の遅い方。保存する日付には依存しない）
+
+使用例:
+    from processors.common.debt_snapshot import get_debt_snapshot_store
+
+    store = get_debt_snapshot_store()
+    store.save("plaza", date.today(), member_nos, arrears)
+    previous_date = store.previous_date("plaza", date.today())
+    previous = store.load("plaza", previous_date)
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Union
+
+import pandas as pd
+
+
+# 保存先（環境変数 DEBT_SNAPSHOT_DB が優先）
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / 'data' / 'debt_snapshots.sqlite3'
+
+# スナップショットの保持日数
+DEFAULT_RETENTION_DAYS = 31
+
+# 差分ログに表示する件数の上限
+DIFF_LOG_LIMIT = 10
+
+# ファイル名の日付（例: csv_arrear_20250901.csv、..._入金退去情報_20250901_ミライル委託分.xlsx）
+_FILENAME_DATE = re.compile(r'(?<!\d)(20\d{2})(\d{2})(\d{2})(?!\d)')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS debt_snapshot (
+    source TEXT NOT NULL,
+    snapshot_date TEXT NOT NULL,
+    key TEXT NOT NULL,
+    amount REAL,
+    PRIMARY KEY (source, snapshot_date, key)
+) WITHOUT ROWID
+"""
+
+
+def normalize_keys(keys: Iterable) -> pd.Series:
+    """キー（会員番号・契約番号）を文字列に統一（前後の空白除去、空欄は None）"""
+    keys = pd.Series(keys, dtype=object).reset_index(drop=True)
+    normalized = keys.astype(str).str.strip()
+    return normalized.where(keys.notna() & (normalized != '') & (normalized != 'nan'))
+
+
+def report_date_from_filename(filename: Optional[str]) -> Optional[date]:
+    """ファイル名に含まれる残債表の日付（YYYYMMDD、なければ None）"""
+    for match in _FILENAME_DATE.finditer(filename or ''):
+        try:
+            return date(*map(int, match.groups()))
+        except ValueError:
+            continue
+    return None
+
+
+class DebtSnapshotStore:
+    """日付ごとの残債スナップショット"""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        today: Callable[[], date] = date.today,
+    ):
+        """
+        Args:
+            path: SQLiteファイルのパス（省略時は DEBT_SNAPSHOT_DB または data/debt_snapshots.sqlite3）
+            retention_days: 保持日数（今日からこの日数より古いものを削除）
+            today: 今日の日付を返す関数（テスト用）
+        """
+        self.path = Path(path or os.environ.get('DEBT_SNAPSHOT_DB') or DEFAULT_DB_PATH)
+        self.retention_days = retention_days
+        self.today = today
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def resolve_date(self, snapshot_date: Optional[date] = None) -> date:
+        """
+        スナップショットの日付を確定（省略時は今日）
+
+        Raises:
+            ValueError: 今日より後の日付の場合（ファイル名の日付の誤りなど）
+        """
+        today = self.today()
+        if snapshot_date is None:
+            return today
+        if snapshot_date > today:
+            raise ValueError(
+                f"残債表の日付（{snapshot_date:%Y/%m/%d}）が今日より後になっています。"
+                "ファイル名の日付を確認してください"
+            )
+        return snapshot_date
+
+    def save(self, source: str, snapshot_date: date, keys: Iterable, amounts: Iterable) -> int:
+        """
+        その日のスナップショットを保存（同じ日付の既存分は置き換え）
+
+        キーが空欄の行は保存しない。キーが重複する場合は後の行を残す。
+        金額は数値に変換し、変換できない値は NULL とする。
+
+        Returns:
+            保存した件数
+
+        Raises:
+            ValueError: 今日より後の日付の場合
+        """
+        snapshot_date = self.resolve_date(snapshot_date)
+        frame = pd.DataFrame({
+            'key': normalize_keys(keys),
+            'amount': pd.to_numeric(pd.Series(amounts, dtype=object).reset_index(drop=True), errors='coerce'),
+        })
+        frame = frame.dropna(subset=['key']).drop_duplicates('key', keep='last')
+        amounts = frame['amount'].astype(object).where(frame['amount'].notna(), None)
+        day = snapshot_date.isoformat()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM debt_snapshot WHERE source = ? AND snapshot_date = ?", (source, day)
+            )
+            conn.executemany(
+                "INSERT INTO debt_snapshot (source, snapshot_date, key, amount) VALUES (?, ?, ?, ?)",
+                zip([source] * len(frame), [day] * len(frame), frame['key'], amounts),
+            )
+            self._prune_source(conn, source)
+        return len(frame)
+
+    def _prune_source(self, conn: sqlite3.Connection, source: str) -> int:
+        """source の保持期間を過ぎたスナップショットを削除（基準日は今日と保存済みの最新日付の遅い方）"""
+        latest = conn.execute(
+            "SELECT MAX(snapshot_date) FROM debt_snapshot WHERE source = ?", (source,)
+        ).fetchone()[0]
+        today = max(self.today(), date.fromisoformat(latest)) if latest else self.today()
+        cutoff = (today - timedelta(days=self.retention_days)).isoformat()
+        return conn.execute(
+            "DELETE FROM debt_snapshot WHERE source = ? AND snapshot_date < ?", (source, cutoff)
+        ).rowcount
+
+    def prune(self, today: Optional[date] = None) -> int:
+        """全 source の保持期間を過ぎたスナップショットを削除し、削除した行数を返す"""
+        cutoff = ((today or self.today()) - timedelta(days=self.retention_days)).isoformat()
+        with closing(self._connect()) as conn, conn:
+            return conn.execute("DELETE FROM debt_snapshot WHERE snapshot_date < ?", (cutoff,)).rowcount
+
+    def dates(self, source: str) -> List[date]:
+        """保存済みの日付（古い順）"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT snapshot_date FROM debt_snapshot WHERE source = ? ORDER BY snapshot_date",
+                (source,),
+            ).fetchall()
+        return [date.fromisoformat(row[0]) for row in rows]
+
+    def previous_date(self, source: str, before: date) -> Optional[date]:
+        """before より前で最も新しいスナップショットの日付（なければ None）"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT MAX(snapshot_date) FROM debt_snapshot WHERE source = ? AND snapshot_date < ?",
+                (source, before.isoformat()),
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row[0] else None
+
+    def load(self, source: str, snapshot_date: date) -> pd.DataFrame:
+        """その日のスナップショット（列: key, amount）"""
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                "SELECT key, amount FROM debt_snapshot WHERE source = ? AND snapshot_date = ? ORDER BY key",
+                conn,
+                params=(source, snapshot_date.isoformat()),
+                dtype={'key': object, 'amount': float},
+            )
+
+    def diff(self, source: str, snapshot_date: date, previous_date: date) -> pd.DataFrame:
+        """
+        2つの日付のスナップショットを突合し、残債額が変わったキーを返す
+
+        Returns:
+            列: key, amount（snapshot_date の残債）, previous_amount（previous_date の残債）,
+            change（'changed' / 'added'（当日のみ）/ 'removed'（前回のみ））
+            どちらか一方にしかないキーは、ない側の残債を NaN とする
+        """
+        query = """
+            SELECT cur.key, cur.amount, prev.amount AS previous_amount,
+                CASE WHEN prev.key IS NULL THEN 'added' ELSE 'changed' END AS change
+            FROM debt_snapshot AS cur
+            LEFT JOIN debt_snapshot AS prev
+                ON prev.source = cur.source AND prev.snapshot_date = ? AND prev.key = cur.key
+            WHERE cur.source = ? AND cur.snapshot_date = ?
+                AND prev.amount IS NOT cur.amount
+            UNION ALL
+            SELECT prev.key, NULL, prev.amount, 'removed'
+            FROM debt_snapshot AS prev
+            WHERE prev.source = ? AND prev.snapshot_date = ?
+                AND NOT EXISTS (
+                    SELECT 1 FROM debt_snapshot AS cur
+                    WHERE cur.source = prev.source AND cur.snapshot_date = ? AND cur.key = prev.key
+                )
+            ORDER BY 1
+        """
+        current_day, previous_day = snapshot_date.isoformat(), previous_date.isoformat()
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                query,
+                conn,
+                params=(previous_day, source, current_day, source, previous_day, current_day),
+                dtype={'key': object, 'amount': float, 'previous_amount': float, 'change': object},
+            )
+
+
+def record_snapshot(
+    store: DebtSnapshotStore,
+    source: str,
+    keys: Iterable,
+    amounts: Iterable,
+    snapshot_date: Optional[date] = None,
+) -> List[str]:
+    """
+    当日のスナップショットを保存し、前回のスナップショットとの差分をログ行で返す
+
+    Returns:
+        ログのリスト
+    """
+    snapshot_date = store.resolve_date(snapshot_date)
+    saved = store.save(source, snapshot_date, keys, amounts)
+    logs = [f"💾 残債スナップショット保存: {snapshot_date:%Y/%m/%d} {saved}件"]
+
+    previous_date = store.previous_date(source, snapshot_date)
+    if previous_date is None:
+        logs.append("  - 前回のスナップショットなし（差分比較は次回から）")
+        return logs
+
+    changes = store.diff(source, snapshot_date, previous_date)
+    counts = changes['change'].value_counts()
+    logs.append(
+        f"  - 前回（{previous_date:%Y/%m/%d}）から: 残債変動 {counts.get('changed', 0)}件 / "
+        f"新規 {counts.get('added', 0)}件 / 前回のみ {counts.get('removed', 0)}件"
+    )
+    changed = changes['change'] == 'changed'
+    if changed.any():
+        sample = changes.loc[changed, 'key'].head(DIFF_LOG_LIMIT).tolist()
+        logs.append(f"  - 残債変動の番号（最大{DIFF_LOG_LIMIT}件）: {sample}")
+    return logs
+
+
+_shared_store: Optional[DebtSnapshotStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_debt_snapshot_store() -> DebtSnapshotStore:
+    """プロセス共有のストアを取得（スレッドセーフ）"""
+    global _shared_store
+    store = _shared_store
+    if store is None:
+        with _shared_lock:
+            if _shared_store is None:
+                _shared_store = DebtSnapshotStore()
+            store = _shared_store
+    return store
@@ -42,6 +42,21 @@ class DetailedLogger:
         excluded = before_count - after_count
         return f"{label}フィルタ後: {after_count}件 (除外: {excluded}件)"
     
+    @staticmethod
+    def log_phone_exclusion(label: str, empty_count: int, other_count: int) -> str:
+        """
+        電話番号フィルタの除外詳細ログを生成
+
+        Args:
+            label: ログに表示するラベル
+            empty_count: 空白/NaNで除外された件数
+            other_count: それ以外（固定電話・形式不正など）で除外された件数
+
+        Example:
+            "TEL携帯除外詳細: {空白/NaN: 12件, 固定電話等: 3件}"
+        """
+        return f"{label}除外詳細: {{空白/NaN: {empty_count}件, 固定電話等: {other_count}件}}"
+    
     @staticmethod
     def log_exclusion_details(
         excluded_data: pd.DataFrame, 
@@ -87,7 +102,7 @@ class DetailedLogger:
             tel_data = column_data.astype(str).str.strip()
             empty_count = tel_data[tel_data.isin(['', 'nan', 'NaN'])].count()
             other_count = len(excluded_data) - empty_count
-            return f"{label}除外詳細: {{空白/NaN: {empty_count}件, 固定電話等: {other_count}件}}"
+            return DetailedLogger.log_phone_exclusion(label, empty_count, other_count)
             
         elif log_type == 'date':
             # 日付の上位N件表示
@@ -0,0 +1,261 @@
+"""
+Excel複数シート読み込み
+
+ブックを1回だけ開き、必要なシート・必要な列だけを読み込む。
+pd.read_excel をシートごとに呼ぶと、呼び出しのたびにブック全体（zip展開・
+共有文字列の解析）を開き直すため、3シートの譲渡一覧では3回開くことになる。
+
+- xlsx: openpyxl の read_only（ストリーミング）で開き、セルの値だけを行ごとに読む
+  usecols（列名）を指定した場合はヘッダー行で列位置を決め、その列だけを変換する
+- xls など: pd.ExcelFile で1回だけ開き、シートごとに parse
+- 複数ファイル: read_excel_files でワーカースレッドに分けて読み込む
+
+読み込み結果（列名・値・dtype=str の文字列化・空欄の NaN）は
+pd.read_excel(sheet_name=..., header=..., usecols=..., dtype=...) と同じ。
+（セルの値の変換は pandas の openpyxl 読み込みと同じ規則で行い、
+列名の付番・NaN 判定・型変換は pandas の TextParser に任せる）
+
+使用例:
+    from processors.common.excel_reader import read_excel_files, read_first_sheet
+
+    for book in read_excel_files(transfer_files, ["譲渡許可", "譲渡－東"], header=1, dtype=str):
+        for sheet_name, df in book.sheets.items():
+            ...
+
+    df = read_first_sheet(content, usecols=["会員番号", "延滞額合計"])
+"""
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from processors.common.metrics import instrument_phase
+
+
+# 複数ファイル読み込みのワーカー数の上限
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# xlsx（zip）の先頭バイト
+XLSX_MAGIC = b"PK\x03\x04"
+
+# Excel のエラー値（pandas の読み込みと同じく NaN にする）
+EXCEL_ERROR_VALUES = frozenset(
+    ["#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A", "#GETTING_DATA"]
+)
+
+
+class WorkbookSheets:
+    """1ファイル分の読み込み結果"""
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.sheets: Dict[str, pd.DataFrame] = {}
+        self.missing: List[str] = []
+        # ブックを開けなかった場合の例外
+        self.error: Optional[Exception] = None
+        # シートの読み込みに失敗した場合のシート名 → 例外（他のシートは読み込む）
+        self.sheet_errors: Dict[str, Exception] = {}
+
+
+@instrument_phase("read")
+def read_excel_sheets(
+    content: bytes,
+    sheet_names: Optional[Sequence[str]] = None,
+    header: int = 0,
+    usecols: Optional[Sequence[str]] = None,
+    dtype: Any = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    ブックを1回だけ開いて複数シートを読み込む
+
+    Args:
+        content: Excelファイルのバイトデータ（xlsx / xls）
+        sheet_names: 読み込むシート名（None の場合は先頭シート）
+        header: ヘッダー行の位置（0始まり）
+        usecols: 読み込む列名（None の場合は全列）
+        dtype: pd.read_excel の dtype と同じ
+
+    Returns:
+        シート名 → DataFrame（ブックにないシートは含まない）
+    """
+    sheets = _read_sheets(content, sheet_names, header, usecols, dtype)
+    for sheet in sheets.values():
+        if isinstance(sheet, Exception):
+            raise sheet
+    return sheets
+
+
+def read_first_sheet(content: bytes, **kwargs) -> pd.DataFrame:
+    """先頭シートを読み込む（引数は read_excel_sheets と同じ）"""
+    return next(iter(read_excel_sheets(content, None, **kwargs).values()))
+
+
+@instrument_phase("read")
+def read_excel_files(
+    files: Sequence[Tuple[str, bytes]],
+    sheet_names: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    **kwargs,
+) -> List[WorkbookSheets]:
+    """
+    複数ファイルをワーカースレッドで読み込む
+
+    読み込みに失敗したファイル・シートは例外を送出せず、
+    結果の error（ブックを開けない場合）・sheet_errors（シートごと）に設定する。
+
+    Args:
+        files: (ファイル名, バイトデータ) のリスト
+        sheet_names: 読み込むシート名（None の場合は先頭シート）
+        max_workers: ワーカー数（省略時は DEFAULT_MAX_WORKERS とファイル数の小さい方）
+        **kwargs: read_excel_sheets の header / usecols / dtype
+
+    Returns:
+        ファイルの順番どおりの読み込み結果
+    """
+    def read(file: Tuple[str, bytes]) -> WorkbookSheets:
+        file_name, content = file
+        book = WorkbookSheets(file_name)
+        try:
+            sheets = _read_sheets(content, sheet_names, **kwargs)
+        except Exception as e:
+            book.error = e
+            return book
+        for name, sheet in sheets.items():
+            if isinstance(sheet, Exception):
+                book.sheet_errors[name] = sheet
+            else:
+                book.sheets[name] = sheet
+        if sheet_names is not None:
+            book.missing = [name for name in sheet_names if name not in sheets]
+        return book
+
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, len(files))
+    if workers <= 1:
+        return [read(file) for file in files]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="excel") as executor:
+        return list(executor.map(read, files))
+
+
+def _read_sheets(
+    content: bytes,
+    sheet_names: Optional[Sequence[str]],
+    header: int = 0,
+    usecols: Optional[Sequence[str]] = None,
+    dtype: Any = None,
+) -> Dict[str, Union[pd.DataFrame, Exception]]:
+    """ブックを1回だけ開いてシートを読み込む（シートの読み込みエラーは例外を値として返す）"""
+    if content[:4] == XLSX_MAGIC:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(io.BytesIO(content), read_only=True, data_only=True, keep_links=False)
+        try:
+            return {
+                name: _try(lambda: _parse_xlsx_sheet(workbook[name], header, usecols, dtype, name))
+                for name in _present(workbook.sheetnames, sheet_names)
+            }
+        finally:
+            workbook.close()
+
+    with pd.ExcelFile(io.BytesIO(content)) as book:
+        return {
+            name: _try(lambda: book.parse(name, header=header, usecols=usecols, dtype=dtype))
+            for name in _present(book.sheet_names, sheet_names)
+        }
+
+
+def _present(book_sheet_names: List[str], sheet_names: Optional[Sequence[str]]) -> List[str]:
+    """読み込むシート名（None の場合は先頭シート、ブックにないシートは除く）"""
+    if sheet_names is None:
+        return book_sheet_names[:1]
+    return [name for name in sheet_names if name in book_sheet_names]
+
+
+def _try(read: Callable[[], pd.DataFrame]) -> Union[pd.DataFrame, Exception]:
+    try:
+        return read()
+    except Exception as e:
+        return e
+
+
+def _parse_xlsx_sheet(sheet, header: int, usecols: Optional[Sequence[str]], dtype: Any, sheet_name: str) -> pd.DataFrame:
+    rows, selected = _sheet_rows(sheet, header, usecols)
+    return _parse_rows(rows, header, None if selected else usecols, dtype, sheet_name)
+
+
+def _convert_value(value: Any) -> Any:
+    """セルの値を pandas の openpyxl 読み込みと同じ規則で変換"""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str) and value in EXCEL_ERROR_VALUES:
+        return np.nan
+    return value
+
+
+def _sheet_rows(sheet, header: int, usecols: Optional[Sequence[str]]) -> Tuple[List[list], bool]:
+    """
+    シートの行を読み込む
+
+    Returns:
+        (行のリスト, usecols の列だけに絞り込んだか)
+        ヘッダーに usecols の列名が1つずつ揃っていない場合は全列を返し、
+        列の選択（と列が見つからないエラー）は TextParser に任せる
+    """
+    reader = sheet.iter_rows(values_only=True)
+    rows: List[list] = []
+    positions: Optional[List[int]] = None
+    last_row_with_data = -1
+
+    for row_number, values in enumerate(reader):
+        if positions is not None:
+            row = [_convert_value(values[i]) if i < len(values) else "" for i in positions]
+        else:
+            row = [_convert_value(value) for value in values]
+            while row and row[-1] == "":
+                row.pop()
+        # 空行の判定は全列で行う（pd.read_excel と同じく末尾の空行だけを除く）
+        if any(value is not None and value != "" for value in values):
+            last_row_with_data = row_number
+        rows.append(row)
+
+        if row_number == header and usecols is not None:
+            positions = _column_positions(row, usecols)
+            if positions is not None:
+                rows = [[r[i] if i < len(r) else "" for i in positions] for r in rows]
+
+    rows = rows[: last_row_with_data + 1]
+    if rows and positions is None:
+        width = max(len(row) for row in rows)
+        rows = [row + [""] * (width - len(row)) for row in rows]
+    return rows, positions is not None
+
+
+def _column_positions(header_row: list, usecols: Sequence[str]) -> Optional[List[int]]:
+    """usecols の列位置（ヘッダーの順）。列名が重複・欠落している場合は None"""
+    positions = []
+    for name in usecols:
+        matches = [i for i, value in enumerate(header_row) if value == name]
+        if len(matches) != 1:
+            return None
+        positions.append(matches[0])
+    return sorted(set(positions))
+
+
+def _parse_rows(rows: List[list], header: int, usecols: Optional[Sequence[str]], dtype: Any, sheet_name: str) -> pd.DataFrame:
+    """読み込んだ行を pd.read_excel と同じ規則で DataFrame に変換"""
+    if not rows:
+        return pd.DataFrame()
+    try:
+        parser = TextParser(rows, header=header, usecols=usecols, dtype=dtype, skip_blank_lines=False)
+        return parser.read()
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+    except Exception as err:
+        err.args = (f"{err.args[0]} (sheet: {sheet_name})", *err.args[1:])
+        raise err
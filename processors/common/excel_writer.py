@@ -0,0 +1,183 @@
+"""
+Excel書き出し（openpyxl 書き込み専用モード）
+
+DataFrameを openpyxl の write-only モードで1行ずつシートに書き込む。
+フォント・数値書式・ヘッダーの配置は列単位で1回だけ作成し、各セルに割り当てる。
+pd.ExcelWriter で全セルを書いた後に全セルを走査してフォントや書式を設定する方式と違い、
+ワークブック全体をメモリ上に保持しない。
+
+- NaN / None は空白セル（フォントは適用）、無限大は 'inf' として書き出す
+- 数値書式は、指定した列の数値（bool以外）のセルにだけ適用する
+- 罫線は付けない
+- 進捗: 書き出したデータ行数を report_progress で報告（PROGRESS_EVERY_ROWS 行ごと）
+
+使用例:
+    from openpyxl.styles import Font
+    from processors.common.excel_writer import ExcelSheet, to_excel_bytes
+
+    font = Font(name='游ゴシック', size=11)
+    excel_bytes = to_excel_bytes([
+        ExcelSheet("契約者", df, font, number_formats={"滞納残債": '#,##0'}),
+    ])
+"""
+
+import io
+import numbers
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import Cell
+from openpyxl.styles import Alignment, Font, PatternFill
+
+from processors.common.metrics import instrument_phase
+from processors.common.progress import report_progress
+
+
+# 進捗を報告する行数の間隔
+PROGRESS_EVERY_ROWS = 1000
+
+
+class ExcelSheet:
+    """
+    1シート分の書き出し設定
+
+    Args:
+        name: シート名
+        df: 書き出すDataFrame
+        font: 全セルに適用するフォント
+        header: 1行目に列名を書き出すか
+        number_formats: 列名 → 数値書式（例: '#,##0'）
+        header_alignment: ヘッダー行のセルの配置
+        row_fills: 行番号（1始まり）→ (背景色, A列から塗る列数)
+        column_widths: 列記号（'C'など）→ 列幅
+    """
+
+    def __init__(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        font: Font,
+        header: bool = True,
+        number_formats: Optional[Dict[str, str]] = None,
+        header_alignment: Optional[Alignment] = None,
+        row_fills: Optional[Dict[int, Tuple[PatternFill, int]]] = None,
+        column_widths: Optional[Dict[str, float]] = None,
+    ):
+        self.name = name
+        self.df = df
+        self.font = font
+        self.header = header
+        self.number_formats = number_formats or {}
+        self.header_alignment = header_alignment
+        self.row_fills = row_fills or {}
+        self.column_widths = column_widths or {}
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _column_values(series: pd.Series) -> List:
+    """
+    列の値をPythonのリストで取得
+
+    NaN / None / NaT は None（空白セル）、無限大は pd.ExcelWriter と同じく 'inf' / '-inf' の文字列にする。
+    """
+    values = series.tolist()
+    for i in series.isna().to_numpy().nonzero()[0]:
+        values[i] = None
+    if pd.api.types.is_float_dtype(series.dtype):
+        array = series.to_numpy(dtype=float, na_value=np.nan)
+        for i in np.isinf(array).nonzero()[0]:
+            values[i] = 'inf' if array[i] > 0 else '-inf'
+    return values
+
+
+def _write_sheet(workbook: Workbook, sheet: ExcelSheet, rows_before: int, total_rows: int) -> None:
+    ws = workbook.create_sheet(sheet.name)
+    for letter, width in sheet.column_widths.items():
+        ws.column_dimensions[letter].width = width
+
+    def style(**attrs):
+        """スタイルを設定したセルを1つ作り、そのスタイルを列のセルで共有する"""
+        cell = WriteOnlyCell(ws)
+        cell.font = sheet.font
+        for name, value in attrs.items():
+            setattr(cell, name, value)
+        return cell._style
+
+    df = sheet.df
+    column_count = len(df.columns)
+    base_style = style()
+
+    # 行単位の背景色（列ごとのスタイルより優先）
+    row_styles = {}
+    for row_number, (fill, fill_columns) in sheet.row_fills.items():
+        fill_style = style(fill=fill)
+        row_styles[row_number] = [
+            fill_style if col < fill_columns else None for col in range(column_count)
+        ]
+
+    row_number = 0
+
+    def append(values, styles, number_styles=None):
+        nonlocal row_number
+        row_number += 1
+        overrides = row_styles.get(row_number)
+        row = []
+        for col, value in enumerate(values):
+            cell_style = styles[col]
+            if overrides is not None and overrides[col] is not None:
+                cell_style = overrides[col]
+            elif number_styles is not None and number_styles[col] is not None and _is_number(value):
+                cell_style = number_styles[col]
+            row.append(Cell(ws, row=1, column=1, value=value, style_array=cell_style))
+        ws.append(row)
+
+    if sheet.header:
+        header_style = style(alignment=sheet.header_alignment) if sheet.header_alignment else base_style
+        append(list(df.columns), [header_style] * column_count)
+
+    styles = [base_style] * column_count
+    number_styles = [
+        style(number_format=sheet.number_formats[column]) if column in sheet.number_formats else None
+        for column in df.columns
+    ]
+    if all(number_style is None for number_style in number_styles):
+        number_styles = None
+
+    phase = f"Excel書き出し（{sheet.name}）"
+    report_progress(phase, rows_before, total_rows)
+    columns = [_column_values(df.iloc[:, col]) for col in range(column_count)]
+    for position, values in enumerate(zip(*columns), 1):
+        append(values, styles, number_styles)
+        if position % PROGRESS_EVERY_ROWS == 0:
+            report_progress(phase, rows_before + position, total_rows)
+
+
+def write_excel(sheets: List[ExcelSheet], stream: BinaryIO) -> None:
+    """
+    シート設定のリストを1つのExcelファイルとしてバイナリストリームに書き込む
+
+    Args:
+        sheets: シートごとの書き出し設定（この順にシートを作成）
+        stream: 書き込み先（BytesIOなど）
+    """
+    workbook = Workbook(write_only=True)
+    total_rows = sum(len(sheet.df) for sheet in sheets)
+    rows_before = 0
+    for sheet in sheets:
+        _write_sheet(workbook, sheet, rows_before, total_rows)
+        rows_before += len(sheet.df)
+    workbook.save(stream)
+
+
+@instrument_phase("serialize")
+def to_excel_bytes(sheets: List[ExcelSheet]) -> bytes:
+    """シート設定のリストをExcelファイルのバイト列に変換"""
+    buffer = io.BytesIO()
+    write_excel(sheets, buffer)
+    return buffer.getvalue()
@@ -0,0 +1,211 @@
+"""
+バックグラウンドジョブ実行
+
+時間のかかる処理（6万行のアーク・ナップ登録、訪問リストなど）を
+Streamlit のスクリプトスレッドではなく共有のワーカースレッドで実行する。
+
+- ワーカー: プロセス共有の ThreadPoolExecutor（上限 max_workers）
+  全ユーザーのジョブが同じワーカーを順番に使う（上限を超えた分は待機）
+- 登録簿: セッションID → ジョブキー（画面ごとのキー）→ Job
+  同じセッション・同じキーで再投入すると前のジョブを置き換える
+- 後始末: 完了から retention_seconds を過ぎたジョブは投入・取得のたびに削除
+  完了したジョブ（処理結果の DataFrame・バイト列を保持）は全セッションで max_retained 件まで
+  （超えた分は完了の古い順に削除）
+- 進捗: 処理関数内の report_progress（processors/common/progress.py）をジョブの進捗に反映
+
+ProcessPoolExecutor は使わない（画面の処理関数は lambda で、
+引数・結果の DataFrame もプロセス間で受け渡すとコピーが発生するため）。
+
+使用例:
+    from processors.common.job_runner import get_job_runner
+
+    runner = get_job_runner()
+    job = runner.submit(session_id, "ark_registration", process_function, file_data)
+    job = runner.get(session_id, "ark_registration")
+    if job.done:
+        result = job.result()
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from processors.common.progress import ProgressUpdate, progress_scope
+
+
+# ワーカー数の上限（環境変数 JOB_WORKERS が優先）
+DEFAULT_MAX_WORKERS = 2
+
+# 完了したジョブを登録簿に残す秒数
+DEFAULT_RETENTION_SECONDS = 60 * 60
+
+# 登録簿に残す完了したジョブの上限（全セッション合計）
+DEFAULT_MAX_RETAINED_JOBS = 20
+
+# ジョブの状態
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    """投入した1つの処理"""
+
+    def __init__(self, key: str):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.status = QUEUED
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.progress = 0.0
+        self.message = ""
+        self.eta_seconds: Optional[float] = None
+        self.future: Optional[Future] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    @property
+    def elapsed(self) -> float:
+        """実行時間（秒）。実行前は0、実行中は現在までの時間"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def update_progress(self, progress: float, message: str = "") -> None:
+        """進捗を更新（処理関数の progress_callback(progress, message) と同じ形式）"""
+        self.progress = min(max(progress, 0.0), 1.0)
+        if message:
+            self.message = message
+
+    def apply_progress(self, update: ProgressUpdate) -> None:
+        """report_progress の報告を反映"""
+        self.progress = update.fraction
+        self.message = update.format()
+        self.eta_seconds = update.eta_seconds
+
+    def result(self) -> Any:
+        """処理結果（処理で発生した例外はそのまま送出）"""
+        return self.future.result()
+
+    def error(self) -> Optional[BaseException]:
+        """処理で発生した例外（正常終了・未完了の場合は None）"""
+        if self.status != FAILED:
+            return None
+        return self.future.exception()
+
+
+class JobRunner:
+    """ワーカースレッドとセッションごとのジョブ登録簿"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+        max_retained: int = DEFAULT_MAX_RETAINED_JOBS,
+    ):
+        max_workers = max_workers or int(os.environ.get("JOB_WORKERS", DEFAULT_MAX_WORKERS))
+        self.max_workers = max_workers
+        self.retention_seconds = retention_seconds
+        self.max_retained = max_retained
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Dict[str, Job]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, session_id: str, key: str, func: Callable, *args, **kwargs) -> Job:
+        """
+        処理をジョブとして投入
+
+        Args:
+            session_id: 登録簿のセッションID
+            key: セッション内のジョブキー（画面ごと）
+            func: 実行する関数（引数は args, kwargs）
+
+        Returns:
+            投入したジョブ
+        """
+        job = Job(key)
+
+        def run():
+            job.status = RUNNING
+            job.started_at = time.time()
+            try:
+                with progress_scope(job.apply_progress):
+                    result = func(*args, **kwargs)
+            except BaseException:
+                job.finished_at = time.time()
+                job.status = FAILED
+                raise
+            job.finished_at = time.time()
+            job.progress = 1.0
+            job.status = DONE
+            return result
+
+        with self._lock:
+            self._expire()
+            job.future = self._executor.submit(run)
+            self._jobs.setdefault(session_id, {})[key] = job
+        return job
+
+    def get(self, session_id: str, key: str) -> Optional[Job]:
+        """セッション・キーのジョブ（なければ None）"""
+        with self._lock:
+            self._expire()
+            return self._jobs.get(session_id, {}).get(key)
+
+    def discard(self, session_id: str, key: str) -> None:
+        """ジョブを登録簿から削除（実行中の処理は止めない）"""
+        with self._lock:
+            jobs = self._jobs.get(session_id, {})
+            jobs.pop(key, None)
+            if not jobs:
+                self._jobs.pop(session_id, None)
+
+    def active_count(self) -> int:
+        """待機中・実行中のジョブ数（全セッション）"""
+        with self._lock:
+            self._expire()
+            return sum(not job.done for jobs in self._jobs.values() for job in jobs.values())
+
+    def _expire(self) -> None:
+        """
+        完了から retention_seconds を過ぎたジョブと、
+        max_retained 件を超えた完了済みジョブ（完了の古い順）を削除（ロック取得済みで呼ぶ）
+        """
+        cutoff = time.time() - self.retention_seconds
+        finished = sorted(
+            ((job.finished_at, session_id, key)
+             for session_id, jobs in self._jobs.items() for key, job in jobs.items() if job.done),
+            reverse=True,
+        )
+        for number, (finished_at, session_id, key) in enumerate(finished):
+            if finished_at < cutoff or number >= self.max_retained:
+                jobs = self._jobs[session_id]
+                del jobs[key]
+                if not jobs:
+                    del self._jobs[session_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_shared_runner: Optional[JobRunner] = None
+_shared_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """プロセス共有のジョブ実行を取得（スレッドセーフ）"""
+    global _shared_runner
+    runner = _shared_runner
+    if runner is None:
+        with _shared_lock:
+            if _shared_runner is None:
+                _shared_runner = JobRunner()
+            runner = _shared_runner
+    return runner
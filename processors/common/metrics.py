@@ -0,0 +1,480 @@
+"""
+処理の実行メトリクス（処理時間・件数・メモリ）
+
+画面から実行した処理（ジョブ）ごとに、処理時間・入出力の件数とバイト数・
+RSS の最大値を記録し、管理画面（screens/metrics.py）で処理ごとの
+p50 / p95 処理時間とスループットを表示するためのストア。
+
+- 実行単位: measure_run(処理名) の中で実行した処理を1件として記録
+  （components/background_job.py の submit_job が全ジョブを囲む）
+- フェーズ: read / filter / convert / serialize の共通関数に @instrument_phase を付け、
+  実行中の処理のフェーズごとの時間・件数を集計する
+  （実行中の処理がない場合・同じスレッドで入れ子になった呼び出しは計測しない）
+- 保存先: data/metrics.jsonl（追記のみの JSON Lines、Docker では /app/data にマウント）
+  環境変数 METRICS_FILE で変更可能
+- プロファイル取得との重なり: profiling_window()（processors/common/profiler.py が使用）の間に
+  実行していた処理は profiling_overlap を付けて記録し、処理時間・スループットの集計から除く
+  （tracemalloc はプロセス全体にかかり、同時に実行した処理も遅くなるため）
+- メモリ: 処理中の RSS の最大値（psutil で計測。psutil がない場合は /proc/self/statm から読み取り、
+  どちらも使えない環境では記録しない）
+
+記録の失敗（書き込めない場合など）は処理結果に影響させない。
+
+使用例:
+    from processors.common.metrics import instrument_phase, measure_run
+
+    @instrument_phase("read")
+    def read_csv_cached(content, ...):
+        ...
+
+    # 呼び出し側（ジョブ）
+    with measure_run("ark_registration", file_data) as run:
+        run.set_result(process_ark_data(*file_data))
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import pandas as pd
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+logger = logging.getLogger(__name__)
+
+# 保存先（環境変数 METRICS_FILE が優先）
+DEFAULT_METRICS_PATH = Path(__file__).parent.parent.parent / 'data' / 'metrics.jsonl'
+
+# RSS の読み取り間隔（秒）
+RSS_SAMPLE_INTERVAL = 0.05
+
+# psutil がない場合の RSS の読み取り元（Linux）
+PROC_STATM = Path("/proc/self/statm")
+
+# フェーズ名
+PHASES = ("read", "filter", "convert", "serialize")
+
+# 件数・バイト数を数える入れ子の深さ（例: {キー: (DataFrame, ログ, ファイル名)}）
+_SIZE_DEPTH = 3
+
+_current_run: ContextVar[Optional["RunMetrics"]] = ContextVar("metrics_run", default=None)
+_current_phase: ContextVar[Optional[str]] = ContextVar("metrics_phase", default=None)
+
+
+def measure_size(value: Any, depth: int = _SIZE_DEPTH) -> Tuple[Optional[int], Optional[int]]:
+    """
+    値に含まれる DataFrame の行数とバイト列のバイト数
+
+    タプル・リスト・辞書の中は depth 段まで数える。
+    ExcelSheet のように df 属性を持つ値はその DataFrame を数える。
+
+    Returns:
+        tuple: (行数, バイト数)（含まれない場合は None）
+    """
+    if isinstance(value, pd.DataFrame):
+        return len(value), None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return None, len(value)
+    if hasattr(value, "getbuffer"):
+        return None, value.getbuffer().nbytes
+    if isinstance(getattr(value, "df", None), pd.DataFrame):
+        return len(value.df), None
+    if depth <= 0 or isinstance(value, str):
+        return None, None
+    if isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, (tuple, list)):
+        items = value
+    else:
+        return None, None
+    rows = size = None
+    for item in items:
+        item_rows, item_size = measure_size(item, depth - 1)
+        rows = _add(rows, item_rows)
+        size = _add(size, item_size)
+    return rows, size
+
+
+def _add(total: Optional[int], value: Optional[int]) -> Optional[int]:
+    if value is None:
+        return total
+    return (total or 0) + value
+
+
+def read_rss() -> Optional[int]:
+    """現在のプロセスの RSS（バイト）。読み取れない環境では None"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        resident_pages = int(PROC_STATM.read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class RssSampler:
+    """処理中の RSS の最大値をバックグラウンドスレッドで読み取る（読み取れない環境では None）"""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.start: Optional[int] = None
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        self.start = self.peak = read_rss()
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        return False
+
+    def _sample(self):
+        while True:
+            self.peak = max(self.peak, read_rss() or 0)
+            if self._stop.wait(self.interval):
+                break
+
+
+class RunMetrics:
+    """1回の実行の計測値"""
+
+    def __init__(self, processor: str):
+        self.processor = processor
+        self.started_at = datetime.now()
+        self.seconds: Optional[float] = None
+        self.rows_in: Optional[int] = None
+        self.bytes_in: Optional[int] = None
+        self.rows_out: Optional[int] = None
+        self.bytes_out: Optional[int] = None
+        self.peak_rss: Optional[int] = None
+        self.rss_start: Optional[int] = None
+        self.error: Optional[str] = None
+        self.profiling_overlap = False
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def set_inputs(self, value: Any) -> None:
+        """処理関数の引数から入力の件数・バイト数を設定"""
+        self.rows_in, self.bytes_in = measure_size(value)
+
+    def set_result(self, value: Any) -> None:
+        """処理結果から出力の件数・バイト数を設定"""
+        self.rows_out, self.bytes_out = measure_size(value)
+
+    def add_phase(self, phase: str, seconds: float, rows_in, bytes_in, rows_out, bytes_out) -> None:
+        """フェーズ1回分の時間・件数を集計に加える"""
+        with self._lock:
+            total = self.phases.setdefault(phase, {"calls": 0, "seconds": 0.0})
+            total["calls"] += 1
+            total["seconds"] = round(total["seconds"] + seconds, 4)
+            for name, value in (("rows_in", rows_in), ("bytes_in", bytes_in),
+                                ("rows_out", rows_out), ("bytes_out", bytes_out)):
+                if value is not None:
+                    total[name] = total.get(name, 0) + value
+
+    def to_record(self) -> Dict[str, Any]:
+        """保存用の辞書
+
+        入力件数は「読み込みで得た行数」と「引数の DataFrame の行数」の合計、
+        出力バイト数は「処理結果のバイト列」がない場合に書き出し（serialize）の合計を使う。
+        """
+        read = self.phases.get("read", {})
+        serialize = self.phases.get("serialize", {})
+        return {
+            "timestamp": self.started_at.isoformat(timespec="seconds"),
+            "processor": self.processor,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "seconds": self.seconds,
+            "rows_in": _add(self.rows_in, read.get("rows_out")),
+            "rows_out": self.rows_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out if self.bytes_out is not None else serialize.get("bytes_out"),
+            "profiling_overlap": self.profiling_overlap,
+            "peak_rss_mb": _mb(self.peak_rss),
+            "rss_delta_mb": _mb(self.peak_rss - self.rss_start) if self.peak_rss is not None else None,
+            "phases": self.phases,
+        }
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return round(value / 1024 / 1024, 1) if value is not None else None
+
+
+class MetricsStore:
+    """実行メトリクスの保存先（追記のみの JSON Lines）"""
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path or os.environ.get("METRICS_FILE") or DEFAULT_METRICS_PATH)
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """1件を追記"""
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def read(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        保存済みの記録を読み込む
+
+        Args:
+            since: この日時以降の記録だけを返す（None の場合は全件）
+
+        書き込み途中などで読めない行は読み飛ばす。
+        """
+        if not self.path.exists():
+            return []
+        threshold = since.isoformat(timespec="seconds") if since is not None else None
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if threshold is not None and str(record.get("timestamp", "")) < threshold:
+                    continue
+                records.append(record)
+        return records
+
+    def read_days(self, days: int) -> List[Dict[str, Any]]:
+        """直近 days 日の記録"""
+        return self.read(datetime.now() - timedelta(days=days))
+
+
+# プロセス共有のストア
+_shared_store: Optional[MetricsStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_metrics_store() -> MetricsStore:
+    """プロセス共有のストアを取得"""
+    global _shared_store
+    store = _shared_store
+    if store is None:
+        with _shared_lock:
+            if _shared_store is None:
+                _shared_store = MetricsStore()
+            store = _shared_store
+    return store
+
+
+class ProfilingWindow:
+    """プロファイル取得の期間（取得中に実行していた他の処理名を集める）"""
+
+    def __init__(self):
+        self.concurrent: List[str] = []
+
+
+# 実行中の処理とプロファイル取得の期間（重なりの判定用）
+_active_runs: Set[RunMetrics] = set()
+_profiling_windows: List[ProfilingWindow] = []
+_runs_lock = threading.Lock()
+
+
+def _overlap(run: RunMetrics, window: ProfilingWindow) -> None:
+    """実行とプロファイル取得の重なりを記録（_runs_lock 取得済みで呼ぶ）"""
+    run.profiling_overlap = True
+    window.concurrent.append(run.processor)
+
+
+@contextmanager
+def profiling_window() -> Iterator[ProfilingWindow]:
+    """
+    プロファイル取得の期間
+
+    期間中に実行していた処理（期間の前から実行中のものを含む）の記録に profiling_overlap を付け、
+    その処理名を ProfilingWindow.concurrent に集める。
+    """
+    window = ProfilingWindow()
+    with _runs_lock:
+        _profiling_windows.append(window)
+        for run in _active_runs:
+            _overlap(run, window)
+    try:
+        yield window
+    finally:
+        with _runs_lock:
+            _profiling_windows.remove(window)
+
+
+@contextmanager
+def measure_run(processor: str, inputs: Any = None, store: Optional[MetricsStore] = None) -> Iterator[RunMetrics]:
+    """
+    ブロック内の処理を1回の実行として計測して保存
+
+    Args:
+        processor: 処理名（画面のジョブキーなど）
+        inputs: 処理関数の引数（入力の件数・バイト数を数える）
+        store: 保存先（省略時はプロセス共有のストア）
+
+    例外が発生した場合もエラーとして記録し、例外はそのまま送出する。
+    """
+    run = RunMetrics(processor)
+    run.set_inputs(inputs)
+    with _runs_lock:
+        _active_runs.add(run)
+        for window in _profiling_windows:
+            _overlap(run, window)
+    token = _current_run.set(run)
+    phase_token = _current_phase.set(None)
+    sampler = RssSampler()
+    start = time.perf_counter()
+    try:
+        with sampler:
+            yield run
+    except Exception as e:
+        run.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        run.seconds = round(time.perf_counter() - start, 4)
+        run.peak_rss, run.rss_start = sampler.peak, sampler.start
+        with _runs_lock:
+            _active_runs.discard(run)
+        _current_phase.reset(phase_token)
+        _current_run.reset(token)
+        try:
+            (store or get_metrics_store()).append(run.to_record())
+        except Exception as e:
+            logger.warning(f"メトリクスの記録に失敗しました: {e}")
+
+
+def instrument_run(processor: str, func: Callable, store: Optional[MetricsStore] = None) -> Callable:
+    """func の呼び出しを measure_run で計測する関数を返す"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with measure_run(processor, (args, kwargs), store) as run:
+            result = func(*args, **kwargs)
+            run.set_result(result)
+            return result
+    return wrapper
+
+
+def current_run() -> Optional[RunMetrics]:
+    """計測中の実行（なければ None）"""
+    return _current_run.get()
+
+
+def instrument_phase(phase: str, arg: int = 0) -> Callable[[Callable], Callable]:
+    """
+    関数の呼び出しをフェーズとして計測するデコレータ
+
+    Args:
+        phase: フェーズ名（PHASES のいずれか）
+        arg: 入力の件数・バイト数を数える引数の位置（メソッドの場合は 1）
+
+    計測中の実行がない場合、他のフェーズの中から呼ばれた場合は何もしない。
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            run = _current_run.get()
+            if run is None or _current_phase.get() is not None:
+                return func(*args, **kwargs)
+            token = _current_phase.set(phase)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _current_phase.reset(token)
+            seconds = time.perf_counter() - start
+            rows_in, bytes_in = measure_size(args[arg]) if len(args) > arg else (None, None)
+            rows_out, bytes_out = measure_size(result)
+            run.add_phase(phase, seconds, rows_in, bytes_in, rows_out, bytes_out)
+            return result
+        return wrapper
+    return decorator
+
+
+def metrics_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """記録のリストを DataFrame に変換（timestamp は日時、rows_per_sec を追加）"""
+    columns = ["timestamp", "processor", "status", "seconds", "rows_in", "rows_out",
+               "bytes_in", "bytes_out", "peak_rss_mb", "profiling_overlap", "error"]
+    df = pd.DataFrame(records).reindex(columns=columns)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    df["profiling_overlap"] = df["profiling_overlap"].eq(True)
+    for column in ["seconds", "rows_in", "rows_out", "bytes_in", "bytes_out", "peak_rss_mb"]:
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+    seconds = df["seconds"].where(df["seconds"] > 0)
+    df["rows_per_sec"] = df["rows_in"] / seconds
+    return df.dropna(subset=["timestamp", "processor"])
+
+
+def _measured_runs(df: pd.DataFrame) -> pd.DataFrame:
+    """処理時間・メモリの集計に使う実行（成功し、プロファイル取得と重なっていないもの）"""
+    return df[(df["status"] == "ok") & ~df["profiling_overlap"]]
+
+
+def summarize_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    処理ごとの集計（metrics_frame の結果から作成）
+
+    Returns:
+        pd.DataFrame: 処理名・実行回数・エラー回数・p50 / p95 処理時間・
+        スループットの中央値・最大 RSS・最終実行日時（実行回数の多い順）
+        処理時間・スループット・RSS はプロファイル取得と重なった実行を除いて集計する。
+    """
+    columns = ["processor", "runs", "errors", "p50_seconds", "p95_seconds",
+               "p50_rows_per_sec", "max_peak_rss_mb", "last_run"]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    ok = _measured_runs(df)
+    grouped = df.groupby("processor")
+    summary = pd.DataFrame({
+        "runs": grouped.size(),
+        "errors": grouped["status"].apply(lambda status: int((status == "error").sum())),
+        "p50_seconds": ok.groupby("processor")["seconds"].quantile(0.5),
+        "p95_seconds": ok.groupby("processor")["seconds"].quantile(0.95),
+        "p50_rows_per_sec": ok.groupby("processor")["rows_per_sec"].median(),
+        "max_peak_rss_mb": ok.groupby("processor")["peak_rss_mb"].max(),
+        "last_run": grouped["timestamp"].max(),
+    })
+    summary = summary.sort_values(["runs", "last_run"], ascending=False)
+    return summary.rename_axis("processor").reset_index()[columns]
+
+
+def daily_metrics(df: pd.DataFrame, processor: Optional[str] = None) -> pd.DataFrame:
+    """
+    日ごとの p50 / p95 処理時間とスループットの中央値（成功し、プロファイル取得と重なっていない実行のみ）
+
+    Args:
+        df: metrics_frame の結果
+        processor: 処理名（None の場合は全処理）
+
+    Returns:
+        pd.DataFrame: 日付をインデックスとした runs / p50_seconds / p95_seconds / p50_rows_per_sec
+    """
+    ok = _measured_runs(df)
+    if processor is not None:
+        ok = ok[ok["processor"] == processor]
+    grouped = ok.groupby(ok["timestamp"].dt.floor("D").rename("date"))
+    return pd.DataFrame({
+        "runs": grouped.size(),
+        "p50_seconds": grouped["seconds"].quantile(0.5),
+        "p95_seconds": grouped["seconds"].quantile(0.95),
+        "p50_rows_per_sec": grouped["rows_per_sec"].median(),
+    })
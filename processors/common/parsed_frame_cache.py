@@ -0,0 +1,195 @@
+"""
+アップロードCSVの読み込み結果キャッシュ
+
+同じContractListをミライル・フェイス・プラザ・通知・訪問リストなど
+複数の画面で続けて処理する場合や、「処理を実行」を押し直した場合に、
+同じバイト列のデコード・CSV解析を繰り返さないためのキャッシュ。
+
+- キー: バイト列のSHA-256 + 読み込みオプション（dtype, usecols など）
+- 上限: DataFrameのメモリ使用量の合計（max_bytes）と件数（max_entries）
+- 追い出し: 最も長く使われていないもの（LRU）から
+- 取得時は DataFrame のコピーを返す（呼び出し側で列を追加・変更してもキャッシュは変わらない）
+
+キャッシュはプロセス共有（スレッドセーフ）で、内容が同じファイルなら
+セッションや画面が異なっても同じ読み込み結果を使う。
+
+使用例:
+    from processors.common.parsed_frame_cache import read_csv_cached
+
+    df = read_csv_cached(file_content, dtype=str)
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from processors.common.metrics import instrument_phase
+from processors.common.text_decoder import DEFAULT_ENCODINGS, read_csv_bytes
+
+
+# キャッシュ全体のメモリ上限（DataFrameのメモリ使用量の合計）
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# キャッシュする件数の上限
+DEFAULT_MAX_ENTRIES = 16
+
+# メモリ使用量の推定に使う行数（これより多い場合は等間隔に抽出した行から推定）
+SIZE_SAMPLE_ROWS = 10_000
+
+CacheKey = Tuple[str, str]
+
+
+def estimate_frame_bytes(df: pd.DataFrame) -> int:
+    """
+    DataFrameのメモリ使用量を推定
+
+    memory_usage(deep=True) は文字列を1つずつ数えるため、大きなDataFrameでは
+    等間隔に抽出した SIZE_SAMPLE_ROWS 行の値から全体を推定する。
+    """
+    rows = len(df)
+    if rows <= SIZE_SAMPLE_ROWS:
+        return int(df.memory_usage(index=True, deep=True).sum())
+    step = rows // SIZE_SAMPLE_ROWS
+    sample = df.iloc[::step]
+    return int(sample.memory_usage(index=True, deep=True).sum() * rows / len(sample))
+
+
+class ParsedFrameCache:
+    """読み込み済みDataFrameのLRUキャッシュ"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content: bytes, options: Dict[str, Any]) -> CacheKey:
+        """バイト列のハッシュと読み込みオプションからキーを作成"""
+        digest = hashlib.sha256(content).hexdigest()
+        return digest, repr(sorted(options.items()))
+
+    def get(self, key: CacheKey) -> Optional[pd.DataFrame]:
+        """キャッシュ済みのDataFrameのコピーを取得（なければ None）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return entry[0].copy()
+
+    def put(self, key: CacheKey, df: pd.DataFrame) -> bool:
+        """
+        DataFrameをキャッシュに追加（上限を超える分は古いものから追い出す）
+
+        Returns:
+            bool: キャッシュした場合は True（1件で上限を超える場合は False）
+        """
+        size = estimate_frame_bytes(df)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            while self._entries and (
+                self.total_bytes + size > self.max_bytes
+                or len(self._entries) >= self.max_entries
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+            self._entries[key] = (df, size)
+            self.total_bytes += size
+        return True
+
+    def get_or_parse(
+        self, content: bytes, parse: Callable[[], pd.DataFrame], **options
+    ) -> pd.DataFrame:
+        """
+        キャッシュにあればそのコピーを、なければ parse() の結果を返してキャッシュする
+
+        Args:
+            content: ファイルのバイトデータ
+            parse: キャッシュにない場合の読み込み処理
+            **options: 読み込み結果に影響するオプション（キーに含める）
+
+        Returns:
+            pd.DataFrame: 読み込み結果（呼び出し側で変更してよいコピー）
+        """
+        key = self.make_key(content, options)
+        cached = self.get(key)
+        with self._lock:
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        df = parse()
+        if self.put(key, df):
+            return df.copy()
+        return df
+
+    def clear(self):
+        """キャッシュを空にする"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """件数・メモリ使用量・ヒット数"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_shared_cache: Optional[ParsedFrameCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_parsed_frame_cache() -> ParsedFrameCache:
+    """プロセス共有のキャッシュを取得（スレッドセーフ）"""
+    global _shared_cache
+    cache = _shared_cache
+    if cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = ParsedFrameCache()
+            cache = _shared_cache
+    return cache
+
+
+@instrument_phase("read")
+def read_csv_cached(content: bytes, encodings=DEFAULT_ENCODINGS, **kwargs) -> pd.DataFrame:
+    """
+    read_csv_bytes の結果をキャッシュして読み込む
+
+    同じバイト列・同じオプションの2回目以降はデコード・CSV解析を行わない。
+
+    Args:
+        content: CSVファイルのバイトデータ
+        encodings: 候補エンコーディング（優先順）
+        **kwargs: pd.read_csv に渡す引数
+
+    Returns:
+        pd.DataFrame: 読み込んだDataFrame（呼び出し側で変更してよいコピー）
+
+    Raises:
+        read_csv_bytes と同じ（読み込みに失敗した結果はキャッシュしない）
+    """
+    return get_parsed_frame_cache().get_or_parse(
+        content,
+        lambda: read_csv_bytes(content, encodings, **kwargs),
+        encodings=tuple(encodings),
+        **kwargs,
+    )
@@ -0,0 +1,310 @@
+"""
+処理のプロファイル取得（cProfile + tracemalloc）
+
+本番で遅い画面を、お客様のファイルを持ち出さずに調べるための仕組み。
+管理画面（screens/profiler.py）で「次の実行をプロファイル」を有効にすると、
+そのセッションで次に投入したジョブ（components/background_job.py の submit_job）を
+cProfile と tracemalloc の下で実行し、次の結果を残す。
+
+- pstats: cProfile の結果（pstats.Stats / snakeviz などで開けるファイル）
+- 関数ごとの時間: 自己時間・累積時間の上位 top_n 件
+- メモリ確保: 処理の終了時点で確保されたままのメモリ（ファイル:行ごと）の上位 top_n 件と
+  処理中のピーク（tracemalloc はプロセス全体が対象のため、取得中に同時に実行した処理の確保も含む。
+  同時に実行した処理名は concurrent_runs に残す）
+
+結果に含まれるのは関数名・ファイル名・行番号・時間・サイズだけで、入力データは含まない。
+
+- 対象: 有効にしたセッションの次の1回（取得後は自動で無効に戻る）
+- 排他: tracemalloc はプロセス全体で1つのため、プロファイル取得は同時に1件まで
+  （取得中に別のプロファイル取得が始まった場合は前の取得の完了を待つ）
+- 計測範囲: cProfile は処理関数を実行したスレッドのみ
+  （read_excel_files などのワーカースレッド内の処理は呼び出し元の待ち時間として現れる）
+- 保存: セッション・ジョブキーごとに最新の1件（retention_seconds を過ぎたものは削除）
+
+プロファイル取得中の実行は処理時間が数倍になるため、実行メトリクス（metrics.py）には記録しない。
+取得中に同時に実行した他の処理も遅くなるため、metrics.profiling_window() で重なりを付けて記録し、
+処理時間の集計から除く。
+
+使用例:
+    from processors.common.profiler import get_profile_registry, instrument_profile
+
+    registry = get_profile_registry()
+    registry.arm(session_id)
+    ...
+    if registry.take(session_id):
+        func = instrument_profile("ark_registration", func, lambda p: registry.save(session_id, p))
+"""
+
+import cProfile
+import functools
+import marshal
+import pstats
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+import pandas as pd
+
+from processors.common.metrics import profiling_window
+
+
+# 上位何件を表に残すか
+DEFAULT_TOP_N = 30
+
+# 取得したプロファイルを残す秒数
+DEFAULT_RETENTION_SECONDS = 60 * 60
+
+# tracemalloc で保存するスタックの深さ
+TRACEMALLOC_FRAMES = 1
+
+# 関数・メモリ確保の場所をこのディレクトリからの相対パスで表示
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# プロファイル取得は同時に1件まで（tracemalloc はプロセス全体で1つのため）
+_profile_lock = threading.Lock()
+
+
+class ProfileResult:
+    """1回分のプロファイル取得結果"""
+
+    def __init__(
+        self,
+        processor: str,
+        started_at: datetime,
+        seconds: float,
+        pstats_bytes: bytes,
+        functions: pd.DataFrame,
+        allocations: pd.DataFrame,
+        peak_memory: Optional[int],
+        error: Optional[str] = None,
+        concurrent_runs: Optional[List[str]] = None,
+    ):
+        self.processor = processor
+        self.started_at = started_at
+        self.seconds = seconds
+        self.pstats_bytes = pstats_bytes
+        self.functions = functions
+        self.allocations = allocations
+        self.peak_memory = peak_memory
+        self.error = error
+        self.concurrent_runs = concurrent_runs or []
+
+    @property
+    def finished_at(self) -> float:
+        """処理の終了時刻（time.time() と同じ基準）"""
+        return self.started_at.timestamp() + self.seconds
+
+    @property
+    def peak_memory_mb(self) -> Optional[float]:
+        return round(self.peak_memory / 1024 / 1024, 1) if self.peak_memory is not None else None
+
+    @property
+    def filename(self) -> str:
+        """ダウンロード用のファイル名（例: ark_registration_20251001_093000.pstats）"""
+        return f"{self.processor}_{self.started_at:%Y%m%d_%H%M%S}.pstats"
+
+    def hot_functions(self, sort: str = "tottime", top_n: Optional[int] = None) -> pd.DataFrame:
+        """関数ごとの時間（sort: "tottime" = 自己時間順 / "cumtime" = 累積時間順）"""
+        df = self.functions.sort_values(sort, ascending=False)
+        return (df.head(top_n) if top_n else df).reset_index(drop=True)
+
+
+def _short_path(filename: str) -> str:
+    """プロジェクト内・site-packages 内のファイルを短いパスで表示"""
+    path = Path(filename)
+    try:
+        return path.relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        pass
+    parts = path.parts
+    if "site-packages" in parts:
+        return "/".join(parts[parts.index("site-packages") + 1:])
+    return filename
+
+
+def _function_label(file: str, line: int, name: str) -> str:
+    if file == "~":
+        return name  # 組み込み関数（例: <built-in method builtins.len>）
+    return f"{_short_path(file)}:{line}({name})"
+
+
+def function_table(stats: Dict, top_n: int = DEFAULT_TOP_N) -> pd.DataFrame:
+    """
+    cProfile の統計から関数ごとの時間の表を作成
+
+    自己時間の上位 top_n 件と累積時間の上位 top_n 件を合わせて残す。
+
+    Returns:
+        pd.DataFrame: function / calls / primitive_calls / tottime / cumtime（自己時間順）
+    """
+    columns = ["function", "calls", "primitive_calls", "tottime", "cumtime"]
+    rows = [
+        (_function_label(*func), nc, cc, tt, ct)
+        for func, (cc, nc, tt, ct, _callers) in stats.items()
+    ]
+    df = pd.DataFrame(rows, columns=columns)
+    top = pd.concat([df.nlargest(top_n, "tottime"), df.nlargest(top_n, "cumtime")]).drop_duplicates("function")
+    return top.sort_values("tottime", ascending=False).reset_index(drop=True)
+
+
+def allocation_table(snapshot: tracemalloc.Snapshot, top_n: int = DEFAULT_TOP_N) -> pd.DataFrame:
+    """
+    tracemalloc のスナップショットからメモリ確保の場所（ファイル:行）ごとの表を作成
+
+    Returns:
+        pd.DataFrame: location / size_mb / count（サイズの大きい順）
+    """
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ])
+    rows = [
+        (f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+         round(stat.size / 1024 / 1024, 3), stat.count)
+        for stat in snapshot.statistics("lineno")[:top_n]
+    ]
+    return pd.DataFrame(rows, columns=["location", "size_mb", "count"])
+
+
+def instrument_profile(
+    processor: str,
+    func: Callable,
+    on_profile: Callable[[ProfileResult], None],
+    top_n: int = DEFAULT_TOP_N,
+) -> Callable:
+    """
+    func の呼び出しを cProfile + tracemalloc の下で実行する関数を返す
+
+    Args:
+        processor: 処理名（画面のジョブキーなど）
+        func: 処理関数
+        on_profile: 取得結果を受け取る関数（処理で例外が発生した場合も呼ぶ）
+        top_n: 表に残す件数
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _profile_lock, profiling_window() as window:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            tracemalloc.reset_peak()
+            profile = cProfile.Profile()
+            started_at = datetime.now()
+            start = time.perf_counter()
+            error = None
+            try:
+                profile.enable()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profile.disable()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                seconds = time.perf_counter() - start
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                if started_tracing:
+                    tracemalloc.stop()
+                profile.create_stats()
+                on_profile(ProfileResult(
+                    processor=processor,
+                    started_at=started_at,
+                    seconds=round(seconds, 3),
+                    pstats_bytes=marshal.dumps(profile.stats),
+                    functions=function_table(profile.stats, top_n),
+                    allocations=allocation_table(snapshot, top_n),
+                    peak_memory=peak,
+                    error=error,
+                    concurrent_runs=sorted(set(window.concurrent)),
+                ))
+    return wrapper
+
+
+def load_pstats(content: bytes) -> pstats.Stats:
+    """ダウンロードした pstats のバイト列を pstats.Stats として読み込む"""
+    stats = pstats.Stats()
+    stats.stats = marshal.loads(content)
+    stats.get_top_level_stats()
+    return stats
+
+
+class ProfileRegistry:
+    """セッションごとのプロファイル取得の予約と取得結果"""
+
+    def __init__(self, retention_seconds: float = DEFAULT_RETENTION_SECONDS):
+        self.retention_seconds = retention_seconds
+        self._armed: Set[str] = set()
+        self._profiles: Dict[str, Dict[str, ProfileResult]] = {}
+        self._lock = threading.Lock()
+
+    def arm(self, session_id: str) -> None:
+        """このセッションの次の実行をプロファイルする"""
+        with self._lock:
+            self._armed.add(session_id)
+
+    def disarm(self, session_id: str) -> None:
+        """予約を取り消す"""
+        with self._lock:
+            self._armed.discard(session_id)
+
+    def is_armed(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._armed
+
+    def take(self, session_id: str) -> bool:
+        """予約があれば取り消して True（ジョブの投入時に呼ぶ）"""
+        with self._lock:
+            if session_id not in self._armed:
+                return False
+            self._armed.discard(session_id)
+            return True
+
+    def save(self, session_id: str, profile: ProfileResult) -> None:
+        """取得結果を保存（同じセッション・処理名の前回分は置き換え）"""
+        with self._lock:
+            self._expire()
+            self._profiles.setdefault(session_id, {})[profile.processor] = profile
+
+    def get(self, session_id: str, processor: str) -> Optional[ProfileResult]:
+        """セッション・処理名の最新の取得結果（なければ None）"""
+        with self._lock:
+            return self._profiles.get(session_id, {}).get(processor)
+
+    def list(self, session_id: str) -> List[ProfileResult]:
+        """セッションの取得結果（新しい順）"""
+        with self._lock:
+            profiles = list(self._profiles.get(session_id, {}).values())
+        return sorted(profiles, key=lambda profile: profile.started_at, reverse=True)
+
+    def _expire(self) -> None:
+        """取得から retention_seconds を過ぎた結果を削除（ロック取得済みで呼ぶ）"""
+        cutoff = time.time() - self.retention_seconds
+        for session_id in list(self._profiles):
+            profiles = self._profiles[session_id]
+            for processor in [p for p, profile in profiles.items() if profile.finished_at < cutoff]:
+                del profiles[processor]
+            if not profiles:
+                del self._profiles[session_id]
+
+
+_shared_registry: Optional[ProfileRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def get_profile_registry() -> ProfileRegistry:
+    """プロセス共有のプロファイル登録簿を取得（スレッドセーフ）"""
+    global _shared_registry
+    registry = _shared_registry
+    if registry is None:
+        with _shared_lock:
+            if _shared_registry is None:
+                _shared_registry = ProfileRegistry()
+            registry = _shared_registry
+    return registry
@@ -0,0 +1,138 @@
+"""
+処理の進捗報告
+
+processors の処理関数は report_progress(phase, done, total) で進捗を報告する。
+報告は progress_scope で登録したコールバック（画面の進捗バーなど）に渡される。
+登録がない場合（テスト・コマンドライン実行）は何もしない。
+
+- phase: 現在のフェーズ名（例: "重複チェック"）
+- done / total: 完了数 / 全体数（行数、または処理ステップ数）
+- 呼び出し頻度: コールバックは min_interval 秒に1回まで
+  （フェーズの切り替わり・完了は間隔に関係なく通知）
+- 残り時間: total が同じ報告が続く間の進み方から推定
+
+使用例:
+    from processors.common.progress import report_progress
+
+    report_progress("ファイル読み込み", 0, 4)
+    ...
+    report_progress("重複チェック", 1, 4)
+
+    # 呼び出し側（画面・ジョブ）
+    with progress_scope(lambda update: print(update.format())):
+        process_nap_data(input_file, contract_file)
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+
+# コールバックを呼ぶ最小間隔（秒）
+DEFAULT_MIN_INTERVAL = 0.2
+
+
+class ProgressUpdate:
+    """1回分の進捗"""
+
+    def __init__(self, phase: str, done: int, total: int, elapsed: float, eta_seconds: Optional[float]):
+        self.phase = phase
+        self.done = done
+        self.total = total
+        self.elapsed = elapsed
+        self.eta_seconds = eta_seconds
+
+    @property
+    def fraction(self) -> float:
+        """進捗率（0〜1）"""
+        if self.total <= 0:
+            return 0.0
+        return min(max(self.done / self.total, 0.0), 1.0)
+
+    def format(self) -> str:
+        """表示用の文字列（例: "重複チェック（2/5）残り約12秒"）"""
+        text = f"{self.phase}（{self.done:,}/{self.total:,}）"
+        if self.eta_seconds is not None and self.done < self.total:
+            text += f" 残り約{format_seconds(self.eta_seconds)}"
+        return text
+
+
+def format_seconds(seconds: float) -> str:
+    """秒数を「N秒」「N分N秒」で表示"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}秒"
+    return f"{seconds // 60}分{seconds % 60}秒"
+
+
+class ProgressTracker:
+    """報告の間引きと残り時間の推定"""
+
+    def __init__(self, callback: Callable[[ProgressUpdate], None], min_interval: float = DEFAULT_MIN_INTERVAL):
+        self.callback = callback
+        self.min_interval = min_interval
+        self.started_at = time.monotonic()
+        self._last_notified: Optional[float] = None
+        self._last_phase: Optional[str] = None
+        # 残り時間推定の基準（total が同じ報告の最初の時刻・完了数）
+        self._series_total: Optional[int] = None
+        self._series_start = (self.started_at, 0)
+
+    def report(self, phase: str, done: int, total: int) -> None:
+        now = time.monotonic()
+        if total != self._series_total:
+            # 最初の報告は処理開始から進んだものとして扱う
+            if self._series_total is not None:
+                self._series_start = (now, done)
+            self._series_total = total
+
+        throttled = (
+            self._last_notified is not None
+            and now - self._last_notified < self.min_interval
+            and phase == self._last_phase
+            and done < total
+        )
+        if throttled:
+            return
+
+        self._last_notified = now
+        self._last_phase = phase
+        self.callback(ProgressUpdate(phase, done, total, now - self.started_at, self._eta(now, done, total)))
+
+    def _eta(self, now: float, done: int, total: int) -> Optional[float]:
+        series_time, series_done = self._series_start
+        progressed = done - series_done
+        if progressed <= 0 or total <= 0:
+            return None
+        return (now - series_time) / progressed * max(total - done, 0)
+
+
+_current_tracker: ContextVar[Optional[ProgressTracker]] = ContextVar("progress_tracker", default=None)
+
+
+@contextmanager
+def progress_scope(
+    callback: Callable[[ProgressUpdate], None], min_interval: float = DEFAULT_MIN_INTERVAL
+) -> Iterator[ProgressTracker]:
+    """このブロック内（同じスレッド）の report_progress を callback に渡す"""
+    tracker = ProgressTracker(callback, min_interval)
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+
+def report_progress(phase: str, done: int, total: int) -> None:
+    """
+    進捗を報告（progress_scope の外では何もしない）
+
+    Args:
+        phase: フェーズ名
+        done: 完了数（行数または処理ステップ数）
+        total: 全体数
+    """
+    tracker = _current_tracker.get()
+    if tracker is not None:
+        tracker.report(phase, done, total)
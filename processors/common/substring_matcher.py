@@ -0,0 +1,88 @@
+"""
+複数パターンの部分一致検索（Aho-Corasick法）
+
+多数のパターン（譲渡一覧の氏名など）のうち、どれが文字列に含まれるかを
+文字列の長さに比例する時間で調べる。パターンごとに `pattern in text` を
+繰り返す場合（パターン数 × 検索回数）と異なり、検索1回あたりの時間は
+パターン数によらない。
+
+使用例:
+    from processors.common.substring_matcher import SubstringMatcher
+
+    matcher = SubstringMatcher(["谷田絵理", "長野美生"])
+    matcher.first_match("佐藤絵理福岡絵理谷田絵理")  # → 0
+"""
+
+import sys
+from collections import deque
+from typing import Iterable, List, Optional
+
+# 一致なしを表す番号（どのパターン番号よりも大きい）
+_NO_MATCH = sys.maxsize
+
+
+class SubstringMatcher:
+    """複数パターンの部分一致検索"""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: 検索するパターン（番号は渡した順。空文字は無視する）
+        """
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        # 各状態で一致するパターン（失敗遷移先を含む）のうち最小の番号
+        self._first: List[int] = [_NO_MATCH]
+
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._first.append(_NO_MATCH)
+                node = next_node
+            if index < self._first[node]:
+                self._first[node] = index
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        """幅優先で失敗遷移を作成し、遷移先で一致するパターン番号を引き継ぐ"""
+        goto, fail, first = self._goto, self._fail, self._first
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                first[child] = min(first[child], first[fail[child]])
+                queue.append(child)
+
+    def first_match(self, text: str) -> Optional[int]:
+        """
+        text に含まれるパターンのうち、番号が最小のものを返す
+
+        「パターンを順に調べて最初に含まれていたもの」と同じ結果になる
+        （text 内で最初に現れるパターンではない）。
+
+        Returns:
+            int: パターン番号（どのパターンも含まれない場合は None）
+        """
+        goto, fail, first = self._goto, self._fail, self._first
+        node = 0
+        result = _NO_MATCH
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if first[node] < result:
+                result = first[node]
+        return None if result == _NO_MATCH else result
@@ -0,0 +1,186 @@
+"""
+アップロードファイルの共通デコーダー
+
+アップロードされたCSVのエンコーディングを先頭の限られた範囲だけで判定し、
+1回だけデコードしたテキストを pandas に渡す。
+chardet によるファイル全体の解析や、エンコーディングごとの
+pd.read_csv 再実行（失敗するたびにファイル全体を再パース）は行わない。
+
+判定手順:
+1. BOM（UTF-8 / UTF-16）があればそのエンコーディング
+2. 最初の非ASCIIバイトから PROBE_BYTES 分を候補順に厳密デコード
+   （末尾で途切れたマルチバイト文字はエラーにしない）
+3. 全体がASCIIの場合は ISO-2022-JP のエスケープシーケンスを確認し、
+   なければ UTF-8（ASCIIと同じ結果）
+
+プローブ範囲より後ろでデコードに失敗した場合のみ、失敗位置の前後で
+残りの候補を判定し直して全体をもう1回デコードする。
+
+使用例:
+    from processors.common.text_decoder import read_csv_bytes
+
+    df = read_csv_bytes(file_content, dtype=str)
+"""
+
+import codecs
+import io
+import re
+from typing import Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+# 判定に使うバイト数（最初の非ASCIIバイトから）
+PROBE_BYTES = 64 * 1024
+
+# ASCIIのみの範囲を探す際の1回あたりの走査サイズ
+_ASCII_SCAN_CHUNK = 1024 * 1024
+
+# 候補エンコーディング（優先順）
+# Shift_JIS は CP932 の部分集合のため CP932 で代表する（①・髙など機種依存文字も読める）
+DEFAULT_ENCODINGS: Tuple[str, ...] = ("utf-8", "cp932", "euc_jp", "iso2022_jp")
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+# ISO-2022-JP の漢字切り替えシーケンス（ESC $ @ / ESC $ B）
+_ISO2022_ESCAPES = (b"\x1b$@", b"\x1b$B")
+
+
+def _bom_encoding(content: bytes) -> Optional[str]:
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+    return None
+
+
+def _first_non_ascii(content: bytes) -> int:
+    """最初の非ASCIIバイトの位置（なければ -1）"""
+    for offset in range(0, len(content), _ASCII_SCAN_CHUNK):
+        chunk = content[offset:offset + _ASCII_SCAN_CHUNK]
+        if not chunk.isascii():
+            return offset + _NON_ASCII.search(chunk).start()
+    return -1
+
+
+def _probe(content: bytes, encoding: str, start: int, probe_bytes: int) -> bool:
+    """start から probe_bytes 分を厳密デコードできるか（途切れた末尾文字は許容）"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+    window = content[start:start + probe_bytes]
+    try:
+        decoder.decode(window, final=start + probe_bytes >= len(content))
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _is_iso2022(content: bytes) -> bool:
+    return any(escape in content for escape in _ISO2022_ESCAPES)
+
+
+def detect_encoding(
+    content: bytes,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    probe_bytes: int = PROBE_BYTES,
+) -> str:
+    """
+    エンコーディングを判定（ファイル全体はデコードしない）
+
+    Args:
+        content: ファイルのバイトデータ
+        encodings: 候補エンコーディング（優先順）
+        probe_bytes: 判定に使うバイト数
+
+    Returns:
+        str: エンコーディング名（どの候補でも読めない場合は先頭の候補）
+    """
+    bom_encoding = _bom_encoding(content)
+    if bom_encoding:
+        return bom_encoding
+
+    start = _first_non_ascii(content)
+    if start < 0:
+        if "iso2022_jp" in encodings and _is_iso2022(content):
+            return "iso2022_jp"
+        return "utf-8"
+
+    # 非ASCIIバイトの直前はASCIIのため、マルチバイト文字の途中から始まることはない
+    for encoding in encodings:
+        if encoding == "iso2022_jp":
+            continue
+        if _probe(content, encoding, start, probe_bytes):
+            return encoding
+    return encodings[0]
+
+
+def decode_bytes(
+    content: bytes,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    probe_bytes: int = PROBE_BYTES,
+) -> Tuple[str, str]:
+    """
+    エンコーディングを判定してテキストにデコード
+
+    Args:
+        content: ファイルのバイトデータ
+        encodings: 候補エンコーディング（優先順）
+        probe_bytes: 判定に使うバイト数
+
+    Returns:
+        Tuple[str, str]: (デコード済みテキスト, 使用したエンコーディング)
+
+    Raises:
+        UnicodeDecodeError: どの候補でもデコードできない場合
+    """
+    encoding = detect_encoding(content, encodings, probe_bytes)
+    try:
+        return content.decode(encoding), encoding
+    except UnicodeDecodeError as e:
+        error = e
+
+    # プローブ範囲より後ろで失敗した場合: 失敗位置の前後で残りの候補を判定し直す
+    remaining = [enc for enc in encodings if enc != encoding]
+    window_start = max(0, error.start - probe_bytes // 2)
+    # 失敗位置より前の非ASCIIバイトから始めるとマルチバイト文字の途中になりうるため、
+    # 判定範囲は行頭にそろえる
+    line_start = content.rfind(b"\n", 0, error.start)
+    if line_start >= window_start:
+        window_start = line_start + 1
+    candidates = [enc for enc in remaining if _probe(content, enc, window_start, probe_bytes)]
+    candidates += [enc for enc in remaining if enc not in candidates]
+
+    for candidate in candidates:
+        try:
+            return content.decode(candidate), candidate
+        except UnicodeDecodeError:
+            continue
+    raise error
+
+
+def read_csv_bytes(
+    content: bytes,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    バイトデータを1回だけデコードしてCSVとして読み込む
+
+    Args:
+        content: CSVファイルのバイトデータ
+        encodings: 候補エンコーディング（優先順）
+        **kwargs: pd.read_csv に渡す引数（dtype, usecols, keep_default_na など）
+
+    Returns:
+        pd.DataFrame: 読み込んだDataFrame
+
+    Raises:
+        UnicodeDecodeError: どの候補でもデコードできない場合
+        pd.errors.EmptyDataError / ParserError: CSVとして読み込めない場合
+    """
+    text, _ = decode_bytes(content, encodings)
+    return pd.read_csv(io.StringIO(text), **kwargs)
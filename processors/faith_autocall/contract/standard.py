@@ -4,7 +4,6 @@
 """
 
 import pandas as pd
-import io
 import sys
 import os
 from datetime import datetime
@@ -14,22 +13,33 @@ from typing import Tuple, List
 processors_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if processors_dir not in sys.path:
     sys.path.append(processors_dir)
-from autocall_common import AUTOCALL_OUTPUT_COLUMNS
+from processors.autocall_common.output_builder import build_autocall_output
 from domain.rules.business_rules import CLIENT_IDS, EXCLUDE_AMOUNTS
+from processors.common.contract_list_reader import ContractListReader
 from processors.common.detailed_logger import DetailedLogger
 
+# 読み込むContractListの列（フィルタ・出力マッピングで使う列のみ、列名で参照）
+CONTRACT_LIST_COLUMNS = [
+    "委託先法人ID",
+    "入金予定日",
+    "入金予定金額",
+    "回収ランク",
+    "滞納残債",
+    "TEL携帯",
+    "入居ステータス",
+    "滞納ステータス",
+    "管理番号",
+    "契約者カナ",
+    "物件名",
+]
+
 
 def read_csv_auto_encoding(file_content: bytes) -> pd.DataFrame:
-    """アップロードされたCSVファイルを自動エンコーディング判定で読み込み"""
-    encodings = ['utf-8', 'utf-8-sig', 'shift_jis', 'cp932']
-    
-    for enc in encodings:
-        try:
-            return pd.read_csv(io.BytesIO(file_content), encoding=enc, dtype=str)
-        except Exception:
-            continue
-    
-    raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
+    """アップロードされたCSVファイルを自動エンコーディング判定で読み込み（CONTRACT_LIST_COLUMNS の列のみ）"""
+    try:
+        return ContractListReader(CONTRACT_LIST_COLUMNS).read(file_content)
+    except Exception:
+        raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
 
 
 def apply_faith_contract_filters(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
@@ -164,10 +174,6 @@ def create_faith_contract_output(df_filtered: pd.DataFrame) -> Tuple[pd.DataFram
     """フェイス契約者出力データ作成（28列統一フォーマット）"""
     logs = []
     
-    # 28列の統一フォーマットで初期化
-    df_output = pd.DataFrame(index=range(len(df_filtered)), columns=AUTOCALL_OUTPUT_COLUMNS)
-    df_output = df_output.fillna("")
-    
     # 出力用のマッピング
     mapping_rules = {
         "電話番号": "TEL携帯",
@@ -180,18 +186,9 @@ def create_faith_contract_output(df_filtered: pd.DataFrame) -> Tuple[pd.DataFram
         "残債": "滞納残債"
     }
     
-    # データをマッピング
-    for i, (_, row) in enumerate(df_filtered.iterrows()):
-        # 基本マッピング
-        for output_col, input_col in mapping_rules.items():
-            if output_col in df_output.columns and input_col in row:
-                df_output.at[i, output_col] = str(row[input_col]) if pd.notna(row[input_col]) else ""
-        
-        # クライアント列の生成（フェイス1, フェイス2, フェイス3, フェイス4）
-        if "委託先法人ID" in row and pd.notna(row["委託先法人ID"]):
-            df_output.at[i, "クライアント"] = f"フェイス{int(row['委託先法人ID'])}"
-        else:
-            df_output.at[i, "クライアント"] = ""
+    # 28列の統一フォーマットで列単位に一括作成
+    # クライアント列は委託先法人IDから生成（フェイス1, フェイス2, フェイス3, フェイス4）
+    df_output = build_autocall_output(df_filtered, mapping_rules, client_label_prefix="フェイス")
     
     logs.append(f"契約者出力データ作成完了: {len(df_output)}件")
     
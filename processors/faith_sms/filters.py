@@ -0,0 +1,42 @@
+"""
+フェイスSMS共通フィルタ定義
+
+契約者・保証人・緊急連絡人SMSで共通のフィルタ。
+委託先法人ID・入金予定日・入金予定金額・回収ランクは列名で参照する。
+"""
+
+from typing import List
+
+from domain.rules.business_rules import CLIENT_IDS, EXCLUDE_AMOUNTS
+from processors.sms_common.pipeline import (
+    SmsFilter,
+    arrears_at_least,
+    collection_rank_excluded,
+    payment_amount_excluded,
+    payment_date_before_today,
+    trustee_id_numeric,
+)
+
+# 回収ランク: 除外するランク
+EXCLUDED_COLLECTION_RANKS = ["弁護士介入", "破産決定", "死亡決定"]
+
+
+def contract_list_filters(phone_filter: SmsFilter) -> List[SmsFilter]:
+    """
+    フェイスSMSのフィルタ
+
+    1. 委託先法人ID: CLIENT_IDS['faith']（1, 2, 3, 4, 8）のみ
+    2. 入金予定日: 前日以前（空白含む）
+    3. 入金予定金額: EXCLUDE_AMOUNTS['faith']（2,3,5）を除外
+    4. 回収ランク: 「弁護士介入」「破産決定」「死亡決定」を除外
+    5. BT列　滞納残債: 1円以上
+    6. TEL携帯（phone_filter）
+    """
+    return [
+        trustee_id_numeric(CLIENT_IDS['faith']),
+        payment_date_before_today('入金予定日', write_back=True),
+        payment_amount_excluded(EXCLUDE_AMOUNTS['faith'], '入金予定金額'),
+        collection_rank_excluded(EXCLUDED_COLLECTION_RANKS, '回収ランク'),
+        arrears_at_least(1),
+        phone_filter,
+    ]
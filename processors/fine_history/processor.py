@@ -6,10 +6,11 @@ NegotiatesInfoSample.csv形式（10列）で出力。
 """
 
 import pandas as pd
-import io
 from typing import Tuple, List
 from datetime import datetime
 
+from processors.common.csv_writer import to_csv_cp932
+
 
 class FineHistoryProcessor:
     """ファイン履歴データ処理クラス"""
@@ -122,9 +123,7 @@ class FineHistoryProcessor:
         logs = []
 
         # CSVファイルを作成（CP932エンコーディング）
-        csv_buffer = io.BytesIO()
-        df.to_csv(csv_buffer, index=False, encoding='cp932')
+        csv_bytes, _ = to_csv_cp932(df, errors='strict')
         logs.append(f"ファイン履歴: {len(df)}件")
 
-        csv_buffer.seek(0)
-        return csv_buffer.getvalue(), logs
+        return csv_bytes, logs
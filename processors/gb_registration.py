@@ -18,7 +18,9 @@ import io
 import re
 from datetime import datetime
 from typing import Tuple, List, Optional
-from .common.address_splitter import AddressSplitter
+from .common.address_splitter import get_address_splitter
+from .common.parsed_frame_cache import read_csv_cached
+from .common.progress import report_progress
 
 
 class GBConfig:
@@ -230,10 +232,6 @@ def format_account_type(account_type: str) -> str:
 # 住所分割関数（AddressSplitter使用）
 # =============================================================================
 
-# AddressSplitterインスタンス（辞書ベースの市区町村判定）
-_address_splitter = AddressSplitter()
-
-
 def split_address(address: str, prefecture: str = "") -> Tuple[str, str]:
     """
     住所を市区町村と残りに分割する（辞書ベース）
@@ -249,16 +247,18 @@ def split_address(address: str, prefecture: str = "") -> Tuple[str, str]:
         return "", ""
 
     address = str(address).strip()
+    # プロセス共有のAddressSplitter（辞書ベースの市区町村判定）
+    address_splitter = get_address_splitter()
 
     # 都道府県が指定されている場合
     if prefecture:
-        city, rest = _address_splitter.extract_municipality(prefecture, address)
+        city, rest = address_splitter.extract_municipality(prefecture, address)
         if city:
             return city, rest
 
     # 都道府県が指定されていない場合、全都道府県で検索
-    for pref in _address_splitter.prefectures:
-        city, rest = _address_splitter.extract_municipality(pref, address)
+    for pref in address_splitter.prefectures:
+        city, rest = address_splitter.extract_municipality(pref, address)
         if city:
             return city, rest
 
@@ -325,16 +325,10 @@ class FileReader:
         Returns:
             pd.DataFrame: 読み込んだデータ
         """
-        encodings = ['cp932', 'shift_jis', 'utf-8', 'utf-8-sig']
-
-        for enc in encodings:
-            try:
-                df = pd.read_csv(io.BytesIO(content), encoding=enc, dtype=str)
-                return df
-            except (UnicodeDecodeError, pd.errors.ParserError):
-                continue
-
-        raise ValueError("CSVファイルの読み込みに失敗しました: エンコーディングを判定できません")
+        try:
+            return read_csv_cached(content, dtype=str)
+        except UnicodeDecodeError:
+            raise ValueError("CSVファイルの読み込みに失敗しました: エンコーディングを判定できません")
 
 
 # =============================================================================
@@ -555,6 +549,7 @@ def process_gb_data(
     data_mapper = DataMapper(config)
 
     # 1. ファイル読み込み
+    report_progress("ファイル読み込み", 0, 3)
     logs.append("ファイル読み込み開始...")
 
     excel_df = file_reader.read_excel_file(
@@ -568,6 +563,7 @@ def process_gb_data(
     logs.append(f"ContractList読み込み完了: {len(contract_df)}件")
 
     # 2. 重複チェック
+    report_progress("重複チェック", 1, 3)
     logs.append("重複チェック開始...")
 
     new_data, existing_data, stats = duplicate_checker.check_duplicates(
@@ -588,6 +584,7 @@ def process_gb_data(
         return empty_df, logs, filename
 
     # 4. データマッピング
+    report_progress("データマッピング", 2, 3)
     logs.append("データマッピング開始...")
 
     output_df = data_mapper.create_output_dataframe(new_data)
@@ -31,6 +31,13 @@ class GBZansaiConfig:
     # 出力ファイル名フォーマット
     OUTPUT_FILENAME_FORMAT = "ガレージバンク管理前取込_{date}.csv"
 
+    # マッチしなかった請求データの出力
+    UNMATCHED_COLUMNS = ["ユーザーID", "請求総額"]
+    UNMATCHED_FILENAME_FORMAT = "ガレージバンク突合なし_{date}.csv"
+
+    # マッチしなかったユーザーIDをログに列挙する件数
+    UNMATCHED_LOG_LIMIT = 10
+
 
 def read_contract_list(file_or_bytes) -> pd.DataFrame:
     """
@@ -89,60 +96,84 @@ def read_seikyu_data(file_or_bytes) -> pd.DataFrame:
     return df
 
 
-def match_data(seikyu_df: pd.DataFrame, contract_df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+def normalize_id(values: pd.Series) -> pd.Series:
     """
-    請求データとContractListをマッチングする
+    突合キー（ユーザーID・引継番号）の表記を統一する
+
+    数値・文字列のどちらでも 123 / 123.0 / "123" / " 123.0 " → "123"。
+    空欄は NaN（どのキーともマッチしない）。
 
     Args:
-        seikyu_df: 請求データのDataFrame
-        contract_df: ContractListのDataFrame
+        values: ユーザーIDまたは引継番号の列
 
     Returns:
-        Tuple[pd.DataFrame, List[str]]: マッチ結果と処理ログ
+        pd.Series: 統一した文字列の列
     """
-    logs = []
+    text = values.astype(str).str.strip()
+
+    # 小数表記（123.0）は小数点を含む値だけ正規表現で整数表記に戻す
+    has_decimal = text.str.contains(".", regex=False)
+    if has_decimal.any():
+        text = text.mask(has_decimal, text[has_decimal].str.replace(r"^(\d+)\.0+$", r"\1", regex=True))
 
-    # 型を統一して比較（文字列に変換）
-    seikyu_df = seikyu_df.copy()
-    contract_df = contract_df.copy()
+    return text.where(values.notna() & (text != ""))
 
-    seikyu_df["ユーザーID_str"] = seikyu_df["ユーザーID"].astype(str)
-    contract_df["引継番号_str"] = contract_df["引継番号"].astype(str)
 
-    # マッチング用の辞書を作成（引継番号 → 管理番号）
-    hikitsugi_to_kanri = dict(zip(
-        contract_df["引継番号_str"],
-        contract_df["管理番号"]
-    ))
+def format_unmatched_log(user_ids: List[str]) -> str:
+    """マッチしなかったユーザーIDの要約ログ（先頭 UNMATCHED_LOG_LIMIT 件のみ列挙）"""
+    limit = GBZansaiConfig.UNMATCHED_LOG_LIMIT
+    listed = ", ".join(user_ids[:limit])
+    if len(user_ids) > limit:
+        listed += f" ほか{len(user_ids) - limit}件（全件はマッチなしCSVで確認）"
+    return f"⚠️ マッチしませんでした: {len(user_ids)}件 ユーザーID {listed}"
 
-    # 結果を格納するリスト
-    results = []
-    unmatched = []
 
-    for _, row in seikyu_df.iterrows():
-        user_id_str = str(row["ユーザーID"])
-        seikyu_amount = row["請求総額"]
+def match_data(seikyu_df: pd.DataFrame, contract_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, List[str]]:
+    """
+    請求データとContractListをマッチングする
+
+    ユーザーID（請求データ）と引継番号（ContractList）を normalize_id で統一してから
+    左結合する。引継番号が重複する場合は後の行を優先する。
+
+    Args:
+        seikyu_df: 請求データのDataFrame
+        contract_df: ContractListのDataFrame
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, List[str]]:
+            マッチ結果（請求データの順）、マッチしなかった請求データ、処理ログ
+    """
+    logs = []
 
-        if user_id_str in hikitsugi_to_kanri:
-            kanri_no = hikitsugi_to_kanri[user_id_str]
-            results.append({
-                "管理番号": kanri_no,
-                "管理前滞納額": seikyu_amount
-            })
-        else:
-            unmatched.append(user_id_str)
+    # マッチング用の対応表（引継番号 → 管理番号）
+    contract_keys = pd.DataFrame({
+        "突合キー": normalize_id(contract_df["引継番号"]).to_numpy(),
+        "管理番号": contract_df["管理番号"].to_numpy(),
+    })
+    contract_keys = contract_keys.dropna(subset=["突合キー"]).drop_duplicates("突合キー", keep="last")
 
-    # マッチしなかったレコードのログ
-    for user_id in unmatched:
-        logs.append(f"⚠️ マッチしませんでした: ユーザーID {user_id}")
+    seikyu_keys = pd.DataFrame({
+        "突合キー": normalize_id(seikyu_df["ユーザーID"]).to_numpy(),
+        "請求総額": seikyu_df["請求総額"].to_numpy(),
+    })
+    merged = seikyu_keys.merge(contract_keys, on="突合キー", how="left", indicator=True)
+    is_matched = (merged["_merge"] == "both").to_numpy()
 
     # 結果のDataFrame
-    if results:
-        result_df = pd.DataFrame(results)
-    else:
-        result_df = pd.DataFrame(columns=GBZansaiConfig.OUTPUT_COLUMNS)
+    result_df = pd.DataFrame({
+        "管理番号": merged["管理番号"].to_numpy()[is_matched],
+        "管理前滞納額": merged["請求総額"].to_numpy()[is_matched],
+    }, columns=GBZansaiConfig.OUTPUT_COLUMNS)
+
+    # マッチしなかったレコード（ダウンロード用）と要約ログ
+    unmatched_df = pd.DataFrame({
+        "ユーザーID": merged["突合キー"].to_numpy()[~is_matched],
+        "請求総額": merged["請求総額"].to_numpy()[~is_matched],
+    }, columns=GBZansaiConfig.UNMATCHED_COLUMNS)
+    if len(unmatched_df) > 0:
+        logs.append(format_unmatched_log(unmatched_df["ユーザーID"].fillna("(空欄)").tolist()))
 
-    return result_df, logs
+    return result_df, unmatched_df, logs
 
 
 def generate_output(df: pd.DataFrame) -> pd.DataFrame:
@@ -160,16 +191,19 @@ def generate_output(df: pd.DataFrame) -> pd.DataFrame:
     return output_df
 
 
-def process_gb_zansai(seikyu_file, contract_file) -> Tuple[pd.DataFrame, List[str], str]:
+def process_gb_zansai_with_unmatched(
+    seikyu_file, contract_file
+) -> Tuple[pd.DataFrame, List[str], str, pd.DataFrame, str]:
     """
-    ガレージバンク残債取り込みのメイン処理関数
+    ガレージバンク残債取り込み（マッチしなかった請求データ付き）
 
     Args:
         seikyu_file: 請求データExcelファイル
         contract_file: ContractList CSVファイル
 
     Returns:
-        Tuple[pd.DataFrame, List[str], str]: 出力DataFrame, 処理ログ, ファイル名
+        Tuple: 出力DataFrame, 処理ログ, ファイル名,
+               マッチしなかった請求データ, そのファイル名
     """
     logs = []
 
@@ -182,12 +216,12 @@ def process_gb_zansai(seikyu_file, contract_file) -> Tuple[pd.DataFrame, List[st
     logs.append(f"📂 ContractList: {len(contract_df)}件")
 
     # マッチング処理
-    result_df, match_logs = match_data(seikyu_df, contract_df)
+    result_df, unmatched_df, match_logs = match_data(seikyu_df, contract_df)
     logs.extend(match_logs)
 
     # マッチ件数ログ
     matched_count = len(result_df)
-    unmatched_count = len(seikyu_df) - matched_count
+    unmatched_count = len(unmatched_df)
     logs.append(f"✅ マッチ: {matched_count}件")
     if unmatched_count > 0:
         logs.append(f"⚠️ マッチなし: {unmatched_count}件")
@@ -198,5 +232,21 @@ def process_gb_zansai(seikyu_file, contract_file) -> Tuple[pd.DataFrame, List[st
     # ファイル名生成
     today = datetime.now().strftime("%Y%m%d")
     filename = GBZansaiConfig.OUTPUT_FILENAME_FORMAT.format(date=today)
+    unmatched_filename = GBZansaiConfig.UNMATCHED_FILENAME_FORMAT.format(date=today)
+
+    return output_df, logs, filename, unmatched_df, unmatched_filename
+
+
+def process_gb_zansai(seikyu_file, contract_file) -> Tuple[pd.DataFrame, List[str], str]:
+    """
+    ガレージバンク残債取り込みのメイン処理関数
 
+    Args:
+        seikyu_file: 請求データExcelファイル
+        contract_file: ContractList CSVファイル
+
+    Returns:
+        Tuple[pd.DataFrame, List[str], str]: 出力DataFrame, 処理ログ, ファイル名
+    """
+    output_df, logs, filename, _, _ = process_gb_zansai_with_unmatched(seikyu_file, contract_file)
     return output_df, logs, filename
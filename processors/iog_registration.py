@@ -14,10 +14,26 @@ import pandas as pd
 import io
 import unicodedata
 from datetime import datetime
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Iterable, Optional
 import logging
 from processors.common.detailed_logger import DetailedLogger
-from processors.common.address_splitter import AddressSplitter
+from processors.common.excel_reader import read_excel_files
+from processors.common.address_splitter import get_address_splitter
+from processors.common.progress import report_progress
+from processors.common.substring_matcher import SubstringMatcher
+from processors.common.column_spec import (
+    ColumnSpec,
+    ConversionContext,
+    apply_unique,
+    build_template_frame,
+    computed,
+    fixed,
+    join_nonempty,
+    move_home_to_mobile,
+    normalize_phone,
+    source,
+    split_address_columns,
+)
 
 
 class IOGConfig:
@@ -160,7 +176,7 @@ class DataConverter:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.address_splitter = AddressSplitter()
+        self.address_splitter = get_address_splitter()
 
     def safe_str_convert(self, value) -> str:
         """安全な文字列変換"""
@@ -336,185 +352,162 @@ class DataConverter:
         """JIDデータを111列テンプレートに変換（譲渡一覧なし）"""
         return self.convert_jid_data_with_transfer(jid_df, has_transfer=False)
 
-    def convert_jid_data_with_transfer(self, merged_df: pd.DataFrame, has_transfer: bool = False) -> Tuple[pd.DataFrame, List[str]]:
-        """
-        JIDデータ（譲渡一覧マージ済み）を111列テンプレートに変換
-
-        Args:
-            merged_df: マージ済みのデータフレーム
-            has_transfer: 譲渡一覧データの有無
+    # 氏名関連フィールド（normalize_name で正規化、その他は normalize_for_client_system）
+    NAME_FIELDS = [
+        "契約者氏名", "契約者カナ",
+        "保証人１氏名", "保証人１カナ",
+        "保証人２氏名", "保証人２カナ",
+        "緊急連絡人１氏名", "緊急連絡人１カナ",
+        "緊急連絡人２氏名", "緊急連絡人２カナ"
+    ]
 
-        Returns:
-            Tuple[pd.DataFrame, List[str]]: (変換済みDF, 処理ログ)
-        """
-        output_data = []
-        logs = []
+    def _phone_pair(self, ctx: ConversionContext, home_col: str, mobile_col: str) -> Tuple[pd.Series, pd.Series]:
+        """電話番号処理（列単位、自宅TELのみの場合は携帯TELに移動）"""
+        # 「電話無」は数字を含まないため正規化で空文字になる
+        return ctx.cached(
+            ("phones", home_col, mobile_col),
+            lambda: move_home_to_mobile(
+                normalize_phone(ctx.text(home_col)),
+                normalize_phone(ctx.text(mobile_col))
+            )
+        )
+
+    def _property_name_parts(self, ctx: ConversionContext) -> Tuple[pd.Series, pd.Series]:
+        """物件名から部屋番号を分割（列単位）"""
+        def build():
+            property_names = ctx.text("物件名")
+            return (
+                apply_unique(property_names, lambda name: self.extract_room_from_property_name(name)[0]),
+                apply_unique(property_names, lambda name: self.extract_room_from_property_name(name)[1]),
+            )
+        return ctx.cached("property_name_parts", build)
 
-        for _, row in merged_df.iterrows():
-            converted_row = {}
+    def _contact_specs(self, prefix: str, address_label: str, source_prefix: str) -> Dict[str, ColumnSpec]:
+        """保証人1・緊急連絡人1の列定義（譲渡一覧から）
 
-            # 1. 基本情報（譲渡一覧から保証番号を優先）
-            converted_row["引継番号"] = self.safe_str_convert(row.get("保証番号", ""))
+        Args:
+            prefix: 出力列名の接頭辞（保証人１ / 緊急連絡人１）
+            address_label: 住所列名（住所 / 現住所）
+            source_prefix: 譲渡一覧の列名の接頭辞（連帯保証人 / 緊急連絡先）
+        """
+        home_col = f"{source_prefix}電話番号（滞納）"
+        mobile_col = f"{source_prefix}携帯電話電話号（滞納）"
+        return {
+            f"{prefix}氏名": source(f"{source_prefix}氏名（滞納）"),
+            f"{prefix}カナ": fixed(""),  # 譲渡一覧にカナなし
+            # 続柄変換（値がある場合「他」に統一）
+            f"{prefix}契約者との関係": source(
+                f"{source_prefix}続柄名（滞納）",
+                lambda s: s.where(s == "", "他")
+            ),
+            f"{prefix}郵便番号": source(f"{source_prefix}郵便番号（滞納）"),
+            f"{prefix}{address_label}1": source(f"{source_prefix}都道府県（滞納）"),
+            f"{prefix}{address_label}2": source(f"{source_prefix}市区町村（滞納）"),
+            # 住所3 = 町域名 + マンション名
+            f"{prefix}{address_label}3": computed(
+                lambda ctx: join_nonempty(
+                    [
+                        ctx.text(f"{source_prefix}町域名（滞納）"),
+                        ctx.text(f"{source_prefix}マンションなど（滞納）")
+                    ],
+                    "　"
+                )
+            ),
+            f"{prefix}TEL自宅": computed(lambda ctx: self._phone_pair(ctx, home_col, mobile_col)[0]),
+            f"{prefix}TEL携帯": computed(lambda ctx: self._phone_pair(ctx, home_col, mobile_col)[1]),
+        }
 
-            # 2. 氏名の優先ロジック（譲渡一覧優先）
-            iog_name = self.safe_str_convert(row.get("対象者名", ""))
-            transfer_name = self.safe_str_convert(row.get("賃借人氏名", ""))
+    def build_column_specs(self, has_transfer: bool = False) -> Dict[str, ColumnSpec]:
+        """111列テンプレートの列定義（固定値・正規化は build_template_frame で適用）"""
 
+        def contractor_name(ctx):
             # 譲渡一覧にマッチした場合は譲渡一覧の氏名を使用、それ以外はIOGの氏名をそのまま使用
-            if has_transfer and transfer_name:
-                final_name = transfer_name
-            else:
-                final_name = iog_name
-
-            converted_row["契約者氏名"] = final_name
-            converted_row["契約者カナ"] = self.safe_str_convert(row.get("フリガナ", ""))
-
-            # 2. 電話番号処理（JIDデータから）
-            phone_result = self.process_phone_numbers(
-                row.get("自宅電話", ""),
-                row.get("携帯", "")
+            iog_name = ctx.text("対象者名")
+            if not has_transfer:
+                return iog_name
+            transfer_name = ctx.text("賃借人氏名")
+            return transfer_name.where(transfer_name != "", iog_name)
+
+        def address_part(part):
+            return computed(
+                lambda ctx: ctx.cached(
+                    "address",
+                    lambda: split_address_columns(self.address_splitter, ctx.text("自宅"))
+                )[part]
             )
-            converted_row["契約者TEL自宅"] = phone_result["home"]
-            converted_row["契約者TEL携帯"] = phone_result["mobile"]
 
-            # 3. 住所分割処理（JIDデータから）
-            address = self.safe_str_convert(row.get("自宅", ""))
-            address_parts = self.split_address(address)
-
-            # 契約者現住所
-            converted_row["契約者現住所郵便番号"] = self.safe_str_convert(row.get("郵便番号", ""))
-            converted_row["契約者現住所1"] = address_parts["prefecture"]
-            converted_row["契約者現住所2"] = address_parts["city"]
-            converted_row["契約者現住所3"] = address_parts["remaining"]
+        def entrusted_date(ctx):
+            # 受任日はExcelの日付型のまま変換する
+            if "受任日" not in ctx.df.columns:
+                return ctx.blank("")
+            return apply_unique(ctx.df["受任日"], self.parse_date)
 
+        specs = {
+            # 1. 基本情報（譲渡一覧から保証番号を優先）
+            "引継番号": source("保証番号"),
+            # 2. 氏名の優先ロジック（譲渡一覧優先）
+            "契約者氏名": computed(contractor_name),
+            "契約者カナ": source("フリガナ"),
+            # 2. 電話番号処理（JIDデータから）
+            "契約者TEL自宅": computed(lambda ctx: self._phone_pair(ctx, "自宅電話", "携帯")[0]),
+            "契約者TEL携帯": computed(lambda ctx: self._phone_pair(ctx, "自宅電話", "携帯")[1]),
+            # 3. 契約者現住所（JIDデータから）
+            "契約者現住所郵便番号": source("郵便番号"),
+            "契約者現住所1": address_part("prefecture"),
+            "契約者現住所2": address_part("city"),
+            "契約者現住所3": address_part("remaining"),
             # 4. 管理前滞納額（JIDデータから）
-            converted_row["管理前滞納額"] = self.safe_str_convert(row.get("差引残高", "0"))
-
+            "管理前滞納額": source("差引残高", default="0"),
             # 5. 管理受託日（JIDデータから）
-            converted_row["管理受託日"] = self.parse_date(row.get("受任日", ""))
-
-            # 6. 物件情報（譲渡一覧から）
-            if has_transfer:
-                # 物件名から部屋番号を分割
-                raw_property_name = self.safe_str_convert(row.get("物件名", ""))
-                clean_property_name, room_number = self.extract_room_from_property_name(raw_property_name)
-
-                converted_row["物件名"] = clean_property_name
-                converted_row["部屋番号"] = room_number
-                converted_row["物件住所郵便番号"] = self.safe_str_convert(row.get("物件郵便番号", ""))
-                converted_row["物件住所1"] = self.safe_str_convert(row.get("物件都道府県", ""))
-                converted_row["物件住所2"] = self.safe_str_convert(row.get("物件市区町村", ""))
-                converted_row["物件住所3"] = self.safe_str_convert(row.get("物件町域名", ""))
-
-                # 7. 保証人1（譲渡一覧から）
-                converted_row["保証人１氏名"] = self.safe_str_convert(row.get("連帯保証人氏名（滞納）", ""))
-                converted_row["保証人１カナ"] = ""  # 譲渡一覧にカナなし
-
-                # 続柄変換（値がある場合「他」に統一）
-                guarantor_relationship = self.safe_str_convert(row.get("連帯保証人続柄名（滞納）", ""))
-                converted_row["保証人１契約者との関係"] = "他" if guarantor_relationship else ""
-                converted_row["保証人１郵便番号"] = self.safe_str_convert(row.get("連帯保証人郵便番号（滞納）", ""))
-                converted_row["保証人１住所1"] = self.safe_str_convert(row.get("連帯保証人都道府県（滞納）", ""))
-                converted_row["保証人１住所2"] = self.safe_str_convert(row.get("連帯保証人市区町村（滞納）", ""))
-
-                # 住所3 = 町域名 + マンション名
-                guarantor_addr3_parts = []
-                town = self.safe_str_convert(row.get("連帯保証人町域名（滞納）", ""))
-                mansion = self.safe_str_convert(row.get("連帯保証人マンションなど（滞納）", ""))
-                if town:
-                    guarantor_addr3_parts.append(town)
-                if mansion:
-                    guarantor_addr3_parts.append(mansion)
-                converted_row["保証人１住所3"] = "　".join(guarantor_addr3_parts) if guarantor_addr3_parts else ""
-
-                # 保証人電話
-                guarantor_phone = self.process_phone_numbers(
-                    row.get("連帯保証人電話番号（滞納）", ""),
-                    row.get("連帯保証人携帯電話電話号（滞納）", "")
-                )
-                converted_row["保証人１TEL自宅"] = guarantor_phone["home"]
-                converted_row["保証人１TEL携帯"] = guarantor_phone["mobile"]
-
-                # 8. 緊急連絡先1（譲渡一覧から）
-                converted_row["緊急連絡人１氏名"] = self.safe_str_convert(row.get("緊急連絡先氏名（滞納）", ""))
-                converted_row["緊急連絡人１カナ"] = ""  # 譲渡一覧にカナなし
-
-                # 続柄変換（値がある場合「他」に統一）
-                emergency_relationship = self.safe_str_convert(row.get("緊急連絡先続柄名（滞納）", ""))
-                converted_row["緊急連絡人１契約者との関係"] = "他" if emergency_relationship else ""
-                converted_row["緊急連絡人１郵便番号"] = self.safe_str_convert(row.get("緊急連絡先郵便番号（滞納）", ""))
-                converted_row["緊急連絡人１現住所1"] = self.safe_str_convert(row.get("緊急連絡先都道府県（滞納）", ""))
-                converted_row["緊急連絡人１現住所2"] = self.safe_str_convert(row.get("緊急連絡先市区町村（滞納）", ""))
-
-                # 現住所3 = 町域名 + マンション名
-                emergency_addr3_parts = []
-                town2 = self.safe_str_convert(row.get("緊急連絡先町域名（滞納）", ""))
-                mansion2 = self.safe_str_convert(row.get("緊急連絡先マンションなど（滞納）", ""))
-                if town2:
-                    emergency_addr3_parts.append(town2)
-                if mansion2:
-                    emergency_addr3_parts.append(mansion2)
-                converted_row["緊急連絡人１現住所3"] = "　".join(emergency_addr3_parts) if emergency_addr3_parts else ""
-
-                # 緊急連絡先電話
-                emergency_phone = self.process_phone_numbers(
-                    row.get("緊急連絡先電話番号（滞納）", ""),
-                    row.get("緊急連絡先携帯電話電話号（滞納）", "")
-                )
-                converted_row["緊急連絡人１TEL自宅"] = emergency_phone["home"]
-                converted_row["緊急連絡人１TEL携帯"] = emergency_phone["mobile"]
+            "管理受託日": computed(entrusted_date),
+        }
+
+        if has_transfer:
+            # 6. 物件情報（譲渡一覧から、物件名から部屋番号を分割）
+            specs.update({
+                "物件名": computed(lambda ctx: self._property_name_parts(ctx)[0]),
+                "部屋番号": computed(lambda ctx: self._property_name_parts(ctx)[1]),
+                "物件住所郵便番号": source("物件郵便番号"),
+                "物件住所1": source("物件都道府県"),
+                "物件住所2": source("物件市区町村"),
+                "物件住所3": source("物件町域名"),
+            })
+            # 7. 保証人1、8. 緊急連絡先1（譲渡一覧から）
+            specs.update(self._contact_specs("保証人１", "住所", "連帯保証人"))
+            specs.update(self._contact_specs("緊急連絡人１", "現住所", "緊急連絡先"))
+
+        return specs
+
+    def _normalize_output_column(self, column: str, series: pd.Series) -> pd.Series:
+        """全項目の正規化（氏名は異体字統一・通称除去・スペース除去、その他はスペース保持）"""
+        if column in self.NAME_FIELDS:
+            return apply_unique(series, normalize_name)
+        return apply_unique(series, self.normalize_for_client_system)
 
-            # 9. 固定値設定
-            for key, value in IOGConfig.FIXED_VALUES.items():
-                if key not in converted_row or converted_row[key] == "":
-                    converted_row[key] = value
+    def convert_jid_data_with_transfer(self, merged_df: pd.DataFrame, has_transfer: bool = False) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        JIDデータ（譲渡一覧マージ済み）を111列テンプレートに変換（列単位）
 
-            # 10. 登録フラグ設定（譲渡一覧からのソース情報）
-            if has_transfer:
-                converted_row["登録フラグ"] = self.safe_str_convert(row.get("_source_info", ""))
-            else:
-                converted_row["登録フラグ"] = ""
-
-            # 11. 全項目を正規化
-            # 氏名関連フィールドは normalize_name を使用（異体字統一・通称除去・スペース除去）
-            # その他のフィールドは normalize_for_client_system を使用（スペース保持）
-            name_fields = [
-                "契約者氏名", "契約者カナ",
-                "保証人１氏名", "保証人１カナ",
-                "保証人２氏名", "保証人２カナ",
-                "緊急連絡人１氏名", "緊急連絡人１カナ",
-                "緊急連絡人２氏名", "緊急連絡人２カナ"
-            ]
-
-            for key in converted_row:
-                if key in name_fields:
-                    converted_row[key] = normalize_name(converted_row[key])
-                else:
-                    converted_row[key] = self.normalize_for_client_system(converted_row[key])
-
-            output_data.append(converted_row)
-
-        # 111列の正確な順序でDataFrame構築（空列対応）
-        temp_columns = []
-        temp_data = {}
-        empty_col_counter = 1
-
-        for i, col in enumerate(IOGConfig.OUTPUT_COLUMNS):
-            if col == "":  # 空列の場合
-                temp_col_name = f"__EMPTY_COL_{empty_col_counter}__"
-                temp_columns.append(temp_col_name)
-                temp_data[temp_col_name] = [""] * len(output_data)
-                empty_col_counter += 1
-            else:
-                temp_columns.append(col)
-                temp_data[col] = [row.get(col, "") for row in output_data]
+        Args:
+            merged_df: マージ済みのデータフレーム
+            has_transfer: 譲渡一覧データの有無
 
-        # DataFrameを一度に構築
-        final_df = pd.DataFrame(temp_data)
+        Returns:
+            Tuple[pd.DataFrame, List[str]]: (変換済みDF, 処理ログ)
+        """
+        logs = []
+
+        specs = self.build_column_specs(has_transfer)
+        # 10. 登録フラグ設定（譲渡一覧からのソース情報、固定値より優先）
+        specs["登録フラグ"] = source("_source_info") if has_transfer else fixed("")
 
-        # 列順を正しく設定し、空列の仮名前を元の空文字列に戻す
-        final_df = final_df.reindex(columns=temp_columns)
-        final_df.columns = IOGConfig.OUTPUT_COLUMNS
+        final_df = build_template_frame(
+            merged_df,
+            specs,
+            IOGConfig.OUTPUT_COLUMNS,
+            fixed_values=IOGConfig.FIXED_VALUES,
+            finalize=self._normalize_output_column
+        )
 
         return final_df, logs
 
@@ -534,20 +527,23 @@ def load_transfer_files(transfer_files: List[Tuple[str, bytes]]) -> pd.DataFrame
 
     all_transfer_data = []
     sheet_names = ["譲渡許可", "譲渡－東", "譲渡－西"]
+    logger = logging.getLogger(__name__)
 
-    for file_name, file_content in transfer_files:
-        for sheet_name in sheet_names:
-            try:
-                # header=1で読み込み（1行目がヘッダー）
-                df = pd.read_excel(io.BytesIO(file_content), sheet_name=sheet_name, dtype=str, header=1)
+    # ファイルごとにブックを1回だけ開いて3シートを読み込む（header=1: 2行目がヘッダー）
+    for book in read_excel_files(transfer_files, sheet_names, header=1, dtype=str):
+        if book.error is not None:
+            logger.warning(f"譲渡一覧ファイル読み込みエラー（スキップ）: {book.file_name}: {book.error}")
+            continue
+        for sheet_name in book.missing:
+            logger.warning(f"譲渡一覧シートがありません（スキップ）: {book.file_name} - {sheet_name}")
+        for sheet_name, error in book.sheet_errors.items():
+            logger.warning(f"譲渡一覧シート読み込みエラー（スキップ）: {book.file_name} - {sheet_name}: {error}")
 
-                # ソース情報列を追加
-                df["_source_info"] = f"{file_name} - {sheet_name}"
+        for sheet_name, df in book.sheets.items():
+            # ソース情報列を追加
+            df["_source_info"] = f"{book.file_name} - {sheet_name}"
 
-                all_transfer_data.append(df)
-            except Exception as e:
-                logging.getLogger(__name__).warning(f"譲渡一覧シート読み込みエラー（スキップ）: {file_name} - {sheet_name}: {e}")
-                continue
+            all_transfer_data.append(df)
 
     if not all_transfer_data:
         return pd.DataFrame()
@@ -691,6 +687,50 @@ def normalize_name(name: str) -> str:
     return normalized.strip()
 
 
+# 部分一致の対象とする譲渡一覧氏名の最小文字数（誤マッチ防止）
+PARTIAL_MATCH_MIN_LENGTH = 3
+
+
+class TransferNameMatcher:
+    """
+    譲渡一覧の氏名による部分一致検索
+
+    正規化済みの氏名（3文字以上）から検索用のインデックスを1回だけ作成し、
+    IOGの氏名に含まれる譲渡一覧の氏名を探す。複数含まれる場合は
+    譲渡一覧で先に出現する行を返す（行を順に調べた場合と同じ）。
+    """
+
+    def __init__(self, normalized_names: Iterable[str]):
+        """
+        Args:
+            normalized_names: 譲渡一覧の正規化済み氏名（行順）
+        """
+        patterns = []
+        self._positions = []
+        seen = set()
+        for position, name in enumerate(normalized_names):
+            # 3文字以上のフルネームのみマッチング対象（同じ氏名は先の行のみ）
+            if len(name) >= PARTIAL_MATCH_MIN_LENGTH and name not in seen:
+                seen.add(name)
+                patterns.append(name)
+                self._positions.append(position)
+        self._matcher = SubstringMatcher(patterns)
+
+    def find(self, normalized_name: str) -> Optional[int]:
+        """
+        正規化済みの氏名に含まれる譲渡一覧の行の位置を返す
+
+        Returns:
+            int: 譲渡一覧での行の位置（0始まり。マッチしない場合は None）
+        """
+        if not normalized_name:
+            return None
+        pattern_index = self._matcher.first_match(normalized_name)
+        if pattern_index is None:
+            return None
+        return self._positions[pattern_index]
+
+
 def find_matching_transfer(iog_name: str, transfer_df: pd.DataFrame) -> pd.Series:
     """
     部分一致で譲渡一覧を検索（最小3文字制限）
@@ -707,19 +747,14 @@ def find_matching_transfer(iog_name: str, transfer_df: pd.DataFrame) -> pd.Serie
         譲渡: "谷田絵理"
         → マッチ（"谷田絵理" in "佐藤絵理福岡絵理谷田絵理"）
     """
-    if not iog_name or transfer_df.empty:
+    if not iog_name or transfer_df.empty or "賃借人氏名" not in transfer_df.columns:
         return None
 
-    iog_normalized = normalize_name(iog_name)
-
-    for idx, row in transfer_df.iterrows():
-        transfer_name = normalize_name(row.get("賃借人氏名", ""))
-
-        # 3文字以上のフルネームのみマッチング対象（誤マッチ防止）
-        if len(transfer_name) >= 3 and transfer_name in iog_normalized:
-            return row
-
-    return None
+    matcher = TransferNameMatcher(transfer_df["賃借人氏名"].apply(normalize_name))
+    position = matcher.find(normalize_name(iog_name))
+    if position is None:
+        return None
+    return transfer_df.iloc[position]
 
 
 def merge_transfer_data(jid_df: pd.DataFrame, transfer_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int], Dict[str, int]]:
@@ -766,16 +801,16 @@ def merge_transfer_data(jid_df: pd.DataFrame, transfer_df: pd.DataFrame) -> Tupl
     # 第2段階: 部分一致（マッチしなかった行のみ）
     unmatched_mask = merged_df["物件名"].isna() if "物件名" in merged_df.columns else pd.Series([True] * len(merged_df))
 
-    for idx in merged_df[unmatched_mask].index:
-        iog_name = merged_df.loc[idx, "対象者名"]
-        matched_row = find_matching_transfer(iog_name, transfer_df)
+    # 譲渡一覧の氏名から検索用インデックスを1回だけ作成
+    matcher = TransferNameMatcher(transfer_df["_normalized_name"])
+    positions = merged_df.loc[unmatched_mask.to_numpy(), "_normalized_name"].map(matcher.find).dropna()
 
-        if matched_row is not None:
-            # マッチした譲渡一覧のデータをマージ
-            for col in transfer_df.columns:
-                if col != "_normalized_name":
-                    merged_df.loc[idx, col] = matched_row[col]
-            partial_match_count += 1
+    if len(positions) > 0:
+        # マッチした譲渡一覧のデータを一括でマージ
+        transfer_columns = [col for col in transfer_df.columns if col != "_normalized_name"]
+        matched_rows = transfer_df.iloc[positions.astype(int).to_numpy()][transfer_columns]
+        merged_df.loc[positions.index, transfer_columns] = matched_rows.set_axis(positions.index)
+        partial_match_count = len(positions)
 
     # 正規化列を削除
     merged_df = merged_df.drop("_normalized_name", axis=1)
@@ -814,12 +849,14 @@ def process_jid_data(excel_content: bytes, transfer_files: List[Tuple[str, bytes
         logger.info("IOG新規登録処理開始")
 
         # 1. IOG Excelファイル読み込み
+        report_progress("ファイル読み込み", 0, 4)
         iog_df = pd.read_excel(io.BytesIO(excel_content), dtype=str)
 
         logs.append(f"IOGファイル読み込み完了: {len(iog_df)}件")
         logs.append(DetailedLogger.log_initial_load(len(iog_df)))
 
         # 2. 譲渡一覧ファイル読み込み＆結合
+        report_progress("譲渡一覧読み込み", 1, 4)
         transfer_df = pd.DataFrame()
         if transfer_files:
             transfer_df = load_transfer_files(transfer_files)
@@ -831,6 +868,7 @@ def process_jid_data(excel_content: bytes, transfer_files: List[Tuple[str, bytes
             logs.append("譲渡一覧なし（IOGデータのみで処理）")
 
         # 3. データマージ（氏名マッチング：2段階）
+        report_progress("氏名マッチング", 2, 4)
         merged_df, duplicates, match_stats = merge_transfer_data(iog_df, transfer_df)
 
         if not transfer_df.empty:
@@ -849,6 +887,7 @@ def process_jid_data(excel_content: bytes, transfer_files: List[Tuple[str, bytes
                     logs.append(f"  • {name}（{count}件マッチ → 最初の1件を使用）")
 
         # 4. データ変換（111列テンプレート準拠）
+        report_progress("データ変換", 3, 4)
         data_converter = DataConverter()
         output_df, conversion_logs = data_converter.convert_jid_data_with_transfer(merged_df, not transfer_df.empty)
 
@@ -4,7 +4,7 @@
 """
 
 from processors.mirail_autocall_unified import MirailAutocallUnifiedProcessor
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Optional
 import pandas as pd
 
 
@@ -52,4 +52,12 @@ def process_mirail_emergency_contact_without10k_data(file_content: bytes) -> Tup
 
 def process_mirail_emergency_contact_with10k_data(file_content: bytes) -> Tuple[pd.DataFrame, List[str], str]:
     """ミライル緊急連絡先（10,000円含む）データ処理"""
-    return _processor.process_mirail_autocall(file_content, "emergency_contact", with_10k=True)
\ No newline at end of file
+    return _processor.process_mirail_autocall(file_content, "emergency_contact", with_10k=True)
+
+# 一括処理（全バリエーションを1回の読み込みで作成）
+def process_mirail_autocall_batch_data(
+    file_content: bytes,
+    variant_keys: Optional[List[str]] = None
+) -> Tuple[Dict[str, Tuple[pd.DataFrame, List[str], str]], List[str]]:
+    """ミライルオートコール一括処理（契約者・保証人・緊急連絡人の全パターン）"""
+    return _processor.process_mirail_autocall_batch(file_content, variant_keys)
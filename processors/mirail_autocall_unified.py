@@ -4,7 +4,6 @@
 """
 
 import pandas as pd
-import io
 import sys
 import os
 from datetime import datetime
@@ -14,10 +13,11 @@ from typing import Tuple, List, Optional, Dict, Any
 processors_dir = os.path.dirname(os.path.abspath(__file__))
 if processors_dir not in sys.path:
     sys.path.append(processors_dir)
-from autocall_common import AUTOCALL_OUTPUT_COLUMNS
 sys.path.append(os.path.join(processors_dir, 'autocall_common'))
-from filter_engine import apply_filters
+from filter_engine import apply_filters, FilterEngine
 from common.contract_list_columns import ContractListColumns as COL
+from processors.autocall_common.output_builder import build_autocall_output
+from processors.common.contract_list_reader import ContractListReader, STREAMING_MIN_BYTES
 
 
 class MirailAutocallUnifiedProcessor:
@@ -42,15 +42,47 @@ class MirailAutocallUnifiedProcessor:
         }
     }
     
+    # 読み込むContractListの列（フィルタ設定・マッピングルールで使う列のみ）
+    CONTRACT_LIST_COLUMNS = [
+        COL.MANAGEMENT_NO,
+        COL.RESIDENCE_STATUS,
+        COL.DELINQUENT_STATUS,
+        COL.CONTRACT_KANA,
+        COL.TEL_MOBILE,
+        COL.TEL_MOBILE_1,
+        COL.TEL_MOBILE_2,
+        COL.DEBT_AMOUNT,
+        COL.PAYMENT_DATE,
+        COL.PAYMENT_AMOUNT,
+        COL.COLLECTION_RANK,
+        COL.PROPERTY_NAME,
+        COL.CLIENT_CD,
+        COL.CLIENT_NAME,
+        COL.TRUSTEE_ID,
+    ]
+    
     # 残債除外金額の定義
     MIRAIL_DEBT_EXCLUDE = [10000, 11000]
     
     # 共通の除外金額
     COMMON_EXCLUDE_AMOUNTS = [2, 3, 5, 12]
     
+    # 一括処理（ファンアウト）の対象バリエーション（画面の8種類と同じ）
+    BATCH_VARIANTS = {
+        "contract_without10k": {"target": "contract", "with_10k": False, "include_today": False},
+        "contract_without10k_today_included": {"target": "contract", "with_10k": False, "include_today": True},
+        "contract_with10k": {"target": "contract", "with_10k": True, "include_today": False},
+        "guarantor_without10k": {"target": "guarantor", "with_10k": False, "include_today": False},
+        "guarantor_without10k_today_included": {"target": "guarantor", "with_10k": False, "include_today": True},
+        "guarantor_with10k": {"target": "guarantor", "with_10k": True, "include_today": False},
+        "emergency_contact_without10k": {"target": "emergency_contact", "with_10k": False, "include_today": False},
+        "emergency_contact_with10k": {"target": "emergency_contact", "with_10k": True, "include_today": False},
+    }
+    
     def __init__(self):
         """初期化"""
         self.logs = []
+        self.reader = ContractListReader(self.CONTRACT_LIST_COLUMNS)
     
     def get_base_filter_config(self, target: str, with_10k: bool, include_today: bool = False) -> Dict[str, Any]:
         """
@@ -118,16 +150,11 @@ class MirailAutocallUnifiedProcessor:
         return filter_config
     
     def read_csv_auto_encoding(self, file_content: bytes) -> pd.DataFrame:
-        """アップロードされたCSVファイルを自動エンコーディング判定で読み込み"""
-        encodings = ['utf-8', 'utf-8-sig', 'shift_jis', 'cp932']
-        
-        for enc in encodings:
-            try:
-                return pd.read_csv(io.BytesIO(file_content), encoding=enc, dtype=str)
-            except Exception:
-                continue
-        
-        raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
+        """アップロードされたCSVファイルを自動エンコーディング判定で読み込み（CONTRACT_LIST_COLUMNS の列のみ）"""
+        try:
+            return self.reader.read(file_content)
+        except Exception:
+            raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
     
     def get_mapping_rules(self, target: str) -> Dict[str, int]:
         """
@@ -162,25 +189,15 @@ class MirailAutocallUnifiedProcessor:
         出力データを作成
         
         Args:
-            df_filtered: フィルタリング済みDataFrame
+            df_filtered: フィルタリング済みDataFrame（CONTRACT_LIST_COLUMNS の列のみ）
             target: 対象者タイプ
             
         Returns:
             28列統一フォーマットのDataFrame
         """
-        # 28列の統一フォーマットで初期化
-        df_output = pd.DataFrame(index=range(len(df_filtered)), columns=AUTOCALL_OUTPUT_COLUMNS)
-        df_output = df_output.fillna("")
-        
-        # データをマッピング
-        mapping_rules = self.get_mapping_rules(target)
-        for i in range(len(df_filtered)):
-            for output_col, col_index in mapping_rules.items():
-                if output_col in df_output.columns:
-                    value = df_filtered.iloc[i, col_index]
-                    df_output.at[i, output_col] = str(value) if pd.notna(value) else ""
-        
-        return df_output
+        # 28列の統一フォーマットで列単位に一括作成
+        mapping_rules = self.reader.project_mapping(self.get_mapping_rules(target))
+        return build_autocall_output(df_filtered, mapping_rules)
     
     def process_mirail_autocall(
         self,
@@ -206,33 +223,218 @@ class MirailAutocallUnifiedProcessor:
             if target not in self.TARGET_CONFIG:
                 raise ValueError(f"無効な対象者タイプ: {target}")
 
-            # 1. CSVファイル読み込み
             self.logs = [f"📂 {self.TARGET_CONFIG[target]['display_name']}データ処理開始..."]
+
+            # 大きいファイルはチャンク単位で読み込み、チャンクごとにフィルタを適用する
+            if len(file_content) >= STREAMING_MIN_BYTES:
+                df_output, process_logs, output_filename = self._process_streaming(
+                    file_content, target, with_10k, include_today
+                )
+                self.logs.extend(process_logs)
+                return df_output, self.logs, output_filename
+
+            # 1. CSVファイル読み込み
             df_input = self.read_csv_auto_encoding(file_content)
             self.logs.append(f"ファイル読み込み完了: {len(df_input)}件")
 
-            # 2. フィルタ設定を取得
-            filter_config = self.get_base_filter_config(target, with_10k, include_today)
+            # 2〜5. フィルタリング・出力データ作成
+            df_output, process_logs, output_filename = self._process_dataframe(
+                df_input, target, with_10k, include_today
+            )
+            self.logs.extend(process_logs)
             
-            # 3. 共通フィルタリングエンジンを使用
-            df_filtered, filter_logs = apply_filters(df_input, filter_config)
-            self.logs.extend(filter_logs)
+            return df_output, self.logs, output_filename
             
-            # 4. 出力データ作成
-            df_output = self.create_output_data(df_filtered, target)
+        except Exception as e:
+            error_msg = f"{self.TARGET_CONFIG[target]['display_name']}データ処理エラー: {str(e)}"
+            self.logs.append(f"❌ {error_msg}")
+            raise Exception(error_msg)
+    
+    def _process_dataframe(
+        self,
+        df_input: pd.DataFrame,
+        target: str,
+        with_10k: bool,
+        include_today: bool,
+        mask_cache: Optional[Dict[str, Any]] = None
+    ) -> Tuple[pd.DataFrame, List[str], str]:
+        """
+        読み込み済みのContractListに対してフィルタリングと出力データ作成を実行
+        
+        Args:
+            df_input: 読み込み済みのContractList（CONTRACT_LIST_COLUMNS の列のみ、変更しない）
+            target: 対象者タイプ
+            with_10k: 10,000円・11,000円を含むかどうか
+            include_today: 当日約定を含むかどうか
+            mask_cache: バリエーション間で共有するフィルタマスクのキャッシュ
             
-            # 5. 出力ファイル名生成
-            today_str = datetime.now().strftime("%m%d")
-            suffix = self.TARGET_CONFIG[target]["name_suffix"]
-            prefix = "with10k" if with_10k else "without10k"
-            today_suffix = "_当日約定込み" if include_today else ""
-            output_filename = f"{today_str}ミライル_{prefix}_{suffix}{today_suffix}.csv"
+        Returns:
+            tuple: (出力DF, 処理ログ, 出力ファイル名)
+        """
+        logs = []
+        
+        # 2. フィルタ設定を取得（列番号は読み込み後の列位置に変換）
+        filter_config = self.reader.project_filter_config(
+            self.get_base_filter_config(target, with_10k, include_today)
+        )
+        
+        # 3. 共通フィルタリングエンジンを使用（単一パスモード）
+        if mask_cache is None:
+            df_filtered, filter_logs = apply_filters(df_input, filter_config, single_pass=True)
+        else:
+            mask_results = self._get_shared_masks(df_input, filter_config, mask_cache)
+            df_filtered, filter_logs = FilterEngine.apply_filters_single_pass(
+                df_input, filter_config, mask_results=mask_results
+            )
+        logs.extend(filter_logs)
+        
+        df_output, output_logs, output_filename = self._build_output(
+            df_filtered, target, with_10k, include_today
+        )
+        logs.extend(output_logs)
+        
+        return df_output, logs, output_filename
+    
+    def _process_streaming(
+        self,
+        file_content: bytes,
+        target: str,
+        with_10k: bool,
+        include_today: bool
+    ) -> Tuple[pd.DataFrame, List[str], str]:
+        """
+        ContractListをチャンク単位で読み込みながらフィルタリングし、出力データを作成
+        
+        メモリに保持するのはフィルタ後の行のみ。結果・ログは
+        read_csv_auto_encoding → _process_dataframe の場合と同じ。
+        """
+        filter_config = self.reader.project_filter_config(
+            self.get_base_filter_config(target, with_10k, include_today)
+        )
+        
+        def filter_chunks(chunks):
+            row_counts = []
             
-            self.logs.append(f"✅ 処理完了: {len(df_output)}件出力")
+            def counted():
+                for chunk in chunks:
+                    row_counts.append(len(chunk))
+                    yield chunk
             
-            return df_output, self.logs, output_filename
+            df_filtered, filter_logs = FilterEngine.apply_filters_chunked(counted(), filter_config)
+            return df_filtered, filter_logs, sum(row_counts)
+        
+        # 1〜3. チャンク単位の読み込みとフィルタリング
+        try:
+            df_filtered, filter_logs, row_count = self.reader.apply_chunked(file_content, filter_chunks)
+        except (UnicodeDecodeError, pd.errors.ParserError, pd.errors.EmptyDataError):
+            raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
+        
+        logs = [f"ファイル読み込み完了: {row_count}件"]
+        logs.extend(filter_logs)
+        
+        df_output, output_logs, output_filename = self._build_output(
+            df_filtered, target, with_10k, include_today
+        )
+        logs.extend(output_logs)
+        
+        return df_output, logs, output_filename
+    
+    def _build_output(
+        self,
+        df_filtered: pd.DataFrame,
+        target: str,
+        with_10k: bool,
+        include_today: bool
+    ) -> Tuple[pd.DataFrame, List[str], str]:
+        """フィルタリング済みデータから出力データとファイル名を作成"""
+        logs = []
+        
+        # 4. 出力データ作成
+        df_output = self.create_output_data(df_filtered, target)
+        
+        # 5. 出力ファイル名生成
+        today_str = datetime.now().strftime("%m%d")
+        suffix = self.TARGET_CONFIG[target]["name_suffix"]
+        prefix = "with10k" if with_10k else "without10k"
+        today_suffix = "_当日約定込み" if include_today else ""
+        output_filename = f"{today_str}ミライル_{prefix}_{suffix}{today_suffix}.csv"
+        
+        logs.append(f"✅ 処理完了: {len(df_output)}件出力")
+        
+        return df_output, logs, output_filename
+    
+    @staticmethod
+    def _get_shared_masks(
+        df_input: pd.DataFrame,
+        filter_config: Dict[str, Any],
+        mask_cache: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        フィルタ設定が同じマスクはキャッシュから再利用する
+        
+        委託先法人ID・回収ランク・滞納残債などの共通フィルタは全バリエーションで
+        同じ設定のため、1回だけ評価される。
+        """
+        converted = mask_cache.setdefault("_converted", {})
+        mask_results = []
+        for filter_name, config in filter_config.items():
+            key = f"{filter_name}:{config!r}"
+            if key not in mask_cache:
+                evaluated = FilterEngine.build_masks(df_input, {filter_name: config}, converted)
+                if not evaluated:
+                    continue
+                mask_cache[key] = evaluated[0]
+            mask_results.append(mask_cache[key])
+        return mask_results
+    
+    def process_mirail_autocall_batch(
+        self,
+        file_content: bytes,
+        variant_keys: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, Tuple[pd.DataFrame, List[str], str]], List[str]]:
+        """
+        1つのContractListから複数バリエーションを一括処理（ファンアウト）
+        
+        ファイルの読み込みは1回だけ行い、共通フィルタのマスクは
+        バリエーション間で共有する。
+        
+        Args:
+            file_content: ContractListのファイル内容（bytes）
+            variant_keys: 処理するバリエーション（BATCH_VARIANTSのキー）。Noneの場合は全8種類
             
+        Returns:
+            tuple: ({バリエーション: (出力DF, 処理ログ, 出力ファイル名)}, 全体ログ)
+        """
+        if variant_keys is None:
+            variant_keys = list(self.BATCH_VARIANTS.keys())
+        
+        invalid_keys = [key for key in variant_keys if key not in self.BATCH_VARIANTS]
+        if invalid_keys:
+            raise ValueError(f"無効なバリエーション: {invalid_keys}")
+        
+        batch_logs = ["📂 一括処理開始..."]
+        try:
+            df_input = self.read_csv_auto_encoding(file_content)
         except Exception as e:
-            error_msg = f"{self.TARGET_CONFIG[target]['display_name']}データ処理エラー: {str(e)}"
-            self.logs.append(f"❌ {error_msg}")
-            raise Exception(error_msg)
\ No newline at end of file
+            error_msg = f"一括処理エラー: {str(e)}"
+            batch_logs.append(f"❌ {error_msg}")
+            raise Exception(error_msg)
+        batch_logs.append(f"ファイル読み込み完了: {len(df_input)}件")
+        
+        results = {}
+        mask_cache = {}
+        for key in variant_keys:
+            variant = self.BATCH_VARIANTS[key]
+            target = variant["target"]
+            try:
+                results[key] = self._process_dataframe(
+                    df_input, target, variant["with_10k"], variant["include_today"], mask_cache
+                )
+            except Exception as e:
+                error_msg = f"{self.TARGET_CONFIG[target]['display_name']}データ処理エラー: {str(e)}"
+                batch_logs.append(f"❌ {error_msg}")
+                raise Exception(error_msg)
+            batch_logs.append(f"{results[key][2]}: {len(results[key][0])}件")
+        
+        batch_logs.append(f"✅ 一括処理完了: {len(results)}種類")
+        return results, batch_logs
@@ -4,23 +4,18 @@
 """
 import pandas as pd
 import numpy as np
-import io
 from datetime import datetime
 from typing import Tuple, Optional, List
 from processors.common.detailed_logger import DetailedLogger
+from processors.common.parsed_frame_cache import read_csv_cached
 
 
 def read_csv_auto_encoding(file_content: bytes) -> pd.DataFrame:
     """アップロードされたCSVファイルを自動エンコーディング判定で読み込み"""
-    encodings = ['utf-8', 'utf-8-sig', 'shift_jis', 'cp932']
-
-    for enc in encodings:
-        try:
-            return pd.read_csv(io.BytesIO(file_content), encoding=enc, dtype=str)
-        except Exception:
-            continue
-
-    raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
+    try:
+        return read_csv_cached(file_content, dtype=str)
+    except Exception:
+        raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
 
 
 def process_mirail_notification(
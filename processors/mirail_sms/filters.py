@@ -0,0 +1,87 @@
+"""
+ミライルSMS共通フィルタ定義
+
+契約者・保証人・連絡人SMS（前日以前）と当日SMSで使うフィルタ。
+列はすべて ContractList の列番号で参照する。
+"""
+
+from typing import List
+
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.sms_common.pipeline import (
+    SmsFilter,
+    arrears_at_least,
+    client_cd_excluded,
+    collection_rank_excluded,
+    mobile_phone,
+    payment_amount_at_least,
+    payment_amount_excluded,
+    payment_date_before_today,
+    payment_date_today,
+    trustee_id_text,
+)
+
+# DO列　委託先法人ID（trustee_filter_type ごと）
+TRUSTEE_FILTERS = {
+    'id5': trustee_id_text(['5'], '委託先法人ID（5のみ）'),
+    'blank': trustee_id_text(['', 'nan'], '委託先法人ID（空白のみ）'),
+}
+# trustee_filter_type がいずれでもない場合: 5または空白
+TRUSTEE_FILTER_DEFAULT = trustee_id_text(['5', '', 'nan'], '委託先法人ID')
+
+# 当日SMSの委託先法人ID
+TODAY_TRUSTEE_ID5 = trustee_id_text(['5'], '委託先法人ID（5のみ）')
+TODAY_TRUSTEE_BLANK = trustee_id_text(['', 'nan', 'NaN', 'None'], '委託先法人ID（空白のみ）')
+
+# BV列　入金予定金額: 除外する金額
+EXCLUDED_PAYMENT_AMOUNTS = [2, 3, 5, 12]
+
+# CI列　回収ランク: 除外するランク
+EXCLUDED_COLLECTION_RANKS = ["弁護士介入", "訴訟中"]
+
+# CT列　クライアントCD: 当日SMSで除外するCD
+TODAY_EXCLUDED_CLIENT_CDS = ['10', '40', '9268']
+
+
+def standard_filters(trustee_filter_type: str, phone_filter: SmsFilter) -> List[SmsFilter]:
+    """
+    契約者・保証人・連絡人SMS（前日以前）のフィルタ
+
+    1. DO列　委託先法人ID: trustee_filter_type に応じて選択
+    2. BU列　入金予定日: 前日以前（空白含む）
+    3. BV列　入金予定金額: 2,3,5,12を除外
+    4. CI列　回収ランク: 「弁護士介入」「訴訟中」を除外
+    5. BT列　滞納残債: 1円以上
+    6. TEL携帯（phone_filter）
+    """
+    return [
+        TRUSTEE_FILTERS.get(trustee_filter_type, TRUSTEE_FILTER_DEFAULT),
+        payment_date_before_today(),
+        payment_amount_excluded(EXCLUDED_PAYMENT_AMOUNTS),
+        collection_rank_excluded(EXCLUDED_COLLECTION_RANKS),
+        arrears_at_least(1),
+        phone_filter,
+    ]
+
+
+def today_filters(trustee_filter: SmsFilter) -> List[SmsFilter]:
+    """
+    当日SMSのフィルタ
+
+    1. DO列　委託先法人ID（trustee_filter）
+    2. CT列　クライアントCD: 10, 40, 9268を除外
+    3. BU列　入金予定日: 当日のみ
+    4. BV列　入金予定金額: 13円以上
+    5. CI列　回収ランク: 「弁護士介入」「訴訟中」を除外
+    6. BT列　滞納残債: 1円以上
+    7. AB列　TEL携帯: 090/080/070形式のみ
+    """
+    return [
+        trustee_filter,
+        client_cd_excluded(TODAY_EXCLUDED_CLIENT_CDS, 'クライアントCD（10,40,9268除外）'),
+        payment_date_today(),
+        payment_amount_at_least(13),
+        collection_rank_excluded(EXCLUDED_COLLECTION_RANKS),
+        arrears_at_least(1),
+        mobile_phone(COL.TEL_MOBILE, 'AB列TEL携帯'),
+    ]
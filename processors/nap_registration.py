@@ -52,12 +52,15 @@
 
 import pandas as pd
 import io
-import chardet
 from datetime import datetime
 from typing import Tuple, List, Dict, Union
 import logging
 import time
 
+from processors.common.metrics import instrument_phase
+from processors.common.parsed_frame_cache import read_csv_cached
+from processors.common.progress import report_progress
+
 
 def format_zipcode(zipcode: str) -> str:
     """
@@ -288,6 +291,7 @@ class FileReader:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
+    @instrument_phase("read", arg=1)
     def read_excel_file(
         self,
         file_content: Union[bytes, io.BytesIO],
@@ -347,33 +351,13 @@ class FileReader:
         else:
             content = file_content
 
-        # エンコーディング検出（最初の10KBのみで高速化）
-        sample_size = min(10240, len(content))
-        detected = chardet.detect(content[:sample_size])
-        encoding = detected['encoding']
-
-        # エンコーディング順リスト
-        encodings = ['cp932', 'shift_jis', 'utf-8', 'utf-8-sig']
-
-        if encoding and encoding.lower() not in [e.lower() for e in encodings]:
-            encodings.insert(0, encoding)
-
-        for enc in encodings:
-            try:
-                df = pd.read_csv(
-                    io.BytesIO(content),
-                    encoding=enc,
-                    dtype=str,
-                    keep_default_na=False
-                )
-
-                self.logger.info(f"CSV file loaded with {enc}: {df.shape[0]} rows, {df.shape[1]} columns")
-                return df
-
-            except Exception:
-                continue
+        try:
+            df = read_csv_cached(content, dtype=str, keep_default_na=False)
+        except Exception:
+            raise ValueError("CSVファイルの読み込みに失敗しました")
 
-        raise ValueError("CSVファイルの読み込みに失敗しました")
+        self.logger.info(f"CSV file loaded: {df.shape[0]} rows, {df.shape[1]} columns")
+        return df
 
 
 class DuplicateChecker:
@@ -382,6 +366,7 @@ class DuplicateChecker:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
+    @instrument_phase("filter", arg=1)
     def filter_contract_list(
         self,
         contract_df: pd.DataFrame,
@@ -405,6 +390,7 @@ class DuplicateChecker:
 
         return filtered_df
 
+    @instrument_phase("filter", arg=1)
     def check_duplicates(
         self,
         input_df: pd.DataFrame,
@@ -470,6 +456,7 @@ class DataMapper:
         self.config = config
         self.logger = logging.getLogger(__name__)
 
+    @instrument_phase("convert", arg=1)
     def create_output_dataframe(
         self,
         input_df: pd.DataFrame
@@ -487,6 +474,7 @@ class DataMapper:
         output_df = pd.DataFrame("", index=range(len(input_df)), columns=self.config.OUTPUT_COLUMNS)
         return output_df
 
+    @instrument_phase("convert", arg=1)
     def map_contractor_info(
         self,
         output_df: pd.DataFrame,
@@ -559,6 +547,7 @@ class DataMapper:
         if "契約者勤務先電話" in input_df.columns:
             output_df["契約者勤務先TEL"] = input_df["契約者勤務先電話"].apply(format_phone)
 
+    @instrument_phase("convert", arg=1)
     def map_property_info(
         self,
         output_df: pd.DataFrame,
@@ -619,6 +608,7 @@ class DataMapper:
             formatted_dates = dates.dt.strftime('%Y/%-m/%-d')  # ゼロ埋めなし
             output_df["引継情報"] = "●入居日" + formatted_dates.fillna("")
 
+    @instrument_phase("convert", arg=1)
     def map_guarantor_info(
         self,
         output_df: pd.DataFrame,
@@ -667,6 +657,7 @@ class DataMapper:
         if "連保人1携帯番号" in input_df.columns:
             output_df["保証人１TEL携帯"] = input_df["連保人1携帯番号"].apply(format_phone)
 
+    @instrument_phase("convert", arg=1)
     def map_emergency_contact_info(
         self,
         output_df: pd.DataFrame,
@@ -709,6 +700,7 @@ class DataMapper:
         if "緊急連絡人携帯１" in input_df.columns:
             output_df["緊急連絡人１TEL携帯"] = input_df["緊急連絡人携帯１"].apply(format_phone)
 
+    @instrument_phase("convert", arg=1)
     def apply_fixed_values(
         self,
         output_df: pd.DataFrame
@@ -753,6 +745,7 @@ def process_nap_data(
 
     try:
         # 1. ファイル読み込み
+        report_progress("ファイル読み込み", 0, 9)
         phase_start = time.time()
         logger.info("=== Phase 1: ファイル読み込み ===")
         file_reader = FileReader()
@@ -774,6 +767,7 @@ def process_nap_data(
         logger.info(f"Phase 1 completed in {phase_time:.2f}s")
 
         # 2. ContractListフィルタリング
+        report_progress("ContractListフィルタリング", 1, 9)
         phase_start = time.time()
         logger.info("=== Phase 2: ContractListフィルタリング ===")
         checker = DuplicateChecker()
@@ -788,6 +782,7 @@ def process_nap_data(
         logger.info(f"Phase 2 completed in {phase_time:.2f}s")
 
         # 3. 重複チェック
+        report_progress("重複チェック", 2, 9)
         phase_start = time.time()
         logger.info("=== Phase 3: 重複チェック ===")
         new_data, existing_data, stats, check_logs = checker.check_duplicates(
@@ -810,36 +805,42 @@ def process_nap_data(
         mapper = DataMapper(config)
 
         # 4-1. DataFrame作成
+        report_progress("DataFrame作成", 3, 9)
         phase_start = time.time()
         output_df = mapper.create_output_dataframe(new_data)
         phase_time = time.time() - phase_start
         logger.info(f"Phase 4-1 (create_output_dataframe) completed in {phase_time:.2f}s")
 
         # 4-2. 契約者情報マッピング
+        report_progress("契約者情報マッピング", 4, 9)
         phase_start = time.time()
         mapper.map_contractor_info(output_df, new_data)
         phase_time = time.time() - phase_start
         logger.info(f"Phase 4-2 (map_contractor_info) completed in {phase_time:.2f}s")
 
         # 4-3. 物件情報マッピング
+        report_progress("物件情報マッピング", 5, 9)
         phase_start = time.time()
         mapper.map_property_info(output_df, new_data)
         phase_time = time.time() - phase_start
         logger.info(f"Phase 4-3 (map_property_info) completed in {phase_time:.2f}s")
 
         # 4-4. 保証人情報マッピング
+        report_progress("保証人情報マッピング", 6, 9)
         phase_start = time.time()
         mapper.map_guarantor_info(output_df, new_data)
         phase_time = time.time() - phase_start
         logger.info(f"Phase 4-4 (map_guarantor_info) completed in {phase_time:.2f}s")
 
         # 4-5. 緊急連絡人情報マッピング
+        report_progress("緊急連絡人情報マッピング", 7, 9)
         phase_start = time.time()
         mapper.map_emergency_contact_info(output_df, new_data)
         phase_time = time.time() - phase_start
         logger.info(f"Phase 4-5 (map_emergency_contact_info) completed in {phase_time:.2f}s")
 
         # 4-6. 固定値適用
+        report_progress("固定値適用", 8, 9)
         phase_start = time.time()
         mapper.apply_fixed_values(output_df)
         phase_time = time.time() - phase_start
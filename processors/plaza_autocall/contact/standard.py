@@ -5,7 +5,6 @@
 """
 
 import pandas as pd
-import io
 import sys
 import os
 from datetime import datetime
@@ -15,21 +14,33 @@ from typing import Tuple, List
 processors_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if processors_dir not in sys.path:
     sys.path.append(processors_dir)
-from autocall_common import AUTOCALL_OUTPUT_COLUMNS
+from processors.autocall_common.output_builder import build_autocall_output
+from processors.common.contract_list_reader import ContractListReader
 from processors.common.detailed_logger import DetailedLogger
 
+# 読み込むContractListの列（フィルタ・出力マッピングで使う列のみ、列名で参照）
+CONTRACT_LIST_COLUMNS = [
+    '委託先法人ID',
+    '入金予定日',
+    '入金予定金額',
+    '回収ランク',
+    '滞納残債',
+    '緊急連絡人１のTEL（携帯）',
+    '入居ステータス',
+    '滞納ステータス',
+    '管理番号',
+    '契約者カナ',
+    '物件名',
+    'クライアント名',
+]
+
 
 def read_csv_auto_encoding(file_content: bytes) -> pd.DataFrame:
-    """アップロードされたCSVファイルを自動エンコーディング判定で読み込み"""
-    encodings = ['utf-8', 'utf-8-sig', 'shift_jis', 'cp932']
-    
-    for enc in encodings:
-        try:
-            return pd.read_csv(io.BytesIO(file_content), encoding=enc, dtype=str)
-        except Exception:
-            continue
-    
-    raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
+    """アップロードされたCSVファイルを自動エンコーディング判定で読み込み（CONTRACT_LIST_COLUMNS の列のみ）"""
+    try:
+        return ContractListReader(CONTRACT_LIST_COLUMNS).read(file_content)
+    except Exception:
+        raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
 
 
 def apply_plaza_contact_filters(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
@@ -187,10 +198,6 @@ def create_plaza_contact_output(df_filtered: pd.DataFrame) -> Tuple[pd.DataFrame
     """プラザ緊急連絡人出力データ作成（28列統一フォーマット）"""
     logs = []
     
-    # 28列の統一フォーマットで初期化
-    df_output = pd.DataFrame(index=range(len(df_filtered)), columns=AUTOCALL_OUTPUT_COLUMNS)
-    df_output = df_output.fillna("")
-    
     # 出力用のマッピング（ミライルwith10kと同じ）
     mapping_rules = {
         "電話番号": "緊急連絡人１のTEL（携帯）",
@@ -204,17 +211,14 @@ def create_plaza_contact_output(df_filtered: pd.DataFrame) -> Tuple[pd.DataFrame
         "残債": "滞納残債"  # J列「残債」にBT列「滞納残債」を格納
     }
     
+    # 28列の統一フォーマットで列単位に一括作成
+    df_output = build_autocall_output(df_filtered, mapping_rules)
+    
     # データが0件の場合
     if len(df_filtered) == 0:
         logs.append("緊急連絡人出力データ作成完了: 0件（フィルタリング後データなし）")
         return df_output, logs
     
-    # データをマッピング
-    for i, (_, row) in enumerate(df_filtered.iterrows()):
-        for output_col, input_col in mapping_rules.items():
-            if output_col in df_output.columns and input_col in row:
-                df_output.at[i, output_col] = str(row[input_col]) if pd.notna(row[input_col]) else ""
-    
     logs.append(f"緊急連絡人出力データ作成完了: {len(df_output)}件")
     
     return df_output, logs
@@ -7,6 +7,7 @@
 
 入力：
 - 前日のコールセンター回収委託情報（Excel）
+  省略時は残債スナップショット（processors/common/debt_snapshot.py）の前回分を使用
 - 当日のコールセンター回収委託情報（Excel）
 - 1241件.csv（プラザ依頼分リスト）
 
@@ -17,28 +18,54 @@
 """
 
 import pandas as pd
-import io
-from datetime import datetime
-from typing import Tuple, List, Dict, Any
+from datetime import date, datetime
+from typing import Tuple, List, Dict, Any, Optional
+from processors.common.debt_snapshot import DebtSnapshotStore
 from processors.common.detailed_logger import DetailedLogger
+from processors.common.excel_reader import read_first_sheet
 from processors.sms_common.utils import read_csv_auto_encoding
 from processors.common.plaza_debt_columns import PlazaDebtUpdateColumns as PDC
 
+# 残債スナップショットの識別名
+SNAPSHOT_SOURCE = "plaza"
+
+
+def load_previous_snapshot(snapshot_store: DebtSnapshotStore, snapshot_date: date) -> Tuple[pd.DataFrame, date]:
+    """
+    snapshot_date より前の最新スナップショットを前日データの形式（会員番号・延滞額合計）で取得
+
+    Raises:
+        ValueError: 保存済みのスナップショットがない場合
+    """
+    previous_date = snapshot_store.previous_date(SNAPSHOT_SOURCE, snapshot_date)
+    if previous_date is None:
+        raise ValueError("前回の残債スナップショットがありません。前日のExcelファイルをアップロードしてください")
+    df_previous = snapshot_store.load(SNAPSHOT_SOURCE, previous_date).rename(columns={
+        'key': PDC.COLLECTION_REPORT['member_no']['name'],
+        'amount': PDC.COLLECTION_REPORT['arrears_total']['name'],
+    })
+    return df_previous, previous_date
+
 
 def process_plaza_debt_update(
-    yesterday_file: bytes,
+    yesterday_file: Optional[bytes],
     today_file: bytes,
     plaza_list_file: bytes,
-    selected_date: datetime.date
+    selected_date: datetime.date,
+    snapshot_store: Optional[DebtSnapshotStore] = None,
+    snapshot_date: Optional[date] = None
 ) -> Tuple[List[pd.DataFrame], List[str], List[str], Dict[str, Any]]:
     """
     プラザ残債更新処理のメイン関数
     
     Args:
         yesterday_file: 前日のコールセンター回収委託情報（Excel）
+            None の場合は snapshot_store の前回スナップショットを前日データとして使用
         today_file: 当日のコールセンター回収委託情報（Excel）
         plaza_list_file: 1241件.csv（プラザ依頼分リスト）
         selected_date: 交渉備考に使用する日付
+        snapshot_store: 残債スナップショットの保存先（指定時は出力の作成後に当日データを保存）
+        snapshot_date: 当日データのスナップショット日付（当日ファイルの日付。省略時は今日）
     
     Returns:
         tuple: (出力DataFrameのリスト, ファイル名のリスト, ログリスト, 統計情報)
@@ -49,19 +76,29 @@ def process_plaza_debt_update(
         # === ファイル読み込み ===
         logs.append("📂 ファイル読み込み開始...")
         
-        # 前日のExcelファイル読み込み
-        df_yesterday = pd.read_excel(
-            io.BytesIO(yesterday_file),
-            usecols=[
-                PDC.COLLECTION_REPORT['member_no']['name'],
-                PDC.COLLECTION_REPORT['arrears_total']['name']
-            ]
-        )
-        logs.append(f"前日データ読み込み: {len(df_yesterday)}件")
+        if yesterday_file is None and snapshot_store is None:
+            raise ValueError("前日のExcelファイルまたは残債スナップショットが必要です")
+        if snapshot_store is not None:
+            snapshot_date = snapshot_store.resolve_date(snapshot_date)
+        snapshot_date = snapshot_date or date.today()
+        
+        # 前日のExcelファイル読み込み（省略時は前回のスナップショット）
+        if yesterday_file is not None:
+            df_yesterday = read_first_sheet(
+                yesterday_file,
+                usecols=[
+                    PDC.COLLECTION_REPORT['member_no']['name'],
+                    PDC.COLLECTION_REPORT['arrears_total']['name']
+                ]
+            )
+            logs.append(f"前日データ読み込み: {len(df_yesterday)}件")
+        else:
+            df_yesterday, previous_date = load_previous_snapshot(snapshot_store, snapshot_date)
+            logs.append(f"前日データ: 残債スナップショット（{previous_date:%Y/%m/%d}）から {len(df_yesterday)}件")
         
         # 当日のExcelファイル読み込み
-        df_today = pd.read_excel(
-            io.BytesIO(today_file),
+        df_today = read_first_sheet(
+            today_file,
             usecols=[
                 PDC.COLLECTION_REPORT['member_no']['name'],
                 PDC.COLLECTION_REPORT['arrears_total']['name'],
@@ -242,6 +279,16 @@ def process_plaza_debt_update(
             'negative_payments': (df_merged['入金額'] < 0).sum()
         }
         
+        # 当日データを残債スナップショットとして保存（次回は前日ファイル不要）
+        if snapshot_store is not None:
+            saved = snapshot_store.save(
+                SNAPSHOT_SOURCE,
+                snapshot_date,
+                df_today[member_no_col],
+                df_today[PDC.COLLECTION_REPORT['arrears_total']['name']]
+            )
+            logs.append(f"💾 残債スナップショット保存: {snapshot_date:%Y/%m/%d} {saved}件")
+        
         logs.append(f"✅ 処理完了")
         logs.append(f"📊 最終結果: 当日データ{len(df_today)}件 → 処理済み{len(df_merged)}件 → 管理番号付き{stats['management_matched']}件")
         
@@ -14,14 +14,30 @@
 """
 
 import pandas as pd
+import numpy as np
 import io
 import re
-import chardet
 import unicodedata
 from datetime import datetime
 from typing import Tuple, List, Dict, Union
 import logging
-from processors.common.address_splitter import AddressSplitter
+from processors.common.address_splitter import get_address_splitter
+from processors.common.parsed_frame_cache import read_csv_cached
+from processors.common.progress import report_progress
+from processors.common.column_spec import (
+    ColumnSpec,
+    ConversionContext,
+    apply_unique,
+    build_template_frame,
+    computed,
+    copy_of,
+    fixed,
+    map_unique,
+    remove_spaces,
+    source,
+    split_address_columns,
+    to_zenkaku,
+)
 
 
 class PlazaConfig:
@@ -208,34 +224,17 @@ class FileReader:
         else:
             content = file_content
 
-        # エンコーディング検出
-        detected = chardet.detect(content)
-        encoding = detected["encoding"]
-
-        # エンコーディング順リスト
-        encodings = ["cp932", "shift_jis", "utf-8", "utf-8-sig"]
-
-        if encoding and encoding.lower() not in [e.lower() for e in encodings]:
-            encodings.insert(0, encoding)
-
-        for enc in encodings:
-            try:
-                df = pd.read_csv(
-                    io.BytesIO(content), encoding=enc, dtype=str, keep_default_na=False
-                )
-
-                # ヘッダー検証
-                if expected_headers:
-                    if list(df.columns) != expected_headers:
-                        continue
-
-                self.logger.info(f"Successfully read file with encoding: {enc}")
-                return df
+        try:
+            df = read_csv_cached(content, dtype=str, keep_default_na=False)
+        except Exception:
+            raise ValueError("ファイルの読み込みに失敗しました")
 
-            except Exception:
-                continue
+        # ヘッダー検証
+        if expected_headers and list(df.columns) != expected_headers:
+            raise ValueError("ファイルの読み込みに失敗しました")
 
-        raise ValueError("ファイルの読み込みに失敗しました")
+        self.logger.info(f"Successfully read file: {df.shape[0]} rows, {df.shape[1]} columns")
+        return df
 
 
 class DuplicateChecker:
@@ -279,7 +278,7 @@ class DataConverter:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.address_splitter = AddressSplitter()
+        self.address_splitter = get_address_splitter()
 
     def safe_str_convert(self, value) -> str:
         """安全な文字列変換"""
@@ -399,6 +398,20 @@ class DataConverter:
 
         return text
 
+    def normalize_person_name(self, name: str) -> str:
+        """氏名の表記統一（異体字統一、アルファベットのみなら半角大文字に変換）
+
+        Args:
+            name: スペース除去済みの氏名
+
+        Returns:
+            str: 表記を統一した氏名
+        """
+        name = self.normalize_kanji_variants(name)
+        if self.is_alphabet_only(name):
+            name = self.convert_fullwidth_alpha_to_halfwidth_upper(name)
+        return name
+
     def convert_date_format(self, date_str: str) -> str:
         """日付フォーマット変換 YYYYMMDD → YYYY/M/D"""
         if pd.isna(date_str) or str(date_str).strip() == "":
@@ -439,402 +452,173 @@ class PlazaProcessor:
         self.duplicate_checker = DuplicateChecker()
         self.converter = DataConverter()
 
-    def convert_to_output_format(self, plaza_df: pd.DataFrame) -> pd.DataFrame:
-        """プラザデータを111列フォーマットに変換"""
-        self.logger.info(f"変換開始: {len(plaza_df)}行")
-        output_df = pd.DataFrame(columns=PlazaConfig.OUTPUT_COLUMNS)
-
-        for idx, row in plaza_df.iterrows():
+    def _address_parts(self, ctx: ConversionContext) -> pd.DataFrame:
+        """住所分割（K列「住所」、列ごとに1回だけ分割）"""
+        return ctx.cached(
+            "address",
+            lambda: split_address_columns(self.converter.address_splitter, ctx.text(10)),
+        )
+
+    def _arrears_before_management(self, ctx: ConversionContext) -> pd.Series:
+        """管理前滞納額（Z列「延滞合計」+ AA列「事務手数料」）"""
+        late_fee_str = ctx.text(25)
+        admin_fee_str = ctx.text(26)
+
+        def to_float(value: str):
+            if not value:
+                return 0.0
             try:
-                self.logger.debug(f"行 {idx} 処理開始")
-                output_row = {}
-
-                # 列インデックスで取得（0ベース）
-                cols = plaza_df.columns
-
-                # A列：引継番号 ← D列「会員番号」
-                output_row["引継番号"] = self.converter.safe_str_convert(row[cols[3]])
-
-                # B列：契約者氏名 ← G列「氏名（漢字）」（スペース削除、異体字統一、アルファベットのみなら半角大文字に変換）
-                contractor_name = self.converter.remove_all_spaces(
-                    self.converter.safe_str_convert(row[cols[6]])
-                )
-                contractor_name = self.converter.normalize_kanji_variants(
-                    contractor_name
-                )
-                if self.converter.is_alphabet_only(contractor_name):
-                    contractor_name = (
-                        self.converter.convert_fullwidth_alpha_to_halfwidth_upper(
-                            contractor_name
-                        )
-                    )
-                output_row["契約者氏名"] = contractor_name
-
-                # C列：契約者カナ ← H列「フリガナ」（スペース削除、半角→全角カナ変換）
-                kana = self.converter.safe_str_convert(row[cols[7]])
-                kana = self.converter.remove_all_spaces(kana)
-                output_row["契約者カナ"] = self.converter.hankaku_to_zenkaku(kana)
-
-                # D列：契約者生年月日 ← I列「生年月日」（YYYYMMDD→YYYY/M/D）
-                output_row["契約者生年月日"] = self.converter.convert_date_format(
-                    self.converter.safe_str_convert(row[cols[8]])
-                )
-
-                # E列：契約者TEL自宅（空欄）
-                output_row["契約者TEL自宅"] = ""
-
-                # F列：契約者TEL携帯 ← M列「電話番号」（先頭0補完、ハイフン挿入）
-                output_row["契約者TEL携帯"] = self.converter.normalize_phone_number(
-                    self.converter.safe_str_convert(row[cols[12]])
-                )
-
-                # G列：契約者現住所郵便番号 ← J列「郵便番号」
-                output_row["契約者現住所郵便番号"] = self.converter.safe_str_convert(
-                    row[cols[9]]
-                )
-
-                # 住所分割（K列「住所」）
-                address = self.converter.safe_str_convert(row[cols[10]])
-                addr_parts = self.converter.split_address(address)
-
-                # H列：契約者現住所1（都道府県）
-                output_row["契約者現住所1"] = addr_parts["prefecture"]
-
-                # I列：契約者現住所2（市区町村）
-                output_row["契約者現住所2"] = addr_parts["city"]
-
-                # J列：契約者現住所3（住所の残り + 物件名 + 号室）
-                remaining = addr_parts["remaining"]
-                building = self.converter.safe_str_convert(
-                    row[cols[11]]
-                )  # L列「物件名」
-                room = self.converter.safe_str_convert(row[cols[4]])  # E列「号室」
-                output_row["契約者現住所3"] = f"{remaining}　{building}　{room}".strip()
-
-                # K列：引継情報（処理日付 + "プラザ一括登録" + メールアドレス）
-                today = datetime.now().strftime("%Y/%-m/%-d")
-                email = self.converter.safe_str_convert(row[cols[13]])  # N列「メール」
-                output_row["引継情報"] = (
-                    f"{today}　プラザ一括登録　●メールアドレス：{email}"
-                )
-
-                # L列：物件名 ← L列「物件名」
-                output_row["物件名"] = building
-
-                # M列：部屋番号 ← E列「号室」
-                output_row["部屋番号"] = room
-
-                # N列：物件住所郵便番号 ← J列「郵便番号」
-                output_row["物件住所郵便番号"] = self.converter.safe_str_convert(
-                    row[cols[9]]
-                )
-
-                # O列：物件住所1（都道府県）
-                output_row["物件住所1"] = addr_parts["prefecture"]
-
-                # P列：物件住所2（市区町村）
-                output_row["物件住所2"] = addr_parts["city"]
-
-                # Q列：物件住所3（住所の残り部分のみ、物件名・号室は含まない）
-                output_row["物件住所3"] = addr_parts["remaining"]
-
-                # R列：入居ステータス（固定値）
-                output_row["入居ステータス"] = "入居中"
-
-                # S列：滞納ステータス（固定値）
-                output_row["滞納ステータス"] = "未精算"
-
-                # T列：受託状況（固定値）
-                output_row["受託状況"] = "契約中"
-
-                # U列：月額賃料 ← S列「利用料合計」
-                output_row["月額賃料"] = self.converter.safe_str_convert(row[cols[18]])
-
-                # V〜AC列：空欄
-                for col in [
-                    "管理費",
-                    "共益費",
-                    "水道代",
-                    "駐車場代",
-                    "その他費用1",
-                    "その他費用2",
-                    "敷金",
-                    "礼金",
-                ]:
-                    output_row[col] = ""
-
-                # AD列：回収口座金融機関CD（固定値）
-                output_row["回収口座金融機関CD"] = "310"
-
-                # AE列：回収口座金融機関名（固定値）
-                output_row["回収口座金融機関名"] = "GMOあおぞらネット銀行"
-
-                # AF列：回収口座支店CD ← AB列「バーチャル口座支店番号」
-                output_row["回収口座支店CD"] = self.converter.safe_str_convert(
-                    row[cols[27]]
-                )
-
-                # AG列：回収口座支店名 ← AC列「バーチャル口座支店名」
-                output_row["回収口座支店名"] = self.converter.safe_str_convert(
-                    row[cols[28]]
-                )
-
-                # AH列：回収口座種類（固定値）
-                output_row["回収口座種類"] = "普通"
-
-                # AI列：回収口座番号 ← AD列「バーチャル口座番号」
-                output_row["回収口座番号"] = self.converter.safe_str_convert(
-                    row[cols[29]]
-                )
-
-                # AJ列：回収口座名義（固定値）
-                output_row["回収口座名義"] = "プラザ賃貸管理保証株式会社"
-
-                # AK列：契約種類（固定値）
-                output_row["契約種類"] = "バックレント"
-
-                # AL列：管理受託日（処理実行日）
-                output_row["管理受託日"] = datetime.now().strftime("%Y/%m/%d")
-
-                # AM列：契約確認日（空欄）
-                output_row["契約確認日"] = ""
-
-                # AN列：退去済手数料（固定値）
-                output_row["退去済手数料"] = "20"
-
-                # AO列：入居中滞納手数料（固定値）
-                output_row["入居中滞納手数料"] = "10"
-
-                # AP列：入居中正常手数料（固定値）
-                output_row["入居中正常手数料"] = "0"
-
-                # AQ列：管理前滞納額（Z列「延滞合計」+ AA列「事務手数料」）
-                late_fee_str = self.converter.safe_str_convert(row[cols[25]])  # Z列
-                admin_fee_str = self.converter.safe_str_convert(row[cols[26]])  # AA列
-
-                try:
-                    late_fee = float(late_fee_str) if late_fee_str else 0.0
-                    admin_fee = float(admin_fee_str) if admin_fee_str else 0.0
-                    output_row["管理前滞納額"] = str(int(late_fee + admin_fee))
-                except ValueError as e:
-                    error_msg = f"行 {idx + 1}: 管理前滞納額の計算エラー - 延滞合計: '{late_fee_str}', 事務手数料: '{admin_fee_str}'"
-                    self.logger.error(error_msg)
-                    raise ValueError(error_msg) from e
-
-                # AR〜AU列：空欄
-                for col in [
-                    "更新契約手数料",
-                    "退去手続き（実費）",
-                    "初回振替月",
-                    "保証開始日",
-                ]:
-                    output_row[col] = ""
-
-                # AV列：クライアントCD（固定値）
-                output_row["クライアントCD"] = "7"
-
-                # AW列：パートナーCD（空欄）
-                output_row["パートナーCD"] = ""
-
-                # 勤務先情報（「退職済」の場合は空欄）
-                work_name = self.converter.safe_str_convert(
-                    row[cols[40]]
-                )  # AO列「勤務先名」
-                work_tel = self.converter.safe_str_convert(
-                    row[cols[42]]
-                )  # AQ列「勤務先TEL」
-
-                if (
-                    "退職済" in work_name
-                    or "退職済" in work_tel
-                    or "退職済み" in work_name
-                    or "退職済み" in work_tel
-                    or "TEL無効" in work_name
-                    or "TEL無効" in work_tel
-                    or "不明" in work_name
-                    or "不明" in work_tel
-                ):
-                    output_row["契約者勤務先名"] = ""
-                    output_row["契約者勤務先TEL"] = ""
-                else:
-                    output_row["契約者勤務先名"] = work_name
-                    output_row["契約者勤務先TEL"] = (
-                        self.converter.normalize_phone_number(work_tel)
-                    )
-
-                # AY列：契約者勤務先カナ（空欄）
-                output_row["契約者勤務先カナ"] = ""
-
-                # BA〜BE列：勤務先住所関連（空欄）
-                for col in [
-                    "勤務先業種",
-                    "契約者勤務先郵便番号",
-                    "契約者勤務先住所1",
-                    "契約者勤務先住所2",
-                    "契約者勤務先住所3",
-                ]:
-                    output_row[col] = ""
-
-                # 保証人１情報
-                # BF列：保証人１氏名 ← AG列「連帯保証人　名（漢字）」（スペース削除、異体字統一、アルファベットのみなら半角大文字に変換）
-                guarantor_name = self.converter.remove_all_spaces(
-                    self.converter.safe_str_convert(row[cols[32]])
-                )
-                guarantor_name = self.converter.normalize_kanji_variants(guarantor_name)
-                if self.converter.is_alphabet_only(guarantor_name):
-                    guarantor_name = (
-                        self.converter.convert_fullwidth_alpha_to_halfwidth_upper(
-                            guarantor_name
-                        )
-                    )
-                output_row["保証人１氏名"] = guarantor_name
-
-                # BG列：保証人１カナ ← AH列「連帯保証人　フリガナ」（スペース削除、半角→全角カナ変換）
-                guarantor_kana = self.converter.safe_str_convert(row[cols[33]])
-                guarantor_kana = self.converter.remove_all_spaces(guarantor_kana)
-                output_row["保証人１カナ"] = self.converter.hankaku_to_zenkaku(
-                    guarantor_kana
-                )
-
-                # BH列：保証人１契約者との関係（固定値）
-                output_row["保証人１契約者との関係"] = (
-                    "他" if output_row["保証人１氏名"] else ""
-                )
-
-                # BI〜BN列：保証人１その他情報（空欄）
-                for col in [
-                    "保証人１生年月日",
-                    "保証人１郵便番号",
-                    "保証人１住所1",
-                    "保証人１住所2",
-                    "保証人１住所3",
-                    "保証人１TEL自宅",
-                ]:
-                    output_row[col] = ""
-
-                # BO列：保証人１TEL携帯 ← AJ列「連帯保証人　電話番号」（先頭0補完、ハイフン挿入）
-                output_row["保証人１TEL携帯"] = self.converter.normalize_phone_number(
-                    self.converter.safe_str_convert(row[cols[35]])
-                )
-
-                # BP〜BY列：保証人２情報（空欄）
-                for col in [
-                    "保証人２氏名",
-                    "保証人２カナ",
-                    "保証人２契約者との関係",
-                    "保証人２生年月日",
-                    "保証人２郵便番号",
-                    "保証人２住所1",
-                    "保証人２住所2",
-                    "保証人２住所3",
-                    "保証人２TEL自宅",
-                    "保証人２TEL携帯",
-                ]:
-                    output_row[col] = ""
-
-                # 緊急連絡人１情報
-                # BZ列：緊急連絡人１氏名 ← AK列「緊急連絡人　氏名（漢字）」（スペース削除、異体字統一、アルファベットのみなら半角大文字に変換）
-                emergency_name = self.converter.remove_all_spaces(
-                    self.converter.safe_str_convert(row[cols[36]])
-                )
-                emergency_name = self.converter.normalize_kanji_variants(emergency_name)
-                if self.converter.is_alphabet_only(emergency_name):
-                    emergency_name = (
-                        self.converter.convert_fullwidth_alpha_to_halfwidth_upper(
-                            emergency_name
-                        )
-                    )
-                output_row["緊急連絡人１氏名"] = emergency_name
-
-                # CA列：緊急連絡人１カナ ← AL列「緊急連絡人　フリガナ」（スペース削除、半角→全角カナ変換）
-                emergency_kana = self.converter.safe_str_convert(row[cols[37]])
-                emergency_kana = self.converter.remove_all_spaces(emergency_kana)
-                output_row["緊急連絡人１カナ"] = self.converter.hankaku_to_zenkaku(
-                    emergency_kana
-                )
-
-                # CB列：緊急連絡人１契約者との関係（固定値）
-                output_row["緊急連絡人１契約者との関係"] = (
-                    "他" if output_row["緊急連絡人１氏名"] else ""
-                )
-
-                # CC〜CG列：緊急連絡人１その他情報（空欄）
-                for col in [
-                    "緊急連絡人１郵便番号",
-                    "緊急連絡人１現住所1",
-                    "緊急連絡人１現住所2",
-                    "緊急連絡人１現住所3",
-                    "緊急連絡人１TEL自宅",
-                ]:
-                    output_row[col] = ""
-
-                # CH列：緊急連絡人１TEL携帯 ← AN列「緊急連絡人　電話番号」（先頭0補完、ハイフン挿入）
-                output_row["緊急連絡人１TEL携帯"] = (
-                    self.converter.normalize_phone_number(
-                        self.converter.safe_str_convert(row[cols[39]])
-                    )
-                )
-
-                # CI〜CQ列：緊急連絡人２情報（空欄）
-                for col in [
-                    "緊急連絡人２氏名",
-                    "緊急連絡人２カナ",
-                    "緊急連絡人２契約者との関係",
-                    "緊急連絡人２郵便番号",
-                    "緊急連絡人２現住所1",
-                    "緊急連絡人２現住所2",
-                    "緊急連絡人２現住所3",
-                    "緊急連絡人２TEL自宅",
-                    "緊急連絡人２TEL携帯",
-                ]:
-                    output_row[col] = ""
-
-                # CR〜CU列：保証入金情報（空欄）
-                for col in ["保証入金日", "保証入金者"]:
-                    output_row[col] = ""
-
-                # CV〜DA列：引落口座情報（空欄）
-                for col in [
-                    "引落銀行CD",
-                    "引落銀行名",
-                    "引落支店CD",
-                    "引落支店名",
-                    "引落預金種別",
-                    "引落口座番号",
-                    "引落口座名義",
-                ]:
-                    output_row[col] = ""
-
-                # DB〜DC列：解約日、管理会社（空欄）
-                for col in ["解約日", "管理会社"]:
-                    output_row[col] = ""
-
-                # DD列：委託先法人ID（固定値）
-                output_row["委託先法人ID"] = "6"
-
-                # DE〜DH列：空欄3列 + 登録フラグ
-                output_row["__EMPTY_COL_1__"] = ""
-                output_row["__EMPTY_COL_2__"] = ""
-                output_row["__EMPTY_COL_3__"] = ""
-                output_row["登録フラグ"] = ""
-
-                self.logger.debug(f"行 {idx} DataFrame連結開始")
-                output_df = pd.concat(
-                    [output_df, pd.DataFrame([output_row])], ignore_index=True
-                )
-                self.logger.debug(f"行 {idx} 処理完了")
-
-            except Exception as e:
-                self.logger.error(f"行 {idx} でエラー発生: {str(e)}", exc_info=True)
-                raise
+                return float(value)
+            except ValueError:
+                return None
+
+        late_fee = apply_unique(late_fee_str, to_float)
+        admin_fee = apply_unique(admin_fee_str, to_float)
+        total = pd.to_numeric(late_fee, errors="coerce") + pd.to_numeric(
+            admin_fee, errors="coerce"
+        )
+
+        invalid = ~np.isfinite(total.to_numpy(dtype=float))
+        if invalid.any():
+            # 最初にエラーとなった行を従来と同じ形式で通知
+            idx = ctx.df.index[invalid.argmax()]
+            error_msg = (
+                f"行 {idx + 1}: 管理前滞納額の計算エラー - "
+                f"延滞合計: '{late_fee_str.loc[idx]}', 事務手数料: '{admin_fee_str.loc[idx]}'"
+            )
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
 
-        self.logger.info(f"変換完了: 出力{len(output_df)}行")
+        return total.astype(np.int64).astype(str).astype(object)
+
+    def _workplace(self, ctx: ConversionContext) -> Tuple[pd.Series, pd.Series]:
+        """勤務先情報（「退職済」などの場合は空欄）"""
+
+        def build():
+            work_name = ctx.text(40)  # AO列「勤務先名」
+            work_tel = ctx.text(42)  # AQ列「勤務先TEL」
+
+            invalid = pd.Series(False, index=ctx.df.index)
+            for keyword in ["退職済", "退職済み", "TEL無効", "不明"]:
+                invalid |= work_name.str.contains(keyword, regex=False)
+                invalid |= work_tel.str.contains(keyword, regex=False)
+
+            normalized_tel = apply_unique(work_tel, self.converter.normalize_phone_number)
+            return work_name.where(~invalid, ""), normalized_tel.where(~invalid, "")
+
+        return ctx.cached("workplace", build)
+
+    def build_column_specs(self) -> Dict[str, ColumnSpec]:
+        """111列テンプレートの列定義（入力は列インデックスで指定、0ベース）"""
+        converter = self.converter
+        today = datetime.now().strftime("%Y/%-m/%-d")
+        name_transforms = (remove_spaces, map_unique(converter.normalize_person_name))
+        kana_transforms = (remove_spaces, to_zenkaku)
+        phone = map_unique(converter.normalize_phone_number)
 
-        # 仮名前を空文字列に戻す
-        output_df.columns = [
-            "" if col.startswith("__EMPTY_COL_") else col for col in output_df.columns
+        def relationship(name_column):
+            # 氏名がある場合のみ「他」
+            return computed(
+                lambda ctx: ctx.blank("他").where(ctx.columns[name_column] != "", "")
+            )
+
+        specs = {
+            # A列：引継番号 ← D列「会員番号」
+            "引継番号": source(3),
+            # B列：契約者氏名 ← G列「氏名（漢字）」（スペース削除、異体字統一、アルファベットのみなら半角大文字に変換）
+            "契約者氏名": source(6, *name_transforms),
+            # C列：契約者カナ ← H列「フリガナ」（スペース削除、半角→全角カナ変換）
+            "契約者カナ": source(7, *kana_transforms),
+            # D列：契約者生年月日 ← I列「生年月日」（YYYYMMDD→YYYY/M/D）
+            "契約者生年月日": source(8, map_unique(converter.convert_date_format)),
+            # E列：契約者TEL自宅（空欄）
+            "契約者TEL自宅": fixed(""),
+            # F列：契約者TEL携帯 ← M列「電話番号」（先頭0補完、ハイフン挿入）
+            "契約者TEL携帯": source(12, phone),
+            # G列：契約者現住所郵便番号 ← J列「郵便番号」
+            "契約者現住所郵便番号": source(9),
+            # H列・I列：契約者現住所1（都道府県）・2（市区町村）
+            "契約者現住所1": computed(lambda ctx: self._address_parts(ctx)["prefecture"]),
+            "契約者現住所2": computed(lambda ctx: self._address_parts(ctx)["city"]),
+            # J列：契約者現住所3（住所の残り + L列「物件名」 + E列「号室」）
+            "契約者現住所3": computed(
+                lambda ctx: (
+                    self._address_parts(ctx)["remaining"]
+                    + "　"
+                    + ctx.text(11)
+                    + "　"
+                    + ctx.text(4)
+                ).str.strip()
+            ),
+            # K列：引継情報（処理日付 + "プラザ一括登録" + N列「メール」）
+            "引継情報": source(
+                13, lambda s: f"{today}　プラザ一括登録　●メールアドレス：" + s
+            ),
+            # L列：物件名 ← L列「物件名」
+            "物件名": source(11),
+            # M列：部屋番号 ← E列「号室」
+            "部屋番号": source(4),
+            # N列〜Q列：物件住所（物件住所3は物件名・号室を含まない）
+            "物件住所郵便番号": source(9),
+            "物件住所1": copy_of("契約者現住所1"),
+            "物件住所2": copy_of("契約者現住所2"),
+            "物件住所3": computed(lambda ctx: self._address_parts(ctx)["remaining"]),
+            # R列〜T列：ステータス（固定値）
+            "入居ステータス": fixed("入居中"),
+            "滞納ステータス": fixed("未精算"),
+            "受託状況": fixed("契約中"),
+            # U列：月額賃料 ← S列「利用料合計」
+            "月額賃料": source(18),
+            # AD列〜AJ列：回収口座情報
+            "回収口座金融機関CD": fixed("310"),
+            "回収口座金融機関名": fixed("GMOあおぞらネット銀行"),
+            "回収口座支店CD": source(27),  # AB列「バーチャル口座支店番号」
+            "回収口座支店名": source(28),  # AC列「バーチャル口座支店名」
+            "回収口座種類": fixed("普通"),
+            "回収口座番号": source(29),  # AD列「バーチャル口座番号」
+            "回収口座名義": fixed("プラザ賃貸管理保証株式会社"),
+            # AK列〜AP列：契約種類・管理受託日・手数料
+            "契約種類": fixed("バックレント"),
+            "管理受託日": fixed(datetime.now().strftime("%Y/%m/%d")),
+            "退去済手数料": fixed("20"),
+            "入居中滞納手数料": fixed("10"),
+            "入居中正常手数料": fixed("0"),
+            # AQ列：管理前滞納額（Z列「延滞合計」+ AA列「事務手数料」）
+            "管理前滞納額": computed(self._arrears_before_management),
+            # AV列：クライアントCD（固定値）
+            "クライアントCD": fixed("7"),
+            # 勤務先情報（「退職済」の場合は空欄）
+            "契約者勤務先名": computed(lambda ctx: self._workplace(ctx)[0]),
+            "契約者勤務先TEL": computed(lambda ctx: self._workplace(ctx)[1]),
+            # BF列〜BO列：保証人１ ← AG列・AH列・AJ列
+            "保証人１氏名": source(32, *name_transforms),
+            "保証人１カナ": source(33, *kana_transforms),
+            "保証人１契約者との関係": relationship("保証人１氏名"),
+            "保証人１TEL携帯": source(35, phone),
+            # BZ列〜CH列：緊急連絡人１ ← AK列・AL列・AN列
+            "緊急連絡人１氏名": source(36, *name_transforms),
+            "緊急連絡人１カナ": source(37, *kana_transforms),
+            "緊急連絡人１契約者との関係": relationship("緊急連絡人１氏名"),
+            "緊急連絡人１TEL携帯": source(39, phone),
+            # DD列：委託先法人ID（固定値）
+            "委託先法人ID": fixed("6"),
+        }
+        return specs
+
+    def convert_to_output_format(self, plaza_df: pd.DataFrame) -> pd.DataFrame:
+        """プラザデータを111列フォーマットに変換（列単位）"""
+        self.logger.info(f"変換開始: {len(plaza_df)}行")
+
+        # 空列の仮名前は空文字列で出力（上記以外の列はすべて空欄）
+        output_columns = [
+            "" if col.startswith("__EMPTY_COL_") else col
+            for col in PlazaConfig.OUTPUT_COLUMNS
         ]
+        output_df = build_template_frame(
+            plaza_df, self.build_column_specs(), output_columns
+        )
 
+        self.logger.info(f"変換完了: 出力{len(output_df)}行")
         return output_df
 
     def process(
@@ -846,6 +630,7 @@ class PlazaProcessor:
             self.logger.info("プラザ新規登録処理開始")
 
             # ファイル読み込み
+            report_progress("ファイル読み込み", 0, 3)
             self.logger.info("ファイル読み込み開始")
             plaza_df = self.file_reader.read_file(plaza_file)
             self.logger.info(f"プラザファイル読み込み完了: {len(plaza_df)}行")
@@ -853,6 +638,7 @@ class PlazaProcessor:
             self.logger.info(f"ContractList読み込み完了: {len(contract_df)}行")
 
             # 重複チェック
+            report_progress("重複チェック", 1, 3)
             self.logger.info("重複チェック開始")
             new_contracts, existing_contracts, stats, check_logs = (
                 self.duplicate_checker.check_duplicates(plaza_df, contract_df)
@@ -863,6 +649,7 @@ class PlazaProcessor:
             )
 
             # 新規契約をフォーマット変換
+            report_progress("フォーマット変換", 2, 3)
             self.logger.info("フォーマット変換開始")
             if len(new_contracts) > 0:
                 output_df = self.convert_to_output_format(new_contracts)
@@ -1,15 +1,26 @@
 import pandas as pd
-import re
 from datetime import datetime, date
 from typing import Tuple, List, Dict
 
-# SMS共通モジュールから関数とヘッダーをインポート
-from processors.sms_common import (
-    SMS_TEMPLATE_HEADERS,
-    format_payment_deadline,
-    read_csv_auto_encoding
-)
 from processors.common.detailed_logger import DetailedLogger
+from processors.plaza_sms.filters import contract_list_filters
+from processors.sms_common import SMS_TEMPLATE_HEADERS, read_contract_list, read_csv_auto_encoding
+from processors.sms_common.pipeline import (
+    INFO_COLUMNS,
+    INFO_INPUT_COLUMNS,
+    SmsSpec,
+    apply_sms_filters,
+    build_sms_frame,
+    mobile_phone,
+)
+
+# プラザSMS契約者（保証人・連絡人列は空文字）
+CONTRACT_SPEC = SmsSpec(
+    filters=contract_list_filters(mobile_phone('TEL携帯', 'TEL携帯')),
+    phone_column='TEL携帯',
+    columns={**INFO_COLUMNS, '保証人': '', '連絡人': ''},
+    input_columns=[*INFO_INPUT_COLUMNS, '引継番号'],  # 引継番号: 国籍のVLOOKUP用
+)
 
 
 def process_plaza_sms_contract_data(
@@ -34,7 +45,7 @@ def process_plaza_sms_contract_data(
         
         # CSVファイル読み込み（自動エンコーディング判定）
         logs.append("ContractList.csvを読み込み中...")
-        contract_df = read_csv_auto_encoding(contract_file_content)
+        contract_df, reader = read_contract_list(contract_file_content, CONTRACT_SPEC.contract_list_columns)
         initial_rows = len(contract_df)
         logs.append(DetailedLogger.log_initial_load(initial_rows))
         
@@ -51,129 +62,9 @@ def process_plaza_sms_contract_data(
         else:
             raise ValueError("コールセンター回収委託CSVの列数が不足しています")
         
-        # Filter 1: 委託先法人ID (Keep only 6)
-        contract_df['委託先法人ID'] = pd.to_numeric(contract_df['委託先法人ID'], errors='coerce').fillna(-1).astype(int)
-        
-        # フィルター適用
-        before_count = len(contract_df)
-        excluded_trustee = contract_df[contract_df['委託先法人ID'] != 6]
-        contract_df = contract_df[contract_df['委託先法人ID'] == 6]
-        logs.append(DetailedLogger.log_filter_result(before_count, len(contract_df), '委託先法人ID'))
-        
-        # 除外データの詳細を記録
-        if len(excluded_trustee) > 0:
-            detail = DetailedLogger.log_exclusion_details(
-                excluded_trustee, 118, '委託先法人ID', 'id', top_n=3
-            )
-            if detail:
-                logs.append(detail)
-        
-        # Filter 2: 入金予定日 (Keep empty or dates before today)
-        contract_df['入金予定日'] = pd.to_datetime(contract_df['入金予定日'], format='%Y/%m/%d', errors='coerce')
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # フィルター適用
-        before_count = len(contract_df)
-        excluded_dates = contract_df[~(contract_df['入金予定日'].isna() | (contract_df['入金予定日'] < today))]
-        contract_df = contract_df[contract_df['入金予定日'].isna() | (contract_df['入金予定日'] < today)]
-        logs.append(DetailedLogger.log_filter_result(before_count, len(contract_df), '入金予定日'))
-        
-        # 除外データの詳細を記録
-        if len(excluded_dates) > 0:
-            detail = DetailedLogger.log_exclusion_details(
-                excluded_dates, 72, '入金予定日', 'date', top_n=3
-            )
-            if detail:
-                logs.append(detail)
-        
-        # Filter 3: 入金予定金額 (Exclude specific amounts: 2, 3, 5, 12 as numeric or string values)
-        payment_amount_exclude_numeric = [2, 3, 5, 12]
-        payment_amount_exclude_string = ["2", "3", "5", "12"]
-        contract_df['入金予定金額_numeric'] = pd.to_numeric(contract_df['入金予定金額'], errors='coerce')
-        contract_df['入金予定金額_string'] = contract_df['入金予定金額'].astype(str)
-        
-        # フィルター適用
-        before_count = len(contract_df)
-        excluded_amounts = contract_df[(contract_df['入金予定金額_numeric'].isin(payment_amount_exclude_numeric) | 
-                                       contract_df['入金予定金額_string'].isin(payment_amount_exclude_string))]
-        contract_df = contract_df[~(contract_df['入金予定金額_numeric'].isin(payment_amount_exclude_numeric) | 
-                                   contract_df['入金予定金額_string'].isin(payment_amount_exclude_string))]
-        contract_df = contract_df.drop(['入金予定金額_numeric', '入金予定金額_string'], axis=1)
-        logs.append(DetailedLogger.log_filter_result(before_count, len(contract_df), '入金予定金額'))
-        
-        # 除外データの詳細を記録
-        if len(excluded_amounts) > 0:
-            detail = DetailedLogger.log_exclusion_details(
-                excluded_amounts, 73, '入金予定金額', 'amount', top_n=3
-            )
-            if detail:
-                logs.append(detail)
-        
-        # Filter 4: 回収ランク (Exclude specific ranks)
-        collection_rank_exclude = ["弁護士介入", "死亡決定", "破産決定"]
-        
-        # フィルター適用
-        before_count = len(contract_df)
-        excluded_ranks = contract_df[contract_df['回収ランク'].isin(collection_rank_exclude)]
-        contract_df = contract_df[~contract_df['回収ランク'].isin(collection_rank_exclude)]
-        logs.append(DetailedLogger.log_filter_result(before_count, len(contract_df), '回収ランク'))
-        
-        # 除外データの詳細を記録
-        if len(excluded_ranks) > 0:
-            detail = DetailedLogger.log_exclusion_details(
-                excluded_ranks, 86, '回収ランク', 'category', top_n=3
-            )
-            if detail:
-                logs.append(detail)
-
-        # Filter 5: BT列　滞納残債 (Keep only >= 1)
-        # BT列は列番号71（0ベース）
-        arrears_column = contract_df.iloc[:, 71]
-        arrears_numeric = pd.to_numeric(
-            arrears_column.astype(str).str.replace(',', ''),
-            errors='coerce'
-        )
-
-        # フィルター適用
-        before_count = len(contract_df)
-        valid_arrears_mask = arrears_numeric >= 1
-        excluded_arrears = contract_df[~valid_arrears_mask]
-        contract_df = contract_df[valid_arrears_mask]
-        logs.append(DetailedLogger.log_filter_result(before_count, len(contract_df), '滞納残債（1円以上）'))
-
-        # 除外データの詳細を記録
-        if len(excluded_arrears) > 0:
-            detail = DetailedLogger.log_exclusion_details(
-                excluded_arrears, 71, '滞納残債', 'amount', top_n=3
-            )
-            if detail:
-                logs.append(detail)
-
-        # Filter 6: 電話番号 (Keep only valid mobile phone numbers)
-        mobile_phone_regex = r'^(090|080|070)-\d{4}-\d{4}$'
-        
-        # AB列（TEL携帯）を取得
-        phone_series = contract_df['TEL携帯'].astype(str).str.strip().replace('nan', '')
-        
-        def is_mobile_phone(phone_number):
-            if phone_number == '':
-                return False
-            return bool(re.match(mobile_phone_regex, phone_number))
-        
-        # フィルター適用
-        before_count = len(contract_df)
-        excluded_phones_mask = ~phone_series.apply(is_mobile_phone)
-        excluded_phones_df = contract_df[excluded_phones_mask]
-        contract_df = contract_df[phone_series.apply(is_mobile_phone)]
-        logs.append(DetailedLogger.log_filter_result(before_count, len(contract_df), 'TEL携帯'))
-        
-        # 除外データの詳細を記録
-        if len(excluded_phones_df) > 0:
-            detail = DetailedLogger.log_exclusion_details(
-                excluded_phones_df, 27, 'TEL携帯', 'phone', top_n=3
-            )
-            if detail:
-                logs.append(detail)
+        # フィルタ（委託先法人ID・入金予定日・入金予定金額・回収ランク・滞納残債・TEL携帯）
+        contract_df, filter_logs = apply_sms_filters(contract_df, CONTRACT_SPEC.filters, reader.position)
+        logs.extend(filter_logs)
         
         # VLOOKUP処理：国籍情報の結合
         logs.append("国籍情報のVLOOKUP処理を開始...")
@@ -216,64 +107,7 @@ def process_plaza_sms_contract_data(
                 output_dfs.append(empty_df)
                 continue
             
-            # Create temporary column names for DataFrame construction
-            temp_column_order = []
-            empty_col_counter = 1
-            for col in output_column_order:
-                if col == "":
-                    temp_column_order.append(f"_empty_{empty_col_counter}")
-                    empty_col_counter += 1
-                else:
-                    temp_column_order.append(col)
-            
-            # Create output DataFrame with temporary column names
-            output_df = pd.DataFrame(columns=temp_column_order)
-            
-            # Map data
-            output_df['電話番号'] = df['TEL携帯'].astype(str)
-            output_df['(info1)契約者名'] = df['契約者氏名']
-            
-            # Combine property name and number
-            output_df['(info2)物件名'] = df['物件名'].astype(str) + df['物件番号'].fillna('').astype(str).apply(
-                lambda x: f'　{x}' if x and x != 'nan' else ''
-            )
-            
-            # Format amount with comma separation
-            df['滞納残債'] = df['滞納残債'].astype(str).str.replace(r'[^0-9,]', '', regex=True)
-            output_df['(info3)金額'] = pd.to_numeric(
-                df['滞納残債'].str.replace(',', ''), errors='coerce'
-            ).fillna(0).astype(int).apply(lambda x: f'{x:,}')
-            
-            # Combine bank account information with full-width spaces
-            output_df['(info4)銀行口座'] = (
-                df['回収口座銀行名'].astype(str) + '　' +
-                df['回収口座支店名'].astype(str) + '　' +
-                df['回収口座種類'].astype(str) + '　' +
-                df['回収口座番号'].astype(str).str.replace('="', '').str.replace('"', '') + '　' +
-                df['回収口座名義人'].astype(str)
-            )
-            
-            output_df['(info5)メモ'] = df['管理番号'].astype(str)
-            
-            # 保証人・連絡人列は空のまま
-            output_df['保証人'] = ''
-            output_df['連絡人'] = ''
-            
-            # Set payment deadline (BG column - column 59)
-            payment_deadline_formatted = format_payment_deadline(payment_deadline_date)
-            output_df['支払期限'] = payment_deadline_formatted
-            
-            # Fill empty columns
-            for col in temp_column_order:
-                if col.startswith('_empty_') and col not in output_df.columns:
-                    output_df[col] = ''
-            
-            # Ensure correct column order
-            output_df = output_df[temp_column_order]
-            
-            # Restore original column names
-            df_copy = output_df.copy()
-            df_copy.columns = output_column_order
+            df_copy = build_sms_frame(df, CONTRACT_SPEC, payment_deadline_date, reader.position)
             
             output_dfs.append(df_copy)
             logs.append(f"{df_name}人向けデータ作成完了: {len(df_copy)}件")
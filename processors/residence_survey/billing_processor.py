@@ -3,10 +3,14 @@
 Kintoneエクスポートデータから弁護士法人ごとの請求書作成用データを生成
 """
 import pandas as pd
+import numpy as np
 import io
+import warnings
 from datetime import datetime
-from typing import Tuple, List
+from typing import Dict, Tuple, List
+from pandas.api.types import is_datetime64_any_dtype
 from openpyxl.styles import Font, PatternFill
+from processors.common.excel_writer import ExcelSheet, to_excel_bytes
 
 # エリア外都道府県リスト
 OUT_OF_AREA_PREFECTURES = [
@@ -17,6 +21,9 @@ OUT_OF_AREA_PREFECTURES = [
 # 高橋裕次郎法律事務所の識別名
 TAKAHASHI_LAW_FIRM = '弁護士法人高橋裕次郎法律事務所'
 
+# 提出日の列（調査回数 → 列名）
+SUBMISSION_DATE_COLUMNS = {1: '1回目提出日', 2: '2回目提出日', 3: '3回目提出日'}
+
 # 弁護士法人の優先順位（シート作成順序）
 LAW_FIRM_PRIORITY = [
     'トラスト弁護士法人',
@@ -225,6 +232,186 @@ def create_billing_row(row: pd.Series, times: int) -> dict:
     }
 
 
+def out_of_area_mask(addresses: pd.Series) -> pd.Series:
+    """住所列からエリア外判定を一括で行う（is_out_of_area の列版）"""
+    return addresses.notna() & addresses.astype(str).str.startswith(tuple(OUT_OF_AREA_PREFECTURES))
+
+
+def to_month_column(values: pd.Series) -> pd.Series:
+    """
+    日付列を月（YYYYMM形式）の列に変換（get_survey_month の列版）
+
+    同じ日付の値は1回だけ datetime に変換する。日付として解釈できない値・空欄は NaN。
+    """
+    codes, uniques = pd.factorize(values)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        dates = pd.to_datetime(pd.Series(uniques, dtype=object), format='mixed', errors='coerce')
+
+    if is_datetime64_any_dtype(dates):
+        months = dates.dt.strftime('%Y%m')
+    else:
+        # タイムゾーンの異なる日時が混在する場合は値ごとに変換
+        months = pd.Series(uniques, dtype=object).map(get_survey_month)
+
+    # 空欄（code = -1）は末尾の NaN を参照
+    month_values = np.append(months.to_numpy(dtype=object), np.nan)
+    return pd.Series(month_values[codes], index=values.index)
+
+
+def determine_billing_flags(df: pd.DataFrame, is_takahashi: pd.Series, selected_month: str = None) -> pd.DataFrame:
+    """
+    請求対象の回数を全行まとめて決定（determine_billing_rows の列版）
+
+    Args:
+        df: 入力CSV DataFrame
+        is_takahashi: 高橋裕次郎法律事務所の行
+        selected_month: 選択された調査月（YYYYMM形式）。Noneの場合は従来の提出日ベース
+
+    Returns:
+        回数（1, 2, 3）ごとの請求対象フラグ
+    """
+    if selected_month:
+        # 選択月に提出された回
+        m1, m2, m3 = (
+            (to_month_column(df[SUBMISSION_DATE_COLUMNS[times]]) == selected_month).to_numpy()
+            for times in (1, 2, 3)
+        )
+        has_1st = df['1回目提出日'].notna().to_numpy()
+        has_2nd = df['2回目提出日'].notna().to_numpy()
+
+        # 通常パターン: 3回目のみ / 2回目も選択月なら全て / 2回目 → 1回目+2回目 / 1回目のみ
+        normal = {
+            1: m2 | (~m3 & m1),
+            2: m2,
+            3: m3,
+        }
+        # 高橋裕次郎の特例: 提出済みの回は重複して請求しない
+        takahashi = {
+            1: (m3 & ~has_2nd) | (~m3 & m2 & ~has_1st) | (~m3 & ~m2 & m1),
+            2: (m3 & ~has_2nd) | (~m3 & m2),
+            3: m3,
+        }
+    else:
+        has_1st = df['1回目提出日'].notna().to_numpy()
+        has_2nd = df['2回目提出日'].notna().to_numpy()
+        has_3rd = df['3回目提出日'].notna().to_numpy()
+
+        # 通常パターン: 3回目のみ / 1回目+2回目 / 1回目のみ
+        normal = {
+            1: ~has_3rd & (has_2nd | has_1st),
+            2: ~has_3rd & has_2nd,
+            3: has_3rd,
+        }
+        # 高橋裕次郎の特例: 提出済みの回まで全て
+        takahashi = {
+            1: has_3rd | has_2nd | has_1st,
+            2: has_3rd | has_2nd,
+            3: has_3rd,
+        }
+
+    takahashi_rows = is_takahashi.to_numpy()
+    return pd.DataFrame(
+        {times: np.where(takahashi_rows, takahashi[times], normal[times]) for times in (1, 2, 3)},
+        index=df.index,
+    )
+
+
+def create_billing_frame(df: pd.DataFrame, billing: pd.DataFrame) -> pd.DataFrame:
+    """
+    請求データを一括生成（create_billing_row の列版）
+
+    Args:
+        df: 入力CSV DataFrame
+        billing: 請求対象の行（'行' = df の行位置、'回数' = 調査回数）
+
+    Returns:
+        請求データ（billing と同じ順）
+    """
+    positions = billing['行'].to_numpy()
+    times = billing['回数'].to_numpy()
+
+    # 提出日（回数に対応する列の値）
+    submission_dates = df[[SUBMISSION_DATE_COLUMNS[t] for t in (1, 2, 3)]].to_numpy(dtype=object)
+    submission_date = pd.Series(submission_dates[positions, times - 1])
+
+    # 費用備考
+    expense_notes = "現地調査(" + pd.Series(times, dtype=str) + "回目)"
+    out_of_area = out_of_area_mask(df['住所']).to_numpy()[positions]
+    expense_notes = expense_notes.where(~out_of_area, expense_notes + "　エリア外")
+
+    return pd.DataFrame({
+        '受託日': '',
+        '依頼者債権番号': df['会員番号'].iloc[positions].fillna('').to_numpy(dtype=object),
+        '債務者氏名': df['居住者名'].iloc[positions].fillna('').to_numpy(dtype=object),
+        '事件種類名称': '',
+        '事件名': '',
+        '費用発生日': '',
+        '費用仕分コード名称': '調査費用',
+        '費用コード名称': '',
+        '金額': '',
+        '費用備考': expense_notes.to_numpy(dtype=object),
+        '業者': 'ミライル',
+        '提出日': submission_date.where(submission_date.notna(), '').to_numpy(dtype=object),
+    }, index=billing.index)
+
+
+def build_law_firm_data(df: pd.DataFrame, selected_month: str = None) -> Tuple[Dict[str, pd.DataFrame], str, int, int]:
+    """
+    弁護士法人ごとの請求データを作成
+
+    提出月・請求対象の回数・費用備考を列単位で求め、
+    1回目/2回目/3回目の請求を行に展開してから依頼元でグループ化する。
+
+    Args:
+        df: 入力CSV DataFrame
+        selected_month: 選択された調査月（YYYYMM形式）。Noneの場合は従来の提出日ベース
+
+    Returns:
+        ({弁護士法人: 請求データ}, 対象月, 請求行数, スキップ件数)
+    """
+    # 依頼元の取得
+    law_firms = df['依頼元'].where(df['依頼元'].notna(), '依頼元不明')
+
+    # 高橋裕次郎かどうか判定
+    is_takahashi = law_firms == TAKAHASHI_LAW_FIRM
+
+    # 請求対象の回数を決定
+    flags = determine_billing_flags(df, is_takahashi, selected_month)
+
+    target_month = selected_month  # 選択月を優先使用
+    if not selected_month:
+        # 提出日がない行はスキップ（3回目 → 2回目 → 1回目の優先順で提出月を判定）
+        months = to_month_column(df['3回目提出日'])
+        for col in ['2回目提出日', '1回目提出日']:
+            months = months.where(months.notna(), to_month_column(df[col]).to_numpy())
+        has_month = months.notna()
+        flags = flags & has_month.to_numpy()[:, np.newaxis]
+
+        # 対象月を記録（最初に見つかった月を使用）
+        if has_month.any():
+            target_month = months[has_month].iloc[0]
+
+    skipped_count = int((~flags.any(axis=1)).sum())
+
+    # 1回目/2回目/3回目の請求を行に展開（元の行順 → 回数順）
+    billing = flags.set_axis(range(len(df))).melt(ignore_index=False, var_name='回数', value_name='請求対象')
+    billing = billing[billing['請求対象']].rename_axis('行').reset_index()
+    billing = billing.sort_values(['行', '回数'], kind='stable', ignore_index=True)
+    billing['回数'] = billing['回数'].astype(int)
+    processed_count = len(billing)
+
+    # 弁護士法人ごとにグループ化
+    df_billing_all = create_billing_frame(df, billing)
+    billing_law_firms = law_firms.to_numpy(dtype=object)[billing['行'].to_numpy()]
+    law_firm_data = {
+        law_firm: group.reset_index(drop=True)
+        for law_firm, group in df_billing_all.groupby(billing_law_firms, sort=False)
+    }
+
+    return law_firm_data, target_month, processed_count, skipped_count
+
+
 def process_residence_survey_billing(df: pd.DataFrame, selected_month: str = None) -> Tuple[io.BytesIO, str, str, List[str]]:
     """
     居住訪問調査報告書から請求書作成用データを生成
@@ -253,47 +440,8 @@ def process_residence_survey_billing(df: pd.DataFrame, selected_month: str = Non
     if selected_month:
         logs.append(f"選択された提出月: {selected_month[:4]}年{selected_month[4:]}月")
 
-    # 弁護士法人ごとにグループ化して処理
-    law_firm_data = {}
-    target_month = selected_month  # 選択月を優先使用
-    skipped_count = 0
-    processed_count = 0
-
-    for idx, row in df.iterrows():
-        # 調査月フィルター使用時は、従来の提出日チェックをスキップ
-        if not selected_month:
-            # 提出日がない行はスキップ
-            month = get_target_month(row)
-            if not month:
-                skipped_count += 1
-                continue
-
-            # 対象月を記録（最初に見つかった月を使用）
-            if target_month is None:
-                target_month = month
-
-        # 依頼元の取得
-        law_firm = row['依頼元'] if pd.notna(row['依頼元']) else '依頼元不明'
-
-        # 高橋裕次郎かどうか判定
-        is_takahashi = law_firm == TAKAHASHI_LAW_FIRM
-
-        # 請求対象の回数を決定
-        billing_times = determine_billing_rows(row, is_takahashi, selected_month)
-
-        if not billing_times:
-            skipped_count += 1
-            continue
-
-        # 弁護士法人ごとのデータを初期化
-        if law_firm not in law_firm_data:
-            law_firm_data[law_firm] = []
-
-        # 各回数分の請求行を生成
-        for times in billing_times:
-            billing_row = create_billing_row(row, times)
-            law_firm_data[law_firm].append(billing_row)
-            processed_count += 1
+    # 弁護士法人ごとの請求データを作成
+    law_firm_data, target_month, processed_count, skipped_count = build_law_firm_data(df, selected_month)
 
     logs.append(f"処理済み: {processed_count}行")
     logs.append(f"スキップ: {skipped_count}件")
@@ -304,88 +452,75 @@ def process_residence_survey_billing(df: pd.DataFrame, selected_month: str = Non
         raise ValueError("対象データが見つかりませんでした")
 
     # Excelファイル作成
-    excel_buffer = io.BytesIO()
-
-    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-        # 優先順位リストに従ってシート作成順序を決定
-        all_law_firms = list(LAW_FIRM_PRIORITY)
-
-        # リストにない法人を追加（五十音順）
-        unlisted_firms = [firm for firm in law_firm_data.keys() if firm not in all_law_firms]
-        all_law_firms.extend(sorted(unlisted_firms))
-
-        # 各法人のシートを作成
-        for law_firm in all_law_firms:
-            billing_rows = law_firm_data.get(law_firm, [])
-
-            # DataFrameに変換
-            df_billing = pd.DataFrame(billing_rows)
-
-            # シート名を作成（Excelの31文字制限を考慮）
-            sheet_name = law_firm[:31] if len(law_firm) > 31 else law_firm
-
-            # ヘッダー行を作成
-            header_row = pd.DataFrame([{
-                '受託日': '受託日',
-                '依頼者債権番号': '依頼者債権番号',
-                '債務者氏名': '債務者氏名',
-                '事件種類名称': '事件種類名称',
-                '事件名': '事件名',
-                '費用発生日': '費用発生日',
-                '費用仕分コード名称': '費用仕分コード名称',
-                '費用コード名称': '費用コード名称',
-                '金額': '',
-                '費用備考': '費用備考',
-                '業者': '業者',
-                '提出日': '提出日'
-            }])
-
-            # 合計行を作成（金額列のみ0、他は空白）
-            total_row = pd.DataFrame([{
-                '受託日': '',
-                '依頼者債権番号': '',
-                '債務者氏名': '',
-                '事件種類名称': '',
-                '事件名': '',
-                '費用発生日': '',
-                '費用仕分コード名称': '',
-                '費用コード名称': '',
-                '金額': 0,
-                '費用備考': '',
-                '業者': '',
-                '提出日': ''
-            }])
-
-            # 合計行 + ヘッダー行 + データ行 の順で結合
-            df_output = pd.concat([total_row, header_row, df_billing], ignore_index=True)
-
-            # Excelに書き込み（ヘッダーなし）
-            df_output.to_excel(writer, sheet_name=sheet_name, index=False, header=False)
-
-            logs.append(f"  - {law_firm}: {len(billing_rows)}行")
-
-        # フォント設定と背景色を適用
-        workbook = writer.book
-        font = Font(name='游ゴシック', size=11)
-        yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-
-        for sheet_name in workbook.sheetnames:
-            worksheet = workbook[sheet_name]
-            # 全セルにフォントを適用
-            for row in worksheet.iter_rows():
-                for cell in row:
-                    cell.font = font
-
-            # ヘッダー行（2行目、A2〜J2）に黄色背景を適用
-            for col_idx in range(1, 11):  # A=1 to J=10
-                cell = worksheet.cell(row=2, column=col_idx)
-                cell.fill = yellow_fill
-
-            # 列幅を設定
-            worksheet.column_dimensions['C'].width = 25  # 債務者氏名（12文字分）
-            worksheet.column_dimensions['J'].width = 25  # 費用備考（12文字分）
-
-    excel_buffer.seek(0)
+    # 優先順位リストに従ってシート作成順序を決定
+    all_law_firms = list(LAW_FIRM_PRIORITY)
+
+    # リストにない法人を追加（五十音順）
+    unlisted_firms = [firm for firm in law_firm_data.keys() if firm not in all_law_firms]
+    all_law_firms.extend(sorted(unlisted_firms))
+
+    font = Font(name='游ゴシック', size=11)
+    yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
+    sheets = []
+
+    # 各法人のシートを作成
+    for law_firm in all_law_firms:
+        df_billing = law_firm_data.get(law_firm, pd.DataFrame())
+
+        # シート名を作成（Excelの31文字制限を考慮）
+        sheet_name = law_firm[:31] if len(law_firm) > 31 else law_firm
+
+        # ヘッダー行を作成
+        header_row = pd.DataFrame([{
+            '受託日': '受託日',
+            '依頼者債権番号': '依頼者債権番号',
+            '債務者氏名': '債務者氏名',
+            '事件種類名称': '事件種類名称',
+            '事件名': '事件名',
+            '費用発生日': '費用発生日',
+            '費用仕分コード名称': '費用仕分コード名称',
+            '費用コード名称': '費用コード名称',
+            '金額': '',
+            '費用備考': '費用備考',
+            '業者': '業者',
+            '提出日': '提出日'
+        }])
+
+        # 合計行を作成（金額列のみ0、他は空白）
+        total_row = pd.DataFrame([{
+            '受託日': '',
+            '依頼者債権番号': '',
+            '債務者氏名': '',
+            '事件種類名称': '',
+            '事件名': '',
+            '費用発生日': '',
+            '費用仕分コード名称': '',
+            '費用コード名称': '',
+            '金額': 0,
+            '費用備考': '',
+            '業者': '',
+            '提出日': ''
+        }])
+
+        # 合計行 + ヘッダー行 + データ行 の順で結合
+        df_output = pd.concat([total_row, header_row, df_billing], ignore_index=True)
+
+        # Excelシート（ヘッダーなし）: 全セルに游ゴシック、ヘッダー行（2行目、A2〜J2）に黄色背景
+        sheets.append(ExcelSheet(
+            sheet_name,
+            df_output,
+            font,
+            header=False,
+            row_fills={2: (yellow_fill, 10)},  # A=1 to J=10
+            column_widths={
+                'C': 25,  # 債務者氏名（12文字分）
+                'J': 25,  # 費用備考（12文字分）
+            },
+        ))
+
+        logs.append(f"  - {law_firm}: {len(df_billing)}行")
+
+    excel_buffer = io.BytesIO(to_excel_bytes(sheets))
 
     # ファイル名生成
     filename = f"【居住訪問調査報告書】{target_month}請求内訳.xlsx"
@@ -0,0 +1,173 @@
+"""
+SMS一括処理
+
+1つのContractListと支払期限から、ミライル（8種類）・フェイス（3種類）・
+ガレージバンクのSMS用CSVをまとめて作成する。
+
+- ContractListの読み込みは1回だけ行い、全バリエーションで同じDataFrameを共有する
+  （読み込む列は対象バリエーションの contract_list_columns の和集合。
+  フィルタ・出力作成は入力DataFrameを変更しない）
+- バリエーションごとにワーカースレッドで並列に処理し、処理時間を記録する
+- 結果はCP932のCSVとして1つのZIPに書き出す
+
+プラザ契約者はコールセンター回収委託ファイルが別途必要なため対象外。
+"""
+
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from processors.common.csv_writer import write_csv_to_zip
+from processors.faith_sms.contract import CONTRACT_SPEC as FAITH_CONTRACT_SPEC
+from processors.faith_sms.emergency_contact import EMERGENCY_CONTACT_SPEC as FAITH_EMERGENCY_CONTACT_SPEC
+from processors.faith_sms.guarantor import GUARANTOR_SPEC as FAITH_GUARANTOR_SPEC
+from processors.gb_sms.contract import CONTRACT_SPEC as GB_CONTRACT_SPEC
+from processors.mirail_sms.contract import contract_spec
+from processors.mirail_sms.contract_today import CONTRACT_TODAY_SPEC
+from processors.mirail_sms.contract_today_blank import CONTRACT_TODAY_BLANK_SPEC
+from processors.mirail_sms.emergency_contact import emergency_contact_spec
+from processors.mirail_sms.guarantor import guarantor_spec
+from processors.sms_common.pipeline import ColumnPosition, ColumnRef, process_sms_frame
+from processors.sms_common.utils import read_contract_list
+
+# (出力DF, ログリスト, 出力ファイル名, 統計情報)
+SmsResult = Tuple[pd.DataFrame, List[str], str, dict]
+
+# ワーカースレッド数の上限
+MAX_WORKERS = 4
+
+# 一括処理の対象バリエーション（サイドバーの個別画面と同じ順）
+BATCH_VARIANTS = {
+    "mirail_sms_contract_id5": {"label": "ミライル　契約者　委託先法人ID→5", "spec": contract_spec('id5')},
+    "mirail_sms_contract_blank": {"label": "ミライル　契約者　委託先法人ID→空白", "spec": contract_spec('blank')},
+    "mirail_sms_guarantor_id5": {"label": "ミライル　保証人　委託先法人ID→5", "spec": guarantor_spec('id5')},
+    "mirail_sms_guarantor_blank": {"label": "ミライル　保証人　委託先法人ID→空白", "spec": guarantor_spec('blank')},
+    "mirail_sms_emergencycontact_id5": {"label": "ミライル　連絡人　委託先法人ID→5", "spec": emergency_contact_spec('id5')},
+    "mirail_sms_emergencycontact_blank": {"label": "ミライル　連絡人　委託先法人ID→空白", "spec": emergency_contact_spec('blank')},
+    "mirail_sms_contract_today": {"label": "ミライル　当日SMS用　契約者　委託先法人ID→5", "spec": CONTRACT_TODAY_SPEC},
+    "mirail_sms_contract_today_blank": {"label": "ミライル　当日SMS用　契約者　委託先法人→空白", "spec": CONTRACT_TODAY_BLANK_SPEC},
+    "faith_sms_contract": {"label": "フェイス　契約者", "spec": FAITH_CONTRACT_SPEC},
+    "faith_sms_guarantor": {"label": "フェイス　保証人", "spec": FAITH_GUARANTOR_SPEC},
+    "faith_sms_emergencycontact": {"label": "フェイス　連絡人", "spec": FAITH_EMERGENCY_CONTACT_SPEC},
+    "gb_sms_contract": {"label": "ガレージバンク　契約者", "spec": GB_CONTRACT_SPEC},
+}
+
+
+def batch_columns(variant_keys: List[str]) -> List[ColumnRef]:
+    """バリエーションで使うContractListの列（和集合）"""
+    columns = [
+        column for key in variant_keys for column in BATCH_VARIANTS[key]["spec"].contract_list_columns
+    ]
+    return list(dict.fromkeys(columns))
+
+
+def _run_variant(
+    df: pd.DataFrame, key: str, payment_deadline_date: date, position: ColumnPosition
+) -> Tuple[SmsResult, float]:
+    """1バリエーションを処理（ワーカースレッドで実行）"""
+    spec = BATCH_VARIANTS[key]["spec"]
+    started = time.perf_counter()
+    output_df, logs, stats = process_sms_frame(df, spec, payment_deadline_date, position)
+    return (output_df, logs, spec.output_filename(), stats), time.perf_counter() - started
+
+
+def process_sms_batch_data(
+    file_content: bytes,
+    payment_deadline_date: date,
+    variant_keys: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, SmsResult], List[str]]:
+    """
+    1つのContractListから複数のSMSバリエーションを一括処理
+
+    Args:
+        file_content: ContractListのファイル内容（bytes）
+        payment_deadline_date: 支払期限日付（全バリエーション共通）
+        variant_keys: 処理するバリエーション（BATCH_VARIANTSのキー）。Noneの場合は全種類
+        max_workers: ワーカースレッド数（省略時はCPU数、最大 MAX_WORKERS）
+
+    Returns:
+        tuple: ({バリエーション: (出力DF, 処理ログ, 出力ファイル名, 統計情報)}, 全体ログ)
+            統計情報の elapsed_seconds はそのバリエーションの処理時間（秒）
+    """
+    if variant_keys is None:
+        variant_keys = list(BATCH_VARIANTS.keys())
+
+    invalid_keys = [key for key in variant_keys if key not in BATCH_VARIANTS]
+    if invalid_keys:
+        raise ValueError(f"無効なバリエーション: {invalid_keys}")
+
+    batch_logs = ["📂 SMS一括処理開始..."]
+    batch_started = time.perf_counter()
+    try:
+        df_input, reader = read_contract_list(file_content, batch_columns(variant_keys))
+    except Exception as e:
+        error_msg = f"SMS一括処理エラー: {str(e)}"
+        batch_logs.append(f"❌ {error_msg}")
+        raise Exception(error_msg)
+    batch_logs.append(
+        f"ファイル読み込み完了: {len(df_input)}件 ({time.perf_counter() - batch_started:.2f}秒)"
+    )
+
+    if max_workers is None:
+        max_workers = min(MAX_WORKERS, os.cpu_count() or 1)
+    max_workers = max(1, min(max_workers, len(variant_keys)))
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sms_batch") as executor:
+        futures = {
+            key: executor.submit(_run_variant, df_input, key, payment_deadline_date, reader.position)
+            for key in variant_keys
+        }
+        for key in variant_keys:
+            try:
+                result, elapsed = futures[key].result()
+            except Exception as e:
+                for future in futures.values():
+                    future.cancel()
+                error_msg = f"{BATCH_VARIANTS[key]['spec'].name}処理エラー: {str(e)}"
+                batch_logs.append(f"❌ {error_msg}")
+                raise Exception(error_msg)
+            result[3]['elapsed_seconds'] = elapsed
+            results[key] = result
+            batch_logs.append(f"{result[2]}: {len(result[0])}件 ({elapsed:.2f}秒)")
+
+    batch_logs.append(
+        f"✅ SMS一括処理完了: {len(results)}種類 ({time.perf_counter() - batch_started:.2f}秒)"
+    )
+    return results, batch_logs
+
+
+def write_sms_batch_zip(results: Dict[str, SmsResult]) -> Tuple[bytes, List[str], Dict[str, Dict[str, int]]]:
+    """
+    一括処理の結果をCP932のCSVとして1つのZIPに書き出す
+
+    各CSVはZIPのエントリに直接書き込む（write_csv_to_zip）。
+    CP932で表せない文字は「?」に置き換える（個別画面のダウンロードと同じ）。
+
+    Args:
+        results: process_sms_batch_data の結果
+
+    Returns:
+        tuple: (ZIPファイルの内容,
+                0件のためZIPに含めなかったバリエーションのキー,
+                {バリエーション: 置き換えた文字 → 件数}（置き換えがあったもののみ）)
+    """
+    zip_buffer = io.BytesIO()
+    empty_keys = []
+    replaced_chars = {}
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for key, (result_df, _, filename, _) in results.items():
+            if result_df.empty:
+                empty_keys.append(key)
+                continue
+            replaced = write_csv_to_zip(zip_file, filename, result_df)
+            if replaced:
+                replaced_chars[key] = replaced
+    return zip_buffer.getvalue(), empty_keys, replaced_chars
@@ -5,10 +5,13 @@ SMSプロセッサで使用する共通の定数とユーティリティ関数
 """
 
 from .constants import SMS_TEMPLATE_HEADERS
-from .utils import format_payment_deadline, read_csv_auto_encoding
+from .utils import format_payment_deadline, read_contract_list, read_csv_auto_encoding
+from .phone_classifier import classify_phones
 
 __all__ = [
     'SMS_TEMPLATE_HEADERS',
     'format_payment_deadline',
-    'read_csv_auto_encoding'
+    'read_contract_list',
+    'read_csv_auto_encoding',
+    'classify_phones'
 ]
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+SMS送信先電話番号の分類
+
+電話番号の列全体を1回で分類し、SMSプロセッサの携帯電話フィルタと
+除外詳細ログの両方に使う。
+
+分類:
+- mobile: SMS送信可能な携帯番号（090/080/070-XXXX-XXXX 形式）
+- landline: 固定電話（ハイフン等を除いて0始まりの10桁）
+- blank: 空白・NaN
+- malformed: 上記以外（ハイフンなしの携帯番号、桁数不足など）
+
+使用例:
+    from processors.sms_common.phone_classifier import classify_phones
+
+    phones = classify_phones(df.iloc[:, 27])
+    df = df[phones.is_mobile]
+    detail = phones.exclusion_log('AB列TEL携帯')
+"""
+
+import re
+import unicodedata
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from processors.common.detailed_logger import DetailedLogger
+
+
+# SMS送信可能な携帯番号の形式
+MOBILE_PHONE_PATTERN = r'^(090|080|070)-\d{4}-\d{4}$'
+
+# 固定電話の形式（数字のみにした後）
+LANDLINE_DIGITS_PATTERN = r'^0\d{9}$'
+
+PHONE_MOBILE = "mobile"
+PHONE_LANDLINE = "landline"
+PHONE_BLANK = "blank"
+PHONE_MALFORMED = "malformed"
+
+# 空白として扱う値（前後の空白除去後）
+_BLANK_VALUES = ["", "nan", "NaN"]
+
+_MOBILE_PHONE_RE = re.compile(MOBILE_PHONE_PATTERN)
+_LANDLINE_DIGITS_RE = re.compile(LANDLINE_DIGITS_PATTERN)
+_NON_DIGIT_RE = re.compile(r'\D')
+
+
+def normalize_phone(value: str) -> str:
+    """全角→半角に変換し、数字以外（ハイフン・括弧など）を除く"""
+    return _NON_DIGIT_RE.sub('', unicodedata.normalize('NFKC', value))
+
+
+class PhoneClassification:
+    """電話番号列の分類結果"""
+
+    def __init__(self, text: pd.Series, kind: pd.Series):
+        # 前後の空白を除去した値（'nan' は空文字）
+        self.text = text
+        # 分類（PHONE_MOBILE / PHONE_LANDLINE / PHONE_BLANK / PHONE_MALFORMED）
+        self.kind = kind
+        self.is_mobile: np.ndarray = (kind == PHONE_MOBILE).to_numpy()
+        self._normalized: Optional[pd.Series] = None
+
+    @property
+    def normalized(self) -> pd.Series:
+        """数字のみにした値（フィルタには不要なため、初回参照時に作成）"""
+        if self._normalized is None:
+            self._normalized = pd.Series(
+                [normalize_phone(value) for value in self.text], index=self.text.index, dtype=object
+            )
+        return self._normalized
+
+    def counts(self, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """分類ごとの件数（mask を指定した場合はその行のみ）"""
+        kind = self.kind if mask is None else self.kind[mask]
+        counts = kind.value_counts()
+        return {
+            name: int(counts.get(name, 0))
+            for name in (PHONE_MOBILE, PHONE_LANDLINE, PHONE_BLANK, PHONE_MALFORMED)
+        }
+
+    def exclusion_log(self, label: str, rows: Optional[np.ndarray] = None) -> Optional[str]:
+        """
+        携帯電話フィルタで除外された行の詳細ログ
+
+        DetailedLogger.log_exclusion_details(除外行, 列番号, label, 'phone') と同じ内容。
+
+        Args:
+            label: ログに表示するラベル
+            rows: 除外された行のマスク（省略時は携帯番号以外の全行。
+                前段のフィルタで除外済みの行を含めない場合に指定する）
+
+        Returns:
+            str: 詳細ログ（除外行がない場合は None）
+        """
+        excluded = ~self.is_mobile if rows is None else rows
+        excluded_count = int(excluded.sum())
+        if excluded_count == 0:
+            return None
+        blank_count = int((self.kind.to_numpy()[excluded] == PHONE_BLANK).sum())
+        return DetailedLogger.log_phone_exclusion(label, blank_count, excluded_count - blank_count)
+
+
+def classify_phones(series: pd.Series) -> PhoneClassification:
+    """
+    電話番号の列を分類
+
+    携帯番号・空白の判定を先に行い、残りの行だけ数字のみにして固定電話を判定する。
+
+    Args:
+        series: 電話番号の列
+
+    Returns:
+        PhoneClassification: 分類結果（インデックスは series と同じ）
+    """
+    stripped = series.astype(str).str.strip()
+    is_blank = stripped.isin(_BLANK_VALUES).to_numpy()
+    text = stripped.replace('nan', '')
+
+    values = text.tolist()
+    is_mobile = np.fromiter(
+        (_MOBILE_PHONE_RE.match(value) is not None for value in values), dtype=bool, count=len(values)
+    )
+
+    kind = np.full(len(values), PHONE_MALFORMED, dtype=object)
+    kind[is_blank] = PHONE_BLANK
+    kind[is_mobile] = PHONE_MOBILE
+
+    undecided = np.flatnonzero(~(is_mobile | is_blank))
+    is_landline = np.fromiter(
+        (_LANDLINE_DIGITS_RE.match(normalize_phone(values[i])) is not None for i in undecided),
+        dtype=bool, count=len(undecided),
+    )
+    kind[undecided[is_landline]] = PHONE_LANDLINE
+
+    return PhoneClassification(text, pd.Series(kind, index=series.index))
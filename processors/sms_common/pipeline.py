@@ -0,0 +1,542 @@
+"""
+SMS送信用データ作成パイプライン（宣言的な定義）
+
+ミライル・フェイス・プラザ・ガレージバンクのSMSプロセッサは、いずれも
+読み込み → フィルタ（委託先法人ID・入金予定日・入金予定金額・回収ランク・
+滞納残債・TEL携帯） → SMS_TEMPLATE_HEADERS（59列）の出力作成 という同じ手順で
+処理する。各プロセッサはフィルタと出力列の定義（SmsSpec）だけを持ち、
+処理はこのモジュールで共通化する。
+
+フィルタは全て元のDataFrame全体に対するマスクとして評価してANDで合成し、
+最後に1回だけ対象行を抽出する。各段階の件数・除外詳細ログは
+「前段までのマスク AND 当該フィルタの否定」から算出するため、
+従来の逐次フィルタ（段階ごとに df = df[mask]）と同じログになる。
+
+列の参照方法:
+- 列番号（int, 0ベース）: ContractListColumns の列位置
+- 列名（str）: フェイス・プラザ・ガレージバンクのように列名で参照する場合
+
+読み込む列: SmsSpec.contract_list_columns（フィルタ・電話番号列・出力列の作成に使う列）だけを
+ContractListReader で読み込む。列番号での参照は読み込み後の列位置に変換する（position）。
+
+使用例:
+    from processors.sms_common.pipeline import (
+        SmsSpec, arrears_at_least, mobile_phone, run_sms_pipeline, trustee_id_numeric
+    )
+
+    spec = SmsSpec(
+        filters=[
+            trustee_id_numeric([7]),
+            arrears_at_least(1),
+            mobile_phone('TEL携帯', 'TEL携帯', write_back=True),
+        ],
+        phone_column='TEL携帯',
+    )
+    output_df, logs, stats = run_sms_pipeline(file_content, spec, payment_deadline_date)
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.common.detailed_logger import DetailedLogger
+from processors.sms_common.constants import SMS_TEMPLATE_HEADERS
+from processors.sms_common.phone_classifier import classify_phones
+from processors.sms_common.utils import format_payment_deadline, read_contract_list
+
+ColumnRef = Union[str, int]
+ColumnMapping = Union[Callable[[pd.DataFrame], pd.Series], Any]
+# 元の列番号 → 入力DataFrameでの列位置（ContractListReader.position）
+ColumnPosition = Callable[[int], int]
+
+# 入金予定日の形式
+PAYMENT_DATE_FORMAT = '%Y/%m/%d'
+
+
+def _today() -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _column_position(df: pd.DataFrame, ref: ColumnRef, position: Optional[ColumnPosition]) -> int:
+    """列名・列番号から df での列位置を取得（列番号は position で変換）"""
+    if isinstance(ref, str):
+        return df.columns.get_loc(ref)
+    return position(ref) if position is not None else ref
+
+
+def _to_mask(values: Any) -> np.ndarray:
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=bool)
+    return np.asarray(values, dtype=bool)
+
+
+class _FilterState:
+    """フィルタ評価中の状態（変換済みの列・残っている行・ログ）"""
+
+    def __init__(self, df: pd.DataFrame, position: Optional[ColumnPosition] = None):
+        self.df = df
+        self.project = position
+        self.converted: Dict[int, pd.Series] = {}
+        self.alive = np.ones(len(df), dtype=bool)
+        self.logs: List[str] = []
+
+    def position(self, ref: ColumnRef) -> int:
+        return _column_position(self.df, ref, self.project)
+
+    def column(self, ref: ColumnRef) -> pd.Series:
+        """変換済み（書き戻し済み）の列があればそれを、なければ元の列を返す"""
+        position = self.position(ref)
+        if position in self.converted:
+            return self.converted[position]
+        return self.df.iloc[:, position]
+
+    def write_back(self, ref: ColumnRef, values: pd.Series):
+        """変換結果で列を置き換える（従来の df['列名'] = 変換結果 に相当）"""
+        self.converted[self.position(ref)] = values
+
+    def narrow(self, mask: np.ndarray, label: str) -> np.ndarray:
+        """残っている行をマスクで絞り込み、件数ログを追加して除外行を返す"""
+        before_count = int(self.alive.sum())
+        excluded = self.alive & ~mask
+        self.alive &= mask
+        self.logs.append(DetailedLogger.log_filter_result(before_count, int(self.alive.sum()), label))
+        return excluded
+
+
+class SmsFilter:
+    """フィルタ1段分の定義"""
+
+    def __init__(
+        self,
+        label: str,
+        column: ColumnRef,
+        keep: Callable[[pd.Series], Any],
+        convert: Optional[Callable[[pd.Series], pd.Series]] = None,
+        write_back: bool = False,
+        log_column: Optional[ColumnRef] = None,
+        log_label: Optional[str] = None,
+        log_type: str = 'category',
+    ):
+        """
+        Args:
+            label: フィルタ結果ログのラベル
+            column: 対象列
+            keep: 対象列（変換後）を受け取り、残す行を True とするマスクを返す関数
+            convert: 判定前の変換処理（数値化・日付変換など）
+            write_back: True の場合は変換結果で列を置き換える（後続のログ・出力も変換後の値を使う）
+            log_column: 除外詳細ログに使う列（省略時は column）
+            log_label: 除外詳細ログのラベル（省略時は label）
+            log_type: 除外詳細ログの種類（DetailedLogger.log_exclusion_details の log_type）
+        """
+        self.label = label
+        self.column = column
+        self.keep = keep
+        self.convert = convert
+        self.write_back = write_back
+        self.log_column = column if log_column is None else log_column
+        self.log_label = label if log_label is None else log_label
+        self.log_type = log_type
+
+    def apply(self, state: _FilterState):
+        values = state.column(self.column)
+        if self.convert is not None:
+            values = self.convert(values)
+            if self.write_back:
+                state.write_back(self.column, values)
+
+        excluded = state.narrow(_to_mask(self.keep(values)), self.label)
+        if excluded.any():
+            excluded_data = state.column(self.log_column)[excluded].to_frame()
+            detail = DetailedLogger.log_exclusion_details(
+                excluded_data, 0, self.log_label, self.log_type, top_n=3
+            )
+            if detail:
+                state.logs.append(detail)
+
+
+class MobilePhoneFilter(SmsFilter):
+    """携帯電話番号フィルタ（分類は classify_phones で1回だけ行う）"""
+
+    def __init__(self, label: str, column: ColumnRef, write_back: bool = False):
+        super().__init__(label, column, keep=None, write_back=write_back)
+
+    def apply(self, state: _FilterState):
+        phones = classify_phones(state.column(self.column))
+        if self.write_back:
+            state.write_back(self.column, phones.text)
+
+        excluded = state.narrow(phones.is_mobile, self.label)
+        detail = phones.exclusion_log(self.label, excluded)
+        if detail:
+            state.logs.append(detail)
+
+
+# ---------------------------------------------------------------------------
+# フィルタ定義
+# ---------------------------------------------------------------------------
+
+def trustee_id_text(
+    values: Sequence[str],
+    label: str,
+    column: ColumnRef = COL.TRUSTEE_ID,
+) -> SmsFilter:
+    """委託先法人ID（文字列として前後空白を除き、values のいずれかに一致する行を残す）"""
+    return SmsFilter(
+        label, column,
+        keep=lambda ids: ids.astype(str).str.strip().isin(values),
+        log_label='委託先法人ID', log_type='id',
+    )
+
+
+def trustee_id_numeric(
+    ids: Sequence[int],
+    label: str = '委託先法人ID',
+    column: ColumnRef = '委託先法人ID',
+    log_column: ColumnRef = COL.TRUSTEE_ID,
+) -> SmsFilter:
+    """委託先法人ID（整数に変換して書き戻し、ids のいずれかに一致する行を残す。数値以外は -1）"""
+    return SmsFilter(
+        label, column,
+        convert=lambda ids_: pd.to_numeric(ids_, errors='coerce').fillna(-1).astype(int),
+        write_back=True,
+        keep=lambda ids_: ids_.isin(ids),
+        log_column=log_column, log_label='委託先法人ID', log_type='id',
+    )
+
+
+def client_cd_excluded(
+    values: Sequence[str],
+    label: str,
+    column: ColumnRef = COL.CLIENT_CD,
+) -> SmsFilter:
+    """クライアントCD（前後空白を除いて values に一致する行を除外）"""
+    return SmsFilter(
+        label, column,
+        keep=lambda codes: ~codes.astype(str).str.strip().isin(values),
+        log_label='クライアントCD', log_type='id',
+    )
+
+
+def _parse_payment_date(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, format=PAYMENT_DATE_FORMAT, errors='coerce')
+
+
+def payment_date_before_today(
+    column: ColumnRef = COL.PAYMENT_DATE,
+    label: str = '入金予定日',
+    write_back: bool = False,
+    log_column: ColumnRef = COL.PAYMENT_DATE,
+) -> SmsFilter:
+    """入金予定日（空白または前日以前を残す。当日以降は除外）"""
+    return SmsFilter(
+        label, column,
+        convert=_parse_payment_date, write_back=write_back,
+        keep=lambda dates: dates.isna() | (dates < _today()),
+        log_column=log_column, log_label='入金予定日', log_type='date',
+    )
+
+
+def payment_date_today(
+    column: ColumnRef = COL.PAYMENT_DATE,
+    label: str = '入金予定日（当日のみ）',
+) -> SmsFilter:
+    """入金予定日（当日のみ残す）"""
+    return SmsFilter(
+        label, column,
+        convert=_parse_payment_date,
+        keep=lambda dates: dates.dt.date == _today().date(),
+        log_column=COL.PAYMENT_DATE, log_label='入金予定日', log_type='date',
+    )
+
+
+def payment_amount_excluded(
+    amounts: Sequence[int],
+    column: ColumnRef = COL.PAYMENT_AMOUNT,
+    label: str = '入金予定金額',
+) -> SmsFilter:
+    """入金予定金額（数値または文字列として amounts に一致する行を除外）"""
+    amount_strings = [str(amount) for amount in amounts]
+    return SmsFilter(
+        label, column,
+        keep=lambda values: ~(
+            pd.to_numeric(values, errors='coerce').isin(amounts) |
+            values.astype(str).isin(amount_strings)
+        ),
+        log_column=COL.PAYMENT_AMOUNT, log_label='入金予定金額', log_type='amount',
+    )
+
+
+def payment_amount_at_least(
+    min_amount: int,
+    column: ColumnRef = COL.PAYMENT_AMOUNT,
+    label: Optional[str] = None,
+) -> SmsFilter:
+    """入金予定金額（カンマを除いて min_amount 円以上の行を残す）"""
+    return SmsFilter(
+        label or f'入金予定金額（{min_amount}円以上）', column,
+        keep=lambda values: pd.to_numeric(
+            values.astype(str).str.replace(',', ''), errors='coerce'
+        ) >= min_amount,
+        log_column=COL.PAYMENT_AMOUNT, log_label='入金予定金額', log_type='amount',
+    )
+
+
+def collection_rank_excluded(
+    ranks: Sequence[str],
+    column: ColumnRef = COL.COLLECTION_RANK,
+    label: str = '回収ランク',
+) -> SmsFilter:
+    """回収ランク（ranks に一致する行を除外）"""
+    return SmsFilter(
+        label, column,
+        keep=lambda values: ~values.isin(ranks),
+        log_column=COL.COLLECTION_RANK, log_label='回収ランク', log_type='category',
+    )
+
+
+def arrears_at_least(min_amount: int = 1, column: ColumnRef = COL.DEBT_AMOUNT) -> SmsFilter:
+    """滞納残債（カンマを除いて min_amount 円以上の行を残す）"""
+    return SmsFilter(
+        f'滞納残債（{min_amount}円以上）', column,
+        keep=lambda values: pd.to_numeric(
+            values.astype(str).str.replace(',', ''), errors='coerce'
+        ) >= min_amount,
+        log_label='滞納残債', log_type='amount',
+    )
+
+
+def mobile_phone(column: ColumnRef, label: str, write_back: bool = False) -> MobilePhoneFilter:
+    """
+    TEL携帯（090/080/070-XXXX-XXXX 形式の携帯番号のみ残す）
+
+    write_back=True の場合は前後空白を除いた値で列を置き換える（出力の電話番号にも反映）。
+    """
+    return MobilePhoneFilter(label, column, write_back=write_back)
+
+
+# ---------------------------------------------------------------------------
+# 出力列定義
+# ---------------------------------------------------------------------------
+
+def text(column: str) -> Callable[[pd.DataFrame], pd.Series]:
+    """入力列を文字列化した出力列（欠損値は 'nan'）"""
+    return lambda df: df[column].astype(str)
+
+
+def property_name(df: pd.DataFrame) -> pd.Series:
+    """物件名 + 全角スペース + 物件番号（物件番号が空の場合は物件名のみ）"""
+    number = df['物件番号'].fillna('').astype(str)
+    suffix = ('　' + number).where((number != '') & (number != 'nan'), '')
+    return df['物件名'].astype(str) + suffix
+
+
+def arrears_amount(df: pd.DataFrame) -> pd.Series:
+    """滞納残債のカンマ区切り表示（数値以外の文字を除去、変換できない場合は 0）"""
+    digits = df['滞納残債'].astype(str).str.replace(r'[^0-9,]', '', regex=True)
+    amounts = pd.to_numeric(digits.str.replace(',', ''), errors='coerce').fillna(0).astype(int)
+    return amounts.map('{:,}'.format)
+
+
+def bank_account(df: pd.DataFrame) -> pd.Series:
+    """回収口座5項目（銀行名・支店名・種類・番号・名義人）の全角スペース結合"""
+    return (
+        df['回収口座銀行名'].astype(str) + '　' +
+        df['回収口座支店名'].astype(str) + '　' +
+        df['回収口座種類'].astype(str) + '　' +
+        df['回収口座番号'].astype(str).str.replace('="', '').str.replace('"', '') + '　' +
+        df['回収口座名義人'].astype(str)
+    )
+
+
+# (info1)〜(info5) の共通定義
+INFO_COLUMNS: Dict[str, ColumnMapping] = {
+    '(info1)契約者名': lambda df: df['契約者氏名'],
+    '(info2)物件名': property_name,
+    '(info3)金額': arrears_amount,
+    '(info4)銀行口座': bank_account,
+    '(info5)メモ': text('管理番号'),
+}
+
+# INFO_COLUMNS の作成に使う入力列
+INFO_INPUT_COLUMNS: List[ColumnRef] = [
+    '契約者氏名', '物件名', '物件番号', '滞納残債',
+    '回収口座銀行名', '回収口座支店名', '回収口座種類', '回収口座番号', '回収口座名義人',
+    '管理番号',
+]
+
+
+class SmsSpec:
+    """SMSプロセッサ1種類分の定義"""
+
+    def __init__(
+        self,
+        filters: Sequence[SmsFilter],
+        phone_column: ColumnRef,
+        columns: Optional[Dict[str, ColumnMapping]] = None,
+        input_columns: Optional[Sequence[ColumnRef]] = None,
+        empty_message: Optional[str] = None,
+        name: str = 'SMS',
+        filename: str = 'SMS.csv',
+    ):
+        """
+        Args:
+            filters: フィルタ（定義順に適用）
+            phone_column: 電話番号列に出力する列
+            columns: 出力列名 → 入力DataFrameを受け取る関数または固定値
+                （省略時は INFO_COLUMNS。定義のない列は空欄）
+            input_columns: columns の作成に使う入力列（省略時は INFO_INPUT_COLUMNS）
+            empty_message: 指定した場合、対象が0件のときはこのログを追加して
+                空のDataFrameを返す（最終処理結果のログは出さない）
+            name: エラーメッセージに使う処理名（「{name}処理エラー: ...」）
+            filename: 出力ファイル名（先頭に処理日のMMDDを付ける）
+        """
+        self.filters = list(filters)
+        self.phone_column = phone_column
+        self.columns = dict(INFO_COLUMNS if columns is None else columns)
+        self.input_columns = list(INFO_INPUT_COLUMNS if input_columns is None else input_columns)
+        self.empty_message = empty_message
+        self.name = name
+        self.filename = filename
+
+    @property
+    def contract_list_columns(self) -> List[ColumnRef]:
+        """読み込むContractListの列（フィルタ・除外詳細ログ・電話番号列・出力列の作成に使う列）"""
+        columns: List[ColumnRef] = []
+        for sms_filter in self.filters:
+            columns += [sms_filter.column, sms_filter.log_column]
+        columns += [self.phone_column, *self.input_columns]
+        return list(dict.fromkeys(columns))
+
+    def output_filename(self) -> str:
+        """出力ファイル名（例: 0630ミライルSMS契約者_ID5.csv）"""
+        return f"{datetime.now().strftime('%m%d')}{self.filename}"
+
+
+def apply_sms_filters(
+    df: pd.DataFrame,
+    filters: Sequence[SmsFilter],
+    position: Optional[ColumnPosition] = None,
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    フィルタを単一パスで適用
+
+    Args:
+        df: 入力DataFrame（変更しない）
+        filters: フィルタ（定義順に評価し、ログもこの順に出力）
+        position: 列番号 → df での列位置（列を絞って読み込んだ場合。省略時は列番号のまま）
+
+    Returns:
+        tuple: (対象行のDataFrame（書き戻し済み、インデックスは元のまま）, ログリスト)
+    """
+    state = _FilterState(df, position)
+    for sms_filter in filters:
+        sms_filter.apply(state)
+
+    positions = np.flatnonzero(state.alive)
+    df_filtered = df.iloc[positions].copy()
+    for position, values in state.converted.items():
+        df_filtered.isetitem(position, values.iloc[positions])
+    return df_filtered, state.logs
+
+
+def build_sms_frame(
+    df: pd.DataFrame,
+    spec: SmsSpec,
+    payment_deadline_date: date,
+    position: Optional[ColumnPosition] = None,
+) -> pd.DataFrame:
+    """
+    SMS_TEMPLATE_HEADERS（59列）の出力を列単位で一括作成
+
+    Args:
+        df: フィルタ済みの入力データ
+        spec: SMSプロセッサの定義
+        payment_deadline_date: 支払期限
+        position: 列番号 → df での列位置（apply_sms_filters と同じ）
+
+    Returns:
+        pd.DataFrame: 出力データ（インデックスは df と同じ、定義のない列は空欄（NaN））
+    """
+    phone_position = _column_position(df, spec.phone_column, position)
+    values: Dict[str, Any] = {'電話番号': df.iloc[:, phone_position].astype(str)}
+    for column, mapping in spec.columns.items():
+        values[column] = mapping(df) if callable(mapping) else mapping
+    values['支払期限'] = format_payment_deadline(payment_deadline_date)
+
+    row_count = len(df)
+    data = {}
+    for position, column in enumerate(SMS_TEMPLATE_HEADERS):
+        key = f"__COL_{position}__"
+        value = values.get(column, np.nan) if column else np.nan
+        if isinstance(value, pd.Series):
+            data[key] = value.to_numpy(dtype=object)
+        else:
+            data[key] = np.full(row_count, value, dtype=object)
+
+    output_df = pd.DataFrame(data, index=df.index)
+    output_df.columns = list(SMS_TEMPLATE_HEADERS)
+    return output_df
+
+
+def process_sms_frame(
+    df: pd.DataFrame,
+    spec: SmsSpec,
+    payment_deadline_date: date,
+    position: Optional[ColumnPosition] = None,
+) -> Tuple[pd.DataFrame, List[str], Dict[str, int]]:
+    """
+    読み込み済みのContractListからSMS出力を作成
+
+    df は変更しないため、一括処理では1つの読み込み結果を複数の定義で共有できる。
+
+    Args:
+        df: ContractList（全列str型。spec.contract_list_columns を含む）
+        spec: SMSプロセッサの定義
+        payment_deadline_date: 支払期限
+        position: 列番号 → df での列位置（列を絞って読み込んだ場合。省略時は列番号のまま）
+
+    Returns:
+        tuple: (出力DataFrame, ログリスト, 統計情報)
+    """
+    initial_rows = len(df)
+    logs = [DetailedLogger.log_initial_load(initial_rows)]
+
+    df_filtered, filter_logs = apply_sms_filters(df, spec.filters, position)
+    logs.extend(filter_logs)
+
+    if len(df_filtered) == 0 and spec.empty_message:
+        logs.append(spec.empty_message)
+        return pd.DataFrame(columns=SMS_TEMPLATE_HEADERS), logs, {
+            'initial_rows': initial_rows,
+            'processed_rows': 0,
+        }
+
+    output_df = build_sms_frame(df_filtered, spec, payment_deadline_date, position)
+    logs.append(DetailedLogger.log_final_result(len(output_df)))
+    return output_df, logs, {
+        'initial_rows': initial_rows,
+        'processed_rows': len(output_df),
+    }
+
+
+def run_sms_pipeline(
+    file_content: bytes,
+    spec: SmsSpec,
+    payment_deadline_date: date,
+) -> Tuple[pd.DataFrame, List[str], Dict[str, int]]:
+    """
+    ContractListの読み込み（spec.contract_list_columns の列のみ）からSMS出力の作成までを実行
+
+    Args:
+        file_content: ContractList（CSV）の内容
+        spec: SMSプロセッサの定義
+        payment_deadline_date: 支払期限
+
+    Returns:
+        tuple: (出力DataFrame, ログリスト, 統計情報)
+    """
+    df, reader = read_contract_list(file_content, spec.contract_list_columns)
+    return process_sms_frame(df, spec, payment_deadline_date, reader.position)
@@ -6,9 +6,11 @@ SMSプロセッサで使用する共通の関数を定義。
 """
 
 import pandas as pd
-import io
 from datetime import date
-from typing import List
+from typing import Iterable, List, Tuple
+
+from processors.common.contract_list_reader import ColumnRef, ContractListReader
+from processors.common.parsed_frame_cache import read_csv_cached
 
 
 def format_payment_deadline(date_input: date) -> str:
@@ -41,12 +43,31 @@ def read_csv_auto_encoding(file_content: bytes) -> pd.DataFrame:
     Raises:
         ValueError: すべてのエンコーディングで読み込みに失敗した場合
     """
-    encodings = ['utf-8', 'utf-8-sig', 'shift_jis', 'cp932', 'euc_jp']
-    
-    for enc in encodings:
-        try:
-            return pd.read_csv(io.BytesIO(file_content), encoding=enc, dtype=str)
-        except Exception:
-            continue
-    
-    raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
\ No newline at end of file
+    try:
+        return read_csv_cached(file_content, dtype=str)
+    except Exception:
+        raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
+
+
+def read_contract_list(
+    file_content: bytes, columns: Iterable[ColumnRef]
+) -> Tuple[pd.DataFrame, ContractListReader]:
+    """
+    ContractListを指定した列だけ読み込み（自動エンコーディング判定）
+
+    Args:
+        file_content: CSVファイルのバイトデータ
+        columns: 必要な列番号（ContractListColumns の値）または列名
+
+    Returns:
+        tuple: (読み込んだDataFrame（すべての列をstr型として）,
+                列名を列番号に変換済みのリーダー（position で列番号 → 読み込み後の列位置）)
+
+    Raises:
+        ValueError: すべてのエンコーディングで読み込みに失敗した場合
+    """
+    try:
+        reader = ContractListReader(columns).resolve(file_content)
+        return reader.read(file_content), reader
+    except Exception:
+        raise ValueError("CSVファイルの読み込みに失敗しました。エンコーディングを確認してください。")
\ No newline at end of file
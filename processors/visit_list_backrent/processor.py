@@ -6,10 +6,11 @@ ContractList.csvから訪問スタッフ用の訪問リストExcelを生成（
 """
 
 import pandas as pd
-import io
 from datetime import datetime
 from typing import Tuple, List, Dict
-from openpyxl.styles import Font, Border
+from openpyxl.styles import Alignment, Font
+from processors.common.excel_writer import ExcelSheet, to_excel_bytes
+from processors.common.progress import report_progress
 from processors.common.prefecture_order import get_prefecture_order, extract_prefecture_from_address
 
 
@@ -110,6 +111,17 @@ class VisitListBackrentConfig:
 
     OUTPUT_FILE_PREFIX = "訪問リスト（バックレント用）"
 
+    # Excel出力の書式（全セル游ゴシック Regular 11pt、金額はカンマ区切り、滞納月数は小数点第1位）
+    EXCEL_FONT = Font(name='游ゴシック Regular', size=11)
+    EXCEL_HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+    EXCEL_NUMBER_FORMATS = {
+        "退去手続き（実費）": '#,##0',
+        "滞納残債": '#,##0',
+        "入金予定金額": '#,##0',
+        "月額賃料合計": '#,##0',
+        "滞納月数": '0.0',
+    }
+
 
 def combine_address(address1, address2, address3) -> str:
     """
@@ -414,69 +426,24 @@ def generate_excel(
         Tuple[bytes, List[str]]: Excelバイト列とログ
     """
     logs = []
+    sheets = []
+
+    for person_type, config in VisitListBackrentConfig.PERSON_TYPES.items():
+        if person_type in df_dict and len(df_dict[person_type]) > 0:
+            df = df_dict[person_type]
+            sheet_name = config["sheet_name"]
+
+            # フォント・数値書式は列単位で指定（罫線なし）
+            sheets.append(ExcelSheet(
+                sheet_name,
+                df,
+                VisitListBackrentConfig.EXCEL_FONT,
+                number_formats=VisitListBackrentConfig.EXCEL_NUMBER_FORMATS,
+                header_alignment=VisitListBackrentConfig.EXCEL_HEADER_ALIGNMENT,
+            ))
+            logs.append(f"{sheet_name}シート: {len(df)}件")
 
-    # Excelファイルを作成
-    excel_buffer = io.BytesIO()
-
-    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-        for person_type, config in VisitListBackrentConfig.PERSON_TYPES.items():
-            if person_type in df_dict and len(df_dict[person_type]) > 0:
-                df = df_dict[person_type]
-                sheet_name = config["sheet_name"]
-
-                # Excelシートに書き込み
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                logs.append(f"{sheet_name}シート: {len(df)}件")
-
-        # フォント設定と罫線削除を適用
-        workbook = writer.book
-        font = Font(name='游ゴシック Regular', size=11)
-
-        for sheet_name in workbook.sheetnames:
-            ws = workbook[sheet_name]
-
-            # フォントと罫線の設定
-            for row in ws.iter_rows():
-                for cell in row:
-                    cell.font = font
-                    cell.border = Border()  # 罫線削除
-
-            # 数値列にカンマ区切り書式を適用
-            headers = [cell.value for cell in ws[1]]
-            numeric_cols = []
-            decimal_cols = []
-            for idx, header in enumerate(headers, start=1):
-                if header in ["退去手続き（実費）", "滞納残債", "入金予定金額", "月額賃料合計"]:
-                    numeric_cols.append(idx)
-                elif header == "滞納月数":
-                    decimal_cols.append(idx)
-
-            # 2行目以降の数値列にカンマ書式
-            for row in ws.iter_rows(min_row=2):
-                for col_idx in numeric_cols:
-                    cell = row[col_idx - 1]
-                    # NaNチェック: pd.isna()で判定し、NaNの場合は空文字に置き換え
-                    if cell.value is not None:
-                        if isinstance(cell.value, (int, float)):
-                            import math
-                            if math.isnan(cell.value):
-                                cell.value = ''
-                            else:
-                                cell.number_format = '#,##0'
-
-                # 小数点列に小数点第1位フォーマット
-                for col_idx in decimal_cols:
-                    cell = row[col_idx - 1]
-                    if cell.value is not None:
-                        if isinstance(cell.value, (int, float)):
-                            import math
-                            if math.isnan(cell.value):
-                                cell.value = ''
-                            else:
-                                cell.number_format = '0.0'
-
-    excel_buffer.seek(0)
-    return excel_buffer.getvalue(), logs
+    return to_excel_bytes(sheets), logs
 
 
 def process_visit_list_backrent(df_input: pd.DataFrame) -> Tuple[bytes, str, str, List[str]]:
@@ -491,7 +458,9 @@ def process_visit_list_backrent(df_input: pd.DataFrame) -> Tuple[bytes, str, str
     """
     logs = []
 
-    # 1. フィルタリング
+    # 1. フィルタリング（人物タイプ別のデータ作成と合わせて進捗を報告）
+    total_steps = 1 + len(VisitListBackrentConfig.PERSON_TYPES)
+    report_progress("フィルタリング", 0, total_steps)
     df_filtered, filter_logs = filter_records(df_input)
     logs.extend(filter_logs)
 
@@ -500,7 +469,8 @@ def process_visit_list_backrent(df_input: pd.DataFrame) -> Tuple[bytes, str, str
 
     # 2. 5つの人物タイプ別にデータ作成
     df_dict = {}
-    for person_type, config in VisitListBackrentConfig.PERSON_TYPES.items():
+    for step, (person_type, config) in enumerate(VisitListBackrentConfig.PERSON_TYPES.items(), 1):
+        report_progress(f"人物別データ作成（{person_type}）", step, total_steps)
         # 該当人物の現住所1が存在するレコードのみ
         address1_col = config["address1_col"]
         mask = df_filtered.iloc[:, address1_col].notna() & (df_filtered.iloc[:, address1_col] != '')
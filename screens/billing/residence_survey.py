@@ -2,10 +2,10 @@
 居住訪問調査報告書 請求書作成画面モジュール
 """
 import streamlit as st
-import pandas as pd
-import io
 from datetime import datetime, timedelta
 from processors.residence_survey.billing_processor import process_residence_survey_billing
+from components.file_utils import read_csv_with_encoding
+from components.background_job import get_job, render_job, submit_job
 
 
 def render_residence_survey_billing():
@@ -66,47 +66,47 @@ def render_residence_survey_billing():
     if uploaded_file:
         st.success(f"✅ {uploaded_file.name}: 読み込み完了")
 
-        # CSVデータを読み込み（エンコーディング自動判定）
-        file_data = uploaded_file.getvalue()
-        try:
-            df_preview = pd.read_csv(io.BytesIO(file_data), encoding='cp932')
-        except UnicodeDecodeError:
-            try:
-                df_preview = pd.read_csv(io.BytesIO(file_data), encoding='shift_jis')
-            except UnicodeDecodeError:
-                df_preview = pd.read_csv(io.BytesIO(file_data), encoding='utf-8-sig')
-
-        # 処理実行ボタン
+        # 処理実行ボタン（CSV読み込み・処理はジョブとして実行し、進捗・結果は下で表示）
         if st.button("処理を実行", type="primary", key="residence_survey_billing_process"):
-            with st.spinner("処理中..."):
-                try:
-                    # プロセッサー呼び出し（既に読み込んだdf_previewを使用）
-                    excel_buffer, filename, message, logs = process_residence_survey_billing(
-                        df_preview,
-                        selected_month=selected_month
-                    )
-
-                    # 成功メッセージ
-                    st.success(message)
-
-                    # Excelダウンロードボタン
-                    st.download_button(
-                        label=f"📥 {filename} をダウンロード",
-                        data=excel_buffer,
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="residence_survey_billing_download",
-                        type="primary"
-                    )
-
-                    # 処理ログ表示
-                    if logs:
-                        with st.expander("📊 処理ログ", expanded=True):
-                            for log in logs:
-                                st.write(f"• {log}")
-
-                except Exception as e:
-                    st.error(f"エラーが発生しました: {str(e)}")
-                    import traceback
-                    with st.expander("詳細エラー情報"):
-                        st.code(traceback.format_exc())
+            file_data = uploaded_file.getvalue()
+            submit_job(
+                "residence_survey_billing",
+                lambda: process_residence_survey_billing(
+                    read_csv_with_encoding(file_data),  # エンコーディング自動判定
+                    selected_month=selected_month
+                ),
+            )
+
+    job = get_job("residence_survey_billing")
+    if job is not None:
+        try:
+            render_job(job, _display_result)
+        except Exception as e:
+            st.error(f"エラーが発生しました: {str(e)}")
+            import traceback
+            with st.expander("詳細エラー情報"):
+                st.code(traceback.format_exc())
+
+
+def _display_result(result):
+    """請求書作成の結果表示"""
+    excel_buffer, filename, message, logs = result
+
+    # 成功メッセージ
+    st.success(message)
+
+    # Excelダウンロードボタン
+    st.download_button(
+        label=f"📥 {filename} をダウンロード",
+        data=excel_buffer,
+        file_name=filename,
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        key="residence_survey_billing_download",
+        type="primary"
+    )
+
+    # 処理ログ表示
+    if logs:
+        with st.expander("📊 処理ログ", expanded=True):
+            for log in logs:
+                st.write(f"• {log}")
@@ -10,6 +10,7 @@ from datetime import datetime
 from components.result_display import display_processing_result, display_error_result
 from components.screen_template import ScreenConfig, render_screen
 from services.debt_update import process_ark_late_payment_data
+from processors.common.debt_snapshot import get_debt_snapshot_store, report_date_from_filename
 
 
 def show_ark_late_payment():
@@ -22,7 +23,10 @@ def show_ark_late_payment():
             "マッチング → 管理番号での照合処理",
             "残債更新 → 管理前滞納額の更新処理"
         ],
-        process_function=lambda files: process_ark_late_payment_data(files[0], files[1]),
+        process_function=lambda files: process_ark_late_payment_data(
+            files[0], files[1], snapshot_store=get_debt_snapshot_store(),
+            snapshot_date=report_date_from_filename(getattr(files[0], "name", None))
+        ),
         file_count=2,
         info_message="📂 必要ファイル: アークデータ + ContractList（2ファイル処理）",
         file_labels=["ファイル1: アークデータ", "ファイル2: ContractList"],
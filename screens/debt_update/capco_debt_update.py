@@ -10,6 +10,7 @@ import time
 from components.common_ui import safe_csv_download, display_processing_logs
 from components.result_display import display_error_result
 from services.debt_update import process_capco_debt_update
+from processors.common.debt_snapshot import get_debt_snapshot_store, report_date_from_filename
 
 
 def show_capco_debt_update():
@@ -50,6 +51,8 @@ def show_capco_debt_update():
                     file_contents[0],
                     file_contents[1],
                     progress_callback=update_progress,
+                    snapshot_store=get_debt_snapshot_store(),
+                    snapshot_date=report_date_from_filename(file1.name),
                 )
 
                 # プログレスバーを完了状態に
@@ -13,7 +13,9 @@ import zipfile
 from datetime import datetime, date, timedelta
 from components.common_ui import display_processing_logs
 from components.result_display import display_processing_result, display_error_result
-from processors.plaza_debt_update import process_plaza_debt_update
+from processors.plaza_debt_update import process_plaza_debt_update, SNAPSHOT_SOURCE
+from processors.common.csv_writer import write_csv_to_zip
+from processors.common.debt_snapshot import get_debt_snapshot_store, report_date_from_filename
 
 
 def show_plaza_debt_update():
@@ -22,7 +24,7 @@ def show_plaza_debt_update():
     st.header("💰 プラザ残債の更新")
     st.subheader("管理前滞納額情報・交渉履歴CSVの生成")
     
-    st.info("📂 必要ファイル: 前日・当日のコールセンター回収委託情報（Excel） + 1241件.csv")
+    st.info("📂 必要ファイル: 当日のコールセンター回収委託情報（Excel） + 1241件.csv（前日分は保存済みの残債スナップショットがあれば省略可）")
     
     # 前営業日の設定（交渉備考用）- 最初に表示
     st.subheader("前営業日の設定")
@@ -51,6 +53,8 @@ def show_plaza_debt_update():
             key="plaza_yesterday",
             help="コールセンター回収委託_入金退去情報_YYYYMMDD_ミライル委託分.xlsx"
         )
+        # 当日ファイルの日付が決まってから表示する
+        snapshot_caption = st.empty()
     
     with col2:
         st.markdown("**📄 当日の回収委託情報**")
@@ -70,9 +74,22 @@ def show_plaza_debt_update():
             help="引継番号と管理番号の対応表"
         )
     
-    # ファイルが全てアップロードされたら処理実行
-    if yesterday_file and today_file and plaza_list_file:
-        st.success(f"✅ {yesterday_file.name}: 読み込み完了")
+    # 前回の残債スナップショット（前日ファイルを省略した場合に使用）
+    # プロセッサーと同じく当日ファイルの日付より前の最新分（未選択時は今日より前）
+    snapshot_store = get_debt_snapshot_store()
+    snapshot_date = report_date_from_filename(today_file.name) if today_file else None
+    previous_snapshot_date = snapshot_store.previous_date(SNAPSHOT_SOURCE, snapshot_date or date.today())
+    if previous_snapshot_date:
+        snapshot_caption.caption(f"省略時は前回のスナップショット（{previous_snapshot_date:%Y/%m/%d}）を使用")
+    else:
+        snapshot_caption.caption("前回のスナップショットがないため必須です")
+    
+    # ファイルが全てアップロードされたら処理実行（前日分はスナップショットで代替可）
+    if (yesterday_file or previous_snapshot_date) and today_file and plaza_list_file:
+        if yesterday_file:
+            st.success(f"✅ {yesterday_file.name}: 読み込み完了")
+        else:
+            st.success(f"✅ 前日データ: 残債スナップショット（{previous_snapshot_date:%Y/%m/%d}）")
         st.success(f"✅ {today_file.name}: 読み込み完了")
         st.success(f"✅ {plaza_list_file.name}: 読み込み完了")
         
@@ -81,10 +98,12 @@ def show_plaza_debt_update():
                 with st.spinner("処理中..."):
                     # プロセッサー実行（選択した日付を渡す）
                     outputs, filenames, logs, stats = process_plaza_debt_update(
-                        yesterday_file.read(),
+                        yesterday_file.read() if yesterday_file else None,
                         today_file.read(),
                         plaza_list_file.read(),
-                        selected_date
+                        selected_date,
+                        snapshot_store=snapshot_store,
+                        snapshot_date=snapshot_date
                     )
                     
                     # ログ表示
@@ -107,12 +126,10 @@ def show_plaza_debt_update():
                         zip_buffer = io.BytesIO()
                         with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                             # 1つ目のCSV（管理前滞納額情報）
-                            csv1_content = outputs[0].to_csv(index=False, encoding='cp932')
-                            zip_file.writestr(filenames[0], csv1_content.encode('cp932'))
+                            write_csv_to_zip(zip_file, filenames[0], outputs[0], errors='strict')
                             
                             # 2つ目のCSV（交渉履歴）
-                            csv2_content = outputs[1].to_csv(index=False, encoding='cp932')
-                            zip_file.writestr(filenames[1], csv2_content.encode('cp932'))
+                            write_csv_to_zip(zip_file, filenames[1], outputs[1], errors='strict')
                         
                         # ZIPファイルのダウンロードボタン
                         zip_buffer.seek(0)
@@ -0,0 +1,73 @@
+"""
+処理メトリクス画面モジュール
+Business Data Processor
+
+ジョブとして実行した処理の記録（processors/common/metrics.py）から
+処理ごとの p50 / p95 処理時間・スループット（入力行数/秒）と日ごとの推移を表示
+"""
+import streamlit as st
+
+from processors.common.metrics import daily_metrics, get_metrics_store, metrics_frame, summarize_metrics
+
+
+# 集計期間の選択肢（日数）
+PERIOD_OPTIONS = {"直近7日": 7, "直近30日": 30, "直近90日": 90}
+
+# 直近の実行一覧に表示する件数
+RECENT_RUNS = 50
+
+
+def render_metrics():
+    """処理メトリクス画面"""
+
+    st.title("処理メトリクス")
+    st.subheader("処理ごとの処理時間・件数・メモリを表示します")
+
+    period = st.selectbox("集計期間", options=list(PERIOD_OPTIONS), key="metrics_period")
+    store = get_metrics_store()
+    df = metrics_frame(store.read_days(PERIOD_OPTIONS[period]))
+    st.caption(f"記録ファイル: {store.path}")
+
+    if df.empty:
+        st.info("この期間の記録はありません（画面から処理を実行すると記録されます）")
+        return
+
+    # 処理ごとの集計
+    summary = summarize_metrics(df)
+    st.markdown("### 処理ごとの集計")
+    st.dataframe(
+        summary.rename(columns={
+            "processor": "処理", "runs": "実行回数", "errors": "エラー",
+            "p50_seconds": "p50（秒）", "p95_seconds": "p95（秒）",
+            "p50_rows_per_sec": "スループット（行/秒）", "max_peak_rss_mb": "最大RSS（MB）",
+            "last_run": "最終実行",
+        }),
+        hide_index=True,
+        use_container_width=True,
+    )
+    if df["profiling_overlap"].any():
+        st.caption("プロファイル取得と同時に実行された記録は、処理時間・スループット・RSSの集計から除いています")
+
+    # 日ごとの推移
+    st.markdown("### 日ごとの推移")
+    processor = st.selectbox("処理", options=summary["processor"].tolist(), key="metrics_processor")
+    daily = daily_metrics(df, processor)
+    if daily.empty:
+        st.info("成功した実行の記録はありません")
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.caption("処理時間（秒）")
+            st.line_chart(daily[["p50_seconds", "p95_seconds"]])
+        with col2:
+            st.caption("スループット（行/秒）")
+            st.line_chart(daily[["p50_rows_per_sec"]])
+
+    # 直近の実行
+    with st.expander(f"直近の実行（{RECENT_RUNS}件まで）"):
+        recent = df[df["processor"] == processor].sort_values("timestamp", ascending=False).head(RECENT_RUNS)
+        st.dataframe(
+            recent.drop(columns=["processor"]),
+            hide_index=True,
+            use_container_width=True,
+        )
@@ -6,10 +6,19 @@ Business Data Processor
 - 契約者（10,000円除外あり/なし）
 - 保証人（10,000円除外あり/なし）  
 - 緊急連絡人（10,000円除外あり/なし）
+- 一括処理（全パターンをZIPで出力）
 """
 
 import streamlit as st
-from components.common_ui import display_filter_conditions
+import io
+import zipfile
+from datetime import datetime
+from components.background_job import get_job, render_job, submit_job
+from components.common_ui import (
+    display_filter_conditions,
+    display_processing_logs,
+    display_replaced_chars_warning
+)
 from components.result_display import display_processing_result, display_error_result
 from components.screen_template import ScreenConfig, render_screen  # 追加
 from services.autocall import process_mirail_contract_without10k_data
@@ -20,8 +29,10 @@ from services.autocall import (
     process_mirail_guarantor_with10k_data,
     process_mirail_guarantor_without10k_today_included_data,
     process_mirail_emergencycontact_without10k_data,
-    process_mirail_emergencycontact_with10k_data
+    process_mirail_emergencycontact_with10k_data,
+    process_mirail_autocall_batch_data
 )
+from processors.common.csv_writer import write_csv_to_zip
 
 
 # 新しい実装（テンプレート使用）
@@ -209,3 +220,111 @@ def show_mirail_guarantor_without10k_today_included():
         title_icon="📞"
     )
     render_screen(config, 'mirail_guarantor_without10k_today_included')
+
+
+# 一括処理で選択できるパターン（表示名）
+BATCH_VARIANT_LABELS = {
+    "contract_without10k": "契約者（10,000円を除外するパターン）",
+    "contract_without10k_today_included": "契約者（10,000円除外）当日約定込み",
+    "contract_with10k": "契約者（10,000円を除外しないパターン）",
+    "guarantor_without10k": "保証人（10,000円を除外するパターン）",
+    "guarantor_without10k_today_included": "保証人（10,000円除外）当日約定込み",
+    "guarantor_with10k": "保証人（10,000円を除外しないパターン）",
+    "emergency_contact_without10k": "緊急連絡人（10,000円を除外するパターン）",
+    "emergency_contact_with10k": "緊急連絡人（10,000円を除外しないパターン）",
+}
+
+
+def show_mirail_autocall_batch():
+    st.title("📞 オートコール用CSV加工")
+    st.subheader("ミライル　一括処理（全パターン）")
+
+    display_filter_conditions([
+        "ContractListを1回アップロードするだけで、選択した全パターンのCSVを作成",
+        "各パターンのフィルタ条件は個別画面と同じ",
+        "0件のパターンはZIPに含めません"
+    ])
+
+    selected_keys = st.multiselect(
+        "作成するパターンを選択してください",
+        options=list(BATCH_VARIANT_LABELS.keys()),
+        default=list(BATCH_VARIANT_LABELS.keys()),
+        format_func=lambda key: BATCH_VARIANT_LABELS[key],
+        key="mirail_autocall_batch_variants"
+    )
+
+    uploaded_file = st.file_uploader(
+        "CSVファイルをアップロードしてください",
+        type="csv",
+        key="mirail_autocall_batch_file"
+    )
+
+    if uploaded_file is not None:
+        st.success(f"✅ {uploaded_file.name}: 読み込み完了")
+
+        if not selected_keys:
+            st.warning("パターンを1つ以上選択してください。")
+        # 処理実行ボタン（処理・ZIP作成はジョブとして実行し、進捗・結果は下で表示）
+        elif st.button("処理を実行", type="primary", key="mirail_autocall_batch_process"):
+            submit_job(
+                "mirail_autocall_batch", _process_mirail_autocall_batch,
+                uploaded_file.getvalue(), list(selected_keys)
+            )
+
+    job = get_job("mirail_autocall_batch")
+    if job is not None:
+        try:
+            render_job(job, _display_mirail_autocall_batch_result)
+        except Exception as e:
+            display_error_result(f"エラーが発生しました: {str(e)}")
+
+
+def _process_mirail_autocall_batch(file_content: bytes, selected_keys):
+    """一括処理とZIP作成（ジョブとして実行、0件のパターンはZIPに含めない）"""
+    results, logs = process_mirail_autocall_batch_data(file_content, selected_keys)
+
+    zip_buffer = io.BytesIO()
+    empty_labels = []
+    replaced_by_file = {}
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for key, (result_df, _, filename) in results.items():
+            if result_df.empty:
+                empty_labels.append(BATCH_VARIANT_LABELS[key])
+                continue
+            replaced_by_file[filename] = write_csv_to_zip(zip_file, filename, result_df)
+
+    return results, logs, zip_buffer.getvalue(), empty_labels, replaced_by_file
+
+
+def _display_mirail_autocall_batch_result(result):
+    """ミライル一括処理の結果表示"""
+    results, logs, zip_bytes, empty_labels, replaced_by_file = result
+
+    output_count = len(results) - len(empty_labels)
+    st.success(f"処理完了: {output_count}種類のCSVを作成しました")
+
+    # パターン別の件数
+    for key, (result_df, _, filename) in results.items():
+        st.markdown(f"• {BATCH_VARIANT_LABELS[key]}: **{len(result_df):,}件**（{filename}）")
+
+    if empty_labels:
+        st.warning("条件に合致するデータがなかったパターン: " + "、".join(empty_labels))
+
+    for filename, replaced in replaced_by_file.items():
+        if replaced:
+            display_replaced_chars_warning(replaced, filename)
+
+    if output_count > 0:
+        date_str = datetime.now().strftime("%m%d")
+        st.download_button(
+            label=f"📦 {output_count}つのCSVをダウンロード",
+            data=zip_bytes,
+            file_name=f"{date_str}ミライル_オートコール一括.zip",
+            mime="application/zip",
+            type="primary"
+        )
+
+    # 処理ログ表示（全体 + パターン別）
+    display_processing_logs(logs, expanded=False)
+    for key, (_, variant_logs, _) in results.items():
+        display_processing_logs(variant_logs, title=f"📊 {BATCH_VARIANT_LABELS[key]}", expanded=False)
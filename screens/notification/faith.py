@@ -4,14 +4,13 @@
 """
 
 import streamlit as st
-import pandas as pd
-import io
 from components.common_ui import (
     display_filter_conditions,
     safe_csv_download,
     safe_excel_download,
 )
 from processors.faith_notification import process_faith_notification
+from components.file_utils import read_csv_with_encoding
 
 
 def render_single_button_process(
@@ -78,17 +77,7 @@ def render_single_button_process(
                 try:
                     # CSVデータを読み込み
                     file_data = uploaded_file.read()
-                    try:
-                        df = pd.read_csv(io.BytesIO(file_data), encoding="cp932")
-                    except UnicodeDecodeError:
-                        try:
-                            df = pd.read_csv(
-                                io.BytesIO(file_data), encoding="shift_jis"
-                            )
-                        except UnicodeDecodeError:
-                            df = pd.read_csv(
-                                io.BytesIO(file_data), encoding="utf-8-sig"
-                            )
+                    df = read_csv_with_encoding(file_data)
 
                     # プロセッサー呼び出し
                     result_df, filename, message, logs = process_faith_notification(
@@ -152,17 +141,7 @@ def render_faith_notification():
             with st.spinner("処理中..."):
                 try:
                     # CSVデータを読み込み
-                    try:
-                        df = pd.read_csv(io.BytesIO(file_data), encoding="cp932")
-                    except UnicodeDecodeError:
-                        try:
-                            df = pd.read_csv(
-                                io.BytesIO(file_data), encoding="shift_jis"
-                            )
-                        except UnicodeDecodeError:
-                            df = pd.read_csv(
-                                io.BytesIO(file_data), encoding="utf-8-sig"
-                            )
+                    df = read_csv_with_encoding(file_data)
 
                     # プロセッサー呼び出し
                     result_df, filename, message, logs = process_faith_notification(
@@ -3,9 +3,9 @@
 """
 import streamlit as st
 import pandas as pd
-import io
 from components.common_ui import display_filter_conditions, safe_excel_download
 from processors.gb_notification import process_gb_notification
+from components.file_utils import read_csv_with_encoding
 
 
 def show_gb_notification():
@@ -58,13 +58,7 @@ def show_gb_notification():
                 try:
                     # ContractList読み込み
                     contract_data = contract_file.read()
-                    try:
-                        contract_df = pd.read_csv(io.BytesIO(contract_data), encoding='cp932', header=None)
-                    except UnicodeDecodeError:
-                        try:
-                            contract_df = pd.read_csv(io.BytesIO(contract_data), encoding='shift_jis', header=None)
-                        except UnicodeDecodeError:
-                            contract_df = pd.read_csv(io.BytesIO(contract_data), encoding='utf-8-sig', header=None)
+                    contract_df = read_csv_with_encoding(contract_data, header=None)
 
                     # ヘッダー行を除外（1行目がヘッダーの場合）
                     if contract_df.iloc[0, 0] == '管理番号' or str(contract_df.iloc[0, 0]).startswith('管理'):
@@ -3,11 +3,8 @@
 契約者、保証人、連絡人の郵送用リストを作成する画面
 """
 import streamlit as st
-import pandas as pd
-import io
-from openpyxl import Workbook
-from openpyxl.styles import Font
-from components.common_ui import display_filter_conditions, display_processing_logs
+from components.common_ui import EXCEL_FONT, display_filter_conditions, display_processing_logs
+from processors.common.excel_writer import ExcelSheet, to_excel_bytes
 from processors.mirail_notification import process_mirail_notification, split_guarantors, split_contacts
 
 
@@ -97,114 +94,27 @@ def render_mirail_notification(target_type: str, client_pattern: str):
                             st.dataframe(result_df.head(10))
 
                         # Excel形式でダウンロード（游ゴシック 12pt）
-                        output = io.BytesIO()
-
-                        # openpyxlで直接ワークブックを作成
-                        wb = Workbook()
-
-                        # フォント設定（游ゴシック Regular 12pt、罫線なし）
-                        custom_font = Font(
-                            name='游ゴシック',  # Yu Gothic / 游ゴシック体 / YuGothic
-                            size=12,
-                            bold=False
-                        )
-
-                        # 保証人の場合は2シート構成
+                        # 保証人の場合は2シート構成（保証人2はデータがある場合のみ）
                         if target_type == 'guarantor':
                             df_g1, df_g2 = split_guarantors(result_df)
-
-                            # 保証人1シート
-                            ws1 = wb.active
-                            ws1.title = '保証人1'
-
-                            # 保証人1のデータを書き込み
-                            for col_num, column_title in enumerate(df_g1.columns, 1):
-                                cell = ws1.cell(row=1, column=col_num, value=column_title)
-                                cell.font = custom_font
-
-                            for row_num, row_data in enumerate(df_g1.values, 2):
-                                for col_num, cell_value in enumerate(row_data, 1):
-                                    if pd.isna(cell_value):
-                                        cell_value = ''
-                                    cell = ws1.cell(row=row_num, column=col_num, value=cell_value)
-                                    cell.font = custom_font
-
-                            # 保証人2シート（データがある場合のみ）
+                            sheets = [ExcelSheet('保証人1', df_g1, EXCEL_FONT)]
                             if len(df_g2) > 0:
-                                ws2 = wb.create_sheet('保証人2')
+                                sheets.append(ExcelSheet('保証人2', df_g2, EXCEL_FONT))
 
-                                for col_num, column_title in enumerate(df_g2.columns, 1):
-                                    cell = ws2.cell(row=1, column=col_num, value=column_title)
-                                    cell.font = custom_font
-
-                                for row_num, row_data in enumerate(df_g2.values, 2):
-                                    for col_num, cell_value in enumerate(row_data, 1):
-                                        if pd.isna(cell_value):
-                                            cell_value = ''
-                                        cell = ws2.cell(row=row_num, column=col_num, value=cell_value)
-                                        cell.font = custom_font
-
-                        # 連絡人の場合は2シート構成
+                        # 連絡人の場合は2シート構成（連絡人2はデータがある場合のみ）
                         elif target_type == 'contact':
                             df_e1, df_e2 = split_contacts(result_df)
-
-                            # 連絡人1シート
-                            ws1 = wb.active
-                            ws1.title = '連絡人1'
-
-                            # 連絡人1のデータを書き込み
-                            for col_num, column_title in enumerate(df_e1.columns, 1):
-                                cell = ws1.cell(row=1, column=col_num, value=column_title)
-                                cell.font = custom_font
-
-                            for row_num, row_data in enumerate(df_e1.values, 2):
-                                for col_num, cell_value in enumerate(row_data, 1):
-                                    if pd.isna(cell_value):
-                                        cell_value = ''
-                                    cell = ws1.cell(row=row_num, column=col_num, value=cell_value)
-                                    cell.font = custom_font
-
-                            # 連絡人2シート（データがある場合のみ）
+                            sheets = [ExcelSheet('連絡人1', df_e1, EXCEL_FONT)]
                             if len(df_e2) > 0:
-                                ws2 = wb.create_sheet('連絡人2')
-
-                                for col_num, column_title in enumerate(df_e2.columns, 1):
-                                    cell = ws2.cell(row=1, column=col_num, value=column_title)
-                                    cell.font = custom_font
-
-                                for row_num, row_data in enumerate(df_e2.values, 2):
-                                    for col_num, cell_value in enumerate(row_data, 1):
-                                        if pd.isna(cell_value):
-                                            cell_value = ''
-                                        cell = ws2.cell(row=row_num, column=col_num, value=cell_value)
-                                        cell.font = custom_font
+                                sheets.append(ExcelSheet('連絡人2', df_e2, EXCEL_FONT))
 
                         # 契約者の場合は1シート
                         else:
-                            ws = wb.active
-                            ws.title = 'Sheet1'
-
-                            # ヘッダーを書き込み（フォント適用）
-                            for col_num, column_title in enumerate(result_df.columns, 1):
-                                cell = ws.cell(row=1, column=col_num, value=column_title)
-                                cell.font = custom_font
-
-                            # データを書き込み（フォント適用）
-                            for row_num, row_data in enumerate(result_df.values, 2):
-                                for col_num, cell_value in enumerate(row_data, 1):
-                                    # NaNやNoneの処理
-                                    if pd.isna(cell_value):
-                                        cell_value = ''
-                                    cell = ws.cell(row=row_num, column=col_num, value=cell_value)
-                                    cell.font = custom_font
-
-                        # 保存
-                        wb.save(output)
-                        output.seek(0)
+                            sheets = [ExcelSheet('Sheet1', result_df, EXCEL_FONT)]
 
                         st.download_button(
                             label=f"📥 {filename}をダウンロード",
-                            data=output.getvalue(),
+                            data=to_excel_bytes(sheets),
                             file_name=filename,
                             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                             type="primary",
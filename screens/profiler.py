@@ -0,0 +1,51 @@
+"""
+プロファイル取得画面モジュール
+Business Data Processor
+
+次に実行する処理を cProfile + tracemalloc の下で実行し（processors/common/profiler.py）、
+関数ごとの時間・メモリ確保の上位と pstats ファイルを表示する
+"""
+import streamlit as st
+
+from components.background_job import get_job_session_id
+from components.profile_view import render_profile
+from processors.common.profiler import get_profile_registry
+
+
+def render_profiler():
+    """プロファイル取得画面"""
+
+    st.title("プロファイル取得")
+    st.subheader("遅い画面の処理を、実際のファイルで計測します")
+
+    with st.expander("使い方", expanded=True):
+        st.markdown("""
+        1. 下の「次の実行をプロファイルする」を有効にする
+        2. 調べたい画面でファイルをアップロードして処理を実行する
+        3. 処理結果の下、またはこの画面にプロファイルが表示される
+
+        - 対象はこのブラウザで次に実行する1回だけです（実行後は自動で無効に戻ります）
+        - プロファイル取得中は処理時間が数倍になります
+        - pstatsファイルには関数名・時間だけが含まれ、入力データは含まれません
+        """)
+
+    registry = get_profile_registry()
+    session_id = get_job_session_id()
+    armed = registry.is_armed(session_id)
+    if st.toggle("次の実行をプロファイルする", value=armed) != armed:
+        if armed:
+            registry.disarm(session_id)
+        else:
+            registry.arm(session_id)
+        st.rerun()
+
+    if registry.is_armed(session_id):
+        st.info("🔬 次に実行する処理のプロファイルを取得します")
+
+    profiles = registry.list(session_id)
+    st.markdown("### 取得したプロファイル")
+    if not profiles:
+        st.info("まだ取得していません")
+        return
+    for number, profile in enumerate(profiles):
+        render_profile(profile, expanded=number == 0)
@@ -7,6 +7,7 @@ Business Data Processor
 """
 
 import streamlit as st
+from components.background_job import get_job, render_job, submit_job
 from components.result_display import display_processing_result, display_error_result
 from services.registration import process_arktrust_data
 
@@ -30,18 +31,19 @@ def show_arktrust_registration_tokyo():
         file2 = st.file_uploader("ContractList_*.csvをアップロード", type="csv", key="arktrust_tokyo_file2")
     
     if file1 and file2:
+        st.success(f"✅ {file1.name}: 読み込み完了")
+        st.success(f"✅ {file2.name}: 読み込み完了")
+        
+        # 処理実行ボタン（処理はジョブとして実行し、進捗・結果は下で表示）
+        if st.button("処理を実行", type="primary", key="arktrust_tokyo_process"):
+            submit_job("arktrust_tokyo", process_arktrust_data, file1.getvalue(), file2.getvalue())
+    elif file1 or file2:
+        st.warning("2つのCSVファイルをアップロードしてください。")
+    
+    job = get_job("arktrust_tokyo")
+    if job is not None:
         try:
-            file_contents = [file1.read(), file2.read()]
-            st.success(f"✅ {file1.name}: 読み込み完了")
-            st.success(f"✅ {file2.name}: 読み込み完了")
-            
-            if st.button("処理を実行", type="primary"):
-                with st.spinner("処理中..."):
-                    result_df, logs, filename = process_arktrust_data(file_contents[0], file_contents[1])
-                    
-                # 共通コンポーネントで結果表示
-                display_processing_result(result_df, logs, filename)
+            # 共通コンポーネントで結果表示
+            render_job(job, lambda result: display_processing_result(*result))
         except Exception as e:
-            display_error_result(f"エラーが発生しました: {str(e)}")
-    elif file1 or file2:
-        st.warning("2つのCSVファイルをアップロードしてください。")
\ No newline at end of file
+            display_error_result(f"エラーが発生しました: {str(e)}")
\ No newline at end of file
@@ -7,25 +7,35 @@ Business Data Processor
 
 import streamlit as st
 from datetime import datetime
-from components.result_display import display_processing_result, display_error_result
 from components.screen_template import ScreenConfig, render_screen
-from processors.gb_zansai import process_gb_zansai
+from components.common_ui import safe_csv_download
+from processors.gb_zansai import process_gb_zansai_with_unmatched
 
 
 def show_gb_zansai():
     """ガレージバンク残債取り込み画面を表示"""
     timestamp = datetime.now().strftime("%m%d")
 
-    # カスタム処理関数
+    # カスタム処理関数（ワーカースレッドで実行するため画面表示は行わない）
     def process_with_message(files):
         # files[0]: 請求データExcel, files[1]: ContractList
-        output_df, logs, filename = process_gb_zansai(files[0], files[1])
+        output_df, logs, filename, unmatched_df, unmatched_filename = process_gb_zansai_with_unmatched(
+            files[0], files[1]
+        )
 
         # 全てマッチしなかった場合
         if len(output_df) == 0:
             logs.insert(0, "【処理結果】マッチするデータがありませんでした。")
-            return (output_df, logs, f"{timestamp}ガレージバンク管理前取込.csv")
+            filename = f"{timestamp}ガレージバンク管理前取込.csv"
 
+        return (output_df, logs, filename, unmatched_df, unmatched_filename)
+
+    # マッチしなかったユーザーIDはログに列挙せず、CSVでダウンロード
+    def show_unmatched(result):
+        output_df, logs, filename, unmatched_df, unmatched_filename = result
+        if len(unmatched_df) > 0:
+            st.warning(f"⚠️ マッチしなかった請求データ: {len(unmatched_df)}件")
+            safe_csv_download(unmatched_df, unmatched_filename, "📥 マッチしなかったユーザーIDをダウンロード")
         return (output_df, logs, filename)
 
     config = ScreenConfig(
@@ -41,6 +51,7 @@ def show_gb_zansai():
         file_labels=["ファイル1: 情報連携シート.xlsx（01_請求データ）", "ファイル2: ContractList（委託先法人ID=7）"],
         title_icon="💰",
         no_data_message="✅ 処理完了: マッチするデータがありませんでした。",
-        file_types=["xlsx", "csv"]
+        file_types=["xlsx", "csv"],
+        on_result=show_unmatched
     )
     render_screen(config, 'gb_zansai')
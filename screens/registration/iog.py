@@ -8,6 +8,7 @@ Business Data Processor
 
 import streamlit as st
 from datetime import datetime
+from components.background_job import get_job, render_job, submit_job
 from components.result_display import display_processing_result, display_error_result
 from services.registration import process_jid_data
 
@@ -55,35 +56,37 @@ def show_jid_registration():
             for i, f in enumerate(transfer_files, 1):
                 st.write(f"{i}. {f.name}")
 
-    # 処理実行ボタン
+    # 処理実行ボタン（処理はジョブとして実行し、進捗・結果は下で表示）
     if iog_file:
         if st.button("処理を実行", type="primary", key="iog_process"):
-            with st.spinner("処理中..."):
-                try:
-                    # ファイルデータ準備
-                    iog_content = iog_file.read()
-
-                    transfer_contents = None
-                    if transfer_files:
-                        transfer_contents = [(f.name, f.read()) for f in transfer_files]
-
-                    # 処理実行
-                    result_df, logs, filename = process_jid_data(iog_content, transfer_contents)
-
-                    # ファイル名をカスタマイズ
-                    custom_filename = f"{timestamp}iog_新規登録.csv"
-
-                    # 結果表示
-                    if not result_df.empty:
-                        display_processing_result(result_df, logs, custom_filename)
-                    else:
-                        st.warning("データが生成されませんでした。")
-                        if logs:
-                            st.expander("📊 処理ログ", expanded=True)
-                            for log in logs:
-                                st.write(f"• {log}")
-
-                except Exception as e:
-                    display_error_result(f"エラーが発生しました: {str(e)}")
+            # ファイルデータ準備
+            iog_content = iog_file.getvalue()
+
+            transfer_contents = None
+            if transfer_files:
+                transfer_contents = [(f.name, f.getvalue()) for f in transfer_files]
+
+            submit_job("iog", process_jid_data, iog_content, transfer_contents)
     else:
         st.warning("IOGファイル（xlsx）をアップロードしてください。")
+
+    job = get_job("iog")
+    if job is not None:
+        try:
+            render_job(job, lambda result: _display_iog_result(result, f"{timestamp}iog_新規登録.csv"))
+        except Exception as e:
+            display_error_result(f"エラーが発生しました: {str(e)}")
+
+
+def _display_iog_result(result, custom_filename: str):
+    """IOG新規登録の結果表示"""
+    result_df, logs, filename = result
+
+    if not result_df.empty:
+        display_processing_result(result_df, logs, custom_filename)
+    else:
+        st.warning("データが生成されませんでした。")
+        if logs:
+            st.expander("📊 処理ログ", expanded=True)
+            for log in logs:
+                st.write(f"• {log}")
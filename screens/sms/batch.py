@@ -0,0 +1,130 @@
+"""
+SMS一括処理画面モジュール
+Business Data Processor
+
+1つのContractListと支払期限から、ミライル・フェイス・ガレージバンクの
+SMS用CSVをまとめて作成し、ZIPでダウンロードする画面
+"""
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime, date
+from components.common_ui import (
+    display_filter_conditions,
+    display_processing_logs,
+    display_replaced_chars_warning
+)
+from components.background_job import get_job, render_job, submit_job
+from components.result_display import display_error_result
+from services.sms import process_sms_batch_data, write_sms_batch_zip
+from processors.sms_batch import BATCH_VARIANTS
+
+
+def show_sms_batch():
+    st.title("📱 SMS送信用CSV加工")
+    st.subheader("一括処理（ミライル・フェイス・ガレージバンク）")
+
+    display_filter_conditions([
+        "ContractListを1回アップロードするだけで、選択した全パターンのCSVを作成",
+        "各パターンのフィルタ条件は個別画面と同じ",
+        "支払期限は全パターン共通",
+        "0件のパターンはZIPに含めません"
+    ])
+
+    selected_keys = st.multiselect(
+        "作成するパターンを選択してください",
+        options=list(BATCH_VARIANTS.keys()),
+        default=list(BATCH_VARIANTS.keys()),
+        format_func=lambda key: BATCH_VARIANTS[key]["label"],
+        key="sms_batch_variants"
+    )
+
+    # 支払期限日付選択
+    st.markdown("### 📅 支払期限の設定")
+    payment_deadline = st.date_input(
+        "支払期限日付を選択してください",
+        value=date.today(),
+        format="YYYY/MM/DD",
+        key="sms_batch_payment_deadline"
+    )
+
+    uploaded_file = st.file_uploader(
+        "ContractList_*.csvをアップロード",
+        type="csv",
+        key="sms_batch_file"
+    )
+
+    if uploaded_file is not None:
+        st.success(f"✅ {uploaded_file.name}: 読み込み完了")
+
+        if not selected_keys:
+            st.warning("パターンを1つ以上選択してください。")
+        # 処理実行ボタン（処理・ZIP作成はジョブとして実行し、進捗・結果は下で表示）
+        elif st.button("処理を実行", type="primary", key="sms_batch_process"):
+            submit_job(
+                "sms_batch", _process_sms_batch,
+                uploaded_file.getvalue(), payment_deadline, list(selected_keys)
+            )
+
+    job = get_job("sms_batch")
+    if job is not None:
+        try:
+            render_job(job, _display_sms_batch_result)
+        except Exception as e:
+            display_error_result(f"エラーが発生しました: {str(e)}")
+
+
+def _process_sms_batch(file_content: bytes, payment_deadline: date, selected_keys):
+    """一括処理とZIP作成（ジョブとして実行）"""
+    results, logs = process_sms_batch_data(file_content, payment_deadline, selected_keys)
+    zip_bytes, empty_keys, replaced_chars = write_sms_batch_zip(results)
+    return results, logs, zip_bytes, empty_keys, replaced_chars
+
+
+def _display_sms_batch_result(result):
+    """SMS一括処理の結果表示"""
+    results, logs, zip_bytes, empty_keys, replaced_chars = result
+
+    output_count = len(results) - len(empty_keys)
+    st.success(f"処理完了: {output_count}種類のCSVを作成しました")
+
+    # パターン別の件数・処理時間
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "パターン": BATCH_VARIANTS[key]["label"],
+                "ファイル名": filename,
+                "件数": len(result_df),
+                "処理時間（秒）": round(stats["elapsed_seconds"], 2),
+            }
+            for key, (result_df, _, filename, stats) in results.items()
+        ]),
+        hide_index=True,
+        use_container_width=True
+    )
+
+    if empty_keys:
+        st.warning(
+            "条件に合致するデータがなかったパターン: "
+            + "、".join(BATCH_VARIANTS[key]["label"] for key in empty_keys)
+        )
+
+    for key, replaced in replaced_chars.items():
+        display_replaced_chars_warning(replaced, results[key][2])
+
+    if output_count > 0:
+        date_str = datetime.now().strftime("%m%d")
+        st.download_button(
+            label=f"📦 {output_count}つのCSVをダウンロード",
+            data=zip_bytes,
+            file_name=f"{date_str}SMS一括.zip",
+            mime="application/zip",
+            type="primary"
+        )
+
+    # 処理ログ表示（全体 + パターン別）
+    display_processing_logs(logs, expanded=False)
+    for key, (_, variant_logs, _, _) in results.items():
+        display_processing_logs(
+            variant_logs, title=f"📊 {BATCH_VARIANTS[key]['label']}", expanded=False
+        )
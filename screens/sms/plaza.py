@@ -15,7 +15,8 @@ from datetime import datetime, date
 from components.common_ui import (
     safe_csv_download,
     display_processing_logs,
-    display_filter_conditions
+    display_filter_conditions,
+    display_replaced_chars_warning
 )
 from components.result_display import display_error_result
 from components.screen_template import ScreenConfig, render_screen, create_payment_deadline_input
@@ -24,6 +25,7 @@ from services.sms import (
     process_plaza_sms_guarantor_data,
     process_plaza_sms_contact_data
 )
+from processors.common.csv_writer import write_csv_to_zip
 
 
 def show_plaza_sms_contract():
@@ -83,15 +85,15 @@ def show_plaza_sms_contract():
                 # ZIPファイル作成
                 zip_buffer = io.BytesIO()
                 with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    # 日本人向けCSV: Unicode文字列 → CP932バイト列
-                    japanese_csv_string = japanese_df.to_csv(index=False)
-                    japanese_csv_bytes = japanese_csv_string.encode('cp932', errors='replace')
-                    zip_file.writestr(japanese_filename, japanese_csv_bytes)
-                    
-                    # 外国人向けCSV: Unicode文字列 → CP932バイト列
-                    foreign_csv_string = foreign_df.to_csv(index=False)
-                    foreign_csv_bytes = foreign_csv_string.encode('cp932', errors='replace')
-                    zip_file.writestr(foreign_filename, foreign_csv_bytes)
+                    # 日本人向け・外国人向けCSV（CP932でエントリに直接書き込み）
+                    replaced_by_file = {
+                        japanese_filename: write_csv_to_zip(zip_file, japanese_filename, japanese_df),
+                        foreign_filename: write_csv_to_zip(zip_file, foreign_filename, foreign_df),
+                    }
+                
+                for filename, replaced in replaced_by_file.items():
+                    if replaced:
+                        display_replaced_chars_warning(replaced, filename)
                 
                 # ZIPファイルダウンロードボタン
                 date_str = datetime.now().strftime("%m%d")
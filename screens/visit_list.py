@@ -5,9 +5,9 @@ Business Data Processor
 ContractList.csvから訪問スタッフ用の訪問リストExcelを生成
 """
 import streamlit as st
-import pandas as pd
-import io
 from processors.visit_list.processor import process_visit_list
+from components.file_utils import read_csv_with_encoding
+from components.background_job import get_job, render_job, submit_job
 
 
 def render_visit_list():
@@ -52,47 +52,47 @@ def render_visit_list():
     if uploaded_file:
         st.success(f"✅ {uploaded_file.name}: 読み込み完了")
 
-        # CSVデータを読み込み（エンコーディング自動判定）
-        file_data = uploaded_file.getvalue()
-        try:
-            df_preview = pd.read_csv(io.BytesIO(file_data), encoding='cp932', low_memory=False)
-        except UnicodeDecodeError:
-            try:
-                df_preview = pd.read_csv(io.BytesIO(file_data), encoding='shift_jis', low_memory=False)
-            except UnicodeDecodeError:
-                df_preview = pd.read_csv(io.BytesIO(file_data), encoding='utf-8-sig', low_memory=False)
-
-        # 処理実行ボタン
+        # 処理実行ボタン（CSV読み込み・処理はジョブとして実行し、進捗・結果は下で表示）
         if st.button("処理を実行", type="primary", key="visit_list_process"):
-            with st.spinner("処理中..."):
-                try:
-                    # プロセッサー呼び出し
-                    excel_buffer, filename, message, logs = process_visit_list(df_preview)
-
-                    if excel_buffer is None:
-                        st.warning(message)
-                    else:
-                        # 成功メッセージ
-                        st.success(message)
-
-                        # Excelダウンロードボタン
-                        st.download_button(
-                            label=f"📥 {filename} をダウンロード",
-                            data=excel_buffer,
-                            file_name=filename,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            key="visit_list_download",
-                            type="primary"
-                        )
-
-                    # 処理ログ表示
-                    if logs:
-                        with st.expander("📊 処理ログ", expanded=True):
-                            for log in logs:
-                                st.write(f"• {log}")
-
-                except Exception as e:
-                    st.error(f"エラーが発生しました: {str(e)}")
-                    import traceback
-                    with st.expander("詳細エラー情報"):
-                        st.code(traceback.format_exc())
+            file_data = uploaded_file.getvalue()
+            submit_job(
+                "visit_list",
+                lambda: process_visit_list(read_csv_with_encoding(file_data, low_memory=False)),
+            )
+
+    job = get_job("visit_list")
+    if job is not None:
+        try:
+            render_job(job, _display_result)
+        except Exception as e:
+            st.error(f"エラーが発生しました: {str(e)}")
+            import traceback
+            with st.expander("詳細エラー情報"):
+                st.code(traceback.format_exc())
+
+
+def _display_result(result):
+    """訪問リストの結果表示"""
+    excel_buffer, filename, message, logs = result
+
+    if excel_buffer is None:
+        st.warning(message)
+    else:
+        # 成功メッセージ
+        st.success(message)
+
+        # Excelダウンロードボタン
+        st.download_button(
+            label=f"📥 {filename} をダウンロード",
+            data=excel_buffer,
+            file_name=filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="visit_list_download",
+            type="primary"
+        )
+
+    # 処理ログ表示
+    if logs:
+        with st.expander("📊 処理ログ", expanded=True):
+            for log in logs:
+                st.write(f"• {log}")
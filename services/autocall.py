@@ -13,7 +13,8 @@ from processors.mirail_autocall.unified_wrapper import (
     process_mirail_guarantor_with10k_data,
     process_mirail_guarantor_without10k_today_included_data,
     process_mirail_emergency_contact_without10k_data,
-    process_mirail_emergency_contact_with10k_data
+    process_mirail_emergency_contact_with10k_data,
+    process_mirail_autocall_batch_data
 )
 
 # 互換性のためのエイリアス（元の関数名を維持）
@@ -41,6 +42,7 @@ __all__ = [
     'process_mirail_guarantor_without10k_today_included_data',
     'process_mirail_emergencycontact_without10k_data',
     'process_mirail_emergencycontact_with10k_data',
+    'process_mirail_autocall_batch_data',
     # フェイス系
     'process_faith_contract_data',
     'process_faith_guarantor_data',
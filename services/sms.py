@@ -24,6 +24,9 @@ from processors.plaza_sms.contact import process_plaza_sms_contact_data
 # ガレージバンク系
 from processors.gb_sms.contract import process_gb_sms_contract_data
 
+# 一括処理（ミライル・フェイス・ガレージバンク）
+from processors.sms_batch import process_sms_batch_data, write_sms_batch_zip
+
 # 公開する関数を明示
 __all__ = [
     # ミライル系
@@ -42,4 +45,7 @@ __all__ = [
     'process_plaza_sms_contact_data',
     # ガレージバンク系
     'process_gb_sms_contract_data',
+    # 一括処理
+    'process_sms_batch_data',
+    'write_sms_batch_zip',
 ]
@@ -0,0 +1,136 @@
+"""
+住所分割インデックス（AddressIndex）のテスト
+
+トライによる検索が、従来の正規表現・辞書ソートによる処理と
+同じ分割結果になることを確認する（パリティテスト）
+"""
+
+import re
+
+import pandas as pd
+import pytest
+
+from processors.common.address_index import spaced_prefix_end
+from processors.common.address_splitter import AddressSplitter
+
+
+class LegacyAddressSplitter(AddressSplitter):
+    """従来の都道府県・市区町村抽出処理（比較用の参照実装）"""
+
+    def extract_prefecture(self, address):
+        for pref in self.prefectures:
+            pattern = r'^' + r'\s*'.join(map(re.escape, list(pref)))
+            m = re.match(pattern, address)
+            if m:
+                return pref, address[m.end():].lstrip()
+        return "", address
+
+    def extract_municipality(self, prefecture, address):
+        if prefecture not in self.municipalities:
+            return "", address
+        normalized_addr = self.normalize(address)
+        municipalities = sorted(self.municipalities[prefecture], key=len, reverse=True)
+        for municipality in municipalities:
+            if normalized_addr.startswith(self.normalize(municipality)):
+                pattern = r'^' + r'\s*'.join(map(re.escape, list(municipality)))
+                m = re.match(pattern, address)
+                if m:
+                    return municipality, address[m.end():].lstrip()
+                return municipality, address[len(municipality):].lstrip()
+        county_match = re.match(r'^(.+?郡)', address)
+        if county_match:
+            county_name = county_match.group(1)
+            return county_name, address[len(county_name):].lstrip()
+        return "", address
+
+
+@pytest.fixture(scope="module")
+def splitter():
+    return AddressSplitter()
+
+
+@pytest.fixture(scope="module")
+def legacy():
+    return LegacyAddressSplitter()
+
+
+def _sample_addresses(splitter):
+    """辞書の全市区町村と表記ゆれを含む住所サンプル"""
+    addresses = []
+    for pref, municipalities in splitter.municipalities.items():
+        for muni in municipalities:
+            addresses.append(f"{pref}{muni}本町1-2-3")
+            addresses.append(f"{pref} {muni}　中央2丁目")
+            addresses.append(f"123-4567 {pref}{' '.join(muni)}1-1")
+            addresses.append(muni.replace("ケ", "ヶ") + "1-2")
+    addresses += [
+        "",
+        "   ",
+        "不明な住所",
+        "東　京　都新宿区西新宿1-1-1",
+        "愛知県海部郡蟹江町本町9-114",
+        "北海道上川郡東川町1",
+        "東京都ＡＢＣ区1-1",
+        "大阪府大阪市北区梅田１－１",
+        "千葉県市原市五井中央西1-1-25",
+        "1234567東京都千代田区丸の内1-1-1",
+    ]
+    return addresses
+
+
+class TestAddressIndexParity:
+    """従来実装とのパリティテスト"""
+
+    def test_split_address_matches_legacy(self, splitter, legacy):
+        """全市区町村・表記ゆれで split_address の結果が一致する"""
+        for address in _sample_addresses(splitter):
+            assert splitter.split_address(address) == legacy.split_address(address), address
+
+    def test_extract_municipality_all_prefectures(self, splitter, legacy):
+        """都道府県を総当たりする呼び出し方（GB新規登録）でも結果が一致する"""
+        for address in ["札幌市東区北四十八条東5丁目2-5", "町田市成瀬が丘1-10-24", "海部郡蟹江町本町"]:
+            for pref in splitter.prefectures:
+                assert (
+                    splitter.extract_municipality(pref, address)
+                    == legacy.extract_municipality(pref, address)
+                ), (pref, address)
+
+
+class TestSplitMany:
+    """一括分割APIのテスト"""
+
+    def test_split_many_matches_split_address(self, splitter):
+        """1件ずつの split_address と同じ結果を返す"""
+        addresses = pd.Series(
+            ["東京都新宿区西新宿1-1-1", None, "東京都新宿区西新宿1-1-1", "愛知県海部郡蟹江町本町9-114"],
+            index=[5, 6, 7, 8],
+        )
+
+        result = splitter.split_many(addresses)
+
+        assert list(result.columns) == ["postal_code", "prefecture", "city", "remaining"]
+        assert list(result.index) == [5, 6, 7, 8]
+        assert result.loc[5].to_dict() == splitter.split_address("東京都新宿区西新宿1-1-1")
+        assert result.loc[6].to_dict() == splitter.split_address("")
+        assert result.loc[8, "city"] == "海部郡"
+
+    def test_split_many_empty(self, splitter):
+        """空のSeriesでは空のDataFrameを返す"""
+        result = splitter.split_many(pd.Series([], dtype=object))
+
+        assert len(result) == 0
+        assert list(result.columns) == ["postal_code", "prefecture", "city", "remaining"]
+
+
+class TestSpacedPrefixEnd:
+    """文字間空白を許容した先頭一致のテスト"""
+
+    @pytest.mark.parametrize("text, name, expected", [
+        ("東京都新宿区", "東京都", 3),
+        ("東 京　都新宿区", "東京都", 5),
+        (" 東京都", "東京都", None),
+        ("東京", "東京都", None),
+        ("大阪府", "東京都", None),
+    ])
+    def test_matches_regex_semantics(self, text, name, expected):
+        assert spaced_prefix_end(text, name) == expected
@@ -0,0 +1,89 @@
+"""
+プロセス共有AddressSplitterのテスト
+"""
+
+import threading
+
+import pytest
+
+import processors.common.address_splitter as address_splitter_module
+from processors.common.address_splitter import (
+    AddressSplitter,
+    get_address_splitter,
+    reload_address_splitter,
+)
+
+
+@pytest.fixture
+def fresh_shared_splitter(monkeypatch):
+    """共有インスタンスを未生成の状態に戻し、生成回数を数える"""
+    monkeypatch.setattr(address_splitter_module, "_shared_splitter", None)
+    created = []
+    original_init = AddressSplitter.__init__
+
+    def counting_init(self):
+        created.append(self)
+        original_init(self)
+
+    monkeypatch.setattr(AddressSplitter, "__init__", counting_init)
+    return created
+
+
+def test_returns_same_instance(fresh_shared_splitter):
+    """2回目以降は同じインスタンスを返す（辞書の読み込みは1回）"""
+    first = get_address_splitter()
+    second = get_address_splitter()
+
+    assert first is second
+    assert len(fresh_shared_splitter) == 1
+
+
+def test_lazy_loading(fresh_shared_splitter):
+    """取得するまで辞書を読み込まない"""
+    assert fresh_shared_splitter == []
+
+    get_address_splitter()
+
+    assert len(fresh_shared_splitter) == 1
+
+
+def test_thread_safe_initialization(fresh_shared_splitter):
+    """複数スレッドから同時に取得しても生成は1回"""
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(get_address_splitter())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fresh_shared_splitter) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_reload_replaces_instance(fresh_shared_splitter):
+    """reload後は新しいインスタンスが返される"""
+    before = get_address_splitter()
+
+    reloaded = reload_address_splitter()
+
+    assert reloaded is not before
+    assert get_address_splitter() is reloaded
+    assert reloaded.split_address("東京都新宿区西新宿1-1-1")["city"] == "新宿区"
+
+
+def test_converters_share_instance():
+    """各登録処理のコンバーターが共有インスタンスを使用する"""
+    from processors.ark_registration import DataConverter as ArkDataConverter
+    from processors.capco_registration import DataConverter as CapcoDataConverter
+    from processors.plaza_registration import DataConverter as PlazaDataConverter
+    from processors.iog_registration import DataConverter as IOGDataConverter
+
+    shared = get_address_splitter()
+    for converter_class in [ArkDataConverter, CapcoDataConverter, PlazaDataConverter, IOGDataConverter]:
+        assert converter_class().address_splitter is shared
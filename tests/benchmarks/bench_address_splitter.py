@@ -0,0 +1,54 @@
+"""
+AddressSplitter ベンチマーク
+
+辞書から生成した10万件の住所で、1件ずつの split_address と
+一括分割 split_many のスループットを計測する。
+
+実行方法:
+    python -m tests.benchmarks.bench_address_splitter [件数]
+"""
+
+import random
+import sys
+import time
+
+import pandas as pd
+
+from processors.common.address_splitter import AddressSplitter
+
+
+def generate_addresses(splitter: AddressSplitter, count: int, seed: int = 0) -> pd.Series:
+    """辞書の都道府県・市区町村から住所を生成（表記ゆれ・重複を含む）"""
+    rng = random.Random(seed)
+    pairs = [(pref, muni) for pref, munis in splitter.municipalities.items() for muni in munis]
+    addresses = []
+    for _ in range(count):
+        pref, muni = rng.choice(pairs)
+        separator = rng.choice(["", "", " ", "　"])
+        addresses.append(f"{pref}{separator}{muni}本町{rng.randint(1, 9)}-{rng.randint(1, 30)}-{rng.randint(1, 20)}")
+    return pd.Series(addresses)
+
+
+def main(count: int = 100_000):
+    start = time.perf_counter()
+    splitter = AddressSplitter()
+    build_time = time.perf_counter() - start
+
+    addresses = generate_addresses(splitter, count)
+
+    start = time.perf_counter()
+    for address in addresses:
+        splitter.split_address(address)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    splitter.split_many(addresses)
+    batch_time = time.perf_counter() - start
+
+    print(f"辞書読み込み・インデックス構築: {build_time:.3f}秒")
+    print(f"split_address（1件ずつ）: {count:,}件 {loop_time:.3f}秒 ({count / loop_time:,.0f}件/秒)")
+    print(f"split_many（一括）:       {count:,}件 {batch_time:.3f}秒 ({count / batch_time:,.0f}件/秒)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
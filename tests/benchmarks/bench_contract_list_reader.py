@@ -0,0 +1,95 @@
+"""
+ContractList列指定読み込み（ContractListReader）ベンチマーク
+
+122列のContractList（CP932）で、ミライルオートコール（契約者・without10k）の
+読み込み〜フィルタリングの時間とメモリ使用量のピーク（tracemalloc）を比較する。
+
+計測ケース:
+- 全列読み込み: 従来の読み込み（122列すべてを dtype=str で読み込み）
+- 列指定読み込み: CONTRACT_LIST_COLUMNS の15列のみ読み込み
+- チャンク読み込み: 15列をチャンク単位で読み込み、チャンクごとにフィルタを適用
+
+実行方法:
+    python -m tests.benchmarks.bench_contract_list_reader [行数]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from processors.autocall_common.filter_engine import FilterEngine
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.common.text_decoder import read_csv_bytes
+from processors.mirail_autocall_unified import MirailAutocallUnifiedProcessor
+
+
+def generate_contract_list(rows: int, seed: int = 0) -> bytes:
+    """122列のContractList（フィルタ後に残るのは全体の数%）"""
+    rng = random.Random(seed)
+    header = ",".join(f"列{i}" for i in range(122))
+    filler = ",".join(["サンプル値"] * 122)
+    base = filler.split(",")
+    lines = [header]
+    for number in range(rows):
+        values = list(base)
+        values[COL.MANAGEMENT_NO] = f"{number:08d}"
+        values[COL.TRUSTEE_ID] = rng.choice(["", "5", "1", "3"])
+        values[COL.PAYMENT_DATE] = rng.choice(["2024-01-01", "2099-01-01", ""])
+        values[COL.PAYMENT_AMOUNT] = rng.choice(["2", "3", "1000", ""])
+        values[COL.COLLECTION_RANK] = rng.choice(["通常", "弁護士介入"])
+        values[COL.DEBT_AMOUNT] = rng.choice(["10000", "50000", "0", '"1,500"'])
+        values[COL.CLIENT_CD] = rng.choice(["1", "4", "7"])
+        values[COL.TEL_MOBILE] = rng.choice(["090-1111-2222", ""])
+        lines.append(",".join(values))
+    return ("\n".join(lines) + "\n").encode("cp932")
+
+
+def _measure(func):
+    """(結果, 実行時間, メモリ使用量のピーク) を返す"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(rows: int = 100_000):
+    content = generate_contract_list(rows)
+    processor = MirailAutocallUnifiedProcessor()
+    reader = processor.reader
+    full_config = processor.get_base_filter_config("contract", with_10k=False)
+    projected_config = reader.project_filter_config(full_config)
+    print(f"ContractList: {rows:,}行 × 122列（{len(content) / 1024 / 1024:.1f}MB）")
+
+    def full_read():
+        df = read_csv_bytes(content, dtype=str)
+        return FilterEngine.apply_filters_single_pass(df, full_config)[0]
+
+    def projected_read():
+        df = read_csv_bytes(content, dtype=str, usecols=reader.columns)
+        return FilterEngine.apply_filters_single_pass(df, projected_config)[0]
+
+    def chunked_read():
+        return reader.apply_chunked(
+            content, lambda chunks: FilterEngine.apply_filters_chunked(chunks, projected_config)
+        )[0]
+
+    for label, func in (
+        ("全列読み込み", full_read),
+        ("列指定読み込み", projected_read),
+        ("チャンク読み込み", chunked_read),
+    ):
+        df_filtered, elapsed, peak = _measure(func)
+        print(
+            f"  {label}: {elapsed:.3f}秒 / ピーク {peak / 1024 / 1024:.1f}MB"
+            f"（対象 {len(df_filtered):,}行 × {df_filtered.shape[1]}列）"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
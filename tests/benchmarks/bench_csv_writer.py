@@ -0,0 +1,77 @@
+"""
+CP932 CSV書き出しベンチマーク
+
+111列（登録テンプレート）・59列（SMSテンプレート）の出力で、
+従来の safe_csv_download（コピー・列名付け替え → to_csv で文字列全体 → encode）と
+to_csv_cp932（チャンク単位でエンコード）の時間とメモリ使用量のピーク（tracemalloc）を比較する。
+
+実行方法:
+    python -m tests.benchmarks.bench_csv_writer [行数]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from processors.common.csv_writer import to_csv_cp932
+from processors.sms_common import SMS_TEMPLATE_HEADERS
+
+
+def legacy_csv_bytes(df: pd.DataFrame) -> bytes:
+    """従来の safe_csv_download と同じ処理"""
+    df_copy = df.copy()
+    columns = list(df_copy.columns)
+    empty_col_counter = 1
+    for i, col in enumerate(columns):
+        if col == "":
+            columns[i] = f"_empty_col_{empty_col_counter}_"
+            empty_col_counter += 1
+    df_copy.columns = columns
+    csv_data = df_copy.to_csv(index=False, encoding='cp932', errors='replace', header=list(df.columns))
+    return csv_data.encode('cp932', errors='replace')
+
+
+def registration_frame(rows: int) -> pd.DataFrame:
+    """111列（空文字の列名を含む）"""
+    columns = [f"項目{i}" if i % 3 else "" for i in range(111)]
+    values = np.array([f"東京都千代田区{i}" for i in range(rows)], dtype=object)
+    return pd.DataFrame({i: values for i in range(111)}).set_axis(columns, axis=1)
+
+
+def sms_frame(rows: int) -> pd.DataFrame:
+    """59列のSMSテンプレート"""
+    data = {i: np.full(rows, np.nan, dtype=object) for i in range(59)}
+    data[0] = np.array([f"090-0000-{i % 10000:04d}" for i in range(rows)], dtype=object)
+    data[1] = np.full(rows, "山田太郎", dtype=object)
+    data[4] = np.full(rows, "銀行　支店　普通　1234567　名義", dtype=object)
+    return pd.DataFrame(data).set_axis(SMS_TEMPLATE_HEADERS, axis=1)
+
+
+def _measure(func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(rows: int = 50_000):
+    for label, df in (("111列", registration_frame(rows)), ("59列", sms_frame(rows * 4))):
+        print(f"{label}: {len(df):,}行")
+        legacy, legacy_time, legacy_peak = _measure(lambda: legacy_csv_bytes(df))
+        (streamed, _), streamed_time, streamed_peak = _measure(lambda: to_csv_cp932(df))
+        print(f"  従来（文字列全体→encode）: {legacy_time:.3f}秒 / ピーク {legacy_peak / 1024 / 1024:.1f}MB")
+        print(f"  to_csv_cp932:              {streamed_time:.3f}秒 / ピーク {streamed_peak / 1024 / 1024:.1f}MB")
+        print(f"  出力サイズ: {len(streamed) / 1024 / 1024:.1f}MB")
+        assert legacy == streamed
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
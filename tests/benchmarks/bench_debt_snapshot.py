@@ -0,0 +1,71 @@
+"""
+残債スナップショット ベンチマーク
+
+プラザ残債更新の前日データ取得について、
+従来の前日Excel読み込み（pd.read_excel、2列のみ）と
+残債スナップショット（SQLite、主キーのインデックスで前回分を読み込み）の時間を比較し、
+同じ会員番号・延滞額合計になることを確認する。
+スナップショットの保存時間と、前回分との差分（store.diff）の時間も表示する。
+
+実行方法:
+    python -m tests.benchmarks.bench_debt_snapshot [会員数]
+"""
+
+import io
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from processors.common.debt_snapshot import DebtSnapshotStore
+from processors.plaza_debt_update import SNAPSHOT_SOURCE, load_previous_snapshot
+
+
+def collection_report(rows: int, seed: int) -> pd.DataFrame:
+    """コールセンター回収委託情報（会員番号・延滞額合計）"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "会員番号": np.arange(1_000_000, 1_000_000 + rows).astype(str),
+        "延滞額合計": rng.integers(0, 500_000, rows),
+    })
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(rows: int = 30_000):
+    yesterday = collection_report(rows, 0)
+    today = collection_report(rows, 1)
+    buffer = io.BytesIO()
+    yesterday.to_excel(buffer, index=False)
+    yesterday_file = buffer.getvalue()
+    print(f"会員数: {rows:,}件")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DebtSnapshotStore(Path(tmp) / "snapshots.sqlite3", today=lambda: date(2025, 9, 2))
+        _, save_time = _timed(lambda: store.save(SNAPSHOT_SOURCE, date(2025, 9, 1), yesterday["会員番号"], yesterday["延滞額合計"]))
+        store.save(SNAPSHOT_SOURCE, date(2025, 9, 2), today["会員番号"], today["延滞額合計"])
+
+        legacy, legacy_time = _timed(lambda: pd.read_excel(io.BytesIO(yesterday_file), usecols=["会員番号", "延滞額合計"]))
+        (previous, _), load_time = _timed(lambda: load_previous_snapshot(store, date(2025, 9, 2)))
+        changes, diff_time = _timed(lambda: store.diff(SNAPSHOT_SOURCE, date(2025, 9, 2), date(2025, 9, 1)))
+
+    print(f"  前日Excel読み込み:         {legacy_time:.2f}秒")
+    print(f"  スナップショット読み込み:  {load_time:.2f}秒")
+    print(f"  スナップショット保存:      {save_time:.2f}秒")
+    print(f"  前回分との差分:            {diff_time:.2f}秒（{len(changes):,}件）")
+
+    legacy["会員番号"] = legacy["会員番号"].astype(str)
+    assert previous["会員番号"].tolist() == legacy["会員番号"].tolist()
+    assert previous["延滞額合計"].tolist() == legacy["延滞額合計"].astype(float).tolist()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30_000)
@@ -0,0 +1,118 @@
+"""
+共通デコーダー（text_decoder）ベンチマーク
+
+50MBのShift_JIS（CP932）CSVで、エンコーディング判定とCSV読み込みの時間を計測する。
+
+計測ケース:
+- 日本語が全体に分布するファイル（通常ケース）
+- 先頭がASCIIのみで末尾にだけ日本語があるファイル（判定の最悪ケース:
+  最初の非ASCIIバイトまで全体を走査する）
+- 判定後に全体デコードで失敗し、別の候補で読み直すファイル（デコードの最悪ケース）
+
+比較として、従来の「エンコーディングごとに pd.read_csv を試行」する読み込みと、
+chardet による判定（ファイル全体は時間がかかるため1MBで計測して換算）も表示する。
+
+実行方法:
+    python -m tests.benchmarks.bench_encoding_decoder [MB]
+"""
+
+import io
+import random
+import sys
+import time
+
+import chardet
+import pandas as pd
+
+from processors.common.text_decoder import decode_bytes, detect_encoding, read_csv_bytes
+
+
+HEADER = "管理番号,引継番号,契約者氏名,契約者カナ,物件名,滞納残債,クライアントCD\n"
+NAMES = ["山田　太郎", "佐藤　花子", "髙橋　一郎", "渡邉　美咲", "斎藤　健"]
+KANA = ["ﾔﾏﾀﾞ ﾀﾛｳ", "ｻﾄｳ ﾊﾅｺ", "ﾀｶﾊｼ ｲﾁﾛｳ", "ﾜﾀﾅﾍﾞ ﾐｻｷ", "ｻｲﾄｳ ｹﾝ"]
+PROPERTIES = ["サンハイツ①", "メゾン新宿", "グランドール～南", "コーポ大阪"]
+
+
+def _japanese_rows(size_bytes: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    number = 0
+    while total < size_bytes:
+        number += 1
+        line = (
+            f"{number:08d},T{number:07d},{rng.choice(NAMES)},{rng.choice(KANA)},"
+            f"{rng.choice(PROPERTIES)} {rng.randint(101, 999)},{rng.randint(0, 500000)},{rng.randint(1, 9)}\n"
+        )
+        lines.append(line)
+        total += len(line.encode("cp932"))
+    return "".join(lines)
+
+
+ASCII_HEADER = "kanri_no,hikitsugi_no,name,kana,property,debt,client_cd\n"
+
+
+def _ascii_rows(size_bytes: int) -> str:
+    line = "00000000,T0000000,YAMADA TARO,YAMADA TARO,SUN HEIGHTS 101,120000,1\n"
+    return line * (size_bytes // len(line))
+
+
+def generate_cases(size_mb: int) -> dict:
+    """計測用のバイトデータ（ケース名 → (バイトデータ, 候補エンコーディング)）"""
+    size_bytes = size_mb * 1024 * 1024
+    tail = _japanese_rows(2000, seed=1)
+    # 判定範囲はCP932としても読めるUTF-8（長音記号のみ）、末尾にUTF-8の漢字
+    misleading = ("ー" * 40 + "\n") * 2000
+    return {
+        "日本語が全体に分布": (
+            (HEADER + _japanese_rows(size_bytes)).encode("cp932"), None,
+        ),
+        "先頭ASCIIのみ・末尾に日本語": (
+            (ASCII_HEADER + _ascii_rows(size_bytes) + tail).encode("cp932"), None,
+        ),
+        "判定後に読み直し（cp932→utf-8）": (
+            (ASCII_HEADER + misleading + _ascii_rows(size_bytes) + tail).encode("utf-8"), ("cp932", "utf-8"),
+        ),
+    }
+
+
+def legacy_read_csv(content: bytes) -> pd.DataFrame:
+    """従来の読み込み（エンコーディングごとにファイル全体を pd.read_csv で試行）"""
+    for enc in ["utf-8", "utf-8-sig", "shift_jis", "cp932"]:
+        try:
+            return pd.read_csv(io.BytesIO(content), encoding=enc, dtype=str)
+        except Exception:
+            continue
+    raise ValueError("CSVファイルの読み込みに失敗しました")
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(size_mb: int = 50):
+    for name, (content, encodings) in generate_cases(size_mb).items():
+        options = {"encodings": encodings} if encodings else {}
+        print(f"[{name}] {len(content) / 1024 / 1024:.1f}MB")
+
+        encoding, detect_time = _timed(detect_encoding, content, **options)
+        (_, decoded_as), decode_time = _timed(decode_bytes, content, **options)
+        df, read_time = _timed(read_csv_bytes, content, dtype=str, **options)
+        print(f"  detect_encoding:  {detect_time:.3f}秒（判定: {encoding}）")
+        print(f"  decode_bytes:     {decode_time:.3f}秒（デコード: {decoded_as}）")
+        print(f"  read_csv_bytes:   {read_time:.3f}秒（{len(df):,}行）")
+
+        if encodings is None:
+            _, legacy_time = _timed(legacy_read_csv, content)
+            print(f"  従来の読み込み:   {legacy_time:.3f}秒（utf-8→utf-8-sig→shift_jis→cp932 の順に試行）")
+
+    # chardet はファイル全体だと時間がかかるため、1MBで計測して換算
+    sample = generate_cases(1)["日本語が全体に分布"][0][:1024 * 1024]
+    _, chardet_time = _timed(chardet.detect, sample)
+    print(f"chardet.detect（参考）: 1MB {chardet_time:.3f}秒 → {size_mb}MB換算 約{chardet_time * size_mb:.0f}秒")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,103 @@
+"""
+Excel複数シート読み込み ベンチマーク
+
+1. 譲渡一覧（3シート × 複数ファイル）
+   従来のシートごとの pd.read_excel（ブックをシート数だけ開き直す）と
+   read_excel_files（ブックを1回だけ開く、ワーカー1つ / 既定のワーカー数）を比較
+2. プラザのコールセンター回収委託情報（多列から5列だけ使用）
+   pd.read_excel(usecols=...) と read_first_sheet(usecols=...) を比較
+
+どちらも読み込み結果が同じになることを確認する。
+
+実行方法:
+    python -m tests.benchmarks.bench_excel_reader [1シートあたりの行数]
+"""
+
+import io
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from processors.common.excel_reader import DEFAULT_MAX_WORKERS, read_excel_files, read_first_sheet
+
+TRANSFER_SHEETS = ["譲渡許可", "譲渡－東", "譲渡－西"]
+PLAZA_COLUMNS = ["会員番号", "延滞額合計", "報告元", "解約日", "退去日"]
+
+
+def transfer_file(rows: int, seed: int) -> bytes:
+    """譲渡一覧（1行目タイトル・2行目ヘッダー、20列 × 3シート）"""
+    rng = np.random.default_rng(seed)
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for number, sheet_name in enumerate(TRANSFER_SHEETS):
+            df = pd.DataFrame({
+                "賃借人氏名": [f"賃借人{seed}-{number}-{i}" for i in range(rows)],
+                "物件名": [f"物件{i % 500}" for i in range(rows)],
+                **{f"項目{c}": rng.integers(0, 100_000, rows) for c in range(18)},
+            })
+            df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=1)
+    return buffer.getvalue()
+
+
+def collection_report(rows: int) -> bytes:
+    """コールセンター回収委託情報（40列）"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"項目{c}": rng.integers(0, 100_000, rows) for c in range(35)})
+    df.insert(3, "会員番号", np.arange(1_000_000, 1_000_000 + rows).astype(str))
+    df.insert(10, "延滞額合計", rng.integers(0, 500_000, rows))
+    df.insert(20, "報告元", np.where(rng.random(rows) < 0.5, "プラザ", "その他"))
+    df.insert(30, "解約日", "")
+    df.insert(36, "退去日", "")
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def legacy_transfer(files):
+    frames = []
+    for file_name, content in files:
+        for sheet_name in TRANSFER_SHEETS:
+            frames.append(pd.read_excel(io.BytesIO(content), sheet_name=sheet_name, dtype=str, header=1))
+    return frames
+
+
+def shared_transfer(files, max_workers):
+    books = read_excel_files(files, TRANSFER_SHEETS, max_workers=max_workers, header=1, dtype=str)
+    return [df for book in books for df in book.sheets.values()]
+
+
+def main(rows: int = 2_000, file_count: int = 3):
+    files = [(f"譲渡一覧{i}.xlsx", transfer_file(rows, i)) for i in range(file_count)]
+    print(f"譲渡一覧: {file_count}ファイル × {len(TRANSFER_SHEETS)}シート × {rows:,}行")
+
+    legacy, legacy_time = _timed(lambda: legacy_transfer(files))
+    single, single_time = _timed(lambda: shared_transfer(files, 1))
+    parallel, parallel_time = _timed(lambda: shared_transfer(files, None))
+    print(f"  シートごとの pd.read_excel:           {legacy_time:.2f}秒")
+    print(f"  read_excel_files（ワーカー1）:         {single_time:.2f}秒")
+    print(f"  read_excel_files（ワーカー{DEFAULT_MAX_WORKERS}）:         {parallel_time:.2f}秒")
+    for expected, actual in zip(legacy, single):
+        pd.testing.assert_frame_equal(actual, expected)
+    for expected, actual in zip(legacy, parallel):
+        pd.testing.assert_frame_equal(actual, expected)
+
+    report_rows = rows * 5
+    report = collection_report(report_rows)
+    print(f"回収委託情報: 40列中5列 × {report_rows:,}行")
+    expected, legacy_time = _timed(lambda: pd.read_excel(io.BytesIO(report), usecols=PLAZA_COLUMNS))
+    actual, shared_time = _timed(lambda: read_first_sheet(report, usecols=PLAZA_COLUMNS))
+    print(f"  pd.read_excel(usecols):               {legacy_time:.2f}秒")
+    print(f"  read_first_sheet(usecols):            {shared_time:.2f}秒")
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,97 @@
+"""
+Excel書き出しベンチマーク
+
+訪問リスト（5シート・23列）の出力で、
+従来の generate_excel（pd.ExcelWriter → 全セルを走査してフォント・罫線・数値書式を設定）と
+to_excel_bytes（書き込み専用モード、列単位のスタイル）の時間とメモリ使用量のピーク（tracemalloc）を比較する。
+
+実行方法:
+    python -m tests.benchmarks.bench_excel_writer [1シートの行数]
+"""
+
+import io
+import math
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from openpyxl.styles import Border, Font
+
+from processors.visit_list.processor import VisitListConfig, generate_excel
+
+
+def legacy_generate_excel(df_dict) -> bytes:
+    """従来の generate_excel と同じ処理"""
+    excel_buffer = io.BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+        for person_type, config in VisitListConfig.PERSON_TYPES.items():
+            df_dict[person_type].to_excel(writer, sheet_name=config["sheet_name"], index=False)
+
+        font = Font(name='游ゴシック Regular', size=11)
+        for ws in writer.book.worksheets:
+            for row in ws.iter_rows():
+                for cell in row:
+                    cell.font = font
+                    cell.border = Border()
+
+            headers = [cell.value for cell in ws[1]]
+            formats = {
+                idx: VisitListConfig.EXCEL_NUMBER_FORMATS[header]
+                for idx, header in enumerate(headers)
+                if header in VisitListConfig.EXCEL_NUMBER_FORMATS
+            }
+            for row in ws.iter_rows(min_row=2):
+                for idx, number_format in formats.items():
+                    cell = row[idx]
+                    if isinstance(cell.value, (int, float)):
+                        if math.isnan(cell.value):
+                            cell.value = ''
+                        else:
+                            cell.number_format = number_format
+    return excel_buffer.getvalue()
+
+
+def person_frame(rows: int, name_col: str) -> pd.DataFrame:
+    """訪問リストの出力形式（23列）"""
+    rng = np.random.default_rng(0)
+    balance = rng.integers(1, 500_000, rows).astype(float)
+    rent = rng.integers(30_000, 150_000, rows).astype(float)
+    text = np.array([f"東京都千代田区{i}" for i in range(rows)], dtype=object)
+    return pd.DataFrame({
+        "管理番号": np.arange(rows), "最新契約種類": "賃貸", "受託状況": "契約中", "入居ステータス": "入居中",
+        "滞納ステータス": "滞納", "退去手続き（実費）": np.nan, "営業担当者": "担当", name_col: "山田太郎",
+        "": text, "現住所1": "東京都", "現住所2": text, "現住所3": np.nan, "滞納残債": balance,
+        "入金予定日": "2025/06/30", "入金予定金額": np.nan, "滞納月数": (balance / rent).round(1),
+        "月額賃料合計": rent, "回収ランク": "通常", "クライアントCD": 1234, "クライアント名": "クライアント",
+        "委託先法人ID": 5, "委託先法人名": "委託先", "解約日": np.nan,
+    })
+
+
+def _measure(func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(rows: int = 30_000):
+    df_dict = {
+        person_type: person_frame(rows, config["output_name_col"])
+        for person_type, config in VisitListConfig.PERSON_TYPES.items()
+    }
+    print(f"5シート × {rows:,}行")
+    legacy_time, legacy_peak = _measure(lambda: legacy_generate_excel(df_dict))
+    streamed_time, streamed_peak = _measure(lambda: generate_excel(df_dict, "bench.xlsx"))
+    print(f"  従来（ExcelWriter→全セル走査）: {legacy_time:.2f}秒 / ピーク {legacy_peak / 1024 / 1024:.1f}MB")
+    print(f"  書き込み専用モード:             {streamed_time:.2f}秒 / ピーク {streamed_peak / 1024 / 1024:.1f}MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30_000)
@@ -0,0 +1,67 @@
+"""
+ガレージバンク残債取り込み 突合ベンチマーク
+
+従来の match_data（引継番号の辞書 + 請求データの iterrows、マッチなしは1件1行のログ）と
+現在の match_data（ID表記を統一して左結合）の時間を比較し、マッチ結果が同じことを確認する。
+
+実行方法:
+    python -m tests.benchmarks.bench_gb_zansai [請求データ件数]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from processors.gb_zansai import match_data
+
+
+def legacy_match_data(seikyu_df: pd.DataFrame, contract_df: pd.DataFrame):
+    """従来の match_data と同じ処理"""
+    hikitsugi_to_kanri = dict(zip(contract_df["引継番号"].astype(str), contract_df["管理番号"]))
+    results = []
+    logs = []
+    for _, row in seikyu_df.iterrows():
+        user_id_str = str(row["ユーザーID"])
+        if user_id_str in hikitsugi_to_kanri:
+            results.append({"管理番号": hikitsugi_to_kanri[user_id_str], "管理前滞納額": row["請求総額"]})
+        else:
+            logs.append(f"⚠️ マッチしませんでした: ユーザーID {user_id_str}")
+    return pd.DataFrame(results), logs
+
+
+def input_frames(rows: int):
+    """請求データ（ユーザーIDは整数）と ContractList（約9割がマッチ）"""
+    rng = np.random.default_rng(0)
+    user_ids = rng.permutation(np.arange(100_000, 100_000 + rows))
+    seikyu_df = pd.DataFrame({"ユーザーID": user_ids, "請求総額": rng.integers(1_000, 500_000, rows)})
+    contract_ids = user_ids[rng.random(rows) < 0.9]
+    contract_df = pd.DataFrame({
+        "管理番号": [str(i) for i in range(len(contract_ids))],
+        "引継番号": contract_ids.astype(str),
+    })
+    return seikyu_df, contract_df
+
+
+def main(rows: int = 200_000):
+    seikyu_df, contract_df = input_frames(rows)
+    print(f"請求データ: {rows:,}件 / ContractList: {len(contract_df):,}件")
+
+    start = time.perf_counter()
+    legacy_df, legacy_logs = legacy_match_data(seikyu_df, contract_df)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
+    merge_time = time.perf_counter() - start
+
+    print(f"  従来（辞書 + iterrows）: {legacy_time:.2f}秒 / ログ {len(legacy_logs):,}行")
+    print(f"  左結合:                 {merge_time:.2f}秒 / ログ {len(logs)}行 + マッチなし {len(unmatched_df):,}件")
+
+    pd.testing.assert_frame_equal(result_df, legacy_df)
+    assert len(unmatched_df) == len(legacy_logs)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
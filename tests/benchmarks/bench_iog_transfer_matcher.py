@@ -0,0 +1,90 @@
+"""
+IOG譲渡一覧の部分一致マッチングベンチマーク
+
+完全一致しなかったJID 5,000件 × 譲渡一覧 20,000件で、merge_transfer_data の
+部分一致（第2段階）の時間を計測する。
+
+比較として、従来の「JIDの行ごとに譲渡一覧を iterrows で走査し、毎回
+normalize_name を実行する」方式の時間を表示する（全件は時間がかかるため
+先頭の数件で計測して換算）。
+
+実行方法:
+    python -m tests.benchmarks.bench_iog_transfer_matcher [JID件数] [譲渡一覧件数]
+"""
+
+import random
+import sys
+import time
+
+import pandas as pd
+
+from processors.iog_registration import merge_transfer_data, normalize_name
+
+
+SURNAMES = ["佐藤", "鈴木", "高橋", "田中", "伊藤", "渡辺", "山本", "中村", "小林", "加藤",
+            "吉田", "山田", "佐々木", "山口", "松本", "井上", "木村", "林", "斎藤", "清水"]
+GIVEN_NAMES = ["太郎", "花子", "一郎", "美咲", "健", "絵理", "美生", "大輔", "陽子", "翔太",
+               "由美", "誠", "直樹", "恵", "拓也", "彩", "浩", "愛", "亮", "舞"]
+
+LEGACY_SAMPLE = 5
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + "　" + rng.choice(GIVEN_NAMES) + rng.choice(["", "子", "美", "介"])
+
+
+def generate_data(jid_count: int, transfer_count: int, seed: int = 0):
+    """
+    JID（完全一致しない氏名）と譲渡一覧を作成
+
+    JIDの半数は旧姓・通称を含む連結氏名（末尾の氏名が譲渡一覧にある）、
+    残りは譲渡一覧にない氏名。
+    """
+    rng = random.Random(seed)
+    transfer_names = [f"{_name(rng)}{i}" for i in range(transfer_count)]
+    transfer_df = pd.DataFrame({
+        "賃借人氏名": transfer_names,
+        "物件名": [f"物件{i}" for i in range(transfer_count)],
+        "部屋番号": [str(100 + i % 900) for i in range(transfer_count)],
+        "_source_info": ["譲渡一覧.xlsx - 譲渡許可"] * transfer_count,
+    })
+
+    jid_names = []
+    for i in range(jid_count):
+        if i % 2 == 0:
+            jid_names.append(_name(rng) + "通称" + rng.choice(transfer_names))
+        else:
+            jid_names.append(_name(rng) + _name(rng))
+    jid_df = pd.DataFrame({"対象者名": jid_names})
+    return jid_df, transfer_df
+
+
+def legacy_find_matching_transfer(iog_name: str, transfer_df: pd.DataFrame):
+    """従来の部分一致（譲渡一覧を行ごとに走査し、毎回正規化）"""
+    iog_normalized = normalize_name(iog_name)
+    for _, row in transfer_df.iterrows():
+        transfer_name = normalize_name(row.get("賃借人氏名", ""))
+        if len(transfer_name) >= 3 and transfer_name in iog_normalized:
+            return row
+    return None
+
+
+def main(jid_count: int = 5_000, transfer_count: int = 20_000):
+    jid_df, transfer_df = generate_data(jid_count, transfer_count)
+    print(f"JID: {jid_count:,}件 × 譲渡一覧: {transfer_count:,}件")
+
+    start = time.perf_counter()
+    merged_df, _, match_stats = merge_transfer_data(jid_df, transfer_df)
+    elapsed = time.perf_counter() - start
+    print(f"  merge_transfer_data: {elapsed:.3f}秒（完全一致 {match_stats['exact']}件 / 部分一致 {match_stats['partial']:,}件）")
+
+    start = time.perf_counter()
+    for iog_name in jid_df["対象者名"].head(LEGACY_SAMPLE):
+        legacy_find_matching_transfer(iog_name, transfer_df)
+    per_row = (time.perf_counter() - start) / LEGACY_SAMPLE
+    print(f"  従来の部分一致: 1件 {per_row:.3f}秒 → {jid_count:,}件換算 約{per_row * jid_count:,.0f}秒")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
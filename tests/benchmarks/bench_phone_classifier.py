@@ -0,0 +1,78 @@
+"""
+SMS送信先電話番号の分類ベンチマーク
+
+電話番号 500,000件で、classify_phones（列全体を1回で分類）と従来の
+「行ごとに re.match を実行し、フィルタ用と除外詳細用に2回 apply する」
+方式の時間を比較する。
+
+実行方法:
+    python -m tests.benchmarks.bench_phone_classifier [件数]
+"""
+
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+from processors.common.detailed_logger import DetailedLogger
+from processors.sms_common.phone_classifier import MOBILE_PHONE_PATTERN, classify_phones
+
+
+def generate_phones(count: int, seed: int = 0) -> pd.Series:
+    """携帯・固定電話・空白・形式不正が混在した電話番号"""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.6:
+            values.append(f"{rng.choice(['090', '080', '070'])}-{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}")
+        elif kind < 0.8:
+            values.append(f"03-{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}")
+        elif kind < 0.9:
+            values.append(rng.choice(["", "nan", " "]))
+        else:
+            values.append(f"090{rng.randint(0, 99999999):08d}")
+    return pd.Series(values)
+
+
+def legacy_filter(df: pd.DataFrame):
+    """従来のフィルタ（行ごとの re.match を2回 apply）"""
+    def is_mobile_phone(phone):
+        if pd.isna(phone) or str(phone).strip() == "":
+            return False
+        return bool(re.match(MOBILE_PHONE_PATTERN, str(phone).strip()))
+
+    column = df.iloc[:, 0]
+    excluded_df = df[~column.apply(is_mobile_phone)]
+    filtered = df[column.apply(is_mobile_phone)]
+    detail = DetailedLogger.log_exclusion_details(excluded_df, 0, "TEL携帯", "phone")
+    return filtered, detail
+
+
+def vectorized_filter(df: pd.DataFrame):
+    """classify_phones による1回の分類"""
+    phones = classify_phones(df.iloc[:, 0])
+    return df[phones.is_mobile], phones.exclusion_log("TEL携帯")
+
+
+def main(count: int = 500_000):
+    df = generate_phones(count).to_frame("TEL携帯")
+    print(f"電話番号: {count:,}件")
+
+    results = []
+    for label, func in (("従来（apply×2）", legacy_filter), ("classify_phones", vectorized_filter)):
+        start = time.perf_counter()
+        filtered, detail = func(df)
+        elapsed = time.perf_counter() - start
+        results.append((filtered, detail))
+        print(f"  {label}: {elapsed:.3f}秒（対象 {len(filtered):,}件）")
+        print(f"    {detail}")
+
+    pd.testing.assert_frame_equal(results[0][0], results[1][0])
+    assert results[0][1] == results[1][1]
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,470 @@
+"""
+プロセッサ別ベンチマーク（ベースライン保存・劣化検出）
+
+services/ の再エクスポート（新規登録・残債更新・オートコール・SMS）と
+訪問リスト・居住訪問調査報告書・催告書の各処理を、合成データ
+（tests/utils/synthetic_data.py）の ContractList 1千・1万・10万行で実行し、
+処理ごとに次の値を JSON に記録する。
+
+- seconds: 処理時間（--repeat 回の最小値）
+- rows_per_sec: 入力行数（ContractList + クライアント入力）/ 処理時間
+- peak_rss_mb: 処理中のプロセスの RSS の最大値（processors/common/metrics.py の RssSampler で計測、読み取れない環境では null）
+- tracemalloc_peak_mb: 処理中に確保したメモリのピーク（tracemalloc、--no-tracemalloc で省略）
+- output_rows: 出力件数（先頭の DataFrame の行数）
+
+入力データは件数ごとに1回だけ作成し、処理時間には含めない。
+各処理の前に読み込み結果キャッシュを空にするため、どの処理も CSV の読み込みから計測する。
+
+compare は保存済みのベースラインと比べ、処理時間または tracemalloc のピークが
+threshold（既定 25%）を超えて増えた処理を表示して終了コード 1 で終わる。
+（時間の差が --min-seconds 未満、メモリの差が --min-mb 未満の場合は誤差として扱う）
+ベースラインは計測した環境の値なので、同じ環境で記録したもの同士を比べる。
+
+実行方法:
+    # ベースラインを記録（tests/benchmarks/baselines/processors.json）
+    python -m tests.benchmarks.bench_processors record [--sizes 1000,10000,100000] [--only "sms_*"]
+
+    # ベースラインと比較（計測結果を保存する場合は --output）
+    python -m tests.benchmarks.bench_processors compare [--threshold 0.25] [--output current.json]
+
+    # 保存済みの計測結果同士を比較
+    python -m tests.benchmarks.bench_processors compare --current current.json
+"""
+
+import argparse
+import fnmatch
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import date, datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from components.file_utils import read_csv_with_encoding
+from processors.common.metrics import RssSampler
+from processors.common.parsed_frame_cache import get_parsed_frame_cache
+from processors.faith_notification import process_faith_notification
+from processors.gb_notification import process_gb_notification
+from processors.mirail_notification import process_mirail_notification
+from processors.plaza_debt_update import process_plaza_debt_update
+from processors.residence_survey.billing_processor import process_residence_survey_billing
+from processors.visit_list.processor import process_visit_list
+from services import autocall, debt_update, registration, sms
+from tests.utils.synthetic_data import SyntheticDataset, to_csv_bytes, to_excel_bytes
+
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines" / "processors.json"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_THRESHOLD = 0.25
+
+# RSS を読み取る間隔（秒）
+RSS_SAMPLE_INTERVAL = 0.01
+
+
+class BenchInputs:
+    """1つの件数の入力データ（初回参照時に作成し、処理間で共有）"""
+
+    def __init__(self, rows: int, seed: int = 0):
+        self.rows = rows
+        self.today = date.today()
+        self.dataset = SyntheticDataset(rows, seed=seed, today=self.today)
+
+    @cached_property
+    def contract_list(self) -> bytes:
+        return to_csv_bytes(self.dataset.contract_list())
+
+    @cached_property
+    def contract_frame(self) -> pd.DataFrame:
+        """画面と同じく read_csv_with_encoding で読み込んだ ContractList"""
+        return read_csv_with_encoding(self.contract_list, low_memory=False)
+
+    @cached_property
+    def contract_frame_without_header(self) -> pd.DataFrame:
+        """ガレージバンク催告書の画面と同じく header=None で読み込み、ヘッダー行を除いた ContractList"""
+        df = read_csv_with_encoding(self.contract_list, header=None)
+        return df.iloc[1:].reset_index(drop=True)
+
+    def csv(self, name: str) -> Tuple[bytes, int]:
+        """SyntheticDataset のメソッド名 → (CSV, 行数)"""
+        df = getattr(self.dataset, name)()
+        return to_csv_bytes(df), len(df)
+
+
+class BenchCase:
+    """
+    計測する処理
+
+    Args:
+        name: 処理名（ベースラインのキー）
+        prepare: 入力データ → (処理の引数, 入力行数)
+        run: 処理の引数 → 処理結果
+    """
+
+    def __init__(self, name: str, prepare: Callable[[BenchInputs], Tuple[tuple, int]], run: Callable[..., Any]):
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+
+
+def _contract_only(inputs: BenchInputs) -> Tuple[tuple, int]:
+    return (inputs.contract_list,), inputs.rows
+
+
+def _contract_with_deadline(inputs: BenchInputs) -> Tuple[tuple, int]:
+    return (inputs.contract_list, inputs.today), inputs.rows
+
+
+def _with_report(name: str) -> Callable[[BenchInputs], Tuple[tuple, int]]:
+    """(クライアント入力CSV, ContractList) を引数にする処理"""
+    def prepare(inputs: BenchInputs) -> Tuple[tuple, int]:
+        report, rows = inputs.csv(name)
+        return (report, inputs.contract_list), rows + inputs.rows
+    return prepare
+
+
+def _iog(inputs: BenchInputs) -> Tuple[tuple, int]:
+    jid = inputs.dataset.iog_jid()
+    transfer = inputs.dataset.iog_transfer()
+    rows = len(jid) + sum(len(sheet) for sheet in transfer.values())
+    return (to_excel_bytes(jid), [("譲渡一覧.xlsx", to_excel_bytes(transfer, title_row=True))]), rows
+
+
+def _plaza_debt(inputs: BenchInputs) -> Tuple[tuple, int]:
+    yesterday = inputs.dataset.plaza_collection_report(days_ago=1)
+    today = inputs.dataset.plaza_collection_report()
+    plaza_list, list_rows = inputs.csv("plaza_list")
+    args = (to_excel_bytes(yesterday), to_excel_bytes(today), plaza_list, inputs.today)
+    return args, len(yesterday) + len(today) + list_rows
+
+
+def _plaza_sms(inputs: BenchInputs) -> Tuple[tuple, int]:
+    callcenter, rows = inputs.csv("plaza_report")
+    return (inputs.contract_list, callcenter, inputs.today), rows + inputs.rows
+
+
+def _contract_frame(inputs: BenchInputs) -> Tuple[tuple, int]:
+    return (inputs.contract_frame,), inputs.rows
+
+
+def _gb_notification(inputs: BenchInputs) -> Tuple[tuple, int]:
+    billing = inputs.dataset.gb_billing()
+    return (inputs.contract_frame_without_header, billing), inputs.rows + len(billing)
+
+
+def _residence_survey(inputs: BenchInputs) -> Tuple[tuple, int]:
+    content, rows = inputs.csv("residence_survey")
+    return (read_csv_with_encoding(content),), rows
+
+
+def _cases() -> List[BenchCase]:
+    cases = [
+        # 新規登録（services/registration.py）
+        BenchCase("registration.ark", _with_report("ark_report"), registration.process_ark_data),
+        BenchCase("registration.arktrust", _with_report("ark_report"), registration.process_arktrust_data),
+        BenchCase("registration.capco", _with_report("capco_report"), registration.process_capco_data),
+        BenchCase("registration.plaza", _with_report("plaza_report"), registration.process_plaza_data),
+        BenchCase("registration.iog", _iog, registration.process_jid_data),
+        BenchCase("registration.nap", _with_report("nap_report"), registration.process_nap_data),
+        # 残債更新（services/debt_update.py とプラザ）
+        BenchCase("debt_update.capco", _with_report("capco_arrear"), debt_update.process_capco_debt_update),
+        BenchCase("debt_update.ark_late_payment", _with_report("ark_report"), debt_update.process_ark_late_payment_data),
+        BenchCase("debt_update.plaza", _plaza_debt, process_plaza_debt_update),
+    ]
+    # オートコール（services/autocall.py）
+    for name in autocall.__all__:
+        if name != "process_mirail_autocall_batch_data":
+            cases.append(BenchCase(f"autocall.{_short_name(name)}", _contract_only, getattr(autocall, name)))
+    cases.append(BenchCase("autocall.mirail_autocall_batch", _contract_only, autocall.process_mirail_autocall_batch_data))
+    # SMS（services/sms.py）
+    for name in sms.__all__:
+        if name in ("process_plaza_sms_contract_data", "process_sms_batch_data", "write_sms_batch_zip"):
+            continue
+        cases.append(BenchCase(f"sms.{_short_name(name)}", _contract_with_deadline, getattr(sms, name)))
+    cases += [
+        BenchCase("sms.plaza_sms_contract", _plaza_sms, sms.process_plaza_sms_contract_data),
+        BenchCase("sms.sms_batch", _contract_with_deadline, sms.process_sms_batch_data),
+        # 訪問リスト・請求・催告書
+        BenchCase("visit_list", _contract_frame, process_visit_list),
+        BenchCase("residence_survey_billing", _residence_survey, process_residence_survey_billing),
+        BenchCase("notification.faith", _contract_frame, lambda df: process_faith_notification(df, "contractor")),
+        BenchCase("notification.mirail", _contract_only, lambda content: process_mirail_notification(content, "contractor", "included")),
+        BenchCase("notification.gb", _gb_notification, process_gb_notification),
+    ]
+    return cases
+
+
+def _short_name(function_name: str) -> str:
+    """process_faith_contract_data → faith_contract"""
+    return function_name.removeprefix("process_").removesuffix("_data")
+
+
+# ========== 計測 ==========
+
+def _output_rows(result: Any) -> Optional[int]:
+    """処理結果の先頭の DataFrame（または辞書・リストの件数）"""
+    first = result[0] if isinstance(result, tuple) and result else result
+    if isinstance(first, pd.DataFrame):
+        return len(first)
+    if isinstance(first, (dict, list)):
+        return len(first)
+    return None
+
+
+def _run_once(case: BenchCase, args: tuple) -> Tuple[Any, float]:
+    get_parsed_frame_cache().clear()
+    gc.collect()
+    start = time.perf_counter()
+    result = case.run(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(case: BenchCase, inputs: BenchInputs, repeat: int = 1, trace: bool = True) -> Dict[str, Any]:
+    """1つの処理を計測"""
+    try:
+        args, input_rows = case.prepare(inputs)
+        seconds = []
+        peak_rss = None
+        for _ in range(repeat):
+            with RssSampler(RSS_SAMPLE_INTERVAL) as sampler:
+                result, elapsed = _run_once(case, args)
+            seconds.append(elapsed)
+            if sampler.peak is not None:
+                peak_rss = max(peak_rss or 0, sampler.peak)
+        output_rows = _output_rows(result)
+        del result
+
+        tracemalloc_peak = None
+        if trace:
+            tracemalloc.start()
+            try:
+                _run_once(case, args)
+                _, tracemalloc_peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    best = min(seconds)
+    return {
+        "seconds": round(best, 4),
+        "rows_per_sec": round(input_rows / best, 1) if best > 0 else None,
+        "input_rows": input_rows,
+        "output_rows": output_rows,
+        "peak_rss_mb": _mb(peak_rss),
+        "tracemalloc_peak_mb": _mb(tracemalloc_peak),
+    }
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return round(value / 1024 / 1024, 1) if value is not None else None
+
+
+def run_suite(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    only: Optional[Sequence[str]] = None,
+    repeat: int = 1,
+    trace: bool = True,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    全処理を計測
+
+    Args:
+        sizes: ContractList の行数
+        only: 計測する処理名のパターン（fnmatch、None の場合は全処理）
+
+    Returns:
+        {"environment": {...}, "results": {処理名: {行数: 計測値}}}
+    """
+    cases = [case for case in _cases() if not only or any(fnmatch.fnmatch(case.name, p) for p in only)]
+    results: Dict[str, Dict[str, Any]] = {case.name: {} for case in cases}
+    # 処理ごとのログ・警告で計測結果が読みにくくなるため表示しない
+    logging.disable(logging.INFO)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for size in sizes:
+                print(f"ContractList {size:,}行: 入力データ作成中...", flush=True)
+                inputs = BenchInputs(size, seed=seed)
+                for case in cases:
+                    values = measure(case, inputs, repeat=repeat, trace=trace)
+                    results[case.name][str(size)] = values
+                    print(f"  {case.name:<50} {_format_values(values)}", flush=True)
+                del inputs
+                gc.collect()
+    finally:
+        logging.disable(logging.NOTSET)
+    return {"environment": _environment(sizes, repeat, trace, seed), "results": results}
+
+
+def _format_values(values: Dict[str, Any]) -> str:
+    if "error" in values:
+        return f"エラー: {values['error']}"
+    text = f"{values['seconds']:8.3f}秒 {values['rows_per_sec'] or 0:>12,.0f}行/秒"
+    if values["peak_rss_mb"] is not None:
+        text += f"  RSS {values['peak_rss_mb']:>8,.1f}MB"
+    if values["tracemalloc_peak_mb"] is not None:
+        text += f"  確保 {values['tracemalloc_peak_mb']:>8,.1f}MB"
+    return text
+
+
+def _environment(sizes: Sequence[int], repeat: int, trace: bool, seed: int) -> Dict[str, Any]:
+    return {
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "sizes": list(sizes),
+        "repeat": repeat,
+        "tracemalloc": trace,
+        "seed": seed,
+    }
+
+
+# ========== 比較 ==========
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = 0.05,
+    min_mb: float = 1.0,
+) -> List[Dict[str, Any]]:
+    """
+    ベースラインと比べて劣化した処理
+
+    処理時間・tracemalloc のピークが threshold の割合を超えて増えた場合
+    （かつ増加量が min_seconds / min_mb 以上の場合）と、
+    ベースラインでは成功した処理がエラーになった場合を劣化とする。
+    ベースラインにない処理・件数は比較しない。
+
+    Returns:
+        [{"name", "size", "metric", "baseline", "current", "ratio"}, ...]
+    """
+    regressions = []
+    for name, sizes in current["results"].items():
+        for size, values in sizes.items():
+            base = baseline["results"].get(name, {}).get(size)
+            if base is None or "error" in base:
+                continue
+            if "error" in values:
+                regressions.append({
+                    "name": name, "size": size, "metric": "error",
+                    "baseline": None, "current": values["error"], "ratio": None,
+                })
+                continue
+            for metric, minimum in (("seconds", min_seconds), ("tracemalloc_peak_mb", min_mb)):
+                before, after = base.get(metric), values.get(metric)
+                if not before or after is None:
+                    continue
+                if after > before * (1 + threshold) and after - before >= minimum:
+                    regressions.append({
+                        "name": name, "size": size, "metric": metric,
+                        "baseline": before, "current": after, "ratio": after / before,
+                    })
+    return regressions
+
+
+def print_comparison(baseline: Dict[str, Any], current: Dict[str, Any], regressions: List[Dict[str, Any]]) -> None:
+    flagged = {(r["name"], r["size"]) for r in regressions}
+    print(f"{'処理':<50} {'行数':>8} {'基準(秒)':>10} {'今回(秒)':>10} {'比':>7}")
+    for name, sizes in current["results"].items():
+        for size, values in sizes.items():
+            base = baseline["results"].get(name, {}).get(size)
+            if base is None or "seconds" not in base or "seconds" not in values:
+                continue
+            mark = "  ← 劣化" if (name, size) in flagged else ""
+            ratio = values["seconds"] / base["seconds"] if base["seconds"] else float("nan")
+            print(f"{name:<50} {int(size):>8,} {base['seconds']:>10.3f} {values['seconds']:>10.3f} {ratio:>6.2f}x{mark}")
+
+    for key in ("platform", "cpu_count", "python", "pandas"):
+        if baseline["environment"].get(key) != current["environment"].get(key):
+            print(f"注意: ベースラインと計測環境の {key} が異なります"
+                  f"（{baseline['environment'].get(key)} → {current['environment'].get(key)}）")
+
+    if not regressions:
+        print("劣化なし")
+        return
+    print(f"劣化: {len(regressions)}件")
+    for r in regressions:
+        if r["metric"] == "error":
+            print(f"  {r['name']}（{int(r['size']):,}行）: エラー {r['current']}")
+        else:
+            print(f"  {r['name']}（{int(r['size']):,}行）: {r['metric']} "
+                  f"{r['baseline']} → {r['current']}（{r['ratio']:.2f}倍）")
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+# ========== コマンド ==========
+
+def _parse_sizes(text: str) -> List[int]:
+    return [int(value.replace("_", "")) for value in text.split(",") if value]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="プロセッサ別ベンチマーク")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(sub):
+        sub.add_argument("--sizes", type=_parse_sizes, help="ContractListの行数（カンマ区切り）")
+        sub.add_argument("--only", action="append", help="計測する処理名のパターン（例: 'sms.*'、複数指定可）")
+        sub.add_argument("--repeat", type=int, default=1, help="計測回数（最小値を記録）")
+        sub.add_argument("--no-tracemalloc", action="store_true", help="tracemalloc による計測を省略")
+        sub.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="ベースラインのJSON")
+
+    record = subparsers.add_parser("record", help="計測してベースラインを保存")
+    add_run_options(record)
+
+    compare = subparsers.add_parser("compare", help="計測してベースラインと比較")
+    add_run_options(compare)
+    compare.add_argument("--current", type=Path, help="計測せずに保存済みの計測結果と比較")
+    compare.add_argument("--output", type=Path, help="今回の計測結果の保存先")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="劣化とみなす増加率（0.25 = 25%%）")
+    compare.add_argument("--min-seconds", type=float, default=0.05, help="劣化とみなす処理時間の最小増加量（秒）")
+    compare.add_argument("--min-mb", type=float, default=1.0, help="劣化とみなすメモリの最小増加量（MB）")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        results = run_suite(args.sizes or DEFAULT_SIZES, args.only, args.repeat, not args.no_tracemalloc)
+        save_results(results, args.baseline)
+        print(f"ベースラインを保存しました: {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        sizes = args.sizes or baseline["environment"]["sizes"]
+        current = run_suite(sizes, args.only, args.repeat, not args.no_tracemalloc, baseline["environment"]["seed"])
+        if args.output:
+            save_results(current, args.output)
+    regressions = compare_results(baseline, current, args.threshold, args.min_seconds, args.min_mb)
+    print_comparison(baseline, current, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+居住訪問調査報告書 請求データ作成ベンチマーク
+
+従来の iterrows による行単位の処理（get_target_month / determine_billing_rows / create_billing_row）と
+build_law_firm_data（列単位の処理）の時間を比較し、作成した請求データが同じことを確認する。
+Excelの書き出し時間は含まない。
+
+実行方法:
+    python -m tests.benchmarks.bench_residence_survey_billing [調査件数]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from processors.residence_survey.billing_processor import (
+    LAW_FIRM_PRIORITY,
+    TAKAHASHI_LAW_FIRM,
+    build_law_firm_data,
+    create_billing_row,
+    determine_billing_rows,
+    get_target_month,
+)
+
+
+def legacy_law_firm_data(df: pd.DataFrame, selected_month: str = None):
+    """従来の process_residence_survey_billing と同じ行単位の処理"""
+    law_firm_data = {}
+    target_month = selected_month
+    for _, row in df.iterrows():
+        if not selected_month:
+            month = get_target_month(row)
+            if not month:
+                continue
+            if target_month is None:
+                target_month = month
+
+        law_firm = row['依頼元'] if pd.notna(row['依頼元']) else '依頼元不明'
+        billing_times = determine_billing_rows(row, law_firm == TAKAHASHI_LAW_FIRM, selected_month)
+        for times in billing_times:
+            law_firm_data.setdefault(law_firm, []).append(create_billing_row(row, times))
+    return {law_firm: pd.DataFrame(rows) for law_firm, rows in law_firm_data.items()}, target_month
+
+
+def survey_frame(rows: int) -> pd.DataFrame:
+    """居住訪問調査報告書のCSV（提出日は2025年8〜10月、約3割が空欄）"""
+    rng = np.random.default_rng(0)
+    dates = np.array(
+        [f"2025-{month:02d}-{day:02d}" for month in (8, 9, 10) for day in range(1, 29)] + [None] * 36,
+        dtype=object,
+    )
+    prefectures = np.array(['東京都', '北海道', '大阪府', '沖縄県', '神奈川県'], dtype=object)
+    return pd.DataFrame({
+        'レコード番号': np.arange(rows),
+        '依頼元': rng.choice(np.array(LAW_FIRM_PRIORITY + ['その他法律事務所'], dtype=object), rows),
+        '会員番号': rng.integers(100000, 999999, rows),
+        '居住者名': '山田太郎',
+        '住所': rng.choice(prefectures, rows) + '千代田区1-1',
+        '調査日時【１回目】': np.nan,
+        '調査日時【２回目】': np.nan,
+        '調査日時【３回目】': np.nan,
+        '1回目提出日': rng.choice(dates, rows),
+        '2回目提出日': rng.choice(dates, rows),
+        '3回目提出日': rng.choice(dates, rows),
+        '請求事項': '',
+    })
+
+
+def main(rows: int = 50_000):
+    df = survey_frame(rows)
+    print(f"調査件数: {rows:,}件")
+    for selected_month in ('202510', None):
+        start = time.perf_counter()
+        legacy, legacy_month = legacy_law_firm_data(df, selected_month)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        law_firm_data, target_month, processed_count, _ = build_law_firm_data(df, selected_month)
+        columnar_time = time.perf_counter() - start
+
+        print(f"  提出月={selected_month or '提出日ベース'}（請求行 {processed_count:,}行）")
+        print(f"    従来（iterrows）: {legacy_time:.2f}秒")
+        print(f"    列単位:           {columnar_time:.2f}秒")
+
+        assert target_month == legacy_month
+        assert list(law_firm_data) == list(legacy)
+        for law_firm, df_billing in law_firm_data.items():
+            pd.testing.assert_frame_equal(df_billing.astype(object), legacy[law_firm].astype(object))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
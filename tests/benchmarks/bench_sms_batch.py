@@ -0,0 +1,133 @@
+"""
+SMS一括処理ベンチマーク
+
+120列のContractListで、SMS一括処理の対象12種類（ミライル8・フェイス3・
+ガレージバンク1）を作成する時間を比較する。
+
+計測ケース:
+- 個別処理: 個別画面と同じく、プロセッサ関数を12回呼び出す
+  （読み込みはキャッシュされるが、呼び出しごとにDataFrameをコピーする）
+- 一括処理（1スレッド）: 1回の読み込み結果を共有して順に処理
+- 一括処理（4スレッド）: 同上をワーカースレッドで並列に処理
+
+各ケースの前に読み込みキャッシュを空にする。
+
+実行方法:
+    python -m tests.benchmarks.bench_sms_batch [行数]
+"""
+
+import random
+import sys
+import time
+from datetime import date
+
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.common.parsed_frame_cache import get_parsed_frame_cache
+from processors.faith_sms.contract import process_faith_sms_contract_data
+from processors.faith_sms.emergency_contact import process_faith_sms_emergencycontact_data
+from processors.faith_sms.guarantor import process_faith_sms_guarantor_data
+from processors.gb_sms.contract import process_gb_sms_contract_data
+from processors.mirail_sms.contract import process_mirail_sms_contract_data
+from processors.mirail_sms.contract_today import process_mirail_sms_contract_today_data
+from processors.mirail_sms.contract_today_blank import process_mirail_sms_contract_today_blank_data
+from processors.mirail_sms.emergency_contact import process_mirail_sms_emergencycontact_data
+from processors.mirail_sms.guarantor import process_mirail_sms_guarantor_data
+from processors.sms_batch import process_sms_batch_data
+
+# ContractListの列名（列番号で参照する列も、フェイス・ガレージバンクは列名で参照する）
+NAMED_COLUMNS = {
+    COL.MANAGEMENT_NO: '管理番号',
+    COL.PROPERTY_NO: '物件番号',
+    COL.CONTRACT_NAME: '契約者氏名',
+    COL.TEL_MOBILE: 'TEL携帯',
+    COL.TEL_MOBILE_1: 'TEL携帯.1',
+    COL.EMERGENCY_CONTACT_NAME: '緊急連絡人１氏名',
+    COL.TEL_MOBILE_2: '緊急連絡人１のTEL（携帯）',
+    COL.DEBT_AMOUNT: '滞納残債',
+    COL.PAYMENT_DATE: '入金予定日',
+    COL.PAYMENT_AMOUNT: '入金予定金額',
+    COL.COLLECTION_RANK: '回収ランク',
+    COL.CLIENT_CD: 'クライアントCD',
+    COL.TRUSTEE_ID: '委託先法人ID',
+    100: '物件名',
+    101: '保証人１氏名',
+    102: '回収口座銀行名',
+    103: '回収口座支店名',
+    104: '回収口座種類',
+    105: '回収口座番号',
+    106: '回収口座名義人',
+}
+
+
+def generate_contract_list(rows: int, seed: int = 0) -> bytes:
+    """120列のContractList（CP932）"""
+    rng = random.Random(seed)
+    today = date.today().strftime('%Y/%m/%d')
+
+    def phone():
+        return rng.choice(["090-1111-2222", "080-3333-4444", "03-1234-5678", ""])
+
+    header = ",".join(NAMED_COLUMNS.get(i, f"列{i}") for i in range(120))
+    base = ["サンプル値"] * 120
+    lines = [header]
+    for number in range(rows):
+        values = list(base)
+        values[COL.MANAGEMENT_NO] = f"{number:08d}"
+        values[COL.PROPERTY_NO] = str(rng.randint(101, 999))
+        values[COL.CONTRACT_NAME] = "山田太郎"
+        values[COL.TEL_MOBILE] = phone()
+        values[COL.TEL_MOBILE_1] = phone()
+        values[COL.TEL_MOBILE_2] = phone()
+        values[COL.DEBT_AMOUNT] = rng.choice(["10000", "50000", "0", '"1,500"'])
+        values[COL.PAYMENT_DATE] = rng.choice(["2024/01/01", today, "2099/01/01", ""])
+        values[COL.PAYMENT_AMOUNT] = rng.choice(["2", "13", "1000", ""])
+        values[COL.COLLECTION_RANK] = rng.choice(["通常", "通常", "弁護士介入"])
+        values[COL.CLIENT_CD] = rng.choice(["1", "10", "7"])
+        values[COL.TRUSTEE_ID] = rng.choice(["", "5", "1", "7"])
+        values[105] = '="1234567"'
+        lines.append(",".join(values))
+    return ("\n".join(lines) + "\n").encode("cp932")
+
+
+def individual(content: bytes, deadline: date):
+    """個別画面と同じくプロセッサ関数を12回呼び出す"""
+    return [
+        process_mirail_sms_contract_data(content, deadline, 'id5'),
+        process_mirail_sms_contract_data(content, deadline, 'blank'),
+        process_mirail_sms_guarantor_data(content, deadline, 'id5'),
+        process_mirail_sms_guarantor_data(content, deadline, 'blank'),
+        process_mirail_sms_emergencycontact_data(content, deadline, 'id5'),
+        process_mirail_sms_emergencycontact_data(content, deadline, 'blank'),
+        process_mirail_sms_contract_today_data(content, deadline),
+        process_mirail_sms_contract_today_blank_data(content, deadline),
+        process_faith_sms_contract_data(content, deadline),
+        process_faith_sms_guarantor_data(content, deadline),
+        process_faith_sms_emergencycontact_data(content, deadline),
+        process_gb_sms_contract_data(content, deadline),
+    ]
+
+
+def main(rows: int = 100_000):
+    content = generate_contract_list(rows)
+    deadline = date.today()
+    print(f"ContractList: {rows:,}行 × 120列（{len(content) / 1024 / 1024:.1f}MB）")
+
+    cases = (
+        ("個別処理（12回呼び出し）", lambda: individual(content, deadline)),
+        ("一括処理（1スレッド）", lambda: list(process_sms_batch_data(content, deadline, max_workers=1)[0].values())),
+        ("一括処理（4スレッド）", lambda: list(process_sms_batch_data(content, deadline, max_workers=4)[0].values())),
+    )
+    outputs = []
+    for label, func in cases:
+        get_parsed_frame_cache().clear()
+        start = time.perf_counter()
+        results = func()
+        elapsed = time.perf_counter() - start
+        outputs.append([len(result[0]) for result in results])
+        print(f"  {label}: {elapsed:.3f}秒（出力 {sum(outputs[-1]):,}件）")
+
+    assert outputs[0] == outputs[1] == outputs[2]
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
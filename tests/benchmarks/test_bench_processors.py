@@ -0,0 +1,89 @@
+"""
+プロセッサ別ベンチマーク（tests/benchmarks/bench_processors.py）のテスト
+"""
+
+import json
+
+import pytest
+
+from tests.benchmarks.bench_processors import BenchInputs, _cases, compare_results, main, measure
+
+
+def results(**cases):
+    """処理名 → {行数: 計測値} のベンチマーク結果"""
+    return {"environment": {"sizes": [1000], "seed": 0}, "results": cases}
+
+
+def values(seconds, memory=10.0):
+    return {"seconds": seconds, "tracemalloc_peak_mb": memory, "rows_per_sec": 1000 / seconds}
+
+
+class TestCompareResults:
+    """ベースラインとの比較のテスト"""
+
+    def test_flags_regressions_beyond_threshold(self):
+        baseline = results(
+            a={"1000": values(1.0)}, b={"1000": values(1.0)}, c={"1000": values(1.0, memory=100)},
+        )
+        current = results(
+            a={"1000": values(1.2)},  # 20%増は許容
+            b={"1000": values(1.5)},
+            c={"1000": values(0.5, memory=200)},
+        )
+
+        regressions = compare_results(baseline, current, threshold=0.25)
+
+        assert [(r["name"], r["metric"]) for r in regressions] == [("b", "seconds"), ("c", "tracemalloc_peak_mb")]
+        assert regressions[0]["ratio"] == pytest.approx(1.5)
+
+    def test_ignores_small_differences_and_unknown_cases(self):
+        baseline = results(a={"1000": values(0.01, memory=0.5)}, b={"1000": {"error": "ValueError"}})
+        current = results(
+            a={"1000": values(0.03, memory=1.2)},  # 3倍だが差は min_seconds / min_mb 未満
+            b={"1000": values(5.0)},  # ベースラインがエラー
+            c={"1000": values(5.0)},  # ベースラインにない処理
+        )
+
+        assert compare_results(baseline, current) == []
+
+    def test_new_error_is_regression(self):
+        baseline = results(a={"1000": values(1.0)})
+        current = results(a={"1000": {"error": "KeyError: '委託先法人ID'"}})
+
+        regressions = compare_results(baseline, current)
+
+        assert [(r["name"], r["metric"]) for r in regressions] == [("a", "error")]
+
+
+class TestSuite:
+    """計測と record / compare コマンドのテスト"""
+
+    def test_measure(self):
+        case = next(case for case in _cases() if case.name == "registration.ark")
+
+        measured = measure(case, BenchInputs(200), trace=True)
+
+        assert measured["seconds"] > 0
+        assert measured["input_rows"] == 210
+        assert measured["output_rows"] >= 0
+        assert measured["tracemalloc_peak_mb"] > 0
+
+    def test_record_and_compare(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        args = ["--sizes", "200", "--only", "sms.gb_*", "--no-tracemalloc", "--baseline", str(baseline)]
+
+        assert main(["record", *args]) == 0
+        recorded = json.loads(baseline.read_text(encoding="utf-8"))
+        assert list(recorded["results"]) == ["sms.gb_sms_contract"]
+
+        # 計測結果が10倍遅くなったことにする
+        slow = dict(recorded, results={"sms.gb_sms_contract": {"200": dict(
+            recorded["results"]["sms.gb_sms_contract"]["200"],
+            seconds=recorded["results"]["sms.gb_sms_contract"]["200"]["seconds"] * 10 + 1,
+        )}})
+        current = tmp_path / "current.json"
+        current.write_text(json.dumps(slow), encoding="utf-8")
+
+        assert main(["compare", "--baseline", str(baseline), "--current", str(current)]) == 1
+        # 再計測して比較（時間の揺れで劣化と判定されないよう threshold を大きくする）
+        assert main(["compare", *args, "--threshold", "100"]) == 0
@@ -126,6 +126,10 @@ class MockUploadedFile:
         csv_string = self._df.to_csv(index=False, encoding=self._encoding)
         self._content = csv_string.encode(self._encoding)
     
+    def getvalue(self):
+        """ファイル全体の内容（読み込み位置に関係なく）"""
+        return self._content
+    
     def read(self, size=-1):
         """ファイル内容を読み込み"""
         if size == -1:
@@ -408,3 +408,109 @@ class TestFilterEngineIntegration:
         assert list(result_df['arrears']) == [100, 200]
         # ログが生成される
         assert len(logs) > 0
+
+
+class TestFilterEngineSinglePass:
+    """単一パスモード（マスク合成）のテスト"""
+
+    @pytest.fixture
+    def contract_df(self):
+        """全種類のフィルタで除外が発生するデータ"""
+        return pd.DataFrame({
+            'trustee_id': ['', '5', '1', None, '', '', '', '', ''],
+            'payment_date': ['2020-01-01', '2099-01-01', '2020-01-01', None,
+                             '2020-01-02', '2020-01-01', '2020-01-01', '2020-01-01', None],
+            'rank': ['通常', '通常', '通常', '通常', '弁護士介入', '通常', '通常', '通常', '通常'],
+            'arrears': ['1,000', '5000', '5000', '10000', '5000', '0', '5000', '11000', '3000'],
+            'phone': ['090-1111-2222', '090-1111-2222', '090-1111-2222', '090-1111-2222',
+                      '090-1111-2222', '090-1111-2222', ' ', '090-1111-2222', '080-3333-4444'],
+            'amount': ['100', '100', '100', '100', '100', '100', '100', '100', '2'],
+            'client_cd': ['1', '1', '1', '1', '1', '1', '1', '1', '2'],
+        }, index=[10, 20, 30, 40, 50, 60, 70, 80, 90])
+
+    @pytest.fixture
+    def filter_config(self):
+        return {
+            "trustee_id": {"column": 0, "values": ["", "5"], "log_type": "id", "label": "委託先法人ID"},
+            "payment_date": {"column": 1, "type": "before_today", "label": "入金予定日", "top_n": 3},
+            "collection_rank": {"column": 2, "exclude": ["弁護士介入"], "label": "回収ランク"},
+            "arrears": {"column": 3, "min_amount": 1, "label": "滞納残債"},
+            "mobile_phone": {"column": 4, "label": "契約者電話"},
+            "payment_amount": {"column": 5, "exclude": [2, 3, 5, 12], "label": "除外金額"},
+            "special_debt": {
+                "client_cd_column": 6,
+                "debt_column": 3,
+                "conditions": {"client_cds": [1, 4], "debt_amounts": [10000, 11000]},
+                "label": "ミライル特殊残債"
+            },
+        }
+
+    def test_same_result_and_logs_as_sequential(self, contract_df, filter_config):
+        """逐次モードと同じ結果・同じログになる"""
+        expected_df, expected_logs = FilterEngine.apply_filters(contract_df, filter_config)
+
+        result_df, logs = FilterEngine.apply_filters(contract_df, filter_config, single_pass=True)
+
+        pd.testing.assert_frame_equal(result_df, expected_df)
+        assert logs == expected_logs
+        assert list(result_df.index) == [10]
+
+    def test_input_is_not_modified(self, contract_df, filter_config):
+        """入力DataFrameは変更されない"""
+        original = contract_df.copy()
+
+        FilterEngine.apply_filters(contract_df, filter_config, single_pass=True)
+
+        pd.testing.assert_frame_equal(contract_df, original)
+
+    def test_precomputed_masks_are_reused(self, contract_df, filter_config):
+        """build_masksの結果を渡すとマスクを再評価しない"""
+        mask_results = FilterEngine.build_masks(contract_df, filter_config)
+
+        result_df, logs = FilterEngine.apply_filters_single_pass(
+            contract_df, filter_config, mask_results=mask_results
+        )
+
+        assert [r["name"] for r in mask_results] == list(filter_config.keys())
+        assert list(result_df.index) == [10]
+        assert logs[-1] == "最終処理結果: 1件"
+
+    def test_stage_counts_follow_filter_order(self, contract_df, filter_config):
+        """各段階の件数は前段までの通過件数を基準にする"""
+        result_df, logs = FilterEngine.apply_filters(contract_df, filter_config, single_pass=True)
+
+        assert "委託先法人ID（,5）フィルタ後: 8件 (除外: 1件)" in logs
+        assert "入金予定日フィルタ後: 7件 (除外: 1件)" in logs
+        assert "ミライル特殊残債フィルタ後: 1件 (除外: 2件)" in logs
+
+
+class TestFilterEngineChunked:
+    """チャンク単位フィルタリングのテスト"""
+
+    contract_df = TestFilterEngineSinglePass.contract_df
+    filter_config = TestFilterEngineSinglePass.filter_config
+
+    @staticmethod
+    def _chunks(df, size):
+        return (df.iloc[start:start + size] for start in range(0, len(df), size))
+
+    @pytest.mark.parametrize("size", [1, 2, 4, 9])
+    def test_same_result_and_logs_as_single_pass(self, contract_df, filter_config, size):
+        """チャンクの大きさによらず単一パスモードと同じ結果・同じログになる"""
+        expected_df, expected_logs = FilterEngine.apply_filters_single_pass(contract_df, filter_config)
+
+        result_df, logs = FilterEngine.apply_filters_chunked(self._chunks(contract_df, size), filter_config)
+
+        pd.testing.assert_frame_equal(result_df, expected_df)
+        assert logs == expected_logs
+
+    def test_all_rows_excluded(self, contract_df, filter_config):
+        """全件除外の場合は空のDataFrameを返す"""
+        filter_config["trustee_id"]["values"] = ["存在しない値"]
+        expected_df, expected_logs = FilterEngine.apply_filters_single_pass(contract_df, filter_config)
+
+        result_df, logs = FilterEngine.apply_filters_chunked(self._chunks(contract_df, 4), filter_config)
+
+        assert len(result_df) == 0
+        assert list(result_df.columns) == list(expected_df.columns)
+        assert logs == expected_logs
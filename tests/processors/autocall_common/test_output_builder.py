@@ -0,0 +1,154 @@
+"""
+オートコール出力データ作成エンジンのテスト
+
+列単位の一括作成が、従来の iterrows + df.at による行単位作成と
+同一の出力になることを確認する（パリティテスト）
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from processors.autocall_common import AUTOCALL_OUTPUT_COLUMNS
+from processors.autocall_common.output_builder import (
+    build_autocall_output,
+    build_client_labels,
+    to_output_strings,
+)
+from processors.faith_autocall.contract.standard import create_faith_contract_output
+from processors.faith_autocall.guarantor.standard import create_faith_guarantor_output
+from processors.faith_autocall.emergency_contact.standard import create_faith_emergencycontact_output
+from processors.plaza_autocall.main.standard import create_plaza_main_output
+from processors.plaza_autocall.guarantor.standard import create_plaza_guarantor_output
+from processors.plaza_autocall.contact.standard import create_plaza_contact_output
+
+
+FAITH_MAPPING = {
+    "電話番号": "TEL携帯",
+    "架電番号": "TEL携帯",
+    "入居ステータス": "入居ステータス",
+    "滞納ステータス": "滞納ステータス",
+    "管理番号": "管理番号",
+    "契約者名（カナ）": "契約者カナ",
+    "物件名": "物件名",
+    "残債": "滞納残債",
+}
+
+
+def legacy_build_output(df_filtered, mapping_rules, faith_client=False):
+    """従来の行単位出力作成（比較用の参照実装）"""
+    df_output = pd.DataFrame(index=range(len(df_filtered)), columns=AUTOCALL_OUTPUT_COLUMNS)
+    df_output = df_output.fillna("")
+    for i, (_, row) in enumerate(df_filtered.iterrows()):
+        for output_col, input_col in mapping_rules.items():
+            if output_col in df_output.columns and input_col in row:
+                df_output.at[i, output_col] = str(row[input_col]) if pd.notna(row[input_col]) else ""
+        if faith_client:
+            if "委託先法人ID" in row and pd.notna(row["委託先法人ID"]):
+                df_output.at[i, "クライアント"] = f"フェイス{int(row['委託先法人ID'])}"
+            else:
+                df_output.at[i, "クライアント"] = ""
+    return df_output
+
+
+@pytest.fixture
+def filtered_df():
+    """フィルタ後を想定したDataFrame（数値変換済み列・欠損値を含む）"""
+    df = pd.DataFrame({
+        "管理番号": ["M001", "M002", None, "M004", "M005"],
+        "入居ステータス": ["入居中", "退去済", "入居中", np.nan, "入居中"],
+        "滞納ステータス": ["滞納", "滞納", "", "滞納", "滞納"],
+        "契約者カナ": ["ヤマダ タロウ", "サトウ ハナコ", "スズキ", "タナカ", None],
+        "物件名": ["テストマンション", "", "ハイツ", "コーポ", "荘"],
+        "クライアント名": ["A社", np.nan, "B社", "C社", "D社"],
+        "TEL携帯": ["090-1111-2222", "080-3333-4444", None, "070-5555-6666", "03-1234-5678"],
+        "TEL携帯.1": ["090-0000-0001", None, "080-0000-0002", "", "070-0000-0003"],
+        "緊急連絡人１のTEL（携帯）": [None, "090-9999-8888", "", "080-7777-6666", "070-1212-3434"],
+        "委託先法人ID": [1.0, 2.0, np.nan, 4.0, 7.0],
+        "滞納残債": [50000.0, 1234.5, 1.0, np.nan, 11000.0],
+        "入金予定日": pd.to_datetime(["2024-01-01", None, "2024-02-03", "2024-03-04", "2024-04-05"]),
+    })
+    # フィルタ後は元のインデックスが飛び飛びになる
+    df.index = [3, 10, 11, 42, 100]
+    return df
+
+
+class TestOutputBuilderParity:
+    """従来実装とのパリティテスト"""
+
+    @pytest.mark.parametrize("create_func, phone_col", [
+        (create_faith_contract_output, "TEL携帯"),
+        (create_faith_guarantor_output, "TEL携帯.1"),
+        (create_faith_emergencycontact_output, "緊急連絡人１のTEL（携帯）"),
+    ])
+    def test_faith_output_matches_legacy(self, filtered_df, create_func, phone_col):
+        """フェイス3種の出力が従来実装と一致する"""
+        mapping = dict(FAITH_MAPPING, 電話番号=phone_col, 架電番号=phone_col)
+        expected = legacy_build_output(filtered_df, mapping, faith_client=True)
+
+        result, logs = create_func(filtered_df)
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        assert list(result.columns) == AUTOCALL_OUTPUT_COLUMNS
+
+    @pytest.mark.parametrize("create_func, phone_col", [
+        (create_plaza_main_output, "TEL携帯"),
+        (create_plaza_guarantor_output, "TEL携帯.1"),
+        (create_plaza_contact_output, "緊急連絡人１のTEL（携帯）"),
+    ])
+    def test_plaza_output_matches_legacy(self, filtered_df, create_func, phone_col):
+        """プラザ3種の出力が従来実装と一致する"""
+        mapping = dict(FAITH_MAPPING, 電話番号=phone_col, 架電番号=phone_col, クライアント="クライアント名")
+        expected = legacy_build_output(filtered_df, mapping)
+
+        result, logs = create_func(filtered_df)
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_plaza_empty_input(self, filtered_df):
+        """0件の場合は空の28列DataFrameを返す"""
+        result, logs = create_plaza_main_output(filtered_df.iloc[0:0])
+
+        assert len(result) == 0
+        assert list(result.columns) == AUTOCALL_OUTPUT_COLUMNS
+        assert "0件" in logs[0]
+
+    def test_position_based_mapping(self, filtered_df):
+        """列番号指定のマッピングはilocと同じ値を使用する"""
+        mapping = {"管理番号": 0, "残債": 10}
+        expected = legacy_build_output(
+            filtered_df, {"管理番号": "管理番号", "残債": "滞納残債"}
+        )
+
+        result = build_autocall_output(filtered_df, mapping)
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+class TestOutputBuilderHelpers:
+    """補助関数のテスト"""
+
+    def test_missing_source_column_is_blank(self):
+        """入力に存在しない列名は空文字になる"""
+        df = pd.DataFrame({"管理番号": ["M001"]})
+
+        result = build_autocall_output(df, {"管理番号": "管理番号", "物件名": "物件名"})
+
+        assert result.loc[0, "管理番号"] == "M001"
+        assert result.loc[0, "物件名"] == ""
+
+    def test_to_output_strings(self):
+        """str()と同じ表記で変換し、欠損値は空文字"""
+        series = pd.Series([1.0, np.nan, "abc", None, 12345.5], dtype=object)
+
+        result = to_output_strings(series)
+
+        assert list(result) == ["1.0", "", "abc", "", "12345.5"]
+
+    def test_build_client_labels(self):
+        """委託先法人IDから接頭辞付きのクライアント名を作成"""
+        series = pd.Series([1.0, "2", np.nan, 7])
+
+        result = build_client_labels(series, "フェイス")
+
+        assert list(result) == ["フェイス1", "フェイス2", "", "フェイス7"]
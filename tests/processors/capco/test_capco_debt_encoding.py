@@ -3,10 +3,15 @@
 
 テスト対象: processors/capco_debt_update.py の detect_encoding() 関数
 問題: 大きなファイルに対してchardet.detect()がファイル全体を解析し、タイムアウトする
-修正: 先頭10KBのみをサンプリングして解析する
+修正: 共通デコーダー（processors/common/text_decoder.py）で、
+      BOMと先頭の一部の厳密デコードだけで判定する（chardetは使用しない）
 """
 
+import time
 from unittest.mock import patch
+
+import chardet
+
 from processors.capco_debt_update import detect_encoding
 
 
@@ -35,47 +40,34 @@ def _make_utf8_bytes(size_bytes: int) -> bytes:
 
 
 class TestDetectEncodingSampling:
-    """detect_encodingが大きなファイルで先頭10KBのみをサンプリングすることを検証"""
+    """detect_encodingが大きなファイルでも先頭の一部だけで判定することを検証"""
 
-    def test_large_file_passes_only_sample_to_chardet(self):
-        """50MBのファイルでchardet.detectに渡されるデータが10KB以下であること"""
+    def test_chardet_is_not_used(self):
+        """chardet によるファイル解析を行わないこと"""
         large_content = _make_cp932_bytes(50 * 1024 * 1024)  # 50MB
 
-        with patch("processors.capco_debt_update.chardet.detect") as mock_detect:
-            mock_detect.return_value = {"encoding": "CP932", "confidence": 0.99}
-            detect_encoding(large_content)
-
-            # chardet.detectに渡されたデータのサイズを検証
-            call_args = mock_detect.call_args[0][0]
-            assert len(call_args) <= 10000, (
-                f"chardet.detectに{len(call_args)}バイト渡された（期待: ≤10000バイト）。"
-                f"大きなファイル全体を渡すとタイムアウトの原因になる。"
-            )
+        with patch.object(chardet, "detect", side_effect=AssertionError("chardet called")):
+            assert detect_encoding(large_content) == "cp932"
 
-    def test_small_file_passes_entire_content_to_chardet(self):
-        """10KB未満のファイルはそのまま全体をchardetに渡すこと"""
-        small_content = _make_cp932_bytes(5000)  # 5KB
-
-        with patch("processors.capco_debt_update.chardet.detect") as mock_detect:
-            mock_detect.return_value = {"encoding": "CP932", "confidence": 0.99}
-            detect_encoding(small_content)
+    def test_large_file_completes_quickly(self):
+        """50MBのファイルでも判定が高速に完了すること"""
+        large_content = _make_cp932_bytes(50 * 1024 * 1024)  # 50MB
 
-            call_args = mock_detect.call_args[0][0]
-            assert len(call_args) == len(small_content), (
-                f"小さなファイルは全体を渡すべき。渡されたサイズ: {len(call_args)}, "
-                f"ファイルサイズ: {len(small_content)}"
-            )
+        start = time.time()
+        detect_encoding(large_content)
+        elapsed = time.time() - start
 
-    def test_exactly_10kb_file(self):
-        """ちょうど10KBのファイルの境界値テスト"""
-        content_10kb = _make_cp932_bytes(10000)
+        assert elapsed < 1.0, (
+            f"判定に{elapsed:.1f}秒かかった（期待: <1秒）。"
+            f"ファイル全体をデコード試行している可能性がある。"
+        )
 
-        with patch("processors.capco_debt_update.chardet.detect") as mock_detect:
-            mock_detect.return_value = {"encoding": "CP932", "confidence": 0.99}
-            detect_encoding(content_10kb)
+    def test_probe_window_only(self):
+        """判定範囲より後ろの内容は判定結果に影響しない"""
+        # 約400KBのCP932の後ろに、どのエンコーディングでも不正なバイト列
+        content = "契約番号,滞納額合計\n".encode("cp932") * 20000 + b"\x81 "
 
-            call_args = mock_detect.call_args[0][0]
-            assert len(call_args) <= 10000
+        assert detect_encoding(content) == "cp932"
 
 
 # === エンコーディング検出精度のテスト ===
@@ -113,46 +105,28 @@ class TestDetectEncodingAccuracy:
         )
 
 
-# === フォールバック時のサンプリングテスト ===
+# === 先頭がASCIIのみの場合のテスト ===
 
 
-class TestDetectEncodingFallback:
-    """chardet信頼度が低い場合のフォールバック処理を検証"""
+class TestDetectEncodingAsciiPrefix:
+    """先頭がASCIIのみで日本語が後ろにある場合の判定を検証"""
 
-    def test_fallback_returns_valid_encoding_for_cp932(self):
-        """chardet信頼度が低くてもCP932テキストのエンコーディングを正しく返す"""
-        text = "契約番号,滞納額合計\n12345,50000\n67890,30000\n"
-        content = text.encode("cp932")
-
-        with patch("processors.capco_debt_update.chardet.detect") as mock_detect:
-            # 信頼度を低くしてフォールバックを発生させる
-            mock_detect.return_value = {"encoding": None, "confidence": 0.1}
-            result = detect_encoding(content)
+    def test_japanese_after_ascii_prefix(self):
+        """ASCIIの行が続いた後の日本語からCP932と判定する"""
+        content = b"12345,50000\n" * 100_000 + "契約番号,滞納額合計\n".encode("cp932")
 
-            # フォールバックでCP932系として検出されること
-            assert result.lower() in ("cp932", "shift_jis", "shift-jis"), (
-                f"フォールバック結果が'{result}'。CP932テキストなのでCP932系であるべき。"
-            )
+        assert detect_encoding(content) == "cp932"
 
-    def test_fallback_completes_quickly_for_large_file(self):
-        """大きなファイルのフォールバック処理が高速に完了すること（タイムアウトしない）"""
-        import time
+    def test_ascii_prefix_large_file_completes_quickly(self):
+        """20MBのASCII行の後に日本語がある場合でも高速に完了すること"""
+        content = b"12345,50000\n" * (20 * 1024 * 1024 // 12) + _make_cp932_bytes(1000)
 
-        large_content = _make_cp932_bytes(20 * 1024 * 1024)  # 20MB
-
-        with patch("processors.capco_debt_update.chardet.detect") as mock_detect:
-            mock_detect.return_value = {"encoding": None, "confidence": 0.1}
-
-            start = time.time()
-            detect_encoding(large_content)
-            elapsed = time.time() - start
+        start = time.time()
+        result = detect_encoding(content)
+        elapsed = time.time() - start
 
-            # 10KBサンプリングなら1秒以内に完了するはず
-            # ファイル全体をデコード試行すると数秒〜数十秒かかる
-            assert elapsed < 2.0, (
-                f"フォールバック処理に{elapsed:.1f}秒かかった（期待: <2秒）。"
-                f"ファイル全体をデコード試行している可能性がある。"
-            )
+        assert result == "cp932"
+        assert elapsed < 2.0, f"判定に{elapsed:.1f}秒かかった（期待: <2秒）。"
 
 
 # === エッジケースのテスト ===
@@ -86,4 +86,42 @@ class TestMirailUnifiedProcessor:
         with pytest.raises(ValueError) as exc_info:
             processor.process_mirail_autocall(sample_csv_data, "invalid_target", True)
         
-        assert "無効な対象者タイプ" in str(exc_info.value)
\ No newline at end of file
+        assert "無効な対象者タイプ" in str(exc_info.value)
+    
+    def test_batch_matches_individual_processing(self, sample_csv_data):
+        """一括処理の結果が個別処理と一致することを確認"""
+        processor = MirailAutocallUnifiedProcessor()
+        
+        results, batch_logs = processor.process_mirail_autocall_batch(sample_csv_data)
+        
+        assert list(results.keys()) == list(processor.BATCH_VARIANTS.keys())
+        for key, variant in processor.BATCH_VARIANTS.items():
+            expected_df, expected_logs, expected_filename = processor.process_mirail_autocall(
+                sample_csv_data, variant["target"], variant["with_10k"], variant["include_today"]
+            )
+            result_df, result_logs, result_filename = results[key]
+            
+            pd.testing.assert_frame_equal(result_df, expected_df)
+            assert result_filename == expected_filename
+            # 個別処理のログから読み込み部分（先頭2行）を除いたものと一致
+            assert result_logs == expected_logs[2:]
+        assert "✅ 一括処理完了: 8種類" in batch_logs
+    
+    def test_batch_selected_variants(self, sample_csv_data):
+        """指定したバリエーションのみ処理されることを確認"""
+        processor = MirailAutocallUnifiedProcessor()
+        
+        results, _ = processor.process_mirail_autocall_batch(
+            sample_csv_data, ["guarantor_with10k", "contract_without10k"]
+        )
+        
+        assert list(results.keys()) == ["guarantor_with10k", "contract_without10k"]
+    
+    def test_batch_invalid_variant(self, sample_csv_data):
+        """無効なバリエーションでエラーになることを確認"""
+        processor = MirailAutocallUnifiedProcessor()
+        
+        with pytest.raises(ValueError) as exc_info:
+            processor.process_mirail_autocall_batch(sample_csv_data, ["unknown"])
+        
+        assert "無効なバリエーション" in str(exc_info.value)
@@ -19,6 +19,7 @@ from io import BytesIO
 
 # テスト対象の関数をインポート
 from processors.mirail_sms.contract import process_mirail_sms_contract_data
+from processors.sms_common import SMS_TEMPLATE_HEADERS
 
 # conftest.py のヘルパー関数をインポート
 from tests.processors.sms.conftest import (
@@ -716,22 +717,24 @@ class TestIntegration:
 
         assert len(result_df) == 1, f"期待: 1件, 実際: {len(result_df)}件"
 
-    def test_all_excluded_raises_error(self, invalid_trustee_id_data, payment_deadline_date):
+    def test_all_excluded_returns_empty(self, invalid_trustee_id_data, payment_deadline_date):
         """
-        【テスト】全件除外された場合、例外が発生する
+        【テスト】全件除外された場合、0件の結果が返る
 
-        【解説】現在の実装の動作
-        全件がフィルターで除外されると、空のDataFrameに対して
-        列番号アクセス（iloc）が失敗し、例外が発生します。
-
-        これは理想的な動作ではありませんが、実際の運用では
-        全件除外されるようなデータは渡されないため、
-        現在の動作を保証するテストとしています。
+        【解説】
+        以前は全件除外されると空のDataFrameへの列番号アクセスで例外が
+        発生していましたが、電話番号の分類を列全体で1回行うようになり、
+        0件でも最後まで処理されます（画面側は0件の結果を表示できます）。
         """
         csv_bytes = dataframe_to_csv_bytes(invalid_trustee_id_data)
 
-        with pytest.raises(Exception):
-            process_mirail_sms_contract_data(csv_bytes, payment_deadline_date)
+        result_df, logs, filename, stats = process_mirail_sms_contract_data(
+            csv_bytes, payment_deadline_date
+        )
+
+        assert len(result_df) == 0
+        assert list(result_df.columns) == SMS_TEMPLATE_HEADERS
+        assert 'AB列TEL携帯フィルタ後: 0件 (除外: 0件)' in logs
 
     def test_logs_contain_filter_info(self, mixed_data, payment_deadline_date):
         """
@@ -0,0 +1,73 @@
+"""
+SMS送信先電話番号の分類（processors/sms_common/phone_classifier.py）のテスト
+"""
+
+import numpy as np
+import pandas as pd
+
+from processors.common.detailed_logger import DetailedLogger
+from processors.sms_common.phone_classifier import (
+    PHONE_BLANK,
+    PHONE_LANDLINE,
+    PHONE_MALFORMED,
+    PHONE_MOBILE,
+    classify_phones,
+)
+
+
+class TestClassifyPhones:
+    """電話番号の分類のテスト"""
+
+    def test_kinds(self):
+        series = pd.Series([
+            "090-1234-5678",
+            "080-1111-2222",
+            " 070-3333-4444 ",
+            "03-1234-5678",
+            "０３－１２３４－５６７８",
+            "",
+            "nan",
+            np.nan,
+            "09012345678",
+            "090-1234",
+        ], index=range(10, 20))
+
+        phones = classify_phones(series)
+
+        assert list(phones.kind) == [
+            PHONE_MOBILE, PHONE_MOBILE, PHONE_MOBILE,
+            PHONE_LANDLINE, PHONE_LANDLINE,
+            PHONE_BLANK, PHONE_BLANK, PHONE_BLANK,
+            PHONE_MALFORMED, PHONE_MALFORMED,
+        ]
+        assert list(phones.kind.index) == list(series.index)
+        assert phones.is_mobile.tolist() == [True] * 3 + [False] * 7
+        assert phones.text.iloc[2] == "070-3333-4444"
+        assert phones.text.iloc[7] == ""
+        assert phones.normalized.iloc[4] == "0312345678"
+        assert phones.counts() == {
+            PHONE_MOBILE: 3, PHONE_LANDLINE: 2, PHONE_BLANK: 3, PHONE_MALFORMED: 2,
+        }
+
+    def test_exclusion_log_matches_detailed_logger(self):
+        """除外詳細ログは従来の log_exclusion_details と同じ"""
+        df = pd.DataFrame({"TEL携帯": ["090-1234-5678", "", "03-1234-5678", "nan", "0901234"]})
+        phones = classify_phones(df["TEL携帯"])
+
+        expected = DetailedLogger.log_exclusion_details(
+            df[~phones.is_mobile], 0, "AB列TEL携帯", "phone"
+        )
+
+        assert phones.exclusion_log("AB列TEL携帯") == expected
+        assert expected == "AB列TEL携帯除外詳細: {空白/NaN: 2件, 固定電話等: 2件}"
+
+    def test_exclusion_log_none_when_all_mobile(self):
+        phones = classify_phones(pd.Series(["090-1234-5678", "080-1234-5678"]))
+
+        assert phones.exclusion_log("TEL携帯") is None
+
+    def test_empty_series(self):
+        phones = classify_phones(pd.Series([], dtype=str))
+
+        assert len(phones.is_mobile) == 0
+        assert phones.exclusion_log("TEL携帯") is None
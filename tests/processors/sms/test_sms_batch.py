@@ -0,0 +1,126 @@
+"""
+SMS一括処理（processors/sms_batch.py）のテスト
+"""
+
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from processors.mirail_sms.contract import process_mirail_sms_contract_data
+from processors.mirail_sms.contract_today import process_mirail_sms_contract_today_data
+from processors.mirail_sms.emergency_contact import process_mirail_sms_emergencycontact_data
+from processors.mirail_sms.guarantor import process_mirail_sms_guarantor_data
+from processors.common import parsed_frame_cache
+from processors.common.parsed_frame_cache import ParsedFrameCache
+from processors.sms_batch import BATCH_VARIANTS, batch_columns, process_sms_batch_data, write_sms_batch_zip
+from processors.sms_common.pipeline import process_sms_frame
+from tests.processors.sms.conftest import MIRAIL_COLUMN_INDICES, dataframe_to_csv_bytes
+
+
+MIRAIL_PROCESSORS = {
+    "mirail_sms_contract_id5": lambda c, d: process_mirail_sms_contract_data(c, d, 'id5'),
+    "mirail_sms_contract_blank": lambda c, d: process_mirail_sms_contract_data(c, d, 'blank'),
+    "mirail_sms_guarantor_id5": lambda c, d: process_mirail_sms_guarantor_data(c, d, 'id5'),
+    "mirail_sms_emergencycontact_blank": lambda c, d: process_mirail_sms_emergencycontact_data(c, d, 'blank'),
+    "mirail_sms_contract_today": process_mirail_sms_contract_today_data,
+}
+
+
+@pytest.fixture
+def contract_list(mixed_data):
+    """
+    全バリエーションを処理できるContractList
+
+    ミライル用のテストデータに、フェイス・ガレージバンクが列名で参照する列と
+    保証人・緊急連絡人の氏名列を追加する。
+    """
+    df = mixed_data.copy()
+    for col_name in ('委託先法人ID', 'TEL携帯', '入金予定日', '入金予定金額', '回収ランク'):
+        df[col_name] = df.iloc[:, MIRAIL_COLUMN_INDICES[col_name]]
+    df['保証人１氏名'] = '保証太郎'
+    df['緊急連絡人１氏名'] = '連絡花子'
+    return df
+
+
+class TestSmsBatch:
+    """SMS一括処理のテスト"""
+
+    def test_batch_matches_individual_processing(self, contract_list, payment_deadline_date):
+        """一括処理の結果が個別処理と一致することを確認"""
+        content = dataframe_to_csv_bytes(contract_list)
+
+        results, batch_logs = process_sms_batch_data(
+            content, payment_deadline_date, list(MIRAIL_PROCESSORS), max_workers=3
+        )
+
+        assert list(results.keys()) == list(MIRAIL_PROCESSORS)
+        for key, process in MIRAIL_PROCESSORS.items():
+            expected_df, expected_logs, expected_filename, expected_stats = process(content, payment_deadline_date)
+            result_df, result_logs, result_filename, result_stats = results[key]
+
+            pd.testing.assert_frame_equal(result_df, expected_df)
+            assert result_logs == expected_logs
+            assert result_filename == expected_filename
+            assert result_stats.pop('elapsed_seconds') >= 0
+            assert result_stats == expected_stats
+        assert batch_logs[-1].startswith("✅ SMS一括処理完了: 5種類")
+
+    def test_all_variants_by_default(self, contract_list, payment_deadline_date):
+        results, _ = process_sms_batch_data(dataframe_to_csv_bytes(contract_list), payment_deadline_date)
+
+        assert list(results.keys()) == list(BATCH_VARIANTS.keys())
+        assert len(results["mirail_sms_contract_id5"][0]) == 1
+
+    def test_reads_union_of_declared_columns_once(self, contract_list, payment_deadline_date, monkeypatch):
+        """読み込みは全バリエーションの列の和集合で1回だけ行い、結果は全列読み込みと同じ"""
+        cache = ParsedFrameCache()
+        monkeypatch.setattr(parsed_frame_cache, "_shared_cache", cache)
+
+        results, _ = process_sms_batch_data(dataframe_to_csv_bytes(contract_list), payment_deadline_date)
+
+        assert cache.stats()["misses"] == 1
+        assert len(batch_columns(list(BATCH_VARIANTS))) < len(contract_list.columns) / 3
+        full = pd.read_csv(io.BytesIO(dataframe_to_csv_bytes(contract_list)), dtype=str)
+        for key, variant in BATCH_VARIANTS.items():
+            expected_df, expected_logs, _ = process_sms_frame(full, variant["spec"], payment_deadline_date)
+            pd.testing.assert_frame_equal(results[key][0], expected_df)
+            assert results[key][1] == expected_logs
+
+    def test_invalid_variant(self, contract_list, payment_deadline_date):
+        with pytest.raises(ValueError) as exc_info:
+            process_sms_batch_data(dataframe_to_csv_bytes(contract_list), payment_deadline_date, ["unknown"])
+
+        assert "無効なバリエーション" in str(exc_info.value)
+
+    def test_variant_error_names_variant(self, payment_deadline_date):
+        """列が足りない場合は失敗したバリエーションの処理名でエラーになる"""
+        content = "委託先法人ID\n5\n".encode("utf-8")
+
+        with pytest.raises(Exception) as exc_info:
+            process_sms_batch_data(content, payment_deadline_date, ["mirail_sms_guarantor_id5"])
+
+        assert str(exc_info.value).startswith("ミライル SMS保証人処理エラー:")
+
+
+class TestSmsBatchZip:
+    """ZIP書き出しのテスト"""
+
+    def test_zip_contains_cp932_csv_per_variant(self, contract_list, payment_deadline_date):
+        contract_list.loc[0, '契約者氏名'] = '髙橋①'
+        results, _ = process_sms_batch_data(
+            dataframe_to_csv_bytes(contract_list), payment_deadline_date,
+            ["mirail_sms_contract_id5", "mirail_sms_contract_today"]
+        )
+
+        zip_bytes, empty_keys, replaced_chars = write_sms_batch_zip(results)
+
+        assert empty_keys == ["mirail_sms_contract_today"]
+        assert replaced_chars == {}
+        result_df, _, filename, _ = results["mirail_sms_contract_id5"]
+        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_file:
+            assert zip_file.namelist() == [filename]
+            data = zip_file.read(filename)
+        assert data == result_df.to_csv(index=False).encode('cp932', errors='replace')
+        assert '髙橋'.encode('cp932') in data
@@ -0,0 +1,144 @@
+"""
+SMSパイプライン（processors/sms_common/pipeline.py）のテスト
+"""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.sms_common import SMS_TEMPLATE_HEADERS
+from processors.sms_common.pipeline import (
+    INFO_COLUMNS,
+    SmsSpec,
+    apply_sms_filters,
+    arrears_at_least,
+    build_sms_frame,
+    collection_rank_excluded,
+    mobile_phone,
+    payment_date_before_today,
+    run_sms_pipeline,
+    text,
+    trustee_id_numeric,
+)
+
+
+# フィルタ列は ContractList と同じ列番号に置く（除外詳細ログは列番号で参照するため）
+FILTER_COLUMNS = {
+    COL.DEBT_AMOUNT: '滞納残債',
+    COL.PAYMENT_DATE: '入金予定日',
+    COL.COLLECTION_RANK: '回収ランク',
+    COL.TRUSTEE_ID: '委託先法人ID',
+}
+
+
+def _contract_list(rows):
+    """フィルタ・出力に使う列を持つContractList（その他の列は空）"""
+    base = {
+        '委託先法人ID': '1',
+        '入金予定日': '',
+        '回収ランク': '通常',
+        '滞納残債': '10,000',
+        '契約者氏名': '山田太郎',
+        '物件名': 'ハイツ',
+        '物件番号': '101',
+        '管理番号': 'M001',
+        '回収口座銀行名': '銀行',
+        '回収口座支店名': '支店',
+        '回収口座種類': '普通',
+        '回収口座番号': '="1234567"',
+        '回収口座名義人': '名義',
+        '保証人１氏名': '保証太郎',
+        'TEL携帯': '090-1234-5678',
+    }
+    df = pd.DataFrame([{**base, **row} for row in rows])
+    columns = [FILTER_COLUMNS.get(i, f'列{i}') for i in range(COL.TRUSTEE_ID + 1)]
+    columns += [name for name in df.columns if name not in FILTER_COLUMNS.values()]
+    return df.reindex(columns=columns, fill_value='')
+
+
+FILTERS = [
+    trustee_id_numeric([1]),
+    payment_date_before_today('入金予定日'),
+    collection_rank_excluded(['弁護士介入'], '回収ランク'),
+    arrears_at_least(1),
+    mobile_phone('TEL携帯', 'TEL携帯', write_back=True),
+]
+
+
+class TestApplySmsFilters:
+    """フィルタの単一パス適用のテスト"""
+
+    def test_logs_match_sequential_filtering(self):
+        """各段階の件数・除外詳細は前段までに残った行だけで集計する"""
+        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y/%m/%d')
+        df = _contract_list([
+            {},
+            {'委託先法人ID': '5', 'TEL携帯': ''},
+            {'入金予定日': tomorrow},
+            {'回収ランク': '弁護士介入', 'TEL携帯': ''},
+            {'滞納残債': '0'},
+            {'TEL携帯': '03-1234-5678'},
+            {'TEL携帯': ''},
+        ])
+
+        df_filtered, logs = apply_sms_filters(df, FILTERS)
+
+        assert list(df_filtered.index) == [0]
+        assert logs == [
+            '委託先法人IDフィルタ後: 6件 (除外: 1件)',
+            "委託先法人ID除外詳細: {'5': 1}",
+            '入金予定日フィルタ後: 5件 (除外: 1件)',
+            f"入金予定日除外詳細（上位3件）: {{'{tomorrow}': 1}}",
+            '回収ランクフィルタ後: 4件 (除外: 1件)',
+            "回収ランク除外詳細: {'弁護士介入': 1}",
+            '滞納残債（1円以上）フィルタ後: 3件 (除外: 1件)',
+            "滞納残債除外詳細: {'0円': 1}",
+            'TEL携帯フィルタ後: 1件 (除外: 2件)',
+            'TEL携帯除外詳細: {空白/NaN: 1件, 固定電話等: 1件}',
+        ]
+
+    def test_write_back_is_applied_to_filtered_frame(self):
+        df = _contract_list([{'TEL携帯': ' 090-1234-5678 '}])
+
+        df_filtered, _ = apply_sms_filters(df, FILTERS)
+
+        assert df_filtered['TEL携帯'].iloc[0] == '090-1234-5678'
+        assert df_filtered['委託先法人ID'].iloc[0] == 1
+        assert df['TEL携帯'].iloc[0] == ' 090-1234-5678 '
+
+
+class TestBuildSmsFrame:
+    """出力作成のテスト"""
+
+    def test_template_columns(self):
+        df = _contract_list([{}, {'物件番号': '', '滞納残債': '¥12,345'}]).set_axis([5, 8])
+        spec = SmsSpec(FILTERS, 'TEL携帯', columns={**INFO_COLUMNS, '保証人': text('保証人１氏名')})
+
+        output_df = build_sms_frame(df, spec, date(2025, 6, 30))
+
+        assert list(output_df.columns) == SMS_TEMPLATE_HEADERS
+        assert list(output_df.index) == [5, 8]
+        row = output_df.loc[8]
+        assert row['電話番号'] == '090-1234-5678'
+        assert row['(info2)物件名'] == 'ハイツ'
+        assert output_df.loc[5, '(info2)物件名'] == 'ハイツ　101'
+        assert row['(info3)金額'] == '12,345'
+        assert row['(info4)銀行口座'] == '銀行　支店　普通　1234567　名義'
+        assert row['保証人'] == '保証太郎'
+        assert row['支払期限'] == '2025年06月30日'
+        assert np.isnan(output_df.iloc[0, 6])
+        assert pd.isna(row['連絡人'])
+
+    def test_empty_message(self):
+        content = _contract_list([{'委託先法人ID': '5'}]).to_csv(index=False).encode('utf-8')
+        spec = SmsSpec(FILTERS, 'TEL携帯', empty_message='0件です')
+
+        output_df, logs, stats = run_sms_pipeline(content, spec, date(2025, 6, 30))
+
+        assert len(output_df) == 0
+        assert list(output_df.columns) == SMS_TEMPLATE_HEADERS
+        assert logs[0] == '元データ読み込み: 1件'
+        assert logs[-1] == '0件です'
+        assert stats == {'initial_rows': 1, 'processed_rows': 0}
@@ -0,0 +1,159 @@
+"""
+列定義による111列テンプレート変換エンジンのテスト
+"""
+
+import numpy as np
+import pandas as pd
+
+from processors.common.column_spec import (
+    ConversionContext,
+    apply_unique,
+    build_template_frame,
+    computed,
+    copy_of,
+    fixed,
+    join_nonempty,
+    move_home_to_mobile,
+    normalize_phone,
+    remove_spaces,
+    source,
+    to_zenkaku,
+)
+
+
+OUTPUT_COLUMNS = ["引継番号", "契約者氏名", "契約者カナ", "物件名", "", "", "登録フラグ"]
+
+
+def _input_df():
+    df = pd.DataFrame({
+        "契約番号": [" A001 ", "A002", np.nan],
+        "氏名": ["山田 太郎", "佐藤　花子", None],
+        "カナ": ["ﾔﾏﾀﾞ ﾀﾛｳ", "", "ｽｽﾞｷ"],
+    })
+    df.index = [10, 20, 30]
+    return df
+
+
+class TestBuildTemplateFrame:
+    """テンプレート作成のテスト"""
+
+    def test_builds_columns_in_output_order(self):
+        """列定義の値を出力列順に並べ、空列名の重複も保持する"""
+        specs = {
+            "契約者カナ": source("カナ", to_zenkaku, remove_spaces),
+            "引継番号": source("契約番号"),
+            "契約者氏名": source("氏名", remove_spaces),
+        }
+
+        result = build_template_frame(_input_df(), specs, OUTPUT_COLUMNS)
+
+        assert list(result.columns) == OUTPUT_COLUMNS
+        assert list(result.index) == [0, 1, 2]
+        assert list(result["引継番号"]) == ["A001", "A002", ""]
+        assert list(result["契約者氏名"]) == ["山田太郎", "佐藤花子", ""]
+        assert list(result["契約者カナ"]) == ["ヤマダタロウ", "", "スズキ"]
+        assert list(result["物件名"]) == ["", "", ""]
+
+    def test_fixed_values_fill_blanks_or_overwrite(self):
+        """固定値は既定では空欄のみ補完し、overwrite_fixed=True なら上書きする"""
+        specs = {"物件名": source("カナ"), "引継番号": source("契約番号")}
+        fixed_values = {"物件名": "固定", "登録フラグ": 1}
+
+        filled = build_template_frame(_input_df(), specs, OUTPUT_COLUMNS, fixed_values)
+        overwritten = build_template_frame(
+            _input_df(), specs, OUTPUT_COLUMNS, fixed_values, overwrite_fixed=True
+        )
+
+        assert list(filled["物件名"]) == ["ﾔﾏﾀﾞ ﾀﾛｳ", "固定", "ｽｽﾞｷ"]
+        assert list(overwritten["物件名"]) == ["固定", "固定", "固定"]
+        # 数値の固定値は従来通り数値列になる
+        assert list(filled["登録フラグ"]) == [1, 1, 1]
+
+    def test_computed_and_copy_reference_built_columns(self):
+        """算出列・コピー列から作成済みの列を参照できる"""
+        specs = {
+            "引継番号": source("契約番号"),
+            "物件名": copy_of("引継番号", lambda s: s + "号"),
+            "登録フラグ": computed(lambda ctx: ctx.columns["引継番号"] != ""),
+        }
+
+        result = build_template_frame(_input_df(), specs, OUTPUT_COLUMNS)
+
+        assert list(result["物件名"]) == ["A001号", "A002号", "号"]
+        assert list(result["登録フラグ"]) == [True, True, False]
+
+    def test_finalize_applies_to_built_and_fixed_columns(self):
+        """finalize は固定値設定後の全列に適用される"""
+        specs = {"引継番号": source("契約番号"), "物件名": fixed("ａｂｃ")}
+
+        result = build_template_frame(
+            _input_df(), specs, OUTPUT_COLUMNS, {"登録フラグ": "ＸＹＺ"},
+            finalize=lambda column, series: to_zenkaku(series),
+        )
+
+        assert list(result["物件名"]) == ["abc"] * 3
+        assert list(result["登録フラグ"]) == ["XYZ"] * 3
+
+    def test_empty_input(self):
+        """0件でも列構成を維持する"""
+        specs = {"引継番号": source("契約番号", remove_spaces), "物件名": fixed("x")}
+
+        result = build_template_frame(_input_df().iloc[0:0], specs, OUTPUT_COLUMNS)
+
+        assert len(result) == 0
+        assert list(result.columns) == OUTPUT_COLUMNS
+
+
+class TestConversionContext:
+    """入力列参照のテスト"""
+
+    def test_column_candidates_and_defaults(self):
+        """列名候補は最初の非空の値、存在しない列は既定値"""
+        df = pd.DataFrame({"氏名2": ["", "新形式", None], "名前2": ["旧形式", "旧", "旧2"]})
+        ctx = ConversionContext(df)
+
+        assert list(ctx.text(("氏名2", "名前2"))) == ["旧形式", "新形式", "旧2"]
+        assert list(ctx.text("賃料", default="0")) == ["0", "0", "0"]
+        assert list(ctx.text(1)) == ["旧形式", "旧", "旧2"]
+
+    def test_keep_na_text(self):
+        """keep_na_text=True では欠損値も str() で文字列化"""
+        ctx = ConversionContext(pd.DataFrame({"契約No": ["C1", np.nan]}))
+
+        assert list(ctx.text("契約No", keep_na_text=True)) == ["C1", "nan"]
+
+
+class TestTransforms:
+    """変換処理のテスト"""
+
+    def test_normalize_phone(self):
+        series = pd.Series(["０９０－１１１１－２２２２", "03（1234）5678", "電話無", ""])
+
+        assert list(normalize_phone(series)) == ["090-1111-2222", "03(1234)5678", "", ""]
+
+    def test_join_nonempty(self):
+        parts = [pd.Series(["町", "", "町", ""]), pd.Series(["建物", "建物", "", ""])]
+
+        assert list(join_nonempty(parts, "　")) == ["町　建物", "建物", "町", ""]
+
+    def test_move_home_to_mobile(self):
+        home, mobile = move_home_to_mobile(
+            pd.Series(["03-1", "03-2", ""]), pd.Series(["", "090-2", ""])
+        )
+
+        assert list(home) == ["", "03-2", ""]
+        assert list(mobile) == ["03-1", "090-2", ""]
+
+    def test_apply_unique_calls_once_per_value(self):
+        calls = []
+
+        def func(value):
+            calls.append(value)
+            return f"<{value}>"
+
+        result = apply_unique(pd.Series(["a", "b", "a", None], index=[5, 6, 7, 8]), func)
+
+        # 欠損値は NaN として1回だけ渡される
+        assert list(result) == ["<a>", "<b>", "<a>", "<nan>"]
+        assert list(result.index) == [5, 6, 7, 8]
+        assert len(calls) == 3
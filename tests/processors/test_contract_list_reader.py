@@ -0,0 +1,157 @@
+"""
+ContractList列指定読み込み（processors/common/contract_list_reader.py）のテスト
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from processors.common import parsed_frame_cache
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.common.contract_list_reader import ContractListReader
+from processors.common.parsed_frame_cache import ParsedFrameCache
+from processors.common.text_decoder import detect_encoding
+from processors.mirail_autocall_unified import MirailAutocallUnifiedProcessor
+
+
+def _contract_list(rows: int = 10) -> pd.DataFrame:
+    """122列のContractList（TEL携帯 は27列目と46列目で重複）"""
+    header = [f"列{i}" for i in range(122)]
+    header[COL.MANAGEMENT_NO] = "管理番号"
+    header[COL.TEL_MOBILE] = "TEL携帯"
+    header[COL.TEL_MOBILE_1] = "TEL携帯"
+    header[COL.TRUSTEE_ID] = "委託先法人ID"
+    data = [[f"{row}-{i}" for i in range(122)] for row in range(rows)]
+    return pd.DataFrame(data, columns=header)
+
+
+def _to_bytes(df: pd.DataFrame, encoding: str = "cp932") -> bytes:
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False)
+    return buffer.getvalue().encode(encoding)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(parsed_frame_cache, "_shared_cache", ParsedFrameCache())
+
+
+class TestContractListReader:
+    """列指定読み込みのテスト"""
+
+    def test_reads_only_declared_columns_in_original_order(self):
+        reader = ContractListReader([COL.TRUSTEE_ID, COL.MANAGEMENT_NO, COL.TEL_MOBILE_1])
+
+        df = reader.read(_to_bytes(_contract_list()))
+
+        full = pd.read_csv(io.BytesIO(_to_bytes(_contract_list())), dtype=str, encoding="cp932")
+        pd.testing.assert_frame_equal(df, full.iloc[:, [0, 46, 118]])
+        assert list(df.columns) == ["管理番号", "TEL携帯.1", "委託先法人ID"]
+
+    def test_position_and_projection(self):
+        reader = ContractListReader([COL.DEBT_AMOUNT, COL.CLIENT_CD, COL.TRUSTEE_ID])
+        filter_config = {
+            "trustee_id": {"column": COL.TRUSTEE_ID, "values": ["", "5"]},
+            "special_debt": {"client_cd_column": COL.CLIENT_CD, "debt_column": COL.DEBT_AMOUNT},
+        }
+
+        projected = reader.project_filter_config(filter_config)
+
+        assert reader.position(COL.TRUSTEE_ID) == 2
+        assert projected["trustee_id"] == {"column": 2, "values": ["", "5"]}
+        assert projected["special_debt"] == {"client_cd_column": 1, "debt_column": 0}
+        assert filter_config["trustee_id"]["column"] == COL.TRUSTEE_ID
+        assert reader.project_mapping({"残債": COL.DEBT_AMOUNT, "管理番号": "管理番号"}) == {
+            "残債": 0, "管理番号": "管理番号",
+        }
+        with pytest.raises(KeyError):
+            reader.position(COL.MANAGEMENT_NO)
+
+    def test_chunks_match_full_read(self):
+        """チャンクを連結すると全体読み込みと同じ（インデックスも通し番号）"""
+        content = _to_bytes(_contract_list(25))
+        reader = ContractListReader([COL.MANAGEMENT_NO, COL.TRUSTEE_ID], chunk_rows=10)
+
+        chunks = reader.apply_chunked(content, list)
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        pd.testing.assert_frame_equal(pd.concat(chunks), reader.read(content))
+
+    def test_chunked_read_recovers_from_late_decode_error(self):
+        """判定範囲より後ろでデコードに失敗した場合は、読み直して最初から処理する"""
+        # 先頭はCP932としても読めるUTF-8（長音記号）、判定範囲より後ろに漢字
+        rows = ["id,name"] + ["1,ーーーー"] + ["2,abc"] * 20_000 + ["3,山田　太郎"]
+        content = "\n".join(rows).encode("utf-8")
+        encodings = ("cp932", "utf-8")
+        reader = ContractListReader([0, 1], chunk_rows=5_000, encodings=encodings)
+        assert detect_encoding(content, encodings) == "cp932"
+
+        chunks = reader.apply_chunked(content, list)
+
+        df = pd.concat(chunks)
+        assert len(df) == 20_002
+        assert df.iloc[0, 1] == "ーーーー"
+        assert df.iloc[-1, 1] == "山田　太郎"
+
+
+class TestNamedColumns:
+    """列名での宣言（フェイス・プラザ・SMS）のテスト"""
+
+    def test_names_are_resolved_from_header(self):
+        content = _to_bytes(_contract_list())
+        reader = ContractListReader(["TEL携帯.1", "委託先法人ID", COL.MANAGEMENT_NO, "存在しない列", 500])
+
+        resolved = reader.resolve(content)
+        df = reader.read(content)
+
+        assert resolved.columns == [COL.MANAGEMENT_NO, COL.TEL_MOBILE_1, COL.TRUSTEE_ID]
+        assert list(df.columns) == ["管理番号", "TEL携帯.1", "委託先法人ID"]
+        pd.testing.assert_frame_equal(df, resolved.read(content))
+        with pytest.raises(KeyError):
+            resolved.position(500)
+
+    def test_chunked_read_resolves_names(self):
+        content = _to_bytes(_contract_list(25))
+        reader = ContractListReader(["委託先法人ID"], chunk_rows=10)
+
+        chunks = reader.apply_chunked(content, list)
+
+        assert [list(chunk.columns) for chunk in chunks] == [["委託先法人ID"]] * 3
+
+
+class TestMirailColumnProjection:
+    """ミライルオートコールの列指定読み込みのテスト"""
+
+    def test_declared_columns_cover_filters_and_mapping(self):
+        processor = MirailAutocallUnifiedProcessor()
+
+        for target in processor.TARGET_CONFIG:
+            for with_10k in (True, False):
+                processor.reader.project_filter_config(processor.get_base_filter_config(target, with_10k))
+            processor.reader.project_mapping(processor.get_mapping_rules(target))
+
+        assert len(processor.CONTRACT_LIST_COLUMNS) < 20
+
+    def test_streaming_matches_cached_read(self, monkeypatch):
+        """大きいファイル用のチャンク処理でも出力・ログは同じ"""
+        df = _contract_list(12)
+        df.iloc[:, COL.TRUSTEE_ID] = ["", "5", "1"] * 4
+        df.iloc[:, COL.PAYMENT_DATE] = ["2024-01-01", "2099-01-01", "", "2024-02-01"] * 3
+        df.iloc[:, COL.PAYMENT_AMOUNT] = ["100", "2", ""] * 4
+        df.iloc[:, COL.COLLECTION_RANK] = ["通常"] * 11 + ["弁護士介入"]
+        df.iloc[:, COL.DEBT_AMOUNT] = ["5,000", "10000", "0", "11000"] * 3
+        df.iloc[:, COL.CLIENT_CD] = ["1", "4", "7"] * 4
+        df.iloc[:, COL.TEL_MOBILE] = ["090-1111-2222"] * 11 + [""]
+        content = _to_bytes(df)
+
+        processor = MirailAutocallUnifiedProcessor()
+        expected = processor.process_mirail_autocall(content, "contract", with_10k=False)
+
+        monkeypatch.setattr("processors.mirail_autocall_unified.STREAMING_MIN_BYTES", 0)
+        processor.reader.chunk_rows = 5
+        result = processor.process_mirail_autocall(content, "contract", with_10k=False)
+
+        pd.testing.assert_frame_equal(result[0], expected[0])
+        assert result[1] == expected[1]
+        assert len(result[0]) > 0
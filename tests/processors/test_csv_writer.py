@@ -0,0 +1,78 @@
+"""
+CP932 CSV書き出し（processors/common/csv_writer.py）のテスト
+"""
+
+import io
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from processors.common.csv_writer import (
+    format_replaced_chars,
+    to_csv_cp932,
+    write_csv_cp932,
+    write_csv_to_zip,
+)
+from processors.sms_common import SMS_TEMPLATE_HEADERS
+
+
+def _sms_frame(rows: int) -> pd.DataFrame:
+    """59列テンプレート（空文字の列名が50列）"""
+    data = [
+        [f"090-0000-{i:04d}", "髙橋①", "ハイツ", f"{i:,}", np.nan, "M001"] + [np.nan] * 50 + ["", "", "2025年06月30日"]
+        for i in range(rows)
+    ]
+    return pd.DataFrame(data, columns=SMS_TEMPLATE_HEADERS)
+
+
+class TestWriteCsvCp932:
+    """CSV書き出しのテスト"""
+
+    @pytest.mark.parametrize("chunk_rows", [1, 7, 5000])
+    def test_matches_to_csv_encode(self, chunk_rows):
+        """チャンク単位で書いても to_csv().encode('cp932') と同じバイト列になる"""
+        df = _sms_frame(20)
+        buffer = io.BytesIO()
+
+        replaced = write_csv_cp932(df, buffer, chunk_rows=chunk_rows)
+
+        assert buffer.getvalue() == df.to_csv(index=False).encode('cp932')
+        assert replaced == {}
+
+    def test_duplicate_and_empty_headers(self):
+        df = pd.DataFrame([["a", "b", "c"]], columns=["", "", "列"])
+
+        csv_bytes, _ = to_csv_cp932(df)
+
+        assert csv_bytes.decode('cp932').splitlines() == [",,列", "a,b,c"]
+
+    def test_empty_frame_writes_header(self):
+        csv_bytes, _ = to_csv_cp932(pd.DataFrame(columns=SMS_TEMPLATE_HEADERS))
+
+        assert csv_bytes == pd.DataFrame(columns=SMS_TEMPLATE_HEADERS).to_csv(index=False).encode('cp932')
+
+    def test_reports_replaced_chars(self):
+        df = pd.DataFrame({"氏名": ["森鷗外", "𠮷田", "鷗"], "備考": ["", "", "通常"]})
+
+        csv_bytes, replaced = to_csv_cp932(df)
+
+        assert csv_bytes == df.to_csv(index=False).encode('cp932', errors='replace')
+        assert replaced == {"鷗": 2, "𠮷": 1}
+        assert format_replaced_chars(replaced) == "「鷗」2件、「𠮷」1件"
+
+    def test_strict_raises(self):
+        df = pd.DataFrame({"氏名": ["森鷗外"]})
+
+        with pytest.raises(UnicodeEncodeError):
+            to_csv_cp932(df, errors='strict')
+
+    def test_write_to_zip(self):
+        df = _sms_frame(3)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            write_csv_to_zip(zip_file, "0630SMS.csv", df)
+
+        with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as zip_file:
+            assert zip_file.read("0630SMS.csv") == df.to_csv(index=False).encode('cp932')
@@ -0,0 +1,206 @@
+"""
+残債スナップショット（processors/common/debt_snapshot.py）のテスト
+"""
+
+import io
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from processors.common.debt_snapshot import DebtSnapshotStore, record_snapshot, report_date_from_filename
+from processors.ark_late_payment_update import SNAPSHOT_SOURCE as ARK_SNAPSHOT_SOURCE, process_ark_late_payment_data
+from processors.plaza_debt_update import SNAPSHOT_SOURCE, process_plaza_debt_update
+
+
+TODAY = date(2025, 9, 30)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DebtSnapshotStore(tmp_path / "snapshots.sqlite3", today=lambda: TODAY)
+
+
+class TestDebtSnapshotStore:
+    """スナップショットの保存・読み込み・差分のテスト"""
+
+    def test_save_and_load(self, store):
+        saved = store.save("plaza", date(2025, 9, 1), [" 1001", "1002", None, "", "1003", "1002"],
+                           [5000, "不明", 1, 2, np.nan, 3000])
+
+        assert saved == 3
+        snapshot = store.load("plaza", date(2025, 9, 1))
+        assert snapshot["key"].tolist() == ["1001", "1002", "1003"]
+        # 重複キーは後の行、数値にできない値は NaN
+        assert snapshot["amount"].tolist()[:2] == [5000.0, 3000.0]
+        assert np.isnan(snapshot["amount"].iloc[2])
+
+    def test_same_day_replaces_snapshot(self, store):
+        store.save("plaza", date(2025, 9, 1), ["1001", "1002"], [5000, 3000])
+        store.save("plaza", date(2025, 9, 1), ["1001"], [4000])
+        store.save("ark", date(2025, 9, 1), ["A1"], [100])
+
+        assert store.load("plaza", date(2025, 9, 1)).to_dict("list") == {"key": ["1001"], "amount": [4000.0]}
+        assert store.dates("ark") == [date(2025, 9, 1)]
+
+    def test_previous_date(self, store):
+        store.save("plaza", date(2025, 9, 1), ["1001"], [5000])
+        store.save("plaza", date(2025, 9, 3), ["1001"], [4000])
+
+        assert store.previous_date("plaza", date(2025, 9, 3)) == date(2025, 9, 1)
+        assert store.previous_date("plaza", date(2025, 9, 4)) == date(2025, 9, 3)
+        assert store.previous_date("plaza", date(2025, 9, 1)) is None
+        assert store.previous_date("capco", date(2025, 9, 4)) is None
+
+    def test_diff(self, store):
+        store.save("capco", date(2025, 9, 1), ["1", "2", "3", "4"], [100, 200, 300, np.nan])
+        store.save("capco", date(2025, 9, 2), ["1", "2", "4", "5"], [100, 150, 400, 500])
+
+        changes = store.diff("capco", date(2025, 9, 2), date(2025, 9, 1))
+
+        assert changes["key"].tolist() == ["2", "3", "4", "5"]
+        assert changes["change"].tolist() == ["changed", "removed", "changed", "added"]
+        assert changes["previous_amount"].tolist()[:2] == [200.0, 300.0]
+
+    def test_retention(self, tmp_path):
+        clock = {"today": date(2025, 9, 5)}
+        store = DebtSnapshotStore(tmp_path / "snapshots.sqlite3", retention_days=7, today=lambda: clock["today"])
+        store.save("plaza", date(2025, 9, 1), ["1001"], [5000])
+        store.save("ark", date(2025, 9, 1), ["A1"], [100])
+
+        clock["today"] = date(2025, 9, 10)
+        store.save("plaza", date(2025, 9, 10), ["1001"], [4000])
+
+        # 保存した source だけが対象
+        assert store.dates("plaza") == [date(2025, 9, 10)]
+        assert store.dates("ark") == [date(2025, 9, 1)]
+        assert store.prune(date(2025, 9, 30)) == 2
+        assert store.dates("plaza") == []
+
+    def test_backdated_save_keeps_recent_snapshots(self, tmp_path):
+        store = DebtSnapshotStore(tmp_path / "snapshots.sqlite3", retention_days=7, today=lambda: TODAY)
+        store.save("plaza", date(2025, 9, 29), ["1001"], [5000])
+
+        # 過去日付の残債表を後から保存しても、基準日は今日
+        store.save("plaza", date(2025, 9, 20), ["1001"], [6000])
+
+        assert store.dates("plaza") == [date(2025, 9, 29)]
+
+    def test_future_date_is_rejected(self, store):
+        store.save("plaza", date(2025, 9, 29), ["1001"], [5000])
+        store.save("ark", date(2025, 9, 29), ["A1"], [100])
+
+        # ファイル名の日付の打ち間違い（csv_arrear_20261216.csv など）
+        mistyped = report_date_from_filename("csv_arrear_20261216.csv")
+        with pytest.raises(ValueError, match="今日より後"):
+            store.save("capco", mistyped, ["1"], [100])
+        with pytest.raises(ValueError, match="今日より後"):
+            record_snapshot(store, "capco", ["1"], [100], mistyped)
+
+        assert store.dates("capco") == []
+        assert store.dates("plaza") == [date(2025, 9, 29)]
+        assert store.dates("ark") == [date(2025, 9, 29)]
+
+    def test_record_snapshot_logs(self, store):
+        first = record_snapshot(store, "ark", ["A1", "A2"], [100, 200], date(2025, 9, 1))
+        second = record_snapshot(store, "ark", ["A1", "A3"], [50, 300], date(2025, 9, 2))
+
+        assert "前回のスナップショットなし" in first[1]
+        assert second[1] == "  - 前回（2025/09/01）から: 残債変動 1件 / 新規 1件 / 前回のみ 1件"
+        assert second[2] == "  - 残債変動の番号（最大10件）: ['A1']"
+
+    def test_report_date_from_filename(self):
+        assert report_date_from_filename(
+            "コールセンター回収委託_入金退去情報_20250901_ミライル委託分.xlsx"
+        ) == date(2025, 9, 1)
+        assert report_date_from_filename("csv_arrear_20250902.csv") == date(2025, 9, 2)
+        assert report_date_from_filename("csv_arrear_20251340.csv") is None
+        assert report_date_from_filename("ContractList.csv") is None
+        assert report_date_from_filename(None) is None
+
+
+def _collection_report(rows) -> bytes:
+    """コールセンター回収委託情報（会員番号・延滞額合計ほか）"""
+    df = pd.DataFrame(rows, columns=["会員番号", "延滞額合計"])
+    df["報告元"] = "プラザ"
+    df["解約申入日"] = None
+    df["退去日"] = None
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+class TestPlazaDebtUpdateSnapshot:
+    """プラザ残債更新で前日ファイルの代わりにスナップショットを使うテスト"""
+
+    yesterday = [[1001, 50000], [1002, 30000], [1003, 10000]]
+    today = [[1001, 40000], [1002, 30000], [1003, 12000], [1004, 8000]]
+    plaza_list = "管理番号,引継番号\nM1,1001\nM2,1002\nM3,1003\nM4,1004\n".encode("cp932")
+
+    def test_matches_yesterday_file(self, store):
+        with_file = process_plaza_debt_update(
+            _collection_report(self.yesterday), _collection_report(self.today),
+            self.plaza_list, date(2025, 9, 1),
+        )
+        store.save(SNAPSHOT_SOURCE, date(2025, 9, 1), *zip(*[(str(k), v) for k, v in self.yesterday]))
+
+        outputs, _, logs, stats = process_plaza_debt_update(
+            None, _collection_report(self.today), self.plaza_list, date(2025, 9, 1),
+            snapshot_store=store, snapshot_date=date(2025, 9, 2),
+        )
+
+        pd.testing.assert_frame_equal(outputs[0], with_file[0][0])
+        assert outputs[1]["交渉備考"].tolist() == with_file[0][1]["交渉備考"].tolist()
+        assert stats == with_file[3]
+        assert "前日データ: 残債スナップショット（2025/09/01）から 3件" in logs
+        # 当日分が保存され、翌日は前日ファイルなしで処理できる
+        assert store.load(SNAPSHOT_SOURCE, date(2025, 9, 2))["amount"].tolist() == [40000, 30000, 12000, 8000]
+
+    def test_failed_run_does_not_save_snapshot(self, store):
+        broken_list = "管理番号,番号\nM1,1001\n".encode("cp932")
+
+        with pytest.raises(Exception):
+            process_plaza_debt_update(
+                _collection_report(self.yesterday), _collection_report(self.today),
+                broken_list, date(2025, 9, 1),
+                snapshot_store=store, snapshot_date=date(2025, 9, 2),
+            )
+
+        assert store.dates(SNAPSHOT_SOURCE) == []
+
+    def test_requires_previous_snapshot(self, store):
+        with pytest.raises(Exception, match="前回の残債スナップショットがありません"):
+            process_plaza_debt_update(
+                None, _collection_report(self.today), self.plaza_list, date(2025, 9, 1),
+                snapshot_store=store, snapshot_date=date(2025, 9, 2),
+            )
+
+
+class TestArkLatePaymentSnapshot:
+    """アーク残債更新でのスナップショット保存のテスト"""
+
+    arc = "契約番号,未収金額合計\nA1,1000\nA2,2000\n".encode("cp932")
+
+    def test_saved_with_report_date(self, store):
+        contracts = "引継番号,管理番号\nA1,M1\nA2,M2\n".encode("cp932")
+
+        process_ark_late_payment_data(self.arc, contracts, snapshot_store=store, snapshot_date=date(2025, 9, 2))
+
+        assert store.dates(ARK_SNAPSHOT_SOURCE) == [date(2025, 9, 2)]
+
+    def test_unmatched_run_does_not_save_snapshot(self, store):
+        contracts = "引継番号,管理番号\nB1,M1\n".encode("cp932")
+
+        with pytest.raises(ValueError, match="0件"):
+            process_ark_late_payment_data(self.arc, contracts, snapshot_store=store)
+
+        assert store.dates(ARK_SNAPSHOT_SOURCE) == []
+
+    def test_future_report_date_fails_before_processing(self, store):
+        contracts = "引継番号,管理番号\nA1,M1\nA2,M2\n".encode("cp932")
+
+        with pytest.raises(ValueError, match="今日より後"):
+            process_ark_late_payment_data(self.arc, contracts, snapshot_store=store, snapshot_date=date(2026, 12, 16))
+
+        assert store.dates(ARK_SNAPSHOT_SOURCE) == []
@@ -0,0 +1,104 @@
+"""
+Excel複数シート読み込み（processors/common/excel_reader.py）のテスト
+"""
+
+import io
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from processors.common.excel_reader import read_excel_files, read_excel_sheets, read_first_sheet
+from processors.iog_registration import load_transfer_files
+
+
+def transfer_workbook(east_rows=None) -> bytes:
+    """譲渡一覧（1行目タイトル・2行目ヘッダー）。譲渡－西シートはなし"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "譲渡許可"
+    sheet.append(["譲渡許可一覧"])
+    sheet.append(["賃借人氏名", "物件名", "金額", "日付", "備考", "備考", None, "比率"])
+    sheet.append(["山田太郎", "ハイツA", 1000, datetime(2025, 1, 2), "a", "b", "欄外", 1.5])
+    sheet.append([None] * 8)
+    sheet.append(["佐藤花子", "#N/A", 2000.0, "NA", None, "c", None, 0.25, "はみ出し"])
+    sheet.append(["  鈴木一郎 ", "001", None, None, None, None, None, 3])
+    sheet.append([])
+    east = workbook.create_sheet("譲渡－東")
+    for row in east_rows or [["譲渡－東"], ["賃借人氏名", "物件名"], ["山田太郎", "コーポB"], ["田中次郎", "コーポC"]]:
+        east.append(row)
+    workbook.create_sheet("集計")
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def content():
+    return transfer_workbook()
+
+
+class TestReadExcelSheets:
+    """pd.read_excel と同じ結果になることのテスト"""
+
+    @pytest.mark.parametrize("kwargs", [
+        {"header": 1, "dtype": str},
+        {"header": 1},
+        {"header": 1, "dtype": str, "usecols": ["比率", "賃借人氏名"]},
+        {"header": 1, "usecols": ["日付", "金額"]},
+        {"header": 1, "dtype": str, "usecols": ["備考"]},
+        {"header": 0, "dtype": str},
+    ])
+    def test_same_as_read_excel(self, content, kwargs):
+        # usecols の列は譲渡許可シートにだけある
+        expected_sheets = ["譲渡許可"] if "usecols" in kwargs else ["譲渡許可", "譲渡－東"]
+        sheets = read_excel_sheets(content, expected_sheets + ["譲渡－西"], **kwargs)
+
+        assert list(sheets) == expected_sheets
+        for name, df in sheets.items():
+            expected = pd.read_excel(io.BytesIO(content), sheet_name=name, **kwargs)
+            pd.testing.assert_frame_equal(df, expected)
+
+    def test_first_sheet_and_missing_columns(self, content):
+        pd.testing.assert_frame_equal(
+            read_first_sheet(content, header=1, usecols=["賃借人氏名"]),
+            pd.read_excel(io.BytesIO(content), header=1, usecols=["賃借人氏名"]),
+        )
+        with pytest.raises(ValueError, match="無い列"):
+            read_first_sheet(content, header=1, usecols=["無い列"])
+
+
+class TestReadExcelFiles:
+    """複数ファイルの読み込みと譲渡一覧への適用のテスト"""
+
+    def test_files_in_order_with_errors(self, content):
+        broken = transfer_workbook(east_rows=[["タイトルのみ"]])
+        books = read_excel_files(
+            [("a.xlsx", content), ("壊れた.xlsx", b"not an excel file"), ("b.xlsx", broken)],
+            ["譲渡許可", "譲渡－東", "譲渡－西"], max_workers=2, header=1, dtype=str,
+        )
+
+        assert [book.file_name for book in books] == ["a.xlsx", "壊れた.xlsx", "b.xlsx"]
+        assert list(books[0].sheets) == ["譲渡許可", "譲渡－東"]
+        assert books[0].missing == ["譲渡－西"]
+        assert books[1].error is not None
+        # 読み込めないシートだけをスキップ
+        assert list(books[2].sheets) == ["譲渡許可"]
+        assert list(books[2].sheet_errors) == ["譲渡－東"]
+
+    def test_load_transfer_files(self, content):
+        other = transfer_workbook(east_rows=[["譲渡－東"], ["賃借人氏名", "物件名"], ["高橋三郎", "コーポD"]])
+
+        df = load_transfer_files([("1月.xlsx", content), ("2月.xlsx", other)])
+
+        # シートごとに pd.read_excel で読み込んだ場合と同じ
+        expected = []
+        for file_name, file_content in [("1月.xlsx", content), ("2月.xlsx", other)]:
+            for sheet_name in ["譲渡許可", "譲渡－東"]:
+                sheet = pd.read_excel(io.BytesIO(file_content), sheet_name=sheet_name, dtype=str, header=1)
+                sheet["_source_info"] = f"{file_name} - {sheet_name}"
+                expected.append(sheet)
+        expected = pd.concat(expected, ignore_index=True).drop_duplicates(subset=["賃借人氏名"], keep="first")
+        pd.testing.assert_frame_equal(df, expected)
+        assert df["賃借人氏名"].dropna().tolist() == ["山田太郎", "佐藤花子", "  鈴木一郎 ", "田中次郎", "高橋三郎"]
@@ -0,0 +1,100 @@
+"""
+Excel書き出し（processors/common/excel_writer.py）のテスト
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.styles import Alignment, Font, PatternFill
+
+from processors.common.excel_writer import ExcelSheet, to_excel_bytes, write_excel
+
+
+FONT = Font(name='游ゴシック', size=11)
+
+
+def _load(excel_bytes: bytes):
+    return load_workbook(io.BytesIO(excel_bytes))
+
+
+class TestToExcelBytes:
+    """Excel書き出しのテスト"""
+
+    def test_values_and_font(self):
+        df = pd.DataFrame({"管理番号": ["M1", None], "滞納残債": [1000.0, np.nan], "": ["東京都", ""]})
+
+        ws = _load(to_excel_bytes([ExcelSheet("契約者", df, FONT)]))["契約者"]
+
+        assert [[cell.value for cell in row] for row in ws.iter_rows()] == [
+            ["管理番号", "滞納残債", None],
+            ["M1", 1000, "東京都"],
+            [None, None, None],
+        ]
+        # 空白セルを含む全セルにフォントを適用
+        for row in ws.iter_rows():
+            for cell in row:
+                assert cell.font.name == '游ゴシック'
+                assert cell.font.sz == 11
+
+    def test_number_formats_only_for_numbers(self):
+        df = pd.DataFrame({
+            "滞納残債": pd.Series([120000, "不明", np.nan], dtype=object),
+            "滞納月数": [1.25, np.inf, np.nan],
+        })
+        sheet = ExcelSheet("契約者", df, FONT, number_formats={"滞納残債": '#,##0', "滞納月数": '0.0'})
+
+        ws = _load(to_excel_bytes([sheet]))["契約者"]
+
+        assert ws["A1"].number_format == 'General'
+        assert ws["A2"].number_format == '#,##0'
+        assert ws["A3"].value == "不明"
+        assert ws["A3"].number_format == 'General'
+        assert ws["B2"].number_format == '0.0'
+        # 無限大は pd.ExcelWriter と同じく 'inf'
+        assert ws["B3"].value == 'inf'
+
+    def test_header_alignment(self):
+        df = pd.DataFrame({"管理番号": ["M1"]})
+        sheet = ExcelSheet("契約者", df, FONT, header_alignment=Alignment(horizontal='center', vertical='top'))
+
+        ws = _load(to_excel_bytes([sheet]))["契約者"]
+
+        assert ws["A1"].alignment.horizontal == 'center'
+        assert ws["A1"].alignment.vertical == 'top'
+        assert ws["A2"].alignment.horizontal is None
+
+    def test_row_fills_and_column_widths(self):
+        df = pd.DataFrame([["", "", 0], ["受託日", "債務者氏名", ""], ["", "山田", ""]])
+        yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
+        sheet = ExcelSheet(
+            "請求", df, FONT, header=False,
+            row_fills={2: (yellow_fill, 2)},
+            column_widths={'B': 25},
+        )
+
+        ws = _load(to_excel_bytes([sheet]))["請求"]
+
+        assert ws["A1"].value is None
+        assert ws["C1"].value == 0
+        assert ws["A2"].value == "受託日"
+        assert ws["A2"].fill.fgColor.rgb == '00FFFF00'
+        assert ws["B2"].fill.fgColor.rgb == '00FFFF00'
+        assert ws["B2"].font.name == '游ゴシック'
+        assert ws["C2"].fill.fill_type is None
+        assert ws["B3"].fill.fill_type is None
+        assert ws.column_dimensions['B'].width == 25
+
+    def test_multiple_sheets_in_order(self):
+        sheets = [
+            ExcelSheet("保証人1", pd.DataFrame({"氏名": ["A"]}), FONT),
+            ExcelSheet("保証人2", pd.DataFrame({"氏名": ["B", "C"]}), FONT),
+        ]
+        buffer = io.BytesIO()
+
+        write_excel(sheets, buffer)
+
+        workbook = _load(buffer.getvalue())
+        assert workbook.sheetnames == ["保証人1", "保証人2"]
+        assert workbook["保証人2"].max_row == 3
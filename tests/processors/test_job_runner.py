@@ -0,0 +1,105 @@
+"""
+バックグラウンドジョブ実行（processors/common/job_runner.py）のテスト
+"""
+
+import threading
+import time
+
+import pytest
+
+from processors.common.job_runner import DONE, FAILED, QUEUED, JobRunner
+
+
+@pytest.fixture
+def runner():
+    runner = JobRunner(max_workers=1)
+    yield runner
+    runner.shutdown()
+
+
+class TestJobRunner:
+    """ジョブの投入・状態・登録簿のテスト"""
+
+    def test_result_and_progress(self, runner):
+        submitted = threading.Event()
+
+        def process(values, scale=1):
+            submitted.wait()
+            job.update_progress(0.5, "集計中...")
+            return sum(values) * scale
+
+        job = runner.submit("s1", "ark", process, [1, 2, 3], scale=10)
+        submitted.set()
+
+        assert job.result() == 60
+        assert job.status == DONE
+        assert job.done
+        assert job.progress == 1.0
+        assert job.message == "集計中..."
+        assert job.elapsed >= 0
+        assert runner.get("s1", "ark") is job
+
+    def test_failure(self, runner):
+        def process():
+            raise ValueError("列が見つかりません")
+
+        job = runner.submit("s1", "nap", process)
+
+        with pytest.raises(ValueError):
+            job.result()
+        assert job.status == FAILED
+        assert str(job.error()) == "列が見つかりません"
+
+    def test_bounded_workers(self, runner):
+        release = threading.Event()
+        first = runner.submit("s1", "ark", release.wait)
+        second = runner.submit("s2", "ark", lambda: "ok")
+
+        assert second.status == QUEUED
+        assert runner.active_count() == 2
+
+        release.set()
+        assert second.result() == "ok"
+        assert first.done
+        assert runner.active_count() == 0
+
+    def test_registry_by_session_and_key(self, runner):
+        first = runner.submit("s1", "ark", lambda: 1)
+        second = runner.submit("s1", "ark", lambda: 2)
+        other = runner.submit("s2", "ark", lambda: 3)
+
+        assert runner.get("s1", "ark") is second
+        assert runner.get("s2", "ark") is other
+        assert runner.get("s1", "nap") is None
+        assert first.result() == 1
+
+        runner.discard("s1", "ark")
+        assert runner.get("s1", "ark") is None
+
+    def test_expire_finished_jobs(self):
+        runner = JobRunner(max_workers=1, retention_seconds=0.2)
+        runner.submit("s1", "ark", lambda: 1).result()
+        time.sleep(0.3)
+
+        runner.submit("s2", "nap", lambda: 2).result()
+
+        assert runner.get("s1", "ark") is None
+        assert runner.get("s2", "nap") is not None
+        # 投入がなくても取得・件数の確認で期限切れを削除
+        time.sleep(0.3)
+        assert runner.active_count() == 0
+        assert runner.get("s2", "nap") is None
+        runner.shutdown()
+
+    def test_retained_jobs_are_capped(self):
+        runner = JobRunner(max_workers=1, max_retained=2)
+        for number in range(4):
+            runner.submit(f"s{number}", "ark", lambda: b"x" * 1024).result()
+        release = threading.Event()
+        running = runner.submit("s9", "nap", release.wait)
+
+        # 完了の新しい2件と実行中のジョブだけが残る
+        assert [runner.get(f"s{number}", "ark") is not None for number in range(4)] == [False, False, True, True]
+        assert runner.get("s9", "nap") is running
+        release.set()
+        runner.shutdown()
@@ -0,0 +1,177 @@
+"""
+実行メトリクス（processors/common/metrics.py）のテスト
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from processors.common import metrics
+from processors.common.csv_writer import to_csv_cp932
+from processors.common.metrics import (
+    MetricsStore,
+    daily_metrics,
+    instrument_phase,
+    instrument_run,
+    measure_run,
+    measure_size,
+    metrics_frame,
+    profiling_window,
+    summarize_metrics,
+)
+from processors.common.parsed_frame_cache import get_parsed_frame_cache, read_csv_cached
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MetricsStore(tmp_path / "metrics.jsonl")
+
+
+def frame(rows):
+    return pd.DataFrame({"管理番号": [str(i) for i in range(rows)]})
+
+
+@instrument_phase("filter")
+def keep_half(df):
+    return df.iloc[: len(df) // 2]
+
+
+@instrument_phase("convert")
+def convert_and_filter(df):
+    # 他のフェーズの中の呼び出しは計測しない
+    return keep_half(df).copy()
+
+
+class TestMeasureSize:
+    """件数・バイト数の数え方のテスト"""
+
+    def test_nested_values(self):
+        assert measure_size(frame(3)) == (3, None)
+        assert measure_size(b"abcd") == (None, 4)
+        assert measure_size(io.BytesIO(b"abc")) == (None, 3)
+        assert measure_size((frame(2), ["ログ"], "out.csv")) == (2, None)
+        assert measure_size(((["a.csv", b"12"], ["b.csv", b"345"]), {})) == (None, 5)
+        assert measure_size({"a": (frame(1), []), "b": (frame(4), [])}) == (5, None)
+        assert measure_size("文字列") == (None, None)
+
+
+class TestMeasureRun:
+    """実行単位の計測・保存のテスト"""
+
+    def test_records_run_and_phases(self, store):
+        get_parsed_frame_cache().clear()
+        content = "管理番号\n1\n2\n3\n4\n".encode("cp932")
+
+        def process(content):
+            df = keep_half(read_csv_cached(content, dtype=str))
+            df = convert_and_filter(df)
+            csv, _ = to_csv_cp932(df)
+            return df, ["ログ"], "out.csv"
+
+        result = instrument_run("sample", process, store)(content)
+
+        assert len(result[0]) == 1
+        [record] = store.read()
+        assert record["processor"] == "sample"
+        assert record["status"] == "ok"
+        assert record["seconds"] > 0
+        assert record["rows_in"] == 4
+        assert record["bytes_in"] == len(content)
+        assert record["rows_out"] == 1
+        assert record["bytes_out"] > 0
+        assert record["peak_rss_mb"] > 0
+        phases = record["phases"]
+        assert set(phases) == {"read", "filter", "convert", "serialize"}
+        assert phases["filter"]["calls"] == 1
+        assert (phases["filter"]["rows_in"], phases["filter"]["rows_out"]) == (4, 2)
+        assert (phases["convert"]["rows_in"], phases["convert"]["rows_out"]) == (2, 1)
+        assert phases["serialize"]["bytes_out"] == record["bytes_out"]
+
+    def test_error_is_recorded_and_raised(self, store):
+        with pytest.raises(KeyError):
+            with measure_run("failing", store=store):
+                raise KeyError("委託先法人ID")
+
+        [record] = store.read()
+        assert record["status"] == "error"
+        assert record["error"] == "KeyError: '委託先法人ID'"
+        assert record["seconds"] >= 0
+
+    def test_peak_rss_without_psutil(self, store, monkeypatch):
+        monkeypatch.setattr(metrics, "psutil", None)
+        if not metrics.PROC_STATM.exists():
+            pytest.skip("/proc/self/statm がない環境")
+
+        instrument_run("sample", lambda: bytearray(8 * 1024 * 1024), store)()
+
+        [record] = store.read()
+        assert record["peak_rss_mb"] > 0
+        assert record["rss_delta_mb"] >= 0
+
+    def test_runs_overlapping_profiling_are_flagged(self, store):
+        with measure_run("before", store=store):
+            with profiling_window() as window:
+                with measure_run("during", store=store):
+                    pass
+        with measure_run("after", store=store):
+            pass
+
+        overlap = {record["processor"]: record["profiling_overlap"] for record in store.read()}
+        assert overlap == {"before": True, "during": True, "after": False}
+        assert sorted(window.concurrent) == ["before", "during"]
+
+    def test_phase_outside_run_is_noop(self, store):
+        assert len(keep_half(frame(4))) == 2
+        assert store.read() == []
+
+    def test_store_failure_does_not_break_processing(self, tmp_path):
+        blocked = tmp_path / "file"
+        blocked.write_text("")
+        store = MetricsStore(blocked / "metrics.jsonl")
+
+        assert instrument_run("sample", lambda: "ok", store)() == "ok"
+
+
+class TestMetricsStore:
+    """保存・集計のテスト"""
+
+    def test_skips_broken_lines_and_filters_by_date(self, store):
+        store.append({"timestamp": "2025-09-01T10:00:00", "processor": "ark"})
+        with open(store.path, "a", encoding="utf-8") as f:
+            f.write('{"timestamp": "2025-09-\n')
+        store.append({"timestamp": "2025-10-01T10:00:00", "processor": "nap"})
+
+        assert [r["processor"] for r in store.read()] == ["ark", "nap"]
+        assert [r["processor"] for r in store.read(pd.Timestamp("2025-09-15").to_pydatetime())] == ["nap"]
+
+    def test_summary_and_daily(self):
+        def record(day, seconds, status="ok"):
+            return {"timestamp": f"2025-10-0{day}T09:00:00", "processor": "ark", "status": status,
+                    "seconds": seconds, "rows_in": 1000, "peak_rss_mb": 100.0 + seconds}
+
+        records = [record(1, s) for s in (1, 2, 3, 4, 10)] + [record(2, 2), record(2, 99, "error")]
+        records.append({"timestamp": "2025-10-02T09:00:00", "processor": "nap", "status": "ok",
+                        "seconds": 0.5, "rows_in": None})
+        # プロファイル取得と重なった実行は回数にだけ含める
+        records.append({**record(1, 50), "profiling_overlap": True})
+        df = metrics_frame(records)
+
+        summary = summarize_metrics(df).set_index("processor")
+        assert summary.loc["ark", "runs"] == 8
+        assert summary.loc["ark", "errors"] == 1
+        assert summary.loc["ark", "p50_seconds"] == 2.5
+        assert summary.loc["ark", "p95_seconds"] == 8.5
+        assert summary.loc["ark", "p50_rows_per_sec"] == pytest.approx((1000 / 3 + 500) / 2)
+        assert summary.loc["ark", "max_peak_rss_mb"] == 110.0
+        assert pd.isna(summary.loc["nap", "p50_rows_per_sec"])
+
+        daily = daily_metrics(df, "ark")
+        assert daily["runs"].tolist() == [5, 1]
+        assert daily["p50_seconds"].tolist() == [3, 2]
+
+    def test_empty(self):
+        df = metrics_frame([])
+
+        assert summarize_metrics(df).empty
+        assert daily_metrics(df).empty
@@ -0,0 +1,145 @@
+"""
+読み込み結果キャッシュ（processors/common/parsed_frame_cache.py）のテスト
+"""
+
+import pandas as pd
+import pytest
+
+from processors.common import parsed_frame_cache
+from processors.common.parsed_frame_cache import ParsedFrameCache, read_csv_cached
+
+
+CSV_BYTES = "管理番号,契約者氏名\n00123,山田　太郎\n00456,佐藤　花子\n".encode("cp932")
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"管理番号": [f"{i:08d}" for i in range(rows)]})
+
+
+class _CountingParser:
+    def __init__(self, df):
+        self.df = df
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.df.copy()
+
+
+class TestParsedFrameCache:
+    """LRUキャッシュのテスト"""
+
+    def test_same_content_and_options_parse_once(self):
+        cache = ParsedFrameCache()
+        parse = _CountingParser(_frame(3))
+
+        first = cache.get_or_parse(b"abc", parse, dtype=str)
+        second = cache.get_or_parse(b"abc", parse, dtype=str)
+
+        assert parse.calls == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_options_and_content_are_part_of_key(self):
+        cache = ParsedFrameCache()
+        parse = _CountingParser(_frame(3))
+
+        cache.get_or_parse(b"abc", parse, dtype=str)
+        cache.get_or_parse(b"abc", parse, dtype=str, usecols=[0])
+        cache.get_or_parse(b"abd", parse, dtype=str)
+
+        assert parse.calls == 3
+
+    def test_returned_frames_are_independent_copies(self):
+        """呼び出し側で変更してもキャッシュの内容は変わらない"""
+        cache = ParsedFrameCache()
+        parse = _CountingParser(_frame(3))
+
+        first = cache.get_or_parse(b"abc", parse)
+        first["追加列"] = "x"
+        first.loc[0, "管理番号"] = "changed"
+        second = cache.get_or_parse(b"abc", parse)
+
+        assert list(second.columns) == ["管理番号"]
+        assert second.loc[0, "管理番号"] == "00000000"
+
+    def test_evicts_least_recently_used_within_memory_budget(self):
+        one_size = int(_frame(1000).memory_usage(index=True, deep=True).sum())
+        cache = ParsedFrameCache(max_bytes=one_size * 2)
+
+        cache.put(("a", ""), _frame(1000))
+        cache.put(("b", ""), _frame(1000))
+        cache.get(("a", ""))  # a を最近使用したものにする
+        cache.put(("c", ""), _frame(1000))
+
+        assert cache.get(("a", "")) is not None
+        assert cache.get(("b", "")) is None
+        assert cache.get(("c", "")) is not None
+        assert cache.stats()["total_bytes"] <= one_size * 2
+
+    def test_entry_limit(self):
+        cache = ParsedFrameCache(max_entries=2)
+
+        for key in ("a", "b", "c"):
+            cache.put((key, ""), _frame(1))
+
+        assert cache.stats()["entries"] == 2
+        assert cache.get(("a", "")) is None
+
+    def test_frame_larger_than_budget_is_not_cached(self):
+        cache = ParsedFrameCache(max_bytes=10)
+        parse = _CountingParser(_frame(100))
+
+        cache.get_or_parse(b"abc", parse)
+        cache.get_or_parse(b"abc", parse)
+
+        assert parse.calls == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_parse_errors_are_not_cached(self):
+        cache = ParsedFrameCache()
+
+        def failing():
+            raise ValueError("broken")
+
+        with pytest.raises(ValueError):
+            cache.get_or_parse(b"abc", failing)
+        assert cache.stats()["entries"] == 0
+
+
+class TestReadCsvCached:
+    """共有キャッシュ経由のCSV読み込みのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(parsed_frame_cache, "_shared_cache", ParsedFrameCache())
+
+    def test_second_read_skips_parsing(self, monkeypatch):
+        calls = []
+        original = parsed_frame_cache.read_csv_bytes
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(parsed_frame_cache, "read_csv_bytes", counting)
+
+        first = read_csv_cached(CSV_BYTES, dtype=str)
+        second = read_csv_cached(CSV_BYTES, dtype=str)
+
+        assert len(calls) == 1
+        assert list(second["管理番号"]) == ["00123", "00456"]
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_processors_share_parsed_upload(self):
+        """同じContractListを別のプロセッサの読み込み関数で読んでも解析は1回"""
+        from processors.sms_common.utils import read_csv_auto_encoding
+        from processors.mirail_notification import read_csv_auto_encoding as read_notification
+
+        read_csv_auto_encoding(CSV_BYTES)
+        read_notification(CSV_BYTES)
+
+        stats = parsed_frame_cache.get_parsed_frame_cache().stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
@@ -0,0 +1,110 @@
+"""
+プロファイル取得（processors/common/profiler.py）のテスト
+"""
+
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from processors.common.metrics import MetricsStore, measure_run
+from processors.common.profiler import ProfileRegistry, ProfileResult, instrument_profile, load_pstats
+
+
+def slow_sum(rows):
+    df = pd.DataFrame({"残債": range(rows)})
+    values = [row["残債"] for _, row in df.iterrows()]
+    return sum(values), bytearray(2 * 1024 * 1024)
+
+
+def profile_of(processor, started_at=None):
+    return ProfileResult(processor, started_at or datetime.now(), 0.1, b"", pd.DataFrame(), pd.DataFrame(), None)
+
+
+class TestInstrumentProfile:
+    """cProfile + tracemalloc での実行のテスト"""
+
+    def test_hot_functions_and_allocations(self):
+        profiles = []
+
+        total, _ = instrument_profile("sample", slow_sum, profiles.append, top_n=20)(500)
+
+        assert total == sum(range(500))
+        [profile] = profiles
+        assert profile.processor == "sample"
+        assert profile.error is None
+        assert profile.filename.startswith("sample_") and profile.filename.endswith(".pstats")
+        by_cumulative = profile.hot_functions("cumtime")["function"].tolist()
+        assert any(name.endswith("(slow_sum)") for name in by_cumulative[:3])
+        assert any("(iterrows)" in name for name in by_cumulative)
+        # 処理結果の bytearray は終了時点で確保されたまま
+        assert profile.allocations["size_mb"].iloc[0] >= 2
+        assert profile.allocations["location"].iloc[0].startswith("tests/processors/test_profiler.py:")
+        assert profile.peak_memory_mb >= 2
+        assert not tracemalloc.is_tracing()
+
+        stats = load_pstats(profile.pstats_bytes)
+        assert any(name == "slow_sum" for _, _, name in stats.stats)
+
+    def test_error_is_profiled_and_raised(self):
+        profiles = []
+
+        def failing():
+            raise KeyError("委託先法人ID")
+
+        with pytest.raises(KeyError):
+            instrument_profile("failing", failing, profiles.append)()
+
+        assert profiles[0].error == "KeyError: '委託先法人ID'"
+
+    def test_concurrent_runs_are_listed_and_flagged(self, tmp_path):
+        store = MetricsStore(tmp_path / "metrics.jsonl")
+        profiles = []
+
+        with measure_run("nap_registration", store=store):
+            instrument_profile("sample", slow_sum, profiles.append)(10)
+
+        assert profiles[0].concurrent_runs == ["nap_registration"]
+        assert store.read()[0]["profiling_overlap"] is True
+
+    def test_keeps_existing_tracing(self):
+        tracemalloc.start()
+        try:
+            instrument_profile("sample", slow_sum, lambda profile: None)(10)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+
+class TestProfileRegistry:
+    """予約・保存のテスト"""
+
+    def test_arm_applies_to_next_run_only(self):
+        registry = ProfileRegistry()
+
+        assert not registry.take("s1")
+        registry.arm("s1")
+        assert registry.is_armed("s1")
+        assert not registry.take("s2")
+        assert registry.take("s1")
+        assert not registry.take("s1")
+
+        registry.arm("s1")
+        registry.disarm("s1")
+        assert not registry.is_armed("s1")
+
+    def test_save_replaces_and_expires(self):
+        registry = ProfileRegistry(retention_seconds=60)
+        first = profile_of("ark", datetime.fromtimestamp(time.time() - 30))
+        second = profile_of("ark")
+        old = profile_of("nap", datetime.fromtimestamp(time.time() - 120))
+
+        registry.save("s1", old)
+        registry.save("s1", first)
+        registry.save("s1", second)
+
+        assert registry.get("s1", "ark") is second
+        assert registry.get("s2", "ark") is None
+        assert registry.list("s1") == [second]
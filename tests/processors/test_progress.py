@@ -0,0 +1,121 @@
+"""
+進捗報告（processors/common/progress.py）のテスト
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+from openpyxl.styles import Font
+
+from processors.common import progress
+from processors.common.excel_writer import ExcelSheet, to_excel_bytes
+from processors.common.job_runner import JobRunner
+from processors.common.progress import ProgressUpdate, format_seconds, progress_scope, report_progress
+
+
+class FakeClock:
+    """time.monotonic の代わり"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(progress.time, "monotonic", clock)
+    return clock
+
+
+class TestProgressReporting:
+    """report_progress の通知・間引き・残り時間のテスト"""
+
+    def test_no_scope_is_noop(self):
+        report_progress("重複チェック", 1, 3)
+
+    def test_throttle_and_always_notify_phase_change(self, clock):
+        updates = []
+        with progress_scope(updates.append, min_interval=1.0):
+            report_progress("ファイル読み込み", 0, 100)
+            clock.now += 0.1
+            report_progress("ファイル読み込み", 10, 100)  # 間引き
+            clock.now += 0.1
+            report_progress("重複チェック", 20, 100)  # フェーズ切り替え
+            clock.now += 1.0
+            report_progress("重複チェック", 50, 100)
+            clock.now += 0.1
+            report_progress("重複チェック", 100, 100)  # 完了
+
+        assert [(u.phase, u.done) for u in updates] == [
+            ("ファイル読み込み", 0), ("重複チェック", 20), ("重複チェック", 50), ("重複チェック", 100),
+        ]
+
+    def test_eta(self, clock):
+        updates = []
+        with progress_scope(updates.append, min_interval=0):
+            clock.now += 10
+            report_progress("データ変換", 1, 4)
+            clock.now += 5
+            # total が変わると残り時間は新しい報告から推定
+            report_progress("Excel書き出し", 0, 1000)
+            clock.now += 2
+            report_progress("Excel書き出し", 500, 1000)
+
+        assert updates[0].eta_seconds == pytest.approx(30)
+        assert updates[1].eta_seconds is None
+        assert updates[2].eta_seconds == pytest.approx(2)
+        assert updates[2].elapsed == pytest.approx(17)
+
+    def test_format(self):
+        update = ProgressUpdate("Excel書き出し（契約者）", 1500, 10000, 3.0, 95)
+
+        assert update.fraction == 0.15
+        assert update.format() == "Excel書き出し（契約者）（1,500/10,000） 残り約1分35秒"
+        assert ProgressUpdate("重複チェック", 3, 3, 1.0, 0).format() == "重複チェック（3/3）"
+        assert format_seconds(9.6) == "10秒"
+
+
+class TestProgressAdoption:
+    """処理・ジョブからの進捗報告のテスト"""
+
+    def test_excel_writer_reports_rows(self, monkeypatch):
+        monkeypatch.setattr("processors.common.excel_writer.PROGRESS_EVERY_ROWS", 2)
+        sheets = [
+            ExcelSheet("契約者", pd.DataFrame({"管理番号": range(4)}), Font(name='游ゴシック')),
+            ExcelSheet("保証人1", pd.DataFrame({"管理番号": range(3)}), Font(name='游ゴシック')),
+        ]
+        updates = []
+
+        with progress_scope(updates.append, min_interval=0):
+            to_excel_bytes(sheets)
+
+        assert [(u.phase, u.done, u.total) for u in updates] == [
+            ("Excel書き出し（契約者）", 0, 7),
+            ("Excel書き出し（契約者）", 2, 7),
+            ("Excel書き出し（契約者）", 4, 7),
+            ("Excel書き出し（保証人1）", 4, 7),
+            ("Excel書き出し（保証人1）", 6, 7),
+        ]
+
+    def test_job_progress(self):
+        runner = JobRunner(max_workers=1)
+        submitted = threading.Event()
+        seen = []
+
+        def process():
+            submitted.wait()
+            report_progress("重複チェック", 1, 3)
+            seen.append((job.progress, job.message))
+            return "ok"
+
+        job = runner.submit("s1", "nap", process)
+        submitted.set()
+
+        assert job.result() == "ok"
+        assert seen[0][0] == pytest.approx(1 / 3)
+        assert seen[0][1].startswith("重複チェック（1/3）")
+        runner.shutdown()
@@ -0,0 +1,153 @@
+"""
+新規登録111列テンプレート変換のゴールデンファイルテスト
+
+列単位の変換エンジン（processors/common/column_spec.py）へ移行した
+アーク・カプコ・プラザ・IOGの変換結果が、移行前の行単位処理で作成した
+期待出力（tests/fixtures/registration_golden/*_expected.csv）と一致することを確認する。
+
+処理日に依存する列（管理受託日・引継情報など）は日付を固定して比較する。
+期待出力の再生成（仕様変更時のみ）:
+    python -m tests.processors.test_registration_golden
+"""
+
+import io
+import os
+from datetime import datetime as _datetime
+
+import pandas as pd
+import pytest
+
+import processors.ark_registration as ark_registration
+import processors.capco_registration as capco_registration
+import processors.iog_registration as iog_registration
+import processors.plaza_registration as plaza_registration
+
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "..", "fixtures", "registration_golden")
+
+FROZEN_NOW = _datetime(2025, 1, 15, 9, 30, 0)
+
+
+class FrozenDatetime(_datetime):
+    """datetime.now() を固定する datetime"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+def _read_input(name: str) -> pd.DataFrame:
+    """入力データ読み込み（各プロセッサのCSV読み込みと同じく全列文字列）"""
+    path = os.path.join(GOLDEN_DIR, name)
+    if name.startswith("plaza"):
+        return pd.read_csv(path, dtype=str, keep_default_na=False)
+    return pd.read_csv(path, dtype=str)
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV出力と同じ表記に揃える（数値の固定値・空列名の重複を含めて比較）"""
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer, dtype=str, keep_default_na=False)
+
+
+def convert_all() -> dict:
+    """全ケースの変換結果（ケース名 → 111列DataFrame）"""
+    results = {}
+
+    ark_converter = ark_registration.DataConverter()
+    for region_code in (1, 3):
+        results[f"ark_region{region_code}"] = ark_converter.convert_new_contracts(
+            _read_input("ark_report.csv"), region_code
+        )
+    results["ark_old_format"] = ark_converter.convert_new_contracts(
+        _read_input("ark_report_old_format.csv")
+    )
+
+    results["capco"] = capco_registration.DataConverter().convert_new_contracts(
+        _read_input("capco_input.csv")
+    )
+
+    results["plaza"] = plaza_registration.PlazaProcessor().convert_to_output_format(
+        _read_input("plaza_input.csv")
+    )
+
+    iog_converter = iog_registration.DataConverter()
+    for has_transfer in (True, False):
+        result, _ = iog_converter.convert_jid_data_with_transfer(
+            _read_input("iog_merged.csv"), has_transfer=has_transfer
+        )
+        results[f"iog_transfer_{has_transfer}".lower()] = result
+
+    return results
+
+
+def _freeze(monkeypatch_setattr):
+    for module in (ark_registration, capco_registration, iog_registration, plaza_registration):
+        monkeypatch_setattr(module, "datetime", FrozenDatetime)
+
+
+CASES = [
+    "ark_region1",
+    "ark_region3",
+    "ark_old_format",
+    "capco",
+    "plaza",
+    "iog_transfer_true",
+    "iog_transfer_false",
+]
+
+
+@pytest.fixture(scope="module")
+def converted():
+    with pytest.MonkeyPatch.context() as mp:
+        _freeze(mp.setattr)
+        return convert_all()
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_matches_golden_output(converted, case):
+    """変換結果が期待出力と列順・値ともに一致する"""
+    result = converted[case]
+    expected = pd.read_csv(
+        os.path.join(GOLDEN_DIR, f"{case}_expected.csv"), dtype=str, keep_default_na=False
+    )
+
+    assert result.shape[1] == 111
+    assert list(result.index) == list(range(len(result)))
+    pd.testing.assert_frame_equal(_normalize(result), expected)
+
+
+@pytest.mark.parametrize("case", ["ark_region1", "capco", "plaza", "iog_transfer_true"])
+def test_empty_input_keeps_template(converted, case):
+    """0件の入力でも111列テンプレートのヘッダーを維持する"""
+    with pytest.MonkeyPatch.context() as mp:
+        _freeze(mp.setattr)
+        if case.startswith("ark"):
+            result = ark_registration.DataConverter().convert_new_contracts(
+                _read_input("ark_report.csv").iloc[0:0]
+            )
+        elif case == "capco":
+            result = capco_registration.DataConverter().convert_new_contracts(
+                _read_input("capco_input.csv").iloc[0:0]
+            )
+        elif case == "plaza":
+            result = plaza_registration.PlazaProcessor().convert_to_output_format(
+                _read_input("plaza_input.csv").iloc[0:0]
+            )
+        else:
+            result, _ = iog_registration.DataConverter().convert_jid_data_with_transfer(
+                _read_input("iog_merged.csv").iloc[0:0], has_transfer=True
+            )
+
+    assert len(result) == 0
+    assert list(result.columns) == list(converted[case].columns)
+
+
+if __name__ == "__main__":
+    with pytest.MonkeyPatch.context() as mp:
+        _freeze(mp.setattr)
+        for name, df in convert_all().items():
+            df.to_csv(os.path.join(GOLDEN_DIR, f"{name}_expected.csv"), index=False)
+            print(f"{name}: {len(df)}行")
@@ -0,0 +1,50 @@
+"""
+複数パターンの部分一致検索（processors/common/substring_matcher.py）のテスト
+"""
+
+import random
+
+import pytest
+
+from processors.common.substring_matcher import SubstringMatcher
+
+
+def _naive_first_match(patterns, text):
+    for index, pattern in enumerate(patterns):
+        if pattern and pattern in text:
+            return index
+    return None
+
+
+class TestSubstringMatcher:
+    """Aho-Corasick法による検索のテスト"""
+
+    def test_returns_smallest_pattern_index(self):
+        """text 内で先に現れるパターンではなく、番号が小さいパターンを返す"""
+        matcher = SubstringMatcher(["谷田絵理", "佐藤絵理"])
+
+        assert matcher.first_match("佐藤絵理福岡絵理谷田絵理") == 0
+
+    def test_overlapping_and_nested_patterns(self):
+        """失敗遷移先で一致するパターン（接尾辞）も検出する"""
+        matcher = SubstringMatcher(["田中太郎", "中太郎", "花子"])
+
+        assert matcher.first_match("今中太郎") == 1
+        assert matcher.first_match("田中太郎") == 0
+        assert matcher.first_match("田中花子") == 2
+
+    @pytest.mark.parametrize("text", ["", "鈴木一郎"])
+    def test_no_match(self, text):
+        matcher = SubstringMatcher(["山田太郎", ""])
+
+        assert matcher.first_match(text) is None
+
+    def test_same_result_as_checking_patterns_in_order(self):
+        rng = random.Random(0)
+        alphabet = "山田太郎花子佐藤"
+        patterns = ["".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(200)]
+        matcher = SubstringMatcher(patterns)
+
+        for _ in range(500):
+            text = "".join(rng.choices(alphabet, k=rng.randint(0, 12)))
+            assert matcher.first_match(text) == _naive_first_match(patterns, text)
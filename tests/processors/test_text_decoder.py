@@ -0,0 +1,119 @@
+"""
+共通デコーダー（processors/common/text_decoder.py）のテスト
+"""
+
+import codecs
+import io
+
+import pandas as pd
+import pytest
+
+from processors.common import text_decoder
+from processors.common.text_decoder import decode_bytes, detect_encoding, read_csv_bytes
+
+
+CSV_TEXT = "管理番号,契約者氏名,備考\n00123,山田　太郎,①髙橋様～\n00456,ｶﾀｶﾅ,\n"
+
+
+class TestDetectEncoding:
+    """エンコーディング判定のテスト"""
+
+    @pytest.mark.parametrize("encoding, expected", [
+        ("utf-8", "utf-8"),
+        ("cp932", "cp932"),
+        ("euc_jp", "euc_jp"),
+    ])
+    def test_detects_japanese_encodings(self, encoding, expected):
+        text = "管理番号,契約者氏名\n00123,山田　太郎\n"
+        assert detect_encoding(text.encode(encoding)) == expected
+
+    def test_bom(self):
+        assert detect_encoding(codecs.BOM_UTF8 + "管理番号".encode("utf-8")) == "utf-8-sig"
+        assert detect_encoding("管理番号".encode("utf-16")) == "utf-16"
+
+    def test_ascii_only(self):
+        assert detect_encoding(b"id,amount\n1,100\n") == "utf-8"
+        assert detect_encoding(b"") == "utf-8"
+
+    def test_iso2022_jp(self):
+        assert detect_encoding("管理番号\n".encode("iso2022_jp")) == "iso2022_jp"
+
+    def test_probe_starts_at_first_non_ascii_byte(self):
+        """先頭がASCIIのみでも、最初の日本語から判定する"""
+        content = b"id,name\n" * 100_000 + "1,山田\n".encode("cp932")
+
+        assert detect_encoding(content, probe_bytes=1024) == "cp932"
+
+    def test_truncated_multibyte_at_probe_end(self):
+        """プローブ範囲の末尾で途切れたマルチバイト文字はエラーにしない"""
+        content = ("あ" * 1000).encode("utf-8")
+
+        assert detect_encoding(content, probe_bytes=1000) == "utf-8"
+
+
+class TestDecodeBytes:
+    """デコード処理のテスト"""
+
+    def test_cp932_extension_characters(self):
+        """①・髙などの機種依存文字を含むCP932を読める"""
+        text, encoding = decode_bytes(CSV_TEXT.encode("cp932"))
+
+        assert encoding == "cp932"
+        assert text == CSV_TEXT
+
+    def test_bom_is_removed(self):
+        text, encoding = decode_bytes(codecs.BOM_UTF8 + CSV_TEXT.encode("utf-8"))
+
+        assert encoding == "utf-8-sig"
+        assert text == CSV_TEXT
+
+    def test_fallback_after_probe_window(self):
+        """プローブ範囲の後ろで判定が覆る場合は、残りの候補で読み直す"""
+        # 先頭はCP932としても読めるUTF-8（長音記号の並び）、末尾に漢字
+        head = "ー,ー\n" * 10
+        tail = "山田,太郎\n"
+        content = (head + "1,2\n" * 5000 + tail).encode("utf-8")
+
+        assert detect_encoding(content, encodings=("cp932", "utf-8"), probe_bytes=32) == "cp932"
+        text, encoding = decode_bytes(content, encodings=("cp932", "utf-8"), probe_bytes=32)
+
+        assert encoding == "utf-8"
+        assert text.endswith(tail)
+
+    def test_undecodable_raises(self):
+        with pytest.raises(UnicodeDecodeError):
+            decode_bytes(b"\x81 " * 10, encodings=("utf-8", "cp932"))
+
+
+class TestReadCsvBytes:
+    """CSV読み込みのテスト"""
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "cp932"])
+    def test_reads_same_dataframe(self, encoding):
+        df = read_csv_bytes(CSV_TEXT.encode(encoding), dtype=str)
+
+        assert list(df.columns) == ["管理番号", "契約者氏名", "備考"]
+        assert list(df["管理番号"]) == ["00123", "00456"]
+        assert df.loc[0, "備考"] == "①髙橋様～"
+
+    def test_reader_options_are_passed(self):
+        df = read_csv_bytes(
+            CSV_TEXT.encode("cp932"), dtype=str, keep_default_na=False, usecols=["管理番号", "備考"]
+        )
+
+        assert list(df.columns) == ["管理番号", "備考"]
+        assert df.loc[1, "備考"] == ""
+
+    def test_parser_receives_text_buffer_once(self, monkeypatch):
+        """パーサーにはデコード済みのテキストを1回だけ渡す（エンコーディングごとの再パースなし）"""
+        calls = []
+        original = pd.read_csv
+
+        def recording_read_csv(buffer, **kwargs):
+            calls.append((type(buffer), kwargs.get("encoding")))
+            return original(buffer, **kwargs)
+
+        monkeypatch.setattr(text_decoder.pd, "read_csv", recording_read_csv)
+        read_csv_bytes(CSV_TEXT.encode("cp932"), dtype=str)
+
+        assert calls == [(io.StringIO, None)]
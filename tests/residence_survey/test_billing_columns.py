@@ -0,0 +1,91 @@
+"""
+居住訪問調査報告書 請求書作成の列単位処理のテスト
+
+列版の関数（to_month_column / out_of_area_mask / determine_billing_flags）が
+行単位の関数（get_survey_month / is_out_of_area / determine_billing_rows）と同じ結果になることを確認
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from processors.residence_survey.billing_processor import (
+    TAKAHASHI_LAW_FIRM,
+    determine_billing_flags,
+    determine_billing_rows,
+    get_survey_month,
+    is_out_of_area,
+    out_of_area_mask,
+    process_residence_survey_billing,
+    to_month_column,
+)
+
+DATE_VALUES = ['2025/10/05', '2025-09-30', '2025-10-31 10:00', 'abc', '', np.nan, None]
+
+
+def _survey_frame() -> pd.DataFrame:
+    """提出日の全組み合わせ × 依頼元（通常 / 高橋裕次郎）"""
+    dates = ['2025/10/05', '2025/09/10', np.nan]
+    rows = []
+    for law_firm in ['トラスト弁護士法人', TAKAHASHI_LAW_FIRM]:
+        for first, second, third in itertools.product(dates, repeat=3):
+            rows.append({
+                'レコード番号': len(rows),
+                '依頼元': law_firm,
+                '会員番号': 1000 + len(rows),
+                '居住者名': '山田',
+                '住所': '北海道札幌市' if len(rows) % 2 else '東京都千代田区',
+                '調査日時【１回目】': np.nan,
+                '調査日時【２回目】': np.nan,
+                '調査日時【３回目】': np.nan,
+                '1回目提出日': first,
+                '2回目提出日': second,
+                '3回目提出日': third,
+                '請求事項': '',
+            })
+    return pd.DataFrame(rows)
+
+
+def test_to_month_column():
+    values = pd.Series(DATE_VALUES, index=[5, 5, 3, 2, 1, 0, 9])
+
+    months = to_month_column(values)
+
+    assert months.index.equals(values.index)
+    assert [None if pd.isna(m) else m for m in months] == [get_survey_month(v) for v in DATE_VALUES]
+
+
+def test_out_of_area_mask():
+    addresses = pd.Series(['北海道札幌市', '東京都千代田区', ' 山形県', '沖縄県那覇市', np.nan])
+
+    assert out_of_area_mask(addresses).tolist() == [is_out_of_area(a) for a in addresses]
+
+
+@pytest.mark.parametrize("selected_month", ['202510', '202509', None])
+def test_determine_billing_flags(selected_month):
+    df = _survey_frame()
+    is_takahashi = df['依頼元'] == TAKAHASHI_LAW_FIRM
+
+    flags = determine_billing_flags(df, is_takahashi, selected_month)
+
+    for idx, row in df.iterrows():
+        expected = determine_billing_rows(row, is_takahashi[idx], selected_month)
+        assert [times for times in (1, 2, 3) if flags.loc[idx, times]] == sorted(expected)
+
+
+def test_billing_rows_in_input_order():
+    """各シートのデータ行は元の行順 → 回数順"""
+    df = _survey_frame()
+
+    excel_buffer, _, _, logs = process_residence_survey_billing(df, selected_month='202510')
+
+    sheet = pd.read_excel(excel_buffer, sheet_name=TAKAHASHI_LAW_FIRM, header=1)
+    numbers = sheet['依頼者債権番号'].tolist()
+    assert numbers == sorted(numbers)
+    assert sheet['費用備考'].str.match(r'^現地調査\([123]回目\)(　エリア外)?$').all()
+    assert f"  - {TAKAHASHI_LAW_FIRM}: {len(sheet)}行" in logs
+
+    excel_buffer.seek(0)
+    assert load_workbook(excel_buffer).sheetnames[0] == 'トラスト弁護士法人'
@@ -71,21 +71,22 @@ class TestAppIntegration:
         ark_file = mock_file_factory(sample_ark_data, "ark_data.csv")
         contract_file = mock_file_factory(sample_contract_data, "contract_list.csv")
         
+        # 必須カラム（未収金額合計）がない場合は原因を含むエラー
+        with pytest.raises(ValueError, match="未収金額合計"):
+            process_ark_late_payment_data(ark_file, contract_file)
+
         # 統合処理実行
-        result = process_ark_late_payment_data(ark_file, contract_file)
-        
-        if result is not None:
-            # Ark processors return 2 values
-            output_df, filename = result
-            
-            # 統合処理結果の検証
-            assert isinstance(output_df, pd.DataFrame), "統合処理の出力がDataFrameではない"
-            assert isinstance(filename, str), "ファイル名が文字列ではない"
-            assert len(filename) > 0, "ファイル名が空"
-            assert 'アーク残債' in filename, "ファイル名にアーク残債が含まれていない"
-        else:
-            # データが条件に合わない場合はNoneが返される
-            assert True, "統合処理でデータが条件に合わずNoneが返された"
+        ark_file = mock_file_factory(
+            sample_ark_data.rename(columns={'管理前滞納額': '未収金額合計'}), "ark_data.csv"
+        )
+        output_df, logs, filename = process_ark_late_payment_data(ark_file, contract_file)
+
+        # 統合処理結果の検証
+        assert isinstance(output_df, pd.DataFrame), "統合処理の出力がDataFrameではない"
+        assert len(output_df) == 4
+        assert isinstance(logs, list), "ログがリストではない"
+        assert isinstance(filename, str), "ファイル名が文字列ではない"
+        assert 'アーク残債' in filename, "ファイル名にアーク残債が含まれていない"
 
     @pytest.mark.integration
     def test_mirail_contract_integration(self, sample_mirail_data, mock_file_factory):
@@ -132,13 +133,15 @@ class TestAppIntegration:
     @pytest.mark.integration  
     def test_file_naming_conventions(self, sample_ark_data, sample_contract_data, mock_file_factory):
         """ファイル命名規則の統合テスト"""
-        ark_file = mock_file_factory(sample_ark_data, "ark_data.csv")
+        ark_file = mock_file_factory(
+            sample_ark_data.rename(columns={'管理前滞納額': '未収金額合計'}), "ark_data.csv"
+        )
         contract_file = mock_file_factory(sample_contract_data, "contract_list.csv")
         
         result = process_ark_late_payment_data(ark_file, contract_file)
         
         if result is not None:
-            output_df, filename = result
+            output_df, logs, filename = result
             
             # ファイル命名規則の確認
             assert filename.endswith('.csv'), "ファイル名が.csvで終わっていない"
@@ -186,7 +189,7 @@ class TestAppIntegration:
         # 大量データでの処理テスト
         large_data = pd.DataFrame({
             '契約番号': [f'A{i:04d}' for i in range(100)],  # 100件に縮小
-            '管理前滞納額': [50000 + i for i in range(100)]
+            '未収金額合計': [50000 + i for i in range(100)]
         })
         
         contract_data = pd.DataFrame({
@@ -209,5 +212,5 @@ class TestAppIntegration:
         
         # 結果確認
         if result is not None:
-            output_df, filename = result
+            output_df, logs, filename = result
             assert len(output_df) <= 100, "出力データ件数が期待値を超える"
\ No newline at end of file
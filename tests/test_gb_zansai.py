@@ -158,7 +158,7 @@ class TestMatchingLogic:
         }
         seikyu_df = pd.DataFrame(seikyu_data)
 
-        result_df, logs = match_data(seikyu_df, contract_df)
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
 
         assert len(result_df) == 2
         assert result_df.iloc[0]["管理番号"] == "80444"
@@ -184,7 +184,7 @@ class TestMatchingLogic:
         }
         seikyu_df = pd.DataFrame(seikyu_data)
 
-        result_df, logs = match_data(seikyu_df, contract_df)
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
 
         # マッチしたのは1件のみ
         assert len(result_df) == 1
@@ -211,11 +211,32 @@ class TestMatchingLogic:
         }
         seikyu_df = pd.DataFrame(seikyu_data)
 
-        result_df, logs = match_data(seikyu_df, contract_df)
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
 
         assert len(result_df) == 0
+        assert unmatched_df["ユーザーID"].tolist() == ["999998", "999999"]
+        # マッチしなかったユーザーIDは1行の要約ログにまとめる
         unmatched_logs = [log for log in logs if "マッチしませんでした" in log]
-        assert len(unmatched_logs) == 2
+        assert len(unmatched_logs) == 1
+        assert "2件" in unmatched_logs[0]
+        assert "999998" in unmatched_logs[0] and "999999" in unmatched_logs[0]
+
+    def test_unmatched_log_summary_is_truncated(self):
+        """マッチしなかったユーザーIDが多い場合は先頭のみ列挙し、全件はDataFrameで返す"""
+        from processors.gb_zansai import match_data, GBZansaiConfig
+
+        contract_df = pd.DataFrame({"管理番号": ["80444"], "引継番号": ["264048"]})
+        seikyu_df = pd.DataFrame({"ユーザーID": range(100000, 100500), "請求総額": 1000})
+
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
+
+        assert len(unmatched_df) == 500
+        assert list(unmatched_df.columns) == GBZansaiConfig.UNMATCHED_COLUMNS
+        assert logs == [
+            "⚠️ マッチしませんでした: 500件 ユーザーID "
+            + ", ".join(str(i) for i in range(100000, 100000 + GBZansaiConfig.UNMATCHED_LOG_LIMIT))
+            + f" ほか{500 - GBZansaiConfig.UNMATCHED_LOG_LIMIT}件（全件はマッチなしCSVで確認）"
+        ]
 
     def test_matching_logs_include_user_id(self):
         """マッチしなかったユーザーIDがログに含まれることを確認"""
@@ -233,7 +254,7 @@ class TestMatchingLogic:
         }
         seikyu_df = pd.DataFrame(seikyu_data)
 
-        result_df, logs = match_data(seikyu_df, contract_df)
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
 
         assert any("123456" in log for log in logs)
 
@@ -470,12 +491,43 @@ class TestEdgeCases:
         }
         seikyu_df = pd.DataFrame(seikyu_data)
 
-        result_df, logs = match_data(seikyu_df, contract_df)
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
 
         # 型が違ってもマッチすること
         assert len(result_df) == 1
         assert result_df.iloc[0]["管理番号"] == "80444"
 
+    def test_float_user_id(self):
+        """ユーザーIDが小数表記（空欄を含むExcel列で 264048.0 など）でもマッチすること"""
+        from processors.gb_zansai import match_data
+
+        contract_df = pd.DataFrame({"管理番号": ["80444", "80314"], "引継番号": ["264048", " 58801 "]})
+        seikyu_df = pd.DataFrame({
+            "ユーザーID": [264048.0, None, 58801.0],
+            "請求総額": [25596, 10000, 180639]
+        })
+
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
+
+        assert result_df["管理番号"].tolist() == ["80444", "80314"]
+        assert result_df["管理前滞納額"].tolist() == [25596, 180639]
+        # 空欄のユーザーIDはマッチしない
+        assert len(unmatched_df) == 1
+        assert unmatched_df.iloc[0]["請求総額"] == 10000
+
+    def test_duplicate_hikitsugi_uses_last_row(self):
+        """引継番号が重複する場合は後の行の管理番号を使うこと（従来の辞書と同じ）"""
+        from processors.gb_zansai import match_data
+
+        contract_df = pd.DataFrame({"管理番号": ["80444", "80999"], "引継番号": ["264048", "264048"]})
+        seikyu_df = pd.DataFrame({"ユーザーID": [264048], "請求総額": [25596]})
+
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
+
+        assert result_df["管理番号"].tolist() == ["80999"]
+        assert unmatched_df.empty
+        assert logs == []
+
     def test_large_amount(self):
         """大きな金額のテスト"""
         from processors.gb_zansai import match_data
@@ -492,6 +544,6 @@ class TestEdgeCases:
         }
         seikyu_df = pd.DataFrame(seikyu_data)
 
-        result_df, logs = match_data(seikyu_df, contract_df)
+        result_df, unmatched_df, logs = match_data(seikyu_df, contract_df)
 
         assert result_df.iloc[0]["管理前滞納額"] == 999999999
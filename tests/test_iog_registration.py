@@ -465,6 +465,35 @@ class TestPartialNameMatching:
         matched = self.find_matching_transfer("山田太郎", transfer_df)
         assert matched is None
 
+    def test_部分一致_複数マッチは譲渡一覧で先の行(self):
+        """複数の譲渡一覧氏名が含まれる場合は譲渡一覧で先に出現する行を返す"""
+        transfer_df = pd.DataFrame({
+            "賃借人氏名": ["福岡絵理", "佐藤絵理", "福岡絵理"],
+            "物件名": ["物件1", "物件2", "物件3"]
+        })
+
+        matched = self.find_matching_transfer("佐藤絵理福岡絵理", transfer_df)
+        assert matched["物件名"] == "物件1"
+
+    def test_部分一致_一括マージ(self):
+        """部分一致した行に譲渡一覧の全列がマージされる"""
+        jid_df = pd.DataFrame({
+            "対象者名": ["佐藤絵理福岡絵理谷田絵理", "鈴木一郎", "岩城美生長野美生"]
+        })
+
+        transfer_df = pd.DataFrame({
+            "賃借人氏名": ["長野美生", "谷田絵理"],
+            "物件名": ["物件A", "物件B"],
+            "_source_info": ["ファイル1", "ファイル2"]
+        })
+
+        merged_df, duplicates, match_stats = self.merge_transfer_data(jid_df, transfer_df)
+
+        assert match_stats["partial"] == 2
+        assert list(merged_df["物件名"].fillna("")) == ["物件B", "", "物件A"]
+        assert list(merged_df["_source_info"].fillna("")) == ["ファイル2", "", "ファイル1"]
+        assert list(merged_df["賃借人氏名"].fillna("")) == ["谷田絵理", "", "長野美生"]
+
     def test_部分一致_完全一致優先(self):
         """完全一致がある場合は部分一致より優先されることを確認"""
         jid_df = pd.DataFrame({
@@ -0,0 +1,966 @@
+"""
+規模テスト用の合成データ生成
+
+ContractList（122列）と、それに対応するクライアント入力ファイルを
+任意の件数（1万〜100万行）で生成する。値は列番号（ContractListColumns）どおりに並び、
+氏名・住所（data/municipalities.json の市区町村）・電話番号の表記揺れ・
+委託先法人ID・回収ランク・日付・金額の分布を実データに近づけている。
+
+生成するファイル:
+- ContractList: 122列（ヘッダーは _docs/headers/contract_list_headers.txt の121列 + 末尾の空列）
+- アーク: 案件取込用レポート（40列、契約番号 ⟷ ContractList「引継番号」）
+- カプコ: カプコ元データ（46列、契約No ⟷ 引継番号）
+- プラザ新規登録: コールセンター回収委託CSV（44列、会員番号 ⟷ 引継番号）
+- プラザ残債更新: コールセンター回収委託情報Excel（前日・当日）と 1241件.csv
+- IOG: JID返却データExcel と 譲渡一覧Excel（3シート、1行目タイトル・2行目ヘッダー）
+- オートコール履歴: list_export.csv
+- ナップ: ミライル様依頼データCSV（承認番号 ⟷ 引継番号）
+- カプコ残債更新: csv_arrear（契約No ⟷ 引継番号）
+- ガレージバンク催告書: 情報連携シートExcel（01_請求データ、ユーザーID ⟷ 引継番号）
+- 居住訪問調査報告書CSV
+
+クライアント入力の一部（overlap の割合）は ContractList に登録済みの番号を使うため、
+各新規登録処理の重複チェックでも一定数が除外される。
+同じ seed・件数・基準日からは同じデータが生成される。
+
+使用例:
+    from tests.utils.synthetic_data import SyntheticDataset, to_csv_bytes
+
+    dataset = SyntheticDataset(100_000, seed=0)
+    contract_content = to_csv_bytes(dataset.contract_list())
+    report_content = to_csv_bytes(dataset.ark_report())
+
+実行方法（ファイル出力）:
+    python -m tests.utils.synthetic_data 出力先ディレクトリ [--rows 100000] [--encoding cp932] [--seed 0]
+"""
+
+import argparse
+import io
+import json
+from datetime import date, timedelta
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.residence_survey.billing_processor import LAW_FIRM_PRIORITY
+
+
+MUNICIPALITIES_PATH = Path(__file__).resolve().parents[2] / "data" / "municipalities.json"
+
+# Excel の最大行数（ヘッダー行を除く）
+EXCEL_MAX_ROWS = 1_048_575
+
+# ContractList の列名（_docs/headers/contract_list_headers.txt、末尾の空列を加えて122列）
+CONTRACT_LIST_HEADERS = [
+    "管理番号", "引継番号", "最新契約種類", "契約確認日", "保証開始日", "保証契約", "承認番号", "月初契約種類",
+    "月初レントワン 2ヵ月以下料金", "月初レントワン 3～6ヵ月料率", "月初レントワン 7ヵ月以上料率",
+    "月初滞納残債(過入金なし)", "月初適用手数料", "受託状況", "入居ステータス", "滞納ステータス", "手数料率",
+    "退去手続き（実費）", "更新契約手数料", "営業担当者", "契約者氏名", "契約者カナ", "郵便番号", "現住所1",
+    "現住所2", "現住所3", "TEL自宅", "TEL携帯", "契約者勤務先名称", "契約者勤務先電話番号", "契約者勤務先郵便番号",
+    "契約者勤務先現住所1", "契約者勤務先現住所2", "契約者勤務先現住所3", "回収口座銀行CD", "回収口座銀行名",
+    "回収口座支店CD", "回収口座支店名", "回収口座種類", "回収口座番号", "回収口座名義人",
+    "保証人１氏名", "郵便番号", "現住所1", "現住所2", "現住所3", "TEL携帯", "契約者との関係",
+    "保証人２氏名", "郵便番号", "現住所1", "現住所2", "現住所3", "TEL携帯", "契約者との関係",
+    "緊急連絡人１氏名", "緊急連絡人１のTEL（携帯）", "郵便番号", "現住所1", "現住所2", "現住所3", "契約者との関係",
+    "緊急連絡人２氏名", "郵便番号", "現住所1", "現住所2", "現住所3", "契約者との関係",
+    "催告書契約者", "催告書保証人", "催告書緊急連絡人", "滞納残債", "入金予定日", "入金予定金額", "最終入金日",
+    "最終入金額", "最終入金者", "月額賃料", "管理費", "共益費", "水道代", "駐車場代", "その他費用1", "その他費用2",
+    "月額賃料合計", "管理会社", "回収ランク", "住民票取得日契約者", "住民票取得日保証人１", "住民票取得日保証人２",
+    "合意書得日", "物件住所郵便番号", "物件住所1", "物件住所2", "物件住所3", "物件名", "物件番号", "クライアントCD",
+    "クライアント名", "クライアント情報の区分", "電話番号", "FAX番号", "クライアント住所郵便番号", "クライアント住所",
+    "金融機関", "支店", "種別", "口座番号", "口座名義", "パートナーCD", "パートナー名", "営業担当", "メール",
+    "家賃精算口座金融機関", "家賃精算口座支店", "家賃精算口座種別", "家賃精算口座番号", "家賃精算口座名義",
+    "委託先法人ID", "委託先法人名", "解約日", "",
+]
+
+# アーク 案件取込用レポート（_docs/headers/ark_input_headers.txt）
+ARK_REPORT_HEADERS = [
+    "契約番号", "契約元帳: 主契約者", "主契約者（カナ）", "生年月日1", "自宅TEL1", "携帯TEL1", "自宅住所1", "取引先",
+    "物件名", "部屋番号", "物件住所", "契約区分", "賃料", "管理共益費", "駐車場料金", "その他料金", "決済サービス料",
+    "バーチャル口座(銀行)", "バーチャル口座(支店)", "バーチャル口座(口座番号)", "未収金額合計", "勤務先1", "勤務先TEL1",
+    "契約者業種", "勤務先住所1", "名前2", "名前2（カナ）", "種別／続柄２", "生年月日2", "自宅住所2", "自宅TEL2",
+    "携帯TEL2", "名前3", "名前3（カナ）", "種別／続柄３", "生年月日3", "自宅住所3", "自宅TEL3", "携帯TEL3", "入居日",
+]
+
+# カプコ元データ（_docs/headers/capco_input_headers.txt）
+CAPCO_REPORT_HEADERS = [
+    "契約No", "請求年月", "地域", "商品", "契約開始", "契約終了", "退去日", "審査状況", "審査状況", "契約者名",
+    "契約者ふりがな", "契約者：電話番号", "契約者：携帯番号", "契約者：メールアドレス", "建物名", "部屋名",
+    "建物：郵便番号", "建物：住所", "請求額", "入金額", "最終入金日", "振込手数料入金", "その他調整入金", "滞納額",
+    "滞納額合計", "督促", "弁護士委託日", "弁護士事務所", "約定日", "約定備考", "控除", "控除メモ", "他社保証会社",
+    "他社更新料", "他社更新日", "管理会社", "加盟店", "最終対応日時", "最終対応者", "最終対応履歴内容", "口振開始日",
+    "V口座銀行名", "V口振支店名", "V口振番号", "V口座振込先", "管理区分",
+]
+
+# プラザ コールセンター回収委託CSV（_docs/headers/plaza_sms_call_center_headers.txt）
+PLAZA_REPORT_HEADERS = [
+    "コールセンター送信日", "文章タイプ", "部屋受付番号", "会員番号", "号室", "AP番号", "氏名（漢字）", "フリガナ",
+    "生年月日", "郵便番号", "住所", "物件名", "電話番号", "メール", "業態区分名", "国籍", "契約日", "入居日",
+    "利用料合計", "未納利用料合計", "支払年保金額", "未納年保金額", "支払更新料", "未納更新料", "未納事務手数料",
+    "延滞合計", "事務手数料", "バーチャル口座支店番号", "バーチャル口座支店名", "バーチャル口座番号",
+    "マイペイメントurl", "支払期日", "連帯保証人　名（漢字）", "連帯保証人　フリガナ", "連帯保証人　続柄",
+    "連帯保証人　電話番号", "緊急連絡人　氏名（漢字）", "緊急連絡人　フリガナ", "緊急連絡人　続柄",
+    "緊急連絡人　電話番号", "勤務先名", "勤務先住所", "勤務先TEL", "滞納スパン",
+]
+
+# IOG JID返却データ
+IOG_JID_HEADERS = ["保証番号", "対象者名", "フリガナ", "自宅電話", "携帯", "自宅", "郵便番号", "差引残高", "受任日"]
+
+# IOG 譲渡一覧（3シート共通）
+IOG_TRANSFER_SHEETS = ["譲渡許可", "譲渡－東", "譲渡－西"]
+IOG_TRANSFER_HEADERS = [
+    "賃借人氏名", "物件名", "物件郵便番号", "物件都道府県", "物件市区町村", "物件町域名",
+    "連帯保証人氏名（滞納）", "連帯保証人続柄名（滞納）", "連帯保証人郵便番号（滞納）", "連帯保証人都道府県（滞納）",
+    "連帯保証人市区町村（滞納）", "連帯保証人町域名（滞納）", "連帯保証人マンションなど（滞納）",
+    "連帯保証人電話番号（滞納）", "連帯保証人携帯電話電話号（滞納）",
+    "緊急連絡先氏名（滞納）", "緊急連絡先続柄名（滞納）", "緊急連絡先郵便番号（滞納）", "緊急連絡先都道府県（滞納）",
+    "緊急連絡先市区町村（滞納）", "緊急連絡先町域名（滞納）", "緊急連絡先マンションなど（滞納）",
+    "緊急連絡先電話番号（滞納）", "緊急連絡先携帯電話電話号（滞納）",
+]
+
+# オートコール list_export
+LIST_EXPORT_HEADERS = [
+    "顧客ID", "電話番号", "入居ステータス", "滞納ステータス", "作成日", "更新日", "更新時間", "管理番号",
+    "契約者名（カナ）", "物件名", "クライアント", "架電番号", "ステータス", "残債", "事前情報8", "架電結果",
+    "再コール日", "再コール時間", "所属", "担当OP", "架電禁止", "最終履歴OP", "最終架電日", "架電回数", "メモ",
+]
+
+SURNAMES = [
+    ("佐藤", "サトウ"), ("鈴木", "スズキ"), ("高橋", "タカハシ"), ("田中", "タナカ"), ("伊藤", "イトウ"),
+    ("渡辺", "ワタナベ"), ("山本", "ヤマモト"), ("中村", "ナカムラ"), ("小林", "コバヤシ"), ("加藤", "カトウ"),
+    ("吉田", "ヨシダ"), ("山田", "ヤマダ"), ("佐々木", "ササキ"), ("山口", "ヤマグチ"), ("松本", "マツモト"),
+    ("井上", "イノウエ"), ("木村", "キムラ"), ("林", "ハヤシ"), ("斎藤", "サイトウ"), ("清水", "シミズ"),
+    ("山崎", "ヤマザキ"), ("森", "モリ"), ("池田", "イケダ"), ("橋本", "ハシモト"), ("阿部", "アベ"),
+    ("石川", "イシカワ"), ("岡本", "オカモト"), ("藤田", "フジタ"), ("後藤", "ゴトウ"), ("長谷川", "ハセガワ"),
+    ("髙橋", "タカハシ"), ("山﨑", "ヤマザキ"), ("齋藤", "サイトウ"), ("渡邊", "ワタナベ"),
+]
+GIVEN_NAMES = [
+    ("太郎", "タロウ"), ("花子", "ハナコ"), ("一郎", "イチロウ"), ("健太", "ケンタ"), ("翔太", "ショウタ"),
+    ("美咲", "ミサキ"), ("大輔", "ダイスケ"), ("由美", "ユミ"), ("直樹", "ナオキ"), ("恵子", "ケイコ"),
+    ("拓也", "タクヤ"), ("陽子", "ヨウコ"), ("誠", "マコト"), ("愛", "アイ"), ("浩", "ヒロシ"),
+    ("真由美", "マユミ"), ("隆", "タカシ"), ("さくら", "サクラ"), ("蓮", "レン"), ("結衣", "ユイ"),
+]
+# 外国籍の契約者（全体の数%）
+FOREIGN_NAMES = [
+    ("NGUYEN VAN AN", "グエン　ヴァン　アン"), ("TRAN THI HOA", "チャン　ティ　ホア"),
+    ("WANG WEI", "ワン　ウェイ"), ("KIM MINJUN", "キム　ミンジュン"),
+]
+TOWNS = ["本町", "中央", "栄町", "緑町", "旭町", "東町", "西新町", "南町", "北町", "元町", "桜台", "若葉町"]
+BUILDINGS = ["サンハイツ", "コーポ山田", "シャトー", "メゾン緑", "グランドール", "レジデンス中央", "パークハイム"]
+COMPANIES = ["株式会社サンプル商事", "有限会社テスト工業", "合同会社ミライ", "株式会社山田建設", "自営", "無職", "パート"]
+RELATIONS = ["父", "母", "兄", "姉", "弟", "妹", "配偶者", "知人", "子"]
+
+# 委託先法人ID（空白=ミライル、1〜4・8=フェイス、5=ミライル、6=プラザ、7=ガレージバンク）
+TRUSTEE_IDS = (["", "1", "2", "3", "4", "5", "6", "7", "8"], [0.30, 0.10, 0.06, 0.05, 0.04, 0.25, 0.08, 0.08, 0.04])
+# 回収ランク
+COLLECTION_RANKS = (
+    ["通常", "督促", "交渉困難", "弁護士介入", "訴訟中", "破産決定", "死亡決定"],
+    [0.62, 0.15, 0.08, 0.06, 0.04, 0.03, 0.02],
+)
+RESIDENCE_STATUSES = (["入居中", "退去済", "退去予定"], [0.70, 0.25, 0.05])
+DELINQUENT_STATUSES = (["未精算", "精算済", "保証中"], [0.60, 0.30, 0.10])
+TRUSTEE_STATUSES = (["契約中", "解約", "保留"], [0.85, 0.12, 0.03])
+# 入金予定金額（2・3・5円は各処理の除外金額）
+PAYMENT_AMOUNTS = (["", "2", "3", "5", "10000", "20000", "30000", "50000"], [0.55, 0.03, 0.02, 0.02, 0.12, 0.10, 0.08, 0.08])
+CALL_RESULTS = (["通話済", "留守電", "不在", "話中", "応答なし", "その他"], [0.25, 0.25, 0.20, 0.10, 0.15, 0.05])
+
+
+class SyntheticDataset:
+    """同じ契約者集団から ContractList とクライアント入力を生成する"""
+
+    def __init__(self, rows: int = 10_000, seed: int = 0, today: Optional[date] = None, overlap: float = 0.3):
+        """
+        Args:
+            rows: ContractList の行数
+            seed: 乱数のシード
+            today: 基準日（入金予定日・受任日などの日付の基準、省略時は今日）
+            overlap: クライアント入力のうち ContractList に登録済みの番号の割合
+        """
+        self.rows = rows
+        self.seed = seed
+        self.today = today or date.today()
+        self.overlap = overlap
+
+    def _rng(self, name: str) -> np.random.Generator:
+        """ファイルごとの乱数（生成順に関係なく同じ結果にする）"""
+        return np.random.default_rng([self.seed, sum(name.encode())])
+
+    # ========== ContractList ==========
+
+    @cached_property
+    def _contract_keys(self) -> Dict[str, np.ndarray]:
+        """引継番号（クライアントごとの番号体系）"""
+        rng = self._rng("contract_keys")
+        kinds = rng.choice(["ark", "capco", "plaza", "iog", "other"], self.rows, p=[0.35, 0.20, 0.20, 0.10, 0.15])
+        serial = np.arange(self.rows)
+        prefixes = {"ark": "ARK", "capco": "CP", "plaza": "PZ", "iog": "IOG", "other": "T"}
+        keys = np.empty(self.rows, dtype=object)
+        for kind, prefix in prefixes.items():
+            mask = kinds == kind
+            keys[mask] = _numbered(prefix, serial[mask], 7)
+        return {"kind": kinds, "key": keys}
+
+    def registered_keys(self, kind: str) -> np.ndarray:
+        """ContractList に登録済みの引継番号（クライアント別）"""
+        keys = self._contract_keys
+        return keys["key"][keys["kind"] == kind]
+
+    def contract_list(self) -> pd.DataFrame:
+        """ContractList（122列、列番号は ContractListColumns と一致）"""
+        n = self.rows
+        rng = self._rng("contract_list")
+        people = _People(rng, n)
+        columns: Dict[int, object] = {}
+
+        columns[COL.MANAGEMENT_NO] = (np.arange(n) + 100_001).astype(str)
+        columns[1] = self._contract_keys["key"]
+        columns[2] = _choice(rng, n, (["レントワン", "スタンダード", "プレミアム"], [0.6, 0.3, 0.1]))
+        columns[3] = _dates(rng, n, self.today - timedelta(days=3650), self.today)
+        columns[13] = _choice(rng, n, TRUSTEE_STATUSES)
+        columns[COL.RESIDENCE_STATUS] = _choice(rng, n, RESIDENCE_STATUSES)
+        columns[COL.DELINQUENT_STATUS] = _choice(rng, n, DELINQUENT_STATUSES)
+        columns[17] = _amounts(rng, n, 0, 0.7)
+        columns[19] = _choice(rng, n, (["担当A", "担当B", "担当C", ""], [0.3, 0.3, 0.2, 0.2]))
+
+        # 契約者
+        columns[COL.CONTRACT_NAME] = people.names
+        columns[COL.CONTRACT_KANA] = people.kana
+        columns[22], columns[23], columns[24], columns[25] = _Address(rng, n).split()
+        columns[26] = _phones(rng, n, landline=True, blank=0.6)
+        columns[COL.TEL_MOBILE] = _phones(rng, n, blank=0.1)
+        columns[28] = _choice(rng, n, (COMPANIES, None))
+        columns[29] = _phones(rng, n, landline=True, blank=0.5)
+
+        # 回収口座
+        columns[34] = np.full(n, "0310")
+        columns[35] = np.full(n, "GMOあおぞらネット銀行")
+        columns[36] = _numbered("", rng.integers(100, 200, n), 3)
+        columns[37] = _choice(rng, n, (["法人第一営業部", "法人第二営業部", "ビジネス営業部"], None))
+        columns[38] = np.full(n, "普通")
+        columns[39] = _numbered("", rng.integers(1_000_000, 9_999_999, n), 7)
+        columns[40] = np.full(n, "ミライル（カ")
+
+        # 保証人１・２、緊急連絡人１・２（氏名が空の人は連絡先も空）
+        for name_col, address_cols, phone_col, relation_col, present in [
+            (41, (42, 43, 44, 45), 46, 47, 0.7),
+            (48, (49, 50, 51, 52), 53, 54, 0.2),
+            (55, (57, 58, 59, 60), COL.TEL_MOBILE_2, 61, 0.6),
+            (62, (63, 64, 65, 66), None, 67, 0.15),
+        ]:
+            mask = rng.random(n) < present
+            columns[name_col] = np.where(mask, _People(rng, n).names, "")
+            for column, values in zip(address_cols, _Address(rng, n).split()):
+                columns[column] = np.where(mask, values, "")
+            if phone_col is not None:
+                columns[phone_col] = np.where(mask, _phones(rng, n, blank=0.1), "")
+            columns[relation_col] = np.where(mask, _choice(rng, n, (RELATIONS, None)), "")
+
+        # 金額・日付
+        debt = _amounts(rng, n, 0.25, 60_000)
+        comma = rng.random(n) < 0.05
+        columns[COL.DEBT_AMOUNT] = np.where(comma, pd.Series(debt).astype(int).map("{:,}".format), debt.astype(str))
+        columns[COL.PAYMENT_DATE] = np.where(
+            rng.random(n) < 0.4, _dates(rng, n, self.today - timedelta(days=60), self.today + timedelta(days=30)), ""
+        )
+        columns[COL.PAYMENT_AMOUNT] = _choice(rng, n, PAYMENT_AMOUNTS)
+        columns[74] = _dates(rng, n, self.today - timedelta(days=365), self.today)
+        columns[75] = _amounts(rng, n, 0, 40_000).astype(str)
+        rent = (rng.integers(30, 150, n) * 1000)
+        management = rng.choice([0, 2000, 3000, 5000, 10000], n)
+        columns[77] = rent.astype(str)
+        columns[78] = management.astype(str)
+        for column in range(79, 84):
+            columns[column] = np.full(n, "0")
+        columns[84] = (rent + management).astype(str)
+        columns[85] = _choice(rng, n, (["管理会社A", "管理会社B", "管理会社C", "管理会社D"], None))
+        columns[COL.COLLECTION_RANK] = _choice(rng, n, COLLECTION_RANKS)
+
+        # 物件・クライアント
+        property_address = _Address(rng, n)
+        columns[91], columns[92], columns[93], columns[94] = property_address.split()
+        columns[COL.PROPERTY_NAME] = property_address.building
+        columns[96] = _numbered("P", rng.integers(0, max(n // 5, 1), n), 6)
+        client_cd = rng.zipf(1.6, n) % 3000 + 1
+        columns[COL.CLIENT_CD] = client_cd.astype(str)
+        columns[COL.CLIENT_NAME] = _numbered("クライアント", client_cd, 4)
+
+        trustee_id = _choice(rng, n, TRUSTEE_IDS)
+        columns[COL.TRUSTEE_ID] = trustee_id
+        columns[119] = pd.Series(trustee_id).map({
+            "": "", "1": "フェイス", "2": "フェイス", "3": "フェイス", "4": "フェイス", "8": "フェイス",
+            "5": "ミライル", "6": "プラザ", "7": "ガレージバンク",
+        }).to_numpy()
+        columns[120] = np.where(rng.random(n) < 0.1, _dates(rng, n, self.today - timedelta(days=365), self.today), "")
+
+        frame = pd.DataFrame({i: columns.get(i, np.full(n, "")) for i in range(len(CONTRACT_LIST_HEADERS))})
+        frame.columns = CONTRACT_LIST_HEADERS
+        return frame
+
+    # ========== クライアント入力 ==========
+
+    def _client_keys(self, rng: np.random.Generator, kind: str, prefix: str, rows: int) -> np.ndarray:
+        """クライアント入力の番号（overlap の割合は ContractList に登録済み）"""
+        registered = self.registered_keys(kind)
+        existing = rng.random(rows) < self.overlap if len(registered) else np.zeros(rows, dtype=bool)
+        new_keys = _numbered(prefix, np.arange(rows) + 9_000_000, 7)
+        if existing.any():
+            new_keys[existing] = rng.choice(registered, int(existing.sum()))
+        return new_keys
+
+    def _client_rows(self, rows: Optional[int], ratio: float) -> int:
+        return rows if rows is not None else max(int(self.rows * ratio), 1)
+
+    def ark_report(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """アーク 案件取込用レポート（40列）"""
+        n = self._client_rows(rows, 0.05)
+        rng = self._rng("ark_report")
+        people = _People(rng, n)
+        address = _Address(rng, n)
+        guarantor = _People(rng, n)
+        contact = _People(rng, n)
+        rent = rng.integers(30, 150, n) * 1000
+        has_guarantor = rng.random(n) < 0.7
+        has_contact = rng.random(n) < 0.5
+        values = {
+            "契約番号": self._client_keys(rng, "ark", "ARK", n),
+            "契約元帳: 主契約者": people.names,
+            "主契約者（カナ）": people.kana,
+            "生年月日1": _birthdays(rng, n, mixed=True),
+            "自宅TEL1": _phones(rng, n, landline=True, blank=0.7),
+            "携帯TEL1": _phones(rng, n, blank=0.05),
+            "自宅住所1": _Address(rng, n).full(postal="mixed"),
+            "取引先": _choice(rng, n, (["管理会社A", "管理会社B", "管理会社C"], None)),
+            "物件名": address.building,
+            "部屋番号": address.room,
+            "物件住所": address.full(postal="mixed"),
+            "契約区分": _choice(rng, n, (["個人", "法人"], [0.9, 0.1])),
+            "賃料": rent.astype(str),
+            "管理共益費": rng.choice(["0", "3000", "5000", "￥3,000"], n),
+            "駐車場料金": rng.choice(["", "0", "10000"], n),
+            "その他料金": rng.choice(["", "0", "1,200"], n),
+            "決済サービス料": rng.choice(["", "0", "500"], n),
+            "バーチャル口座(銀行)": np.full(n, "GMOあおぞらネット銀行"),
+            "バーチャル口座(支店)": np.full(n, "ｱｰｸ支店"),
+            "バーチャル口座(口座番号)": _numbered("", rng.integers(1_000_000, 9_999_999, n), 7),
+            "未収金額合計": _amounts(rng, n, 0.1, 80_000).astype(str),
+            "勤務先1": _choice(rng, n, (COMPANIES, None)),
+            "勤務先TEL1": _phones(rng, n, landline=True, blank=0.5),
+            "契約者業種": _choice(rng, n, (["会社員", "自営業", "パート", ""], None)),
+            "勤務先住所1": _Address(rng, n).full(postal="none"),
+            "名前2": np.where(has_guarantor, guarantor.names, ""),
+            "名前2（カナ）": np.where(has_guarantor, guarantor.kana, ""),
+            "種別／続柄２": np.where(has_guarantor, _choice(rng, n, (["保証人", "緊急連絡先"], [0.7, 0.3])), ""),
+            "生年月日2": np.where(has_guarantor, _birthdays(rng, n, mixed=True), ""),
+            "自宅住所2": np.where(has_guarantor, _Address(rng, n).full(postal="mixed"), ""),
+            "自宅TEL2": np.where(has_guarantor, _phones(rng, n, landline=True, blank=0.6), ""),
+            "携帯TEL2": np.where(has_guarantor, _phones(rng, n, blank=0.1), ""),
+            "名前3": np.where(has_contact, contact.names, ""),
+            "名前3（カナ）": np.where(has_contact, contact.kana, ""),
+            "種別／続柄３": np.where(has_contact, "緊急連絡先", ""),
+            "生年月日3": np.where(has_contact, _birthdays(rng, n, mixed=True), ""),
+            "自宅住所3": np.where(has_contact, _Address(rng, n).full(postal="mixed"), ""),
+            "自宅TEL3": np.where(has_contact, _phones(rng, n, landline=True, blank=0.6), ""),
+            "携帯TEL3": np.where(has_contact, _phones(rng, n, blank=0.1), ""),
+            "入居日": _dates(rng, n, self.today - timedelta(days=60), self.today, fmt="%Y-%m-%d"),
+        }
+        return pd.DataFrame(values, columns=ARK_REPORT_HEADERS)
+
+    def capco_report(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """カプコ元データ（46列、審査状況は2列）"""
+        n = self._client_rows(rows, 0.03)
+        rng = self._rng("capco_report")
+        people = _People(rng, n)
+        address = _Address(rng, n)
+        debt = _amounts(rng, n, 0.2, 50_000)
+        values = [
+            self._client_keys(rng, "capco", "CP", n),
+            np.full(n, self.today.strftime("%Y%m")),
+            _choice(rng, n, (["関東", "関西", "東海", "九州"], None)),
+            _choice(rng, n, (["家賃保証", "家賃保証ライト"], None)),
+            _dates(rng, n, self.today - timedelta(days=730), self.today),
+            "",
+            "",
+            "承認",
+            "承認",
+            people.names,
+            people.hiragana,
+            _phones(rng, n, landline=True, blank=0.6),
+            _phones(rng, n, blank=0.05),
+            "",
+            address.building,
+            address.room,
+            address.postal,
+            address.full(postal="none"),
+            _amounts(rng, n, 0, 70_000).astype(str),
+            _amounts(rng, n, 0.5, 30_000).astype(str),
+            _dates(rng, n, self.today - timedelta(days=90), self.today),
+            "0",
+            "0",
+            debt.astype(str),
+            pd.Series(debt).astype(int).map("{:,}".format).to_numpy(),
+        ]
+        frame = pd.DataFrame({i: (values[i] if i < len(values) else "") for i in range(len(CAPCO_REPORT_HEADERS))}, index=range(n))
+        frame[28] = rng.integers(1, 29, n).astype(str)
+        frame[35] = _choice(rng, n, (["管理会社A", "管理会社B", "管理会社C"], None))
+        frame[41] = "GMOあおぞらネット銀行"
+        frame[42] = _choice(rng, n, (["中央支店", "東支店", "西支店"], None))
+        frame[43] = _numbered("", rng.integers(1_000_000, 9_999_999, n), 7)
+        frame[44] = "カプコ"
+        frame.columns = CAPCO_REPORT_HEADERS
+        return frame
+
+    def plaza_report(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """プラザ新規登録用 コールセンター回収委託CSV（44列）"""
+        n = self._client_rows(rows, 0.03)
+        rng = self._rng("plaza_report")
+        people = _People(rng, n)
+        address = _Address(rng, n)
+        guarantor = _People(rng, n)
+        contact = _People(rng, n)
+        has_guarantor = rng.random(n) < 0.4
+        has_contact = rng.random(n) < 0.6
+        values = {
+            "コールセンター送信日": self.today.strftime("%Y/%m/%d"),
+            "会員番号": self._client_keys(rng, "plaza", "PZ", n),
+            "号室": address.room,
+            "氏名（漢字）": people.names,
+            "フリガナ": people.kana,
+            "生年月日": _birthdays(rng, n, fmt="%Y%m%d"),
+            "住所": address.full(postal="mixed"),
+            "物件名": address.building,
+            "電話番号": _phones(rng, n, blank=0.05),
+            "国籍": np.where(people.foreign, "外国籍", "日本"),
+            "入居日": _dates(rng, n, self.today - timedelta(days=1000), self.today),
+            "延滞合計": _amounts(rng, n, 0.1, 50_000).astype(str),
+            "事務手数料": "500",
+            "バーチャル口座支店名": "ﾌﾟﾗｻﾞ支店",
+            "バーチャル口座番号": _numbered("", rng.integers(1_000_000, 9_999_999, n), 7),
+            "連帯保証人　名（漢字）": np.where(has_guarantor, guarantor.names, ""),
+            "連帯保証人　フリガナ": np.where(has_guarantor, guarantor.kana, ""),
+            "連帯保証人　続柄": np.where(has_guarantor, _choice(rng, n, (RELATIONS, None)), ""),
+            "連帯保証人　電話番号": np.where(has_guarantor, _phones(rng, n, blank=0.1), ""),
+            "緊急連絡人　氏名（漢字）": np.where(has_contact, contact.names, ""),
+            "緊急連絡人　フリガナ": np.where(has_contact, contact.kana, ""),
+            "緊急連絡人　続柄": np.where(has_contact, _choice(rng, n, (RELATIONS, None)), ""),
+            "緊急連絡人　電話番号": np.where(has_contact, _phones(rng, n, blank=0.1), ""),
+            "勤務先名": _choice(rng, n, (COMPANIES, None)),
+            "勤務先TEL": _phones(rng, n, landline=True, blank=0.5),
+        }
+        frame = pd.DataFrame(values, index=range(n)).reindex(columns=PLAZA_REPORT_HEADERS, fill_value="")
+        return frame
+
+    def plaza_collection_report(self, days_ago: int = 0, rows: Optional[int] = None) -> pd.DataFrame:
+        """
+        プラザ残債更新用 コールセンター回収委託情報（Excel）
+
+        Args:
+            days_ago: 何日前の報告か（前日分は延滞額合計が当日より多い会員がいる）
+        """
+        n = self._client_rows(rows, 0.05)
+        rng = self._rng("plaza_collection_report")
+        today_amounts = _amounts(rng, n, 0.2, 40_000)
+        paid = np.where(rng.random(n) < 0.15, rng.integers(1, 30, n) * 1000, 0)
+        amounts = today_amounts + paid * days_ago
+        return pd.DataFrame({
+            "部屋受付番号": _numbered("R", np.arange(n), 8),
+            "会員番号": self._client_keys(rng, "plaza", "PZ", n),
+            "氏名（漢字）": _People(rng, n).names,
+            "延滞額合計": amounts,
+            "報告元": _choice(rng, n, (["プラザ", "コールセンター"], [0.9, 0.1])),
+            "解約申入日": np.where(rng.random(n) < 0.05, _dates(rng, n, self.today - timedelta(days=60), self.today), ""),
+            "退去日": np.where(rng.random(n) < 0.05, _dates(rng, n, self.today - timedelta(days=60), self.today), ""),
+        })
+
+    def plaza_list(self) -> pd.DataFrame:
+        """プラザ依頼分リスト（1241件.csv: 引継番号 → 管理番号）"""
+        contract = self._contract_keys
+        mask = contract["kind"] == "plaza"
+        return pd.DataFrame({
+            "管理番号": (np.flatnonzero(mask) + 100_001).astype(str),
+            "引継番号": contract["key"][mask],
+        })
+
+    def iog_jid(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """IOG JID返却データ（Excel）"""
+        n = self._client_rows(rows, 0.01)
+        rng = self._rng("iog_jid")
+        people = self._iog_people
+        take = people.index[:n] if len(people.index) >= n else np.arange(n) % len(people.index)
+        address = _Address(rng, n)
+        return pd.DataFrame({
+            "保証番号": self._client_keys(rng, "iog", "IOG", n),
+            # JIDの氏名は半角スペース区切り
+            "対象者名": pd.Series(people.names[take]).str.replace("　", " ").to_numpy(),
+            "フリガナ": people.kana[take],
+            "自宅電話": _phones(rng, n, landline=True, blank=0.6),
+            "携帯": _phones(rng, n, blank=0.1),
+            "自宅": address.full(postal="mixed"),
+            "郵便番号": np.where(rng.random(n) < 0.5, address.postal, ""),
+            "差引残高": _amounts(rng, n, 0.1, 60_000).astype(str),
+            "受任日": _dates(rng, n, self.today - timedelta(days=30), self.today, fmt="%Y-%m-%d 00:00:00"),
+        }, columns=IOG_JID_HEADERS)
+
+    @cached_property
+    def _iog_people(self) -> "_People":
+        people = _People(self._rng("iog_people"), self._client_rows(None, 0.01) * 2)
+        people.index = np.arange(len(people.names))
+        return people
+
+    def iog_transfer(self, rows: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """IOG 譲渡一覧（シート名 → DataFrame、JIDの対象者の約7割が載る）"""
+        n = self._client_rows(rows, 0.01)
+        rng = self._rng("iog_transfer")
+        people = self._iog_people
+        # 前半は JID と同じ人、後半は JID にない人
+        picks = np.where(rng.random(n) < 0.7, rng.integers(0, min(n, len(people.names)), n), rng.integers(0, len(people.names), n))
+        address = _Address(rng, n)
+        guarantor = _People(rng, n)
+        contact = _People(rng, n)
+        guarantor_address = _Address(rng, n)
+        contact_address = _Address(rng, n)
+        frame = pd.DataFrame({
+            "賃借人氏名": people.names[picks],
+            "物件名": address.building + " " + address.room,
+            "物件郵便番号": address.postal,
+            "物件都道府県": address.prefecture,
+            "物件市区町村": address.municipality,
+            "物件町域名": address.street,
+            "連帯保証人氏名（滞納）": guarantor.names,
+            "連帯保証人続柄名（滞納）": _choice(rng, n, (RELATIONS, None)),
+            "連帯保証人郵便番号（滞納）": guarantor_address.postal,
+            "連帯保証人都道府県（滞納）": guarantor_address.prefecture,
+            "連帯保証人市区町村（滞納）": guarantor_address.municipality,
+            "連帯保証人町域名（滞納）": guarantor_address.street,
+            "連帯保証人電話番号（滞納）": _phones(rng, n, landline=True, blank=0.6),
+            "連帯保証人携帯電話電話号（滞納）": _phones(rng, n, blank=0.2),
+            "緊急連絡先氏名（滞納）": contact.names,
+            "緊急連絡先続柄名（滞納）": _choice(rng, n, (RELATIONS, None)),
+            "緊急連絡先郵便番号（滞納）": contact_address.postal,
+            "緊急連絡先都道府県（滞納）": contact_address.prefecture,
+            "緊急連絡先市区町村（滞納）": contact_address.municipality,
+            "緊急連絡先町域名（滞納）": contact_address.street,
+            "緊急連絡先電話番号（滞納）": _phones(rng, n, landline=True, blank=0.6),
+            "緊急連絡先携帯電話電話号（滞納）": _phones(rng, n, blank=0.2),
+        }).reindex(columns=IOG_TRANSFER_HEADERS, fill_value="")
+        sheet = rng.choice(len(IOG_TRANSFER_SHEETS), n, p=[0.5, 0.25, 0.25])
+        return {name: frame[sheet == i].reset_index(drop=True) for i, name in enumerate(IOG_TRANSFER_SHEETS)}
+
+    def list_export(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """オートコール list_export（ContractList の管理番号への架電結果）"""
+        n = self._client_rows(rows, 0.1)
+        rng = self._rng("list_export")
+        management_no = rng.integers(100_001, 100_001 + self.rows, n)
+        phone = _phones(rng, n, blank=0, messy=False)
+        called_at = pd.Timestamp(self.today) + pd.to_timedelta(np.sort(rng.integers(9 * 3600, 18 * 3600, n)), unit="s")
+        called = called_at.strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+        debt = _amounts(rng, n, 0.05, 50_000)
+        return pd.DataFrame({
+            "顧客ID": (np.arange(n) + 500_000).astype(str),
+            "電話番号": pd.Series(phone).str.replace("-", "").to_numpy(),
+            "入居ステータス": _choice(rng, n, RESIDENCE_STATUSES),
+            "滞納ステータス": _choice(rng, n, DELINQUENT_STATUSES),
+            "作成日": self.today.strftime("%Y-%m-%d"),
+            "更新日": self.today.strftime("%Y-%m-%d"),
+            "更新時間": called_at.strftime("%H:%M:%S").to_numpy(),
+            "管理番号": management_no.astype(str),
+            "契約者名（カナ）": _People(rng, n).kana,
+            "物件名": _Address(rng, n).building,
+            "クライアント": _numbered("クライアント", rng.integers(1, 300, n), 4),
+            "架電番号": phone,
+            # 残債が空の行は「不明」と表示される
+            "残債": np.where(rng.random(n) < 0.03, "", debt.astype(str)),
+            "架電結果": _choice(rng, n, CALL_RESULTS),
+            "所属": "オートコール",
+            "架電禁止": "許可",
+            # 最終架電日の空欄は前の行で補完される
+            "最終架電日": np.where(rng.random(n) < 0.1, "", called),
+            "架電回数": pd.Series(rng.integers(1, 5, n)).astype(str).add("回").to_numpy(),
+        }).reindex(columns=LIST_EXPORT_HEADERS, fill_value="")
+
+    def nap_report(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """ナップ ミライル様依頼データ（CSV、承認番号 ⟷ 引継番号）"""
+        n = self._client_rows(rows, 0.02)
+        rng = self._rng("nap_report")
+        people = _People(rng, n)
+        home = _Address(rng, n)
+        address = _Address(rng, n)
+        guarantor = _People(rng, n)
+        guarantor_address = _Address(rng, n)
+        contact = _People(rng, n)
+        contact_address = _Address(rng, n)
+        has_guarantor = rng.random(n) < 0.3
+        has_contact = rng.random(n) < 0.7
+        return pd.DataFrame({
+            "承認番号": self._client_keys(rng, "other", "T", n),
+            "契約者氏名": people.names,
+            "契約者氏名かな": people.hiragana,
+            "契約者生年月日": _birthdays(rng, n),
+            "契約者携帯1": _phones(rng, n, blank=0.1),
+            "契約者電話": _phones(rng, n, landline=True, blank=0.7),
+            "契約者郵便番号": home.postal,
+            "契約者１住所１": home.prefecture,
+            "契約者１住所２": home.municipality,
+            "契約者１住所３": home.street,
+            "契約者住所アパート等": np.where(rng.random(n) < 0.6, home.building + " " + home.room, ""),
+            "契約者勤務先名": _choice(rng, n, (COMPANIES, None)),
+            "契約者勤務先電話": _phones(rng, n, landline=True, blank=0.5),
+            "物件名": address.building,
+            "部屋番号": address.room,
+            "物件郵便番号": address.postal,
+            "物件住所１": address.prefecture,
+            "物件住所２": address.municipality,
+            "物件住所３": address.street,
+            "賃料": (rng.integers(30, 150, n) * 1000).astype(str),
+            "管理費公益費": rng.choice(["0", "3000", "5000"], n),
+            "水道代": rng.choice(["", "0", "2000"], n),
+            "駐車場": rng.choice(["", "0", "10000"], n),
+            "その他費用": rng.choice(["", "0", "1200"], n),
+            "加盟店: 加盟店名": _choice(rng, n, (["管理会社A", "管理会社B", "管理会社C"], None)),
+            "バーチャル口座: 名称": _numbered("", rng.integers(1_000_000, 9_999_999, n), 7),
+            "日割家賃発生日": _dates(rng, n, self.today - timedelta(days=60), self.today),
+            "連保人1氏名": np.where(has_guarantor, guarantor.names, ""),
+            "連保人1氏名かな": np.where(has_guarantor, guarantor.hiragana, ""),
+            "連保人1生年月日": np.where(has_guarantor, _birthdays(rng, n), ""),
+            "連保人1郵便番号": np.where(has_guarantor, guarantor_address.postal, ""),
+            "連保人1住所１": np.where(has_guarantor, guarantor_address.prefecture, ""),
+            "連保人1住所２": np.where(has_guarantor, guarantor_address.municipality, ""),
+            "連保人1住所３": np.where(has_guarantor, guarantor_address.street, ""),
+            "連保人1電話": np.where(has_guarantor, _phones(rng, n, landline=True, blank=0.6), ""),
+            "連保人1携帯番号": np.where(has_guarantor, _phones(rng, n, blank=0.1), ""),
+            "緊急連絡人氏名": np.where(has_contact, contact.names, ""),
+            "緊急連絡人氏名かな": np.where(has_contact, contact.hiragana, ""),
+            "緊急連絡人郵便番号": np.where(has_contact, contact_address.postal, ""),
+            "緊急連絡人住所１": np.where(has_contact, contact_address.prefecture, ""),
+            "緊急連絡人住所２": np.where(has_contact, contact_address.municipality, ""),
+            "緊急連絡人住所３": np.where(has_contact, contact_address.street, ""),
+            "緊急連絡人電話": np.where(has_contact, _phones(rng, n, landline=True, blank=0.6), ""),
+            "緊急連絡人携帯１": np.where(has_contact, _phones(rng, n, blank=0.1), ""),
+        })
+
+    def capco_arrear(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """カプコ残債更新用 csv_arrear（A列: 契約No、Y列: 滞納額合計）"""
+        n = self._client_rows(rows, 0.1)
+        rng = self._rng("capco_arrear")
+        values = {
+            0: self._client_keys(rng, "capco", "CP", n),
+            1: _People(rng, n).names,
+            24: _amounts(rng, n, 0.3, 40_000).astype(str),
+        }
+        frame = pd.DataFrame({i: values.get(i, "") for i in range(30)}, index=range(n))
+        frame.columns = ["契約No", "契約者名"] + [f"項目{i}" for i in range(2, 24)] + ["滞納額合計"] + [
+            f"項目{i}" for i in range(25, 30)
+        ]
+        return frame
+
+    def gb_billing(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """ガレージバンク 情報連携シート「01_請求データ」（ユーザーID ⟷ 引継番号）"""
+        n = self._client_rows(rows, 0.02)
+        rng = self._rng("gb_billing")
+        keys = self._contract_keys["key"]
+        return pd.DataFrame({
+            "ユーザーID": keys[rng.integers(0, len(keys), n)],
+            "請求金額": _amounts(rng, n, 0.1, 30_000),
+            "遅延損害金額": _amounts(rng, n, 0.5, 1_000),
+            "その他費用": _amounts(rng, n, 0.8, 3_000),
+        })
+
+    def residence_survey(self, rows: Optional[int] = None) -> pd.DataFrame:
+        """居住訪問調査報告書（提出日は直近3か月、約3割が空欄）"""
+        n = self._client_rows(rows, 0.05)
+        rng = self._rng("residence_survey")
+        people = _People(rng, n)
+        address = _Address(rng, n)
+
+        def submitted():
+            dates = _dates(rng, n, self.today - timedelta(days=90), self.today, fmt="%Y-%m-%d")
+            return np.where(rng.random(n) < 0.3, None, dates)
+
+        return pd.DataFrame({
+            "レコード番号": np.arange(n),
+            "依頼元": _choice(rng, n, (LAW_FIRM_PRIORITY + ["その他法律事務所"], None)),
+            "会員番号": rng.integers(100_000, 999_999, n),
+            "居住者名": people.names,
+            "住所": address.full(postal="none"),
+            "調査日時【１回目】": np.nan,
+            "調査日時【２回目】": np.nan,
+            "調査日時【３回目】": np.nan,
+            "1回目提出日": submitted(),
+            "2回目提出日": submitted(),
+            "3回目提出日": submitted(),
+            "請求事項": "",
+        })
+
+
+# ========== ファイル出力 ==========
+
+def to_csv_bytes(df: pd.DataFrame, encoding: str = "cp932") -> bytes:
+    """CSVのバイトデータ（CP932 / UTF-8）"""
+    return df.to_csv(index=False).encode(encoding)
+
+
+def to_excel_bytes(sheets: Union[pd.DataFrame, Dict[str, pd.DataFrame]], title_row: bool = False) -> bytes:
+    """
+    Excel（xlsx）のバイトデータ
+
+    Args:
+        sheets: DataFrame（1シート）またはシート名 → DataFrame
+        title_row: True の場合は1行目にシート名を書き、2行目をヘッダーにする（譲渡一覧の形式）
+    """
+    if isinstance(sheets, pd.DataFrame):
+        sheets = {"Sheet1": sheets}
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for name, df in sheets.items():
+            df.head(EXCEL_MAX_ROWS).to_excel(writer, sheet_name=name, index=False, startrow=1 if title_row else 0)
+            if title_row:
+                writer.sheets[name].cell(row=1, column=1, value=name)
+    return buffer.getvalue()
+
+
+def write_dataset(
+    output_dir: Union[str, Path],
+    rows: int = 100_000,
+    encoding: str = "cp932",
+    seed: int = 0,
+    today: Optional[date] = None,
+    include_excel: bool = True,
+) -> List[Path]:
+    """
+    全ファイルを出力
+
+    Args:
+        output_dir: 出力先ディレクトリ
+        rows: ContractList の行数（クライアント入力は行数に応じた件数）
+        encoding: CSVのエンコーディング（cp932 / utf-8 / utf-8-sig）
+        include_excel: False の場合はExcelファイル（書き出しに時間がかかる）を省略
+
+    Returns:
+        出力したファイルのパス
+    """
+    dataset = SyntheticDataset(rows, seed=seed, today=today)
+    stamp = dataset.today.strftime("%Y%m%d")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    files = {
+        f"ContractList_{stamp}.csv": lambda: to_csv_bytes(dataset.contract_list(), encoding),
+        "案件取込用レポート.csv": lambda: to_csv_bytes(dataset.ark_report(), encoding),
+        "カプコ元データ.csv": lambda: to_csv_bytes(dataset.capco_report(), encoding),
+        "コールセンター回収委託_ミライル.csv": lambda: to_csv_bytes(dataset.plaza_report(), encoding),
+        "1241件.csv": lambda: to_csv_bytes(dataset.plaza_list(), encoding),
+        f"list_export{stamp}.csv": lambda: to_csv_bytes(dataset.list_export(), encoding),
+        "ミライル様依頼データ.csv": lambda: to_csv_bytes(dataset.nap_report(), encoding),
+        f"csv_arrear_{stamp}.csv": lambda: to_csv_bytes(dataset.capco_arrear(), encoding),
+        "居住訪問調査報告書.csv": lambda: to_csv_bytes(dataset.residence_survey(), encoding),
+    }
+    if include_excel:
+        files.update({
+            "コールセンター回収委託情報_前日.xlsx": lambda: to_excel_bytes(dataset.plaza_collection_report(days_ago=1)),
+            "コールセンター回収委託情報_当日.xlsx": lambda: to_excel_bytes(dataset.plaza_collection_report()),
+            f"合同会社IOG（日本賃貸保証返却データ）{stamp}.xlsx": lambda: to_excel_bytes(dataset.iog_jid()),
+            "譲渡一覧.xlsx": lambda: to_excel_bytes(dataset.iog_transfer(), title_row=True),
+            "情報連携シート.xlsx": lambda: to_excel_bytes({"01_請求データ": dataset.gb_billing()}),
+        })
+
+    paths = []
+    for name, build in files.items():
+        path = output_dir / name
+        path.write_bytes(build())
+        paths.append(path)
+    return paths
+
+
+# ========== 値の生成 ==========
+
+def _choice(rng: np.random.Generator, n: int, options) -> np.ndarray:
+    """(選択肢, 確率) から n 個選ぶ（確率 None は一様）"""
+    values, weights = options
+    return np.asarray(values, dtype=object)[rng.choice(len(values), n, p=weights)]
+
+
+def _numbered(prefix: str, numbers: np.ndarray, width: int) -> np.ndarray:
+    """prefix + ゼロ埋めの番号（width 桁を超える番号はそのまま）"""
+    numbers = np.asarray(numbers, dtype=np.int64)
+    if len(numbers) and numbers.max() >= 10 ** width:
+        return (prefix + pd.Series(numbers).astype(str).str.zfill(width)).to_numpy(dtype=object)
+    # 10**width を足して文字列化し、先頭の "1" を落とす（str.zfill より速い）
+    padded = (numbers + 10 ** width).astype(f"U{width + 1}").view(f"U1").reshape(-1, width + 1)[:, 1:]
+    return np.char.add(prefix, padded.copy().view(f"U{width}").ravel()).astype(object)
+
+
+def _amounts(rng: np.random.Generator, n: int, zero_ratio: float, median: float) -> np.ndarray:
+    """金額（対数正規分布、100円単位、zero_ratio の割合は0円）"""
+    amounts = np.round(rng.lognormal(np.log(max(median, 1)), 0.8, n) / 100) * 100
+    return np.where(rng.random(n) < zero_ratio, 0, amounts).astype(np.int64)
+
+
+def _dates(rng: np.random.Generator, n: int, start: date, end: date, fmt: str = "%Y/%m/%d") -> np.ndarray:
+    """start〜end の日付文字列"""
+    offsets = rng.integers(0, (end - start).days + 1, n)
+    # 期間内の日付を1回だけ文字列化して引く（行ごとの strftime より速い）
+    return _date_strings(start, (end - start).days + 1, fmt)[offsets]
+
+
+def _date_strings(start: date, days: int, fmt: str) -> np.ndarray:
+    """start から days 日分の日付文字列"""
+    return pd.date_range(start, periods=days, freq="D").strftime(fmt).to_numpy(dtype=object)
+
+
+def _birthdays(rng: np.random.Generator, n: int, fmt: str = "%Y/%m/%d", mixed: bool = False) -> np.ndarray:
+    """生年月日（mixed の場合は「1980年1月2日」「1980-01-02」などの表記揺れを含む）"""
+    start = date(1945, 1, 1)
+    offsets = rng.integers(0, 365 * 60, n)
+    values = _date_strings(start, 365 * 60, fmt)[offsets]
+    if mixed:
+        variant = rng.random(n)
+        days = pd.date_range(start, periods=365 * 60, freq="D")
+        japanese = (days.year.astype(str) + "年" + days.month.astype(str) + "月" + days.day.astype(str) + "日").to_numpy()
+        values = np.where(variant < 0.2, japanese[offsets], values)
+        values = np.where((variant >= 0.2) & (variant < 0.3), _date_strings(start, 365 * 60, "%Y-%m-%d")[offsets], values)
+        values = np.where(variant >= 0.97, "", values)
+    return values.astype(object)
+
+
+def _phones(
+    rng: np.random.Generator, n: int, landline: bool = False, blank: float = 0.1, messy: bool = True
+) -> np.ndarray:
+    """
+    電話番号
+
+    messy の場合はハイフン区切り・ハイフンなし・括弧区切り・全角・先頭ゼロ落ち・注記付き・「電話無」を混在させる。
+    """
+    if landline:
+        area = _choice(rng, n, (["03", "06", "011", "052", "092", "045"], [0.3, 0.2, 0.1, 0.15, 0.1, 0.15]))
+    else:
+        area = _choice(rng, n, (["090", "080", "070"], [0.45, 0.45, 0.1]))
+    area = area.astype(str)
+    digits = rng.integers(0, 10 ** 8, n)
+    # 携帯は11桁（090-1234-5678）、固定電話は10桁（03-1234-5678、011-123-4567）
+    middle = _numbered("", digits // 10 ** 4, 4)
+    last = _numbered("", digits % 10 ** 4, 4)
+    if landline:
+        three = np.char.str_len(area) == 3
+        middle[three] = _numbered("", digits[three] // 10 ** 5, 3)
+        last[three] = _numbered("", digits[three] // 10 % 10 ** 4, 4)
+    area, middle, last = (values.astype(object) for values in (area, middle, last))
+    hyphen = area + "-" + middle + "-" + last
+    plain = area + middle + last
+    if not messy:
+        return np.where(rng.random(n) < blank, "", hyphen).astype(object)
+
+    variant = rng.random(n)
+    values = np.where(variant < 0.55, hyphen, plain)
+    values = np.where((variant >= 0.80) & (variant < 0.84), area + "(" + middle + ")" + last, values)
+    zenkaku = (variant >= 0.84) & (variant < 0.87)
+    values[zenkaku] = [_to_zenkaku(value) for value in hyphen[zenkaku]]
+    dropped = (variant >= 0.87) & (variant < 0.90)
+    values[dropped] = [value[1:] for value in plain[dropped]]
+    values = np.where((variant >= 0.90) & (variant < 0.92), "携帯" + hyphen, values)
+    values = np.where((variant >= 0.92) & (variant < 0.93), "電話無", values)
+    return np.where(rng.random(n) < blank, "", values).astype(object)
+
+
+_ZENKAKU = str.maketrans("0123456789-()", "０１２３４５６７８９－（）")
+
+
+def _to_zenkaku(value: str) -> str:
+    return value.translate(_ZENKAKU)
+
+
+class _People:
+    """氏名・カナ（全角スペース区切り、外国籍は数%）"""
+
+    def __init__(self, rng: np.random.Generator, n: int):
+        surname = rng.integers(0, len(SURNAMES), n)
+        given = rng.integers(0, len(GIVEN_NAMES), n)
+        self.foreign = rng.random(n) < 0.03
+        foreign = rng.integers(0, len(FOREIGN_NAMES), n)
+        surnames = np.array(SURNAMES, dtype=object)
+        given_names = np.array(GIVEN_NAMES, dtype=object)
+        foreign_names = np.array(FOREIGN_NAMES, dtype=object)
+        names = surnames[surname, 0] + "　" + given_names[given, 0]
+        kana = surnames[surname, 1] + "　" + given_names[given, 1]
+        self.names = np.where(self.foreign, foreign_names[foreign, 0], names)
+        self.kana = np.where(self.foreign, foreign_names[foreign, 1], kana)
+
+    @property
+    def hiragana(self) -> np.ndarray:
+        """ふりがな（カタカナをひらがなに変換）"""
+        return pd.Series(self.kana).map(_to_hiragana).to_numpy()
+
+
+def _to_hiragana(value: str) -> str:
+    # ヴ・ヵ・ヶ はCP932にひらがながないためカタカナのまま
+    return "".join(chr(ord(c) - 0x60) if "ァ" <= c <= "ン" else c for c in value)
+
+
+class _Address:
+    """住所（都道府県・市区町村は data/municipalities.json から選ぶ）"""
+
+    _pairs: Optional[np.ndarray] = None
+
+    def __init__(self, rng: np.random.Generator, n: int):
+        pairs = self._municipalities()
+        picked = pairs[rng.integers(0, len(pairs), n)]
+        self.prefecture = picked[:, 0]
+        self.municipality = picked[:, 1]
+        # 小さい番号は文字列の表から引く（行ごとの文字列化より速い）
+        numbers = np.arange(1000).astype(str).astype(object)
+        block = numbers[rng.integers(1, 10, n)]
+        lot = numbers[rng.integers(1, 30, n)]
+        number = numbers[rng.integers(1, 20, n)]
+        town = _choice(rng, n, (TOWNS, None))
+        self.street = town + block + "-" + lot + "-" + number
+        self.building = _choice(rng, n, (BUILDINGS, None))
+        self.room = numbers[rng.integers(1, 10, n) * 100 + rng.integers(1, 10, n)]
+        self.postal = _numbered("", rng.integers(0, 1000, n), 3) + "-" + _numbered("", rng.integers(0, 10000, n), 4)
+        self._variant = rng.random(n)
+
+    @classmethod
+    def _municipalities(cls) -> np.ndarray:
+        if cls._pairs is None:
+            with open(MUNICIPALITIES_PATH, encoding="utf-8") as f:
+                municipalities = json.load(f)
+            cls._pairs = np.array(
+                [(prefecture, name) for prefecture, names in municipalities.items() for name in names], dtype=object
+            )
+        return cls._pairs
+
+    def split(self):
+        """(郵便番号, 都道府県, 市区町村, 町域以降) の4列"""
+        return self.postal, self.prefecture, self.municipality, self.street + np.where(self._variant < 0.3, " " + self.building + self.room, "")
+
+    def full(self, postal: str = "none") -> np.ndarray:
+        """
+        1列の住所
+
+        Args:
+            postal: "none"（郵便番号なし）/ "mixed"（「〒」付き・なし・郵便番号なしを混在）
+        """
+        address = self.prefecture + self.municipality + self.street
+        if postal == "none":
+            return address
+        with_mark = "〒" + self.postal + " " + address
+        without_mark = self.postal + " " + address
+        return np.where(self._variant < 0.4, with_mark, np.where(self._variant < 0.7, without_mark, address))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="規模テスト用の合成データを出力")
+    parser.add_argument("output_dir", help="出力先ディレクトリ")
+    parser.add_argument("--rows", type=int, default=100_000, help="ContractListの行数")
+    parser.add_argument("--encoding", default="cp932", choices=["cp932", "utf-8", "utf-8-sig"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-excel", action="store_true", help="Excelファイルを出力しない")
+    args = parser.parse_args(argv)
+
+    for path in write_dataset(args.output_dir, args.rows, args.encoding, args.seed, include_excel=not args.no_excel):
+        print(f"{path}（{path.stat().st_size / 1024 / 1024:.1f}MB）")
+
+
+if __name__ == "__main__":
+    main()
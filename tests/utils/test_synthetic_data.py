@@ -0,0 +1,111 @@
+"""
+規模テスト用の合成データ生成（tests/utils/synthetic_data.py）のテスト
+"""
+
+import io
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from processors.ark_registration import process_ark_data
+from processors.capco_debt_update import process_capco_debt_update
+from processors.common.contract_list_columns import ContractListColumns as COL
+from processors.common.text_decoder import read_csv_bytes
+from processors.iog_registration import process_jid_data
+from processors.nap_registration import process_nap_data
+from processors.plaza_registration import process_plaza_data
+from tests.utils.synthetic_data import (
+    CONTRACT_LIST_HEADERS,
+    IOG_TRANSFER_SHEETS,
+    SyntheticDataset,
+    to_csv_bytes,
+    to_excel_bytes,
+    write_dataset,
+)
+
+TODAY = date(2025, 10, 1)
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return SyntheticDataset(2_000, seed=1, today=TODAY)
+
+
+@pytest.fixture(scope="module")
+def contract_content(dataset):
+    return to_csv_bytes(dataset.contract_list())
+
+
+class TestContractList:
+    """ContractList の列構成・再現性のテスト"""
+
+    def test_columns_match_contract_list_columns(self, contract_content):
+        df = read_csv_bytes(contract_content, dtype=str)
+
+        assert df.shape == (2_000, 122)
+        assert len(CONTRACT_LIST_HEADERS) == 122
+        assert df.columns[COL.MANAGEMENT_NO] == "管理番号"
+        assert df.columns[COL.CONTRACT_NAME] == "契約者氏名"
+        assert df.columns[COL.TRUSTEE_ID] == "委託先法人ID"
+        assert df.columns[COL.CLIENT_CD] == "クライアントCD"
+        assert df["管理番号"].is_unique
+        assert df["引継番号"].is_unique
+
+    def test_same_seed_same_data(self, dataset):
+        again = SyntheticDataset(2_000, seed=1, today=TODAY)
+        other = SyntheticDataset(2_000, seed=2, today=TODAY)
+
+        pd.testing.assert_frame_equal(dataset.contract_list(), again.contract_list())
+        pd.testing.assert_frame_equal(dataset.ark_report(), again.ark_report())
+        assert not dataset.contract_list().equals(other.contract_list())
+
+    @pytest.mark.parametrize("encoding", ["cp932", "utf-8-sig"])
+    def test_encodings(self, dataset, encoding):
+        for df in [dataset.contract_list(), dataset.ark_report(), dataset.capco_report(), dataset.plaza_report()]:
+            to_csv_bytes(df, encoding)
+
+
+class TestClientInputs:
+    """クライアント入力と新規登録処理のテスト"""
+
+    def test_ark_registration(self, dataset, contract_content):
+        report = dataset.ark_report()
+        registered = set(dataset.registered_keys("ark"))
+
+        result_df, _, _ = process_ark_data(to_csv_bytes(report), contract_content)
+
+        # 登録済みの契約番号は重複チェックで除外される
+        duplicates = report["契約番号"].isin(registered).sum()
+        assert 0 < duplicates < len(report)
+        assert 0 < len(result_df) <= len(report) - duplicates
+
+    def test_plaza_registration(self, dataset, contract_content):
+        report = dataset.plaza_report()
+
+        result = process_plaza_data(to_csv_bytes(report), contract_content)
+
+        assert 0 < len(result[0]) < len(report)
+
+    def test_iog_transfer_workbook(self, dataset):
+        transfer = to_excel_bytes(dataset.iog_transfer(), title_row=True)
+
+        for sheet_name in IOG_TRANSFER_SHEETS:
+            sheet = pd.read_excel(io.BytesIO(transfer), sheet_name=sheet_name, header=1, dtype=str)
+            assert "賃借人氏名" in sheet.columns
+        result = process_jid_data(to_excel_bytes(dataset.iog_jid()), [("譲渡一覧.xlsx", transfer)])
+        assert len(result[0]) > 0
+
+    def test_nap_and_capco_debt_update(self, dataset, contract_content):
+        nap_df, _, _ = process_nap_data(to_csv_bytes(dataset.nap_report()), contract_content)
+        debt_df, _, _, _ = process_capco_debt_update(to_csv_bytes(dataset.capco_arrear()), contract_content)
+
+        assert len(nap_df) > 0
+        assert list(debt_df.columns) == ["管理番号", "管理前滞納額"]
+        assert len(debt_df) > 0
+
+    def test_write_dataset(self, tmp_path):
+        paths = write_dataset(tmp_path, rows=500, today=TODAY, include_excel=False)
+
+        assert all(path.stat().st_size > 0 for path in paths)
+        assert (tmp_path / "ContractList_20251001.csv").exists()